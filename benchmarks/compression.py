@@ -0,0 +1,73 @@
+"""Benchmark bytes on the wire against CPU cost of compressing record updates
+
+Serializes synthetic, repetitive record updates as streamed by `Dataset.upsert_records`,
+then compresses the stream incrementally at each compression level.
+The estimated upload time assumes compression and transfer overlap,
+so that the slower of the two is the bottleneck.
+
+Usage::
+
+    poetry run python benchmarks/compression.py [--records N] [--bandwidth MBIT_PER_S]
+"""
+import argparse
+import json
+import random
+import time
+
+from tamr_unify_client import _upload
+
+
+def make_updates(n, seed=0):
+    rng = random.Random(seed)
+    cities = ["Boston", "Cambridge", "Somerville", "Medford", "Quincy"]
+    for i in range(n):
+        record = {
+            "id": str(i),
+            "name": [f"Customer {rng.randrange(10_000)}"],
+            "city": [rng.choice(cities)],
+            "state": ["MA"],
+            "revenue": [str(round(rng.uniform(0, 1e6), 2))],
+        }
+        yield json.dumps({"action": "CREATE", "recordId": str(i), "record": record})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=100.0,
+        help="Link bandwidth (in Mbit/s) used to estimate the upload time",
+    )
+    args = parser.parse_args()
+
+    updates = [u.encode("utf-8") for u in make_updates(args.records)]
+    chunks = list(_upload.coalesce(updates, _upload.BUFFER_SIZE))
+    raw = sum(len(c) for c in chunks)
+    bytes_per_s = args.bandwidth * 1e6 / 8
+
+    print(
+        f"{'encoding':<10}{'level':>6}{'MB sent':>10}{'ratio':>8}"
+        f"{'CPU s':>8}{'MB/s':>9}{'upload s':>10}"
+    )
+    print(
+        f"{'none':<10}{'-':>6}{raw / 1e6:>10.2f}{1:>8.1f}"
+        f"{0:>8.2f}{'-':>9}{raw / bytes_per_s:>10.2f}"
+    )
+    for compression in ["gzip", "deflate"]:
+        for level in range(1, 10):
+            start = time.process_time()
+            sent = sum(
+                len(c) for c in _upload.compress(iter(chunks), compression, level)
+            )
+            cpu = time.process_time() - start
+            upload = max(cpu, sent / bytes_per_s)
+            print(
+                f"{compression:<10}{level:>6}{sent / 1e6:>10.2f}{raw / sent:>8.1f}"
+                f"{cpu:>8.2f}{raw / 1e6 / cpu:>9.1f}{upload:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
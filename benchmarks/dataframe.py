@@ -0,0 +1,68 @@
+"""Benchmark serializing DataFrame rows into record update commands
+
+Compares the previous row-wise serialization (`iterrows`, `Series.to_json`, parsing and
+re-serializing each row) against the chunked, column-wise serialization used by
+`Dataset.upsert_from_dataframe` and `tamr_client.dataframe.upsert`.
+
+Usage::
+
+    poetry run python benchmarks/dataframe.py [--rows N] [--columns N]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from tamr_unify_client.dataset.resource import _dataframe_records
+
+
+def make_frame(rows, columns, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {"pk": np.arange(rows)}
+    for c in range(columns):
+        values = rng.random(rows)
+        values[rng.random(rows) < 0.1] = np.nan
+        data[f"f{c}"] = values if c % 2 else values.astype(str)
+    return pd.DataFrame(data)
+
+
+def row_wise(df, primary_key_name):
+    for pk, row in df.iterrows():
+        record = {primary_key_name: row[primary_key_name], **json.loads(row.to_json())}
+        update = {"action": "CREATE", "recordId": record[primary_key_name]}
+        yield json.dumps({**update, "record": record}).encode("utf-8")
+
+
+def column_wise(df, primary_key_name):
+    for record_id, record in _dataframe_records(df, primary_key_name):
+        yield (
+            b'{"action": "CREATE", "recordId": '
+            + json.dumps(record_id).encode("utf-8")
+            + b', "record": '
+            + record
+            + b"}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=10)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.columns)
+    print(f"{'serialization':<16}{'rows/s':>12}{'speedup':>10}")
+    baseline = None
+    for name, serialize in [("row-wise", row_wise), ("column-wise", column_wise)]:
+        start = time.perf_counter()
+        for _ in serialize(df, "pk"):
+            pass
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{name:<16}{args.rows / seconds:>12,.0f}{baseline / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
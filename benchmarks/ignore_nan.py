@@ -0,0 +1,90 @@
+"""Benchmark encoding float-heavy records with non-finite floats encoded as `null`
+
+Compares the pure Python encoder previously used by `IgnoreNanEncoder`,
+the C accelerated path now used by `IgnoreNanEncoder`, the JSON codecs with `ignore_nan=True`,
+and the standard library C encoder on records without non-finite floats (best case).
+
+Usage::
+
+    poetry run python benchmarks/ignore_nan.py [--records N] [--columns N] [--nan-fraction F]
+"""
+import argparse
+import json
+import math
+import random
+import time
+
+from tamr_unify_client import _codec
+from tamr_unify_client._ignore_nan_encoder import IgnoreNanEncoder
+
+
+def make_records(n, columns, nan_fraction, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        record = {"pk": str(i)}
+        for c in range(columns):
+            record[f"f{c}"] = math.nan if rng.random() < nan_fraction else rng.random()
+        records.append(record)
+    return records
+
+
+def pure_python(record, _encoder=IgnoreNanEncoder()):
+    # incremental encoding always takes the pure Python path
+    return "".join(_encoder.iterencode(record))
+
+
+def c_accelerated(record):
+    return json.dumps(record, cls=IgnoreNanEncoder)
+
+
+def codec(name):
+    dumps = _codec.get(name).dumps
+    return lambda record: dumps(record, ignore_nan=True)
+
+
+def stdlib(record):
+    return json.dumps(record)
+
+
+def run(encode, records, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for record in records:
+            encode(record)
+        best = min(best, time.perf_counter() - start)
+    return len(records) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--nan-fraction", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.columns, args.nan_fraction)
+    finite = make_records(args.records, args.columns, 0.0)
+    for record in records[:100]:
+        assert pure_python(record) == c_accelerated(record)
+
+    baseline = run(pure_python, records, args.repeat)
+    print(f"{'encoder':<36}{'records/s':>12}{'speedup':>10}")
+    benchmarks = [
+        ("pure Python (previous)", pure_python, records),
+        ("C accelerated", c_accelerated, records),
+        ("C accelerated, no NaN", c_accelerated, finite),
+        ("json codec, ignore_nan=True", codec("json"), records),
+        ("stdlib json.dumps, no NaN", stdlib, finite),
+    ]
+    if "orjson" in _codec._registry:
+        benchmarks.append(("orjson codec, ignore_nan=True", codec("orjson"), records))
+    for name, encode, data in benchmarks:
+        rate = baseline if encode is pure_python else run(encode, data, args.repeat)
+        print(f"{name:<36}{rate:>12,.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark the memory held by streamed records with repeated values
+
+Compares holding records parsed by `tamr_client.response.ndjson` against records whose
+repeated attributes are interned via its `intern` option, for records shaped like a
+unified dataset: a few source names, and clusters of several records each.
+
+Usage::
+
+    TAMR_CLIENT_BETA=1 poetry run python benchmarks/intern.py [--records N] [--cluster-size N]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+import tamr_client as tc
+from tamr_client import response
+
+_INTERNED = ["origin_source_name", "persistentId", "category"]
+
+
+def make_lines(records, cluster_size):
+    for i in range(records):
+        r = {
+            "origin_entity_id": str(i),
+            "origin_source_name": [f"source_{i % 5}"],
+            "persistentId": f"cluster_{i // cluster_size:012d}",
+            "category": ["Parts", "Electrical", f"Category {i % 50}"],
+            "name": [f"name {i}"],
+        }
+        yield json.dumps(r).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--cluster-size", type=int, default=4)
+    args = parser.parse_args()
+
+    loads = tc.codec.default().loads
+    print(
+        f"{'records':<10}{'records/s':>12}{'MiB':>10}{'saved MiB':>12}{'reported':>10}"
+    )
+    baseline = None
+    for name in ["parsed", "interned"]:
+        stats = tc.InternStats()
+        parse = loads
+        if name == "interned":
+            parse = response._interning(loads, _INTERNED, stats)
+        tracemalloc.start()
+        start = time.perf_counter()
+        records = list(map(parse, make_lines(args.records, args.cluster_size)))
+        seconds = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del records
+        baseline = baseline or size
+        print(
+            f"{name:<10}{args.records / seconds:>12,.0f}{size / 2 ** 20:>10.1f}"
+            f"{(baseline - size) / 2 ** 20:>12.1f}{stats.bytes_saved / 2 ** 20:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
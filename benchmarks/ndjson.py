@@ -0,0 +1,88 @@
+"""Benchmark reading newline-delimited JSON record streams
+
+Compares the previous reader, which parses each line of
+:func:`requests.Response.iter_lines` (512 byte reads), against the batched reader
+used by `Dataset.records` and `tamr_client.response.ndjson`, for each JSON codec.
+Bodies are read from memory, so network reads and system calls are not included.
+
+Usage::
+
+    poetry run python benchmarks/ndjson.py [--records N] [--chunk-size BYTES]
+"""
+import argparse
+import io
+import json
+import math
+import time
+
+import requests
+
+from tamr_unify_client import _codec, _ndjson
+
+
+def make_body(n):
+    lines = []
+    for i in range(n):
+        record = {
+            "id": [str(i)],
+            "name": [f"Customer {i}"],
+            "address": [f"{i} Main Street", "Boston, MA"],
+            "revenue": [str(i * 1.5)],
+        }
+        lines.append(json.dumps(record))
+    return "\n".join(lines).encode("utf-8")
+
+
+def response(body):
+    r = requests.Response()
+    r.raw = io.BytesIO(body)
+    r.status_code = 200
+    return r
+
+
+def iter_lines(body, loads, chunk_size):
+    return sum(1 for line in response(body).iter_lines() for _ in [loads(line)])
+
+
+def batched(body, loads, chunk_size):
+    return sum(1 for _ in _ndjson.parse(response(body), loads, chunk_size))
+
+
+def run(read, body, loads, chunk_size, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read(body, loads, chunk_size)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=_ndjson.CHUNK_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = make_body(args.records)
+    print(f"{'codec':<8}{'reader':<24}{'records/s':>12}{'MB/s':>8}{'speedup':>9}")
+    # "none" reads lines without parsing them, to measure the readers alone
+    decoders = [("none", bytes)]
+    decoders += [(name, _codec.get(name).loads) for name in _codec._registry]
+    for name, loads in decoders:
+        assert batched(body, loads, args.chunk_size) == args.records
+        baseline = None
+        for reader_name, read in [
+            ("iter_lines", iter_lines),
+            (f"batched ({args.chunk_size} B)", batched),
+        ]:
+            seconds = run(read, body, loads, args.chunk_size, args.repeat)
+            baseline = baseline or seconds
+            print(
+                f"{name:<8}{reader_name:<24}{args.records / seconds:>12,.0f}"
+                f"{len(body) / 1e6 / seconds:>8.1f}{baseline / seconds:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
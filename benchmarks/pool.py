@@ -0,0 +1,115 @@
+"""Benchmark connection reuse under concurrent requests
+
+Sends rounds of concurrent requests, one per thread of a pool, through a
+`tamr_unify_client.Client` to a local HTTP/1.1 server, with the default connection pool, a pool sized for the threads, and a
+blocking pool. The server delays each new connection to simulate the cost of a TCP and
+TLS handshake with a remote server. Reports throughput, the connections opened by the
+server, and the connections discarded by the client because its pool was full.
+
+Usage::
+
+    poetry run python benchmarks/pool.py [--requests N] [--workers N] [--latency-ms N]
+        [--handshake-ms N]
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+import threading
+import time
+
+from tamr_unify_client import Client
+from tamr_unify_client.auth import TokenAuth
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+    handshake = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with Handler.lock:
+            Handler.connections += 1
+        time.sleep(self.handshake)
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Discarded(logging.Handler):
+    """Count the connections discarded by urllib3 because their pool was full"""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        if "Connection pool is full" in record.getMessage():
+            self.count += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--handshake-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    Handler.latency = args.latency_ms / 1000
+    Handler.handshake = args.handshake_ms / 1000
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    discarded = Discarded()
+    logger = logging.getLogger("urllib3.connectionpool")
+    logger.addHandler(discarded)
+    logger.propagate = False
+
+    configs = [
+        ("default", {}),
+        ("sized", {"pool_maxsize": args.workers}),
+        ("blocking", {"pool_block": True}),
+    ]
+    print(
+        f"{'pool':<10}{'requests/s':>12}{'opened':>8}{'discarded':>11}"
+        f"{'reuse':>8}{'speedup':>9}"
+    )
+    requests = args.requests // args.workers * args.workers
+    baseline = None
+    for name, options in configs:
+        client = Client(
+            TokenAuth("token"), port=server.server_port, base_path="/", **options
+        )
+        Handler.connections = discarded.count = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.workers) as pool:
+            for _ in range(args.requests // args.workers):
+                for r in pool.map(lambda _: client.get("ping"), range(args.workers)):
+                    r.raise_for_status()
+        seconds = time.perf_counter() - start
+        client.session.close()
+        baseline = baseline or seconds
+        print(
+            f"{name:<10}{requests / seconds:>12,.0f}{Handler.connections:>8}"
+            f"{discarded.count:>11}{requests / Handler.connections:>8.1f}"
+            f"{baseline / seconds:>8.1f}x"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark reading a few columns of a wide dataset
+
+Compares reading whole records, and parsing whole records then selecting columns, against
+the column projection used by `Dataset.records(columns=...)` and
+`tamr_client.record.stream(columns=...)`, for each registered JSON codec.
+Reports throughput and the peak memory of the records read.
+
+Usage::
+
+    poetry run python benchmarks/projection.py [--rows N] [--attributes N] [--columns N]
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from tamr_unify_client import _codec, _ndjson
+
+
+def make_lines(rows, attributes, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for i in range(rows):
+        record = {"pk": str(i)}
+        for a in range(attributes):
+            record[f"attribute{a}"] = [f"value {rng.random()}"] if a % 2 else None
+        lines.append(json.dumps(record).encode("utf-8"))
+    return lines
+
+
+def read_all(codec, lines, columns):
+    return list(map(codec.loads, lines))
+
+
+def read_selected(codec, lines, columns):
+    records = []
+    for line in lines:
+        record = codec.loads(line)
+        records.append({name: record[name] for name in columns if name in record})
+    return records
+
+
+def read_projected(codec, lines, columns):
+    return list(map(_ndjson.projection(codec.loads, columns), lines))
+
+
+def measure(read, codec, lines, columns):
+    start = time.perf_counter()
+    read(codec, lines, columns)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    read(codec, lines, columns)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--attributes", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = make_lines(args.rows, args.attributes)
+    columns = ["pk"] + [f"attribute{a}" for a in range(1, 2 * args.columns - 2, 2)]
+    print(f"{'codec':<10}{'read':<12}{'records/s':>12}{'peak MiB':>10}{'speedup':>10}")
+    for name in _codec._registry:
+        codec = _codec.get(name)
+        baseline = None
+        for label, read in [
+            ("all", read_all),
+            ("selected", read_selected),
+            ("projected", read_projected),
+        ]:
+            seconds, peak = measure(read, codec, lines, columns)
+            baseline = baseline or seconds
+            print(
+                f"{name:<10}{label:<12}{args.rows / seconds:>12,.0f}"
+                f"{peak / 2 ** 20:>10.1f}{baseline / seconds:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
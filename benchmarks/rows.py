@@ -0,0 +1,63 @@
+"""Benchmark the memory held by streamed records
+
+Compares the dictionaries yielded by `tamr_client.record.stream` against the compact rows
+yielded by `tamr_client.record.stream_rows`, holding all records of a dataset in memory.
+
+Usage::
+
+    TAMR_CLIENT_BETA=1 poetry run python benchmarks/rows.py [--records N] [--attributes N]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+import tamr_client as tc
+from tamr_client.dataset import record
+
+
+def make_lines(records, attributes):
+    for i in range(records):
+        r = {"pk": str(i)}
+        for a in range(attributes):
+            r[f"attribute{a}"] = [f"value {i}"] if a % 2 else None
+        yield json.dumps(r).encode("utf-8")
+
+
+def read_dicts(lines, keys):
+    return list(map(tc.codec.default().loads, lines))
+
+
+def read_rows(lines, keys):
+    row_type = record._row_type(keys)
+    return [
+        row_type(tuple(map(r.get, keys))) for r in map(tc.codec.default().loads, lines)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--attributes", type=int, default=10)
+    args = parser.parse_args()
+
+    keys = ("pk",) + tuple(f"attribute{a}" for a in range(args.attributes))
+    print(f"{'type':<10}{'records/s':>12}{'MiB':>10}{'bytes/record':>14}{'saved':>8}")
+    baseline = None
+    for name, read in [("dicts", read_dicts), ("rows", read_rows)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        records = read(make_lines(args.records, args.attributes), keys)
+        seconds = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del records
+        baseline = baseline or size
+        print(
+            f"{name:<10}{args.records / seconds:>12,.0f}{size / 2 ** 20:>10.1f}"
+            f"{size / args.records:>14,.0f}{1 - size / baseline:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,45 @@
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, overload, Tuple, Union
 
 JsonDict = Dict[str, Any]
 
+NA: Any
+
+def concat(objs: List[DataFrame], ignore_index: bool = ...) -> DataFrame: ...
+
 class DataFrame:
     index: Index
     columns: Index
+    iloc: _ILocIndexer
+    dtypes: Series
     def __init__(
-        self, data: Optional[List[JsonDict]] = None, index: Optional[List[int]] = None
+        self,
+        data: Union[List[JsonDict], Dict[str, Series], None] = None,
+        index: Optional[List[int]] = None,
     ): ...
     def drop(self, labels: str, axis: int, inplace: bool): ...
     def insert(self, loc: int, column: str, value: Index): ...
     def iterrows(self) -> Iterator[Tuple[int, Series]]: ...
     def set_index(self, keys: str) -> DataFrame: ...
+    def reset_index(self) -> DataFrame: ...
+    def to_json(self, orient: str, lines: bool) -> str: ...
+    @overload
+    def __getitem__(self, key: str) -> Series: ...
+    @overload
+    def __getitem__(self, key: List[str]) -> DataFrame: ...
+    def __len__(self) -> int: ...
+
+class _ILocIndexer:
+    def __getitem__(self, key: slice) -> DataFrame: ...
 
 class Series:
+    dtype: Any
+    cat: Any
+    def __init__(
+        self, data: Optional[List[Any]] = None, dtype: Optional[str] = None
+    ): ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def isna(self) -> Series: ...
+    def tolist(self) -> List[Any]: ...
     def to_json(self) -> str: ...
 
 class Index:
@@ -0,0 +1,48 @@
+from typing import Any, Iterator, List, Optional
+
+class DataType: ...
+
+class ListType(DataType):
+    value_type: DataType
+
+class MapType(DataType):
+    key_type: DataType
+    item_type: DataType
+
+class StructType(DataType):
+    def __iter__(self) -> Iterator[Field]: ...
+
+class Field:
+    name: str
+    type: DataType
+    nullable: bool
+
+class Schema:
+    names: List[str]
+    def __iter__(self) -> Iterator[Field]: ...
+    def field(self, name: str) -> Field: ...
+
+class Array:
+    def to_pylist(self) -> List[Any]: ...
+
+class RecordBatch:
+    schema: Schema
+    num_rows: int
+    nbytes: int
+    @staticmethod
+    def from_pylist(
+        mapping: List[Any], schema: Optional[Schema] = None
+    ) -> RecordBatch: ...
+    def column(self, i: int) -> Array: ...
+    def to_pylist(self) -> List[Any]: ...
+
+def bool_() -> DataType: ...
+def float64() -> DataType: ...
+def int32() -> DataType: ...
+def int64() -> DataType: ...
+def string() -> DataType: ...
+def list_(value_type: DataType) -> ListType: ...
+def map_(key_type: DataType, item_type: DataType) -> MapType: ...
+def struct(fields: List[Field]) -> StructType: ...
+def field(name: str, type: DataType, nullable: bool = True) -> Field: ...
+def schema(fields: List[Field]) -> Schema: ...
@@ -0,0 +1,16 @@
+from typing import Any
+
+from pyarrow import RecordBatch, Schema
+
+class ParquetWriter:
+    def __init__(self, where: str, schema: Schema, compression: str = ...): ...
+    def write_batch(self, batch: RecordBatch): ...
+    def close(self): ...
+
+def read_table(source: str) -> Any: ...
+
+class ParquetFile:
+    num_row_groups: int
+    metadata: Any
+    def __init__(self, source: str): ...
+    def read_row_group(self, i: int) -> Any: ...
@@ -1,3 +1,4 @@
 from typing import Any
 
 def raises(expected_exception: Any): ...
+def importorskip(modname: str) -> Any: ...
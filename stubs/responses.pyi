@@ -1,5 +1,5 @@
 from functools import partial
-from typing import Any, Callable, ContextManager, Dict, Optional
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Union
 
 JsonDict = Dict[str, Any]
 
@@ -11,10 +11,17 @@ PUT: str
 def add(
     method: Optional[str] = None,
     url: Optional[str] = None,
-    body: Optional[str] = None,
+    body: Optional[Union[str, Exception]] = None,
     status: Optional[int] = None,
-    json: Optional[JsonDict] = None,
+    json: Optional[Union[JsonDict, List[Any]]] = None,
 ): ...
 def activate(Callable) -> Callable: ...
-def add_callback(method: Optional[str], url: Optional[str], callback: partial[Any]): ...
+def add_callback(
+    method: Optional[str],
+    url: Optional[str],
+    callback: Union[partial[Any], Callable[..., Any]],
+): ...
+
+calls: List[Any]
+
 def RequestsMock() -> ContextManager[Any]: ...
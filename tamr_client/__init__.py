@@ -18,28 +18,47 @@ _beta.check()
 
 from tamr_client._types import (
     AnyDataset,
+    AnyPollStrategy,
     Attribute,
     AttributeMapping,
     AttributeType,
+    BackoffPoll,
     Backup,
     CategorizationProject,
+    Codec,
     Dataset,
+    EstimatedPoll,
+    ExportManifest,
+    ExportShard,
+    FixedPoll,
     GoldenRecordsProject,
+    IngestProgress,
     InputTransformation,
     Instance,
+    InternStats,
     JwtTokenAuth,
     MasteringProject,
     Operation,
+    PollStrategy,
+    PoolStats,
+    PrefetchStats,
     Project,
     Restore,
+    Retry,
+    RetryStats,
+    Row,
     SchemaMappingProject,
     Session,
     SubAttribute,
+    Timeout,
+    TokenCache,
     Transformations,
     UnifiedDataset,
     UnknownProject,
+    UploadOptions,
     URL,
     UsernamePasswordAuth,
+    WaitStats,
 )
 
 # functionality
@@ -48,6 +67,7 @@ from tamr_client._types import (
 from tamr_client import attribute
 from tamr_client import backup
 from tamr_client import categorization
+from tamr_client import codec
 from tamr_client import dataset
 from tamr_client import golden_records
 from tamr_client import instance
@@ -59,6 +79,7 @@ from tamr_client import response
 from tamr_client import restore
 from tamr_client import schema_mapping
 from tamr_client import session
+from tamr_client import timeout
 from tamr_client import transformations
 from tamr_client.dataset import dataframe
 from tamr_client.dataset import record
@@ -17,10 +17,24 @@ from tamr_client._types.attribute import (
 )
 from tamr_client._types.auth import JwtTokenAuth, UsernamePasswordAuth
 from tamr_client._types.backup import Backup
+from tamr_client._types.codec import Codec
 from tamr_client._types.dataset import AnyDataset, Dataset, UnifiedDataset
+from tamr_client._types.export import ExportManifest, ExportShard
+from tamr_client._types.ingest import IngestProgress
 from tamr_client._types.instance import Instance
+from tamr_client._types.intern import InternStats
 from tamr_client._types.json import JsonDict
 from tamr_client._types.operation import Operation
+from tamr_client._types.poll import (
+    AnyPollStrategy,
+    BackoffPoll,
+    EstimatedPoll,
+    FixedPoll,
+    PollStrategy,
+    WaitStats,
+)
+from tamr_client._types.pool import PoolStats
+from tamr_client._types.prefetch import PrefetchStats
 from tamr_client._types.project import (
     AttributeMapping,
     CategorizationProject,
@@ -31,6 +45,11 @@ from tamr_client._types.project import (
     UnknownProject,
 )
 from tamr_client._types.restore import Restore
+from tamr_client._types.retry import Retry, RetryStats
+from tamr_client._types.row import Row
 from tamr_client._types.session import Session
+from tamr_client._types.timeout import Timeout
+from tamr_client._types.token_cache import TokenCache
 from tamr_client._types.transformations import InputTransformation, Transformations
+from tamr_client._types.upload import UploadOptions
 from tamr_client._types.url import URL
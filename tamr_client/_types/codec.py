@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A JSON codec for encoding and decoding records
+
+    See :mod:`tamr_client.codec` for the available codecs.
+
+    Args:
+        name: Name under which the codec is registered
+        dumps: Serializes a JSON-compatible object to UTF-8 encoded bytes.
+            Non-finite floats must be encoded as ``NaN``, ``Infinity`` and ``-Infinity``,
+            like the standard library :func:`json.dumps` does
+        loads: Deserializes a JSON document from bytes or a string
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ExportShard:
+    """A file written by a dataset export
+
+    Args:
+        path: Name of the file, relative to the export directory
+        rows: Number of records in the file
+        bytes: Size of the file
+        sha256: SHA-256 checksum of the file, as a hexadecimal string
+    """
+
+    path: str
+    rows: int
+    bytes: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class ExportManifest:
+    """Description of the files written by a dataset export
+
+    Args:
+        dataset_name: Name of the exported dataset
+        format: File format e.g. ``"parquet"``
+        shards: Files written, in the order of the exported records
+    """
+
+    dataset_name: str
+    format: str
+    shards: Tuple[ExportShard, ...]
+
+    @property
+    def rows(self) -> int:
+        """Total number of records exported"""
+        return sum(shard.rows for shard in self.shards)
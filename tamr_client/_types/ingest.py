@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class IngestProgress:
+    """Progress of the ingestion of a file into a dataset
+
+    Args:
+        path: Path of the file
+        records: Number of records read from the file and handed to the upload so far
+        bytes_read: Number of bytes of the file read so far
+        total_bytes: Size of the file
+        done: Whether all records of the file were uploaded
+    """
+
+    path: str
+    records: int
+    bytes_read: int
+    total_bytes: int
+    done: bool = False
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the file read so far, from 0 to 1"""
+        if self.total_bytes == 0:
+            return 1.0
+        return min(self.bytes_read / self.total_bytes, 1.0)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class InternStats:
+    """Statistics of string interning in a record stream
+
+    Like :class:`~tamr_client.PrefetchStats`, these statistics are updated in place while
+    the stream is consumed.
+
+    Args:
+        strings: Number of strings read from the interned attributes
+        unique: Number of distinct strings kept, each shared by all of its repeats
+        bytes_saved: Total size (in bytes) of the repeated strings that were replaced by
+            a shared string, i.e. the memory saved while the records are held
+    """
+
+    strings: int = 0
+    unique: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def repeats(self) -> int:
+        """Number of strings replaced by a shared string"""
+        return self.strings - self.unique
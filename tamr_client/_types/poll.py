@@ -0,0 +1,128 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Union
+
+from tamr_client._types.operation import Operation
+
+
+class PollStrategy(ABC):
+    """Strategy for the delays between polls of an operation, see
+    :func:`~tamr_client.operation.wait`
+
+    Subclass to plug in a strategy other than :class:`~tamr_client.FixedPoll`,
+    :class:`~tamr_client.BackoffPoll` and :class:`~tamr_client.EstimatedPoll`.
+    """
+
+    @abstractmethod
+    def delay(self, operation: Operation, polls: int) -> float:
+        """Delay (in seconds) before the next poll of an unresolved operation
+
+        Args:
+            operation: Operation, as of the last poll
+            polls: Number of polls made so far while waiting for the operation
+        """
+
+    def observe(self, operation: Operation):
+        """Called with each operation once it is resolved, e.g. to learn its duration
+
+        Args:
+            operation: Resolved operation
+        """
+        pass
+
+
+@dataclass(frozen=True)
+class FixedPoll:
+    """Poll at a fixed interval
+
+    Args:
+        interval: Delay (in seconds) between polls
+    """
+
+    interval: float = 3.0
+
+
+@dataclass(frozen=True)
+class BackoffPoll:
+    """Poll at a delay that grows exponentially, so that short operations resolve quickly
+    while long operations are polled rarely
+
+    Args:
+        backoff: Delay (in seconds) before the first poll
+        factor: Factor by which the delay grows after each poll
+        backoff_max: Maximum delay (in seconds) between polls
+        jitter: Fraction of each delay that is randomized, from 0 (no randomization) to
+            1 (any delay up to the backoff), so that many waits do not poll in lockstep
+    """
+
+    backoff: float = 0.5
+    factor: float = 2.0
+    backoff_max: float = 30.0
+    jitter: float = 0.2
+
+
+@dataclass
+class EstimatedPoll:
+    """Poll shortly after an operation is expected to resolve, estimated from its
+    ``startTime`` and from the durations of the previous operations of the same type
+
+    The durations of operations are learned as they resolve, so share one instance between
+    waits, e.g. for all operations of a pipeline. Estimates assume that the clocks of the
+    client and of the server agree. Operations of a type not seen yet,
+    operations that have not started and operations that take longer than estimated are
+    polled according to `fallback`. See :func:`~tamr_client.operation.remaining`.
+
+    Args:
+        fallback: Strategy when no estimate is available
+        margin: Time (in seconds) after the estimated end of an operation to poll it
+        interval_max: Maximum delay (in seconds) between polls, after which the end of an
+            operation is estimated again
+        history: Number of previous durations of each type of operation to estimate from
+        durations: Previous durations (in seconds) of operations, by type
+    """
+
+    fallback: "AnyPollStrategy" = field(default_factory=BackoffPoll)
+    margin: float = 0.5
+    interval_max: float = 60.0
+    history: int = 20
+    durations: Dict[str, Deque[float]] = field(default_factory=dict)
+
+
+AnyPollStrategy = Union[FixedPoll, BackoffPoll, EstimatedPoll, PollStrategy]
+
+
+@dataclass
+class WaitStats:
+    """Statistics of waits for operations, to measure the tradeoff between the latency of
+    waits and the load of their polls on the server
+
+    Like :class:`~tamr_client.RetryStats`, these statistics are updated in place while
+    waiting for operations.
+
+    Args:
+        waits: Number of waits for operations that resolved
+        polls: Number of polls
+        wait_seconds: Total time spent waiting
+        ended: Number of waits for operations with an ``endTime``, whose lateness is known
+        late_seconds: Total time between the end of operations and the polls that observed
+            their end. Only waits that polled operations with an ``endTime`` are counted
+        max_late_seconds: Longest time between the end of an operation and the poll that
+            observed it
+    """
+
+    waits: int = 0
+    polls: int = 0
+    wait_seconds: float = 0.0
+    ended: int = 0
+    late_seconds: float = 0.0
+    max_late_seconds: float = 0.0
+
+    @property
+    def polls_per_wait(self) -> float:
+        """Average number of polls of each wait"""
+        return self.polls / self.waits if self.waits else 0.0
+
+    @property
+    def mean_late_seconds(self) -> float:
+        """Average time between the end of an operation and the poll that observed it"""
+        return self.late_seconds / self.ended if self.ended else 0.0
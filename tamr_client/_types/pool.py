@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of the connection pools of a session
+
+    Unlike :class:`~tamr_client.PrefetchStats`, these statistics are not updated in place:
+    get a new snapshot with :func:`tamr_client.session.pool_stats`.
+
+    Args:
+        pools: Number of connection pools, one per host
+        maxsize: Total number of connections kept by the pools for reuse
+        in_use: Number of connections currently checked out of the pools by requests
+        idle: Number of open connections waiting in the pools to be reused
+        connections: Number of connections opened so far
+        requests: Number of requests sent so far
+    """
+
+    pools: int = 0
+    maxsize: int = 0
+    in_use: int = 0
+    idle: int = 0
+    connections: int = 0
+    requests: int = 0
+
+    @property
+    def requests_per_connection(self) -> float:
+        """Average number of requests sent over each opened connection.
+        Close to 1 when connections are not reused, e.g. because the pools are too small
+        for the number of concurrent requests
+        """
+        return self.requests / self.connections if self.connections else 0.0
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class PrefetchStats:
+    """Statistics of a prefetching record stream
+
+    Unlike other types, these statistics are updated in place while the stream is consumed.
+
+    Args:
+        capacity: Maximum number of line batches held in the queue
+        batches: Number of line batches read so far
+        depth: Number of line batches currently in the queue
+        max_depth: Largest number of line batches held in the queue at once
+        reader_waits: Number of times the reader waited because the queue was full
+        reader_wait_seconds: Total time the reader waited for the consumer
+        consumer_waits: Number of times the consumer waited because the queue was empty
+        consumer_wait_seconds: Total time the consumer waited for the reader
+    """
+
+    capacity: int = 0
+    batches: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    reader_waits: int = 0
+    reader_wait_seconds: float = 0.0
+    consumer_waits: int = 0
+    consumer_wait_seconds: float = 0.0
+
+    @property
+    def bottleneck(self) -> Optional[str]:
+        """Whether the ``"reader"`` or the ``"consumer"`` is the bottleneck, based on which
+        side waited less for the other. `None` before any side waited
+        """
+        if self.reader_wait_seconds == self.consumer_wait_seconds == 0:
+            return None
+        if self.consumer_wait_seconds >= self.reader_wait_seconds:
+            return "reader"
+        return "consumer"
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+import threading
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Retry:
+    """Policy for retrying requests that failed transiently
+
+    Requests are retried on connection errors (e.g. a connection reset by a proxy), on
+    timeouts (see :class:`~tamr_client.Timeout`) and on responses with a retryable status
+    (e.g. ``503 Service Unavailable``), after a delay that doubles at each retry.
+    Only requests of an idempotent method are retried, unless the request was never sent,
+    e.g. because the connection was refused or timed out, or unless it is known to be idempotent, e.g. a batch of record updates.
+    Requests whose body is a stream (e.g. a generator) cannot be replayed, so are not retried.
+
+    Args:
+        total: Maximum number of retries of each request
+        backoff: Delay (in seconds) before the first retry
+        backoff_max: Maximum delay (in seconds) before a retry, including the delay
+            requested by a ``Retry-After`` header
+        jitter: Fraction of each delay that is randomized, from 0 (no randomization) to
+            1 (any delay up to the backoff), so that clients do not retry in lockstep
+        statuses: Response statuses that are retried
+        methods: HTTP methods whose requests are retried
+        budget: Maximum number of retries over all requests sharing the same
+            :class:`~tamr_client.RetryStats`, e.g. of a session, so that retries stop
+            when a server is persistently failing. By default retries are not limited
+    """
+
+    total: int = 3
+    backoff: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 0.5
+    statuses: Tuple[int, ...] = (502, 503, 504)
+    methods: Tuple[str, ...] = ("DELETE", "GET", "HEAD", "OPTIONS", "PUT")
+    budget: Optional[int] = None
+
+
+@dataclass
+class RetryStats:
+    """Statistics of retried requests
+
+    Like :class:`~tamr_client.PrefetchStats`, these statistics are updated in place while
+    requests are sent, including by concurrent requests of several threads.
+
+    Args:
+        requests: Number of requests sent, not counting retries
+        retries: Number of retries
+        retried: Number of requests that were retried at least once
+        exhausted: Number of requests that still failed when no retries were left
+        wait_seconds: Total time spent waiting before retries
+        reasons: Number of retries by reason, either a response status e.g. ``"503"``
+            or an exception type e.g. ``"ConnectionError"`` or ``"ReadTimeout"``
+    """
+
+    requests: int = 0
+    retries: int = 0
+    retried: int = 0
+    exhausted: int = 0
+    wait_seconds: float = 0.0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    # guards the updates of the statistics by concurrent requests
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
@@ -0,0 +1,37 @@
+from typing import Any, ClassVar, Dict, Iterator, Mapping, Tuple
+
+
+class Row(Mapping[str, Any]):
+    """A record stored compactly as a tuple of values
+
+    Each dataset gets its own subclass, whose attribute names are shared by all of its rows,
+    so that a row only holds its values instead of repeating every key like a dictionary.
+    Rows are read-only mappings from attribute name to value, and compare equal to
+    dictionaries with the same items.
+
+    Args:
+        values: Value of each attribute, in the order of the attribute names of the class
+    """
+
+    __slots__ = ("_values",)
+
+    _keys: ClassVar[Tuple[str, ...]] = ()
+    _index: ClassVar[Dict[str, int]] = {}
+
+    def __init__(self, values: Tuple[Any, ...]):
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(zip(self._keys, self._values))!r})"
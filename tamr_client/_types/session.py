@@ -1,52 +1,45 @@
-from typing import Optional, Union
+import threading
+from typing import Callable, Optional, Union
 
 import requests
 
 from tamr_client._types.auth import JwtTokenAuth, UsernamePasswordAuth
+from tamr_client._types.codec import Codec
+from tamr_client._types.retry import Retry, RetryStats
+from tamr_client._types.timeout import Timeout
+from tamr_client._types.token_cache import TokenCache
 
 
 class Session(requests.Session):
     def __init__(self):
         super(self.__class__, self).__init__()
         self._stored_auth: Optional[Union[UsernamePasswordAuth, JwtTokenAuth]] = None
+        self._codec: Optional[Codec] = None
+        self._retry: Optional[Retry] = None
+        self._retry_stats = RetryStats()
+        self._timeout: Optional[Timeout] = Timeout()
+        self._auth_token: Optional[str] = None
+        self._auth_token_expiry: Optional[float] = None
+        # time the auth token was obtained by logging in, if known
+        self._auth_token_time: Optional[float] = None
+        self._token_cache: Optional[TokenCache] = None
+        # serializes logins, so that threads rejected at once log in only once
+        self._auth_lock = threading.RLock()
+        self._logins = 0
+        # sends the requests of the session, see :func:`tamr_client.session.from_auth`
+        self._send_request: Optional[Callable[..., requests.Response]] = None
 
-    def request(self, *args, **kwargs):
+    def request(
+        self,
+        *args,
+        idempotent: Optional[bool] = None,
+        profile: Optional[str] = None,
+        **kwargs,
+    ):
         # signature of `requests` requires not naming positional args
-        response = super(self.__class__, self).request(*args, **kwargs)
-        if response.status_code == 401 and "credentials" in response.text.lower():
-            first_response = response
-            self._set_auth_cookie(args[1])
-            response = super(self.__class__, self).request(*args, **kwargs)
-            if response.status_code == 401 and "credentials" in response.text.lower():
-                # Login credentials are bad, return original response
-                response = first_response
-        return response
-
-    def _set_auth_cookie(self, parent_url: str):
-        """Fetch and store an auth token for the given client configuration"""
-        # No-op if _stored_auth is None
-        if self._stored_auth is None:
-            return
-
-        # Fetch auth token and store as cookie
-        socket_address = parent_url.split("/api/")[0]
-        if not isinstance(self._stored_auth, UsernamePasswordAuth):
-            raise TypeError(
-                "Auth cookie only supported for UsernamePasswordAuth authentication"
-            )
-        r = self.post(
-            socket_address + "/api/versioned/v1/instance:login",
-            json={
-                "username": self._stored_auth.username,
-                "password": self._stored_auth.password,
-            },
+        send = super(self.__class__, self).request
+        if self._send_request is None:
+            return send(*args, **kwargs)
+        return self._send_request(
+            self, send, *args, idempotent=idempotent, profile=profile, **kwargs
         )
-        if r.status_code == 200:
-            auth_token = r.json()["token"]
-            self.cookies.set("authToken", auth_token)  # TODO: Set domain for security
-            # Clear session auth if cookie is retrieved
-            self.auth = None
-        else:
-            # Set session auth from client auth in case it has been cleared
-            # Allow the following call to pass credentials in header
-            self.auth = self._stored_auth
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Policy for timing out requests, so that a half-open connection does not hang forever
+
+    Each request has a connect timeout, and a read timeout that depends on its profile:
+    requests for metadata (e.g. to get a dataset), record streams (e.g. to stream or upsert
+    records) and polls of operations. A read timeout bounds the time waiting for the server
+    to send any data, not the total time of a request: a record stream can take hours,
+    as long as it does not stall. Set a timeout to `None` to wait forever.
+
+    Args:
+        connect: Time (in seconds) to establish a connection
+        read: Time (in seconds) to wait for data of the responses to metadata requests
+        stream: Time (in seconds) to wait for data of record streams, including the response
+            to a record upload while the server processes the records
+        poll: Time (in seconds) to wait for data of the responses to polls of operations
+    """
+
+    connect: Optional[float] = 10.0
+    read: Optional[float] = 60.0
+    stream: Optional[float] = 600.0
+    poll: Optional[float] = 30.0
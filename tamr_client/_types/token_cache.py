@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass(frozen=True)
+class TokenCache:
+    """File caching auth tokens, shared by the sessions of many processes
+
+    Tokens are cached by origin and username, with their expiration time if they are
+    JSON Web Tokens. Sessions reuse a cached token instead of logging in, and log in again
+    only when the token is rejected or about to expire. Concurrent logins are serialized by
+    locking the file ``<path>.lock``, so that processes rejected at once log in only once.
+
+    The file is only readable by its owner, but holds tokens in clear: store it on a local
+    file system, where other users cannot read it.
+
+    Args:
+        path: Path of the file
+    """
+
+    path: Union[str, Path]
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class UploadOptions:
+    """Options for sending record updates to a dataset, e.g. by :func:`~tamr_client.record.upsert`
+
+    By default, all updates are streamed to the server in a single request.
+    If `batch_size` or `batch_bytes` is specified, updates are instead split into batches
+    that are sent as sequential requests, so that a failure only costs the batch in flight.
+    With the retry policy of the session (see :func:`tamr_client.session.from_auth`),
+    a batch that failed transiently is sent again from memory, without restarting the updates.
+    Updates streamed in a single request cannot be replayed, so are not retried.
+
+    If `workers` is greater than 1, batches are sent concurrently over that many connections.
+    Updates are partitioned by record ID so that all updates to the same record are sent
+    by the same worker, in order.
+    The connection pool of the session should allow at least `workers` connections per host.
+
+    When streaming all updates in a single request, each update is sent as its own chunk
+    unless `buffer_size` is specified, in which case updates are packed into chunks of about
+    that size (e.g. 1 MiB).
+    Alternatively, `spool` writes all updates to a temporary file before sending them,
+    so that the request has a known `Content-Length` instead of using chunked encoding.
+
+    If `compression` is specified, request bodies are compressed incrementally as they are sent,
+    which reduces the bytes sent for repetitive records at the cost of CPU time.
+
+    Args:
+        batch_size: Maximum number of updates sent per request.
+            Defaults to 10,000 when sending with multiple workers
+        batch_bytes: Maximum size (in bytes) of the serialized updates sent per request.
+            An update larger than this limit is sent in a batch of its own
+        workers: Number of concurrent connections used to send batches
+        max_in_flight: Maximum number of batches held in memory (queued or being sent) at once
+            when sending with multiple workers. By default twice the number of workers
+        buffer_size: Size (in bytes) of the chunks sent when streaming updates in a single request
+        spool: Whether to spool updates to a temporary file when sending them in a single request
+        compression: Content encoding used to compress request bodies, either "gzip" or "deflate".
+            By default request bodies are not compressed
+        compression_level: Compression level, from 0 (no compression) to 9 (best compression)
+    """
+
+    batch_size: Optional[int] = None
+    batch_bytes: Optional[int] = None
+    workers: int = 1
+    max_in_flight: Optional[int] = None
+    buffer_size: Optional[int] = None
+    spool: bool = False
+    compression: Optional[str] = None
+    compression_level: int = 6
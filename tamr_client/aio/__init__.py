@@ -0,0 +1,32 @@
+"""
+Asynchronous counterparts of the core :mod:`tamr_client` modules, built on :mod:`asyncio`.
+
+Requires the `httpx` package. Functions take an :class:`~tamr_client.aio.AsyncSession`
+instead of a :class:`~tamr_client.Session` and are awaited, so that many API calls,
+operation waits and record streams can run concurrently on one connection pool
+without threads. Records are streamed with asynchronous generators.
+Resources are the same types as in :mod:`tamr_client`, and so are the exceptions raised,
+except that HTTP errors are raised as :class:`httpx.HTTPStatusError`.
+
+Example:
+    >>> import asyncio
+    >>> import tamr_client as tc
+    >>> from tamr_client import aio
+    >>> async def main():
+    ...     async with aio.session.from_auth(tc.UsernamePasswordAuth(...)) as s:
+    ...         datasets = await aio.dataset.get_all(s, tc.Instance())
+    ...         return await asyncio.gather(*(aio.dataset.attributes(s, d) for d in datasets))
+    >>> asyncio.run(main())
+"""
+from tamr_client.aio import (
+    attribute,
+    categorization,
+    dataset,
+    mastering,
+    operation,
+    project,
+    response,
+    session,
+)
+from tamr_client.aio.dataset import record
+from tamr_client.aio.session import AsyncSession
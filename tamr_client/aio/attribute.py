@@ -0,0 +1,185 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.attribute`
+
+See https://docs.tamr.com/reference/attribute-types
+"""
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from tamr_client._types import Attribute, AttributeType, JsonDict, UnifiedDataset, URL
+from tamr_client.aio import response
+from tamr_client.aio.session import AsyncSession
+from tamr_client.attribute import _attribute, type as attribute_type
+from tamr_client.attribute._attribute import (
+    AlreadyExists,
+    CannotCreateAttributesOnUnifiedDataset,
+    NotFound,
+    Parent,
+    ReservedName,
+)
+
+
+async def by_resource_id(session: AsyncSession, parent: Parent, id: str) -> Attribute:
+    """Get attribute by resource ID
+
+    Fetches attribute from Tamr server
+
+    Args:
+        parent: Dataset or project containing this attribute
+        id: Attribute ID
+
+    Raises:
+        attribute.NotFound: If no attribute could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    url = replace(parent.url, path=parent.url.path + f"/attributes/{id}")
+    return await _by_url(session, url)
+
+
+async def _by_url(session: AsyncSession, url: URL) -> Attribute:
+    """Get attribute by URL
+
+    Fetches attribute from Tamr server
+
+    Args:
+        url: Attribute URL
+
+    Raises:
+        attribute.NotFound: If no attribute could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.get(str(url))
+    if r.status_code == 404:
+        raise NotFound(str(url))
+    data = response.successful(r).json()
+    return _attribute._from_json(url, data)
+
+
+async def create(
+    session: AsyncSession,
+    parent: Parent,
+    *,
+    name: str,
+    is_nullable: bool,
+    type: AttributeType = attribute_type.DEFAULT,
+    description: Optional[str] = None,
+) -> Attribute:
+    """Create an attribute
+
+    Posts a creation request to the Tamr server
+
+    Args:
+        parent: Dataset or project that should contain the new attribute
+        name: Name for the new attribute
+        type: Attribute type for the new attribute
+        is_nullable: Determines if the new attribute can contain NULL values
+        description: Description of the new attribute
+
+    Returns:
+        The newly created attribute
+
+    Raises:
+        attribute.ReservedName: If attribute name is reserved.
+        attribute.AlreadyExists: If an attribute already exists at the specified URL.
+            Corresponds to a 409 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    if name in _attribute._RESERVED_NAMES:
+        raise ReservedName(name)
+
+    if isinstance(parent, UnifiedDataset):
+        raise CannotCreateAttributesOnUnifiedDataset(
+            "Attributes for unified datasets must be created as attributes of the "
+            "containing project"
+        )
+
+    attrs_url = replace(parent.url, path=parent.url.path + "/attributes")
+    url = replace(attrs_url, path=attrs_url.path + f"/{name}")
+
+    body = {
+        "name": name,
+        "type": attribute_type.to_json(type),
+        "isNullable": is_nullable,
+    }
+    if description is not None:
+        body["description"] = description
+
+    r = await session.post(str(attrs_url), json=body)
+    if r.status_code == 409:
+        raise AlreadyExists(str(url))
+    data = response.successful(r).json()
+
+    return _attribute._from_json(url, data)
+
+
+async def update(
+    session: AsyncSession, attribute: Attribute, *, description: Optional[str] = None
+) -> Attribute:
+    """Update an existing attribute
+
+    PUTS an update request to the Tamr server
+
+    Args:
+        attribute: Existing attribute to update
+        description: Updated description for the existing attribute
+
+    Returns:
+        The newly updated attribute
+
+    Raises:
+        attribute.NotFound: If no attribute could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    updates = {"description": description}
+    r = await session.put(str(attribute.url), json=updates)
+    if r.status_code == 404:
+        raise NotFound(str(attribute.url))
+    data = response.successful(r).json()
+    return _attribute._from_json(attribute.url, data)
+
+
+async def delete(session: AsyncSession, attribute: Attribute):
+    """Deletes an existing attribute
+
+    Sends a deletion request to the Tamr server
+
+    Args:
+        attribute: Existing attribute to delete
+
+    Raises:
+        attribute.NotFound: If no attribute could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.delete(str(attribute.url))
+    if r.status_code == 404:
+        raise NotFound(str(attribute.url))
+    response.successful(r)
+
+
+async def _get_all_from_parent(
+    session: AsyncSession, parent: Parent
+) -> Tuple[Attribute, ...]:
+    """Get all attributes belonging to a parent entity
+
+    Args:
+        parent: Entity to fetch attributes from
+
+    Returns:
+        The attributes for the specified parent
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered.
+    """
+    attrs_url = replace(parent.url, path=parent.url.path + "/attributes")
+    r = await session.get(str(attrs_url))
+    attrs_json = response.successful(r).json()
+
+    def attr_from_json(attr_json: JsonDict) -> Attribute:
+        attr_url = replace(attrs_url, path=attrs_url.path + f'/{attr_json["name"]}')
+        return _attribute._from_json(attr_url, attr_json)
+
+    return tuple(attr_from_json(attr_json) for attr_json in attrs_json)
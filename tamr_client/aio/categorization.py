@@ -0,0 +1,117 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.categorization`
+
+See https://docs.tamr.com/docs/overall-workflow-classification
+
+Each function waits for its operation to complete while letting other tasks run
+"""
+from typing import Optional
+
+from tamr_client._types import (
+    CategorizationProject,
+    Dataset,
+    Instance,
+    Operation,
+    Project,
+)
+from tamr_client.aio import operation, project as _project
+from tamr_client.aio.dataset import _dataset, unified
+from tamr_client.aio.session import AsyncSession
+
+
+async def create(
+    session: AsyncSession,
+    instance: Instance,
+    name: str,
+    description: Optional[str] = None,
+    external_id: Optional[str] = None,
+    unified_dataset_name: Optional[str] = None,
+) -> Project:
+    """Create a Categorization project in Tamr.
+
+    Args:
+        instance: Tamr instance
+        name: Project name
+        description: Project description
+        external_id: External ID of the project
+        unified_dataset_name: Unified dataset name. If None, will be set to project name + _'unified_dataset'
+
+    Returns:
+        Project created in Tamr
+
+    Raises:
+        project.AlreadyExists: If a project with these specifications already exists
+        httpx.HTTPStatusError: If any other HTTP error is encountered
+    """
+    return await _project._create(
+        session=session,
+        instance=instance,
+        name=name,
+        project_type="CATEGORIZATION",
+        description=description,
+        external_id=external_id,
+        unified_dataset_name=unified_dataset_name,
+    )
+
+
+async def manual_labels(
+    session: AsyncSession, project: CategorizationProject
+) -> Dataset:
+    """Get manual labels from a Categorization project.
+
+    Args:
+        project: Tamr project containing labels
+
+    Returns:
+        Dataset containing manual labels
+
+    Raises:
+        dataset.NotFound: If no dataset could be found at the specified URL
+        dataset.Ambiguous: If multiple targets match dataset name
+    """
+    unified_dataset = await unified.from_project(session=session, project=project)
+    labels_dataset_name = unified_dataset.name + "_manual_categorizations"
+    return await _dataset.by_name(
+        session=session, instance=project.url.instance, name=labels_dataset_name
+    )
+
+
+async def update_unified_dataset(
+    session: AsyncSession, project: CategorizationProject
+) -> Operation:
+    """Apply changes to the unified dataset and wait for the operation to complete
+
+    Args:
+        project: Tamr Categorization project
+    """
+    unified_dataset = await unified.from_project(session, project)
+    op = await unified._apply_changes_async(session, unified_dataset)
+    return await operation.wait(session, op)
+
+
+async def apply_feedback(
+    session: AsyncSession, project: CategorizationProject
+) -> Operation:
+    """Train the categorization model according to verified labels and wait for the
+    operation to complete
+
+    Args:
+        project: Tamr Categorization project
+    """
+    r = await session.post(str(project.url) + "/categorizations/model:refresh")
+    op = operation._from_response(project.url.instance, r)
+    return await operation.wait(session, op)
+
+
+async def update_results(
+    session: AsyncSession, project: CategorizationProject
+) -> Operation:
+    """Generate classifications based on the latest categorization model and wait for the
+    operation to complete
+
+    Args:
+        project: Tamr Categorization project
+    """
+    r = await session.post(str(project.url) + "/categorizations:refresh")
+    op = operation._from_response(project.url.instance, r)
+    return await operation.wait(session, op)
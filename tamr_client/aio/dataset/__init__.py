@@ -0,0 +1,14 @@
+from tamr_client.aio.dataset import record, unified
+from tamr_client.aio.dataset._dataset import (
+    _materialize_async,
+    AlreadyExists,
+    Ambiguous,
+    attributes,
+    by_name,
+    by_resource_id,
+    create,
+    delete,
+    get_all,
+    materialize,
+    NotFound,
+)
@@ -0,0 +1,212 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.dataset`
+
+See https://docs.tamr.com/reference/dataset-models
+"""
+from typing import List, Optional, Tuple, Union
+
+from tamr_client._types import Attribute, Dataset, Instance, Operation, URL
+from tamr_client.aio import attribute, operation, response
+from tamr_client.aio.session import AsyncSession
+from tamr_client.dataset._dataset import _from_json, AlreadyExists, Ambiguous, NotFound
+
+
+async def by_resource_id(session: AsyncSession, instance: Instance, id: str) -> Dataset:
+    """Get dataset by resource ID
+
+    Fetches dataset from Tamr server
+
+    Args:
+        instance: Tamr instance containing this dataset
+        id: Dataset ID
+
+    Raises:
+        dataset.NotFound: If no dataset could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    url = URL(instance=instance, path=f"datasets/{id}")
+    return await _by_url(session, url)
+
+
+async def by_name(session: AsyncSession, instance: Instance, name: str) -> Dataset:
+    """Get dataset by name
+
+    Fetches dataset from Tamr server
+
+    Args:
+        instance: Tamr instance containing this dataset
+        name: Dataset name
+
+    Raises:
+        dataset.NotFound: If no dataset could be found with that name.
+        dataset.Ambiguous: If multiple targets match dataset name.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.get(
+        str(URL(instance=instance, path="datasets")),
+        params={"filter": f"name=={name}"},
+    )
+
+    # Check that exactly one dataset is returned
+    matches = r.json()
+    if len(matches) == 0:
+        raise NotFound(str(r.url))
+    if len(matches) > 1:
+        raise Ambiguous(str(r.url))
+
+    # Make Dataset from response
+    url = URL(instance=instance, path=matches[0]["relativeId"])
+    return _from_json(url=url, data=matches[0])
+
+
+async def _by_url(session: AsyncSession, url: URL) -> Dataset:
+    """Get dataset by URL
+
+    Fetches dataset from Tamr server
+
+    Args:
+        url: Dataset URL
+
+    Raises:
+        dataset.NotFound: If no dataset could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.get(str(url))
+    if r.status_code == 404:
+        raise NotFound(str(url))
+    data = response.successful(r).json()
+    return _from_json(url, data)
+
+
+async def attributes(session: AsyncSession, dataset: Dataset) -> Tuple[Attribute, ...]:
+    """Get all attributes from a dataset
+
+    Args:
+        dataset: Dataset containing the desired attributes
+
+    Returns:
+        The attributes for the specified dataset
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered.
+    """
+    return await attribute._get_all_from_parent(session, dataset)
+
+
+async def materialize(session: AsyncSession, dataset: Dataset) -> Operation:
+    """Materialize a dataset and wait for the operation to complete
+    Materializing consists of updating the dataset (including records) in persistent storage (HBase) based on upstream changes to data.
+
+    Args:
+        dataset: A Tamr dataset which will be materialized
+    """
+    op = await _materialize_async(session, dataset)
+    return await operation.wait(session, op)
+
+
+async def _materialize_async(session: AsyncSession, dataset: Dataset) -> Operation:
+    r = await session.post(str(dataset.url) + ":refresh")
+    return operation._from_response(dataset.url.instance, r)
+
+
+async def delete(session: AsyncSession, dataset: Dataset, *, cascade: bool = False):
+    """Deletes an existing dataset
+
+    Sends a deletion request to the Tamr server
+
+    Args:
+        dataset: Existing dataset to delete
+        cascade: Whether to delete all derived datasets as well
+
+    Raises:
+        dataset.NotFound: If no dataset could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.delete(str(dataset.url), params={"cascade": cascade})
+    if r.status_code == 404:
+        raise NotFound(str(dataset.url))
+    response.successful(r)
+
+
+async def get_all(
+    session: AsyncSession,
+    instance: Instance,
+    *,
+    filter: Optional[Union[str, List[str]]] = None,
+) -> Tuple[Dataset, ...]:
+    """Get all datasets from an instance
+
+    Args:
+        instance: Tamr instance from which to get datasets
+        filter: Filter expression, e.g. "externalId==wobbly"
+            Multiple expressions can be passed as a list
+
+    Returns:
+        The datasets retrieved from the instance
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered.
+    """
+    url = URL(instance=instance, path="datasets")
+
+    if filter is not None:
+        r = await session.get(str(url), params={"filter": filter})
+    else:
+        r = await session.get(str(url))
+
+    datasets_json = response.successful(r).json()
+
+    datasets = []
+    for dataset_json in datasets_json:
+        dataset_url = URL(instance=instance, path=dataset_json["relativeId"])
+        dataset = _from_json(dataset_url, dataset_json)
+        datasets.append(dataset)
+    return tuple(datasets)
+
+
+async def create(
+    session: AsyncSession,
+    instance: Instance,
+    *,
+    name: str,
+    key_attribute_names: Tuple[str, ...],
+    description: Optional[str] = None,
+    external_id: Optional[str] = None,
+) -> Dataset:
+    """Create a dataset in Tamr.
+
+    Args:
+        instance: Tamr instance
+        name: Dataset name
+        key_attribute_names: Dataset primary key attribute names
+        description: Dataset description
+        external_id: External ID of the dataset
+
+    Returns:
+        Dataset created in Tamr
+
+    Raises:
+        dataset.AlreadyExists: If a dataset with these specifications already exists.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    data = {
+        "name": name,
+        "keyAttributeNames": key_attribute_names,
+        "description": description,
+        "externalId": external_id,
+    }
+
+    dataset_url = URL(instance=instance, path="datasets")
+    r = await session.post(str(dataset_url), json=data)
+
+    if r.status_code == 400 and "already exists" in r.json()["message"]:
+        raise AlreadyExists(r.json()["message"])
+
+    data = response.successful(r).json()
+    dataset_path = data["relativeId"]
+    dataset_url = URL(instance=instance, path=str(dataset_path))
+
+    return await _by_url(session=session, url=dataset_url)
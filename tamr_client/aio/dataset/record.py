@@ -0,0 +1,263 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.record`
+
+See https://docs.tamr.com/reference/record
+"""
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from tamr_client import codec, primary_key
+from tamr_client._types import (
+    AnyDataset,
+    Dataset,
+    InternStats,
+    JsonDict,
+    UploadOptions,
+)
+from tamr_client.aio import response
+from tamr_client.aio.session import _codec_of, AsyncSession
+from tamr_client.dataset import record as _record
+
+
+async def _update(
+    session: AsyncSession,
+    dataset: Dataset,
+    updates: Iterable[Dict],
+    *,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Send a batch of record creations/updates/deletions to this dataset.
+    You probably want to use :func:`~tamr_client.aio.record.upsert`
+    or :func:`~tamr_client.aio.record.delete` instead.
+
+    By default, all updates are streamed to the server in a single request,
+    packed into chunks of 1 MiB unless `options` specifies a `buffer_size`.
+    See :func:`tamr_client.record._update`
+
+    Args:
+        dataset: Dataset containing records to be updated
+        updates: Each update should be formatted as specified in the `Public Docs for Dataset updates <https://docs.tamr.com/reference#modify-a-datasets-records>`_.
+        options: Options for sending the updates. Batches are sent sequentially,
+            so `workers`, `max_in_flight` and `spool` are not supported
+
+    Returns:
+        JSON response body from server.
+        When batching, the responses for all batches are merged into a single response body.
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered
+        ValueError: If `options` are not supported
+    """
+    if options.workers != 1 or options.max_in_flight is not None or options.spool:
+        raise ValueError(
+            "Options workers, max_in_flight and spool are not supported by the asynchronous client"
+        )
+    compression = options.compression
+    if compression is not None:
+        _record._compressor(compression, options.compression_level)
+    dumps = _codec_of(session).dumps
+    stringified_updates = (dumps(update) for update in updates)
+
+    async def post(body: Union[bytes, Iterator[bytes]]) -> JsonDict:
+        if compression is not None:
+            body = _record._compress(
+                body, compression=compression, level=options.compression_level
+            )
+        r = await session.post(
+            str(dataset.url) + ":updateRecords",
+            headers={"Content-Encoding": compression or "utf-8"},
+            content=body if isinstance(body, bytes) else _aiter(body),
+        )
+        return response.successful(r).json()
+
+    if options.batch_size is None and options.batch_bytes is None:
+        buffer_size = options.buffer_size or _record._BUFFER_SIZE
+        return await post(_record._coalesce(stringified_updates, buffer_size))
+
+    batches = _record._batches(
+        stringified_updates, size=options.batch_size, nbytes=options.batch_bytes
+    )
+    return _record._merge_responses([await post(b"\n".join(b)) for b in batches])
+
+
+async def _aiter(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Stream chunks produced synchronously as an asynchronous request body"""
+    for chunk in chunks:
+        yield chunk
+
+
+def _check_primary_key(dataset: Dataset, primary_key_name: Optional[str]) -> str:
+    """Get the primary key name to use for this dataset
+
+    Raises:
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+    """
+    if primary_key_name is None:
+        primary_key_name = dataset.key_attribute_names[0]
+
+    if primary_key_name not in dataset.key_attribute_names:
+        raise primary_key.NotFound(
+            f"Primary key: {primary_key_name} is not in dataset key attribute names: {dataset.key_attribute_names}"
+        )
+    return primary_key_name
+
+
+async def upsert(
+    session: AsyncSession,
+    dataset: Dataset,
+    records: Iterable[Dict],
+    *,
+    primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update the specified records.
+
+    Args:
+        dataset: Dataset to receive record updates
+        records: The records to update, as dictionaries
+        primary_key_name: The primary key for these records, which must be a key in each record dictionary.
+            By default the key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name not in a record dictionary
+        ValueError: If `options` are not supported
+    """
+    primary_key_name = _check_primary_key(dataset, primary_key_name)
+    updates = (
+        _record._create_command(record, primary_key_name=primary_key_name)
+        for record in records
+    )
+    return await _update(
+        session,
+        dataset,
+        updates,
+        options=options,
+    )
+
+
+async def delete(
+    session: AsyncSession,
+    dataset: Dataset,
+    records: Iterable[Dict],
+    *,
+    primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Deletes the specified records, based on primary key values.  Does not check that other attribute values match.
+
+    Args:
+        dataset: Dataset from which to delete records
+        records: The records to update, as dictionaries
+        primary_key_name: The primary key for these records, which must be a key in each record dictionary.
+            By default the key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name not in a record dictionary
+        ValueError: If `options` are not supported
+    """
+    primary_key_name = _check_primary_key(dataset, primary_key_name)
+    updates = (
+        _record._delete_command(record, primary_key_name=primary_key_name)
+        for record in records
+    )
+    return await _update(
+        session,
+        dataset,
+        updates,
+        options=options,
+    )
+
+
+async def stream(
+    session: AsyncSession,
+    dataset: AnyDataset,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    intern: Optional[Iterable[str]] = None,
+    intern_stats: Optional[InternStats] = None,
+) -> AsyncIterator[JsonDict]:
+    """Stream the records in this dataset as Python dictionaries.
+
+    Asynchronous counterpart of :func:`tamr_client.record.stream`:
+    other tasks run while waiting for the next chunk of records.
+
+    Args:
+        dataset: Dataset from which to stream records
+        columns: Names of the attributes to keep in each record. Attributes missing from a
+            record are omitted. By default all attributes are kept
+        intern: Names of the attributes whose strings are interned.
+            See :func:`~tamr_client.response.ndjson`
+        intern_stats: Statistics updated while interning, including the memory saved
+
+    Returns:
+        Asynchronous generator yielding records
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered
+
+    Example:
+        >>> async for record in aio.record.stream(s, dataset):
+        ...     print(record)
+    """
+    c = _codec_of(session)
+    if columns is not None:
+        c = codec._projection(c, columns)
+    async with session.stream("GET", str(dataset.url) + "/records") as r:
+        response.successful(r)
+        async for record in response.ndjson(
+            r, codec=c, intern=intern, intern_stats=intern_stats
+        ):
+            yield record
+
+
+async def stream_raw(
+    session: AsyncSession, dataset: AnyDataset
+) -> AsyncIterator[bytes]:
+    """Stream the records in this dataset as serialized JSON objects, without parsing them.
+
+    Args:
+        dataset: Dataset from which to stream records
+
+    Returns:
+        Asynchronous generator yielding each record as a UTF-8 encoded JSON object,
+        without a trailing newline
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered
+    """
+    async with session.stream("GET", str(dataset.url) + "/records") as r:
+        response.successful(r)
+        async for lines in response._line_batches(r.aiter_bytes(response._CHUNK_SIZE)):
+            for line in lines:
+                if line:
+                    yield line
+
+
+async def delete_all(session: AsyncSession, dataset: AnyDataset):
+    """Delete all records in this dataset
+
+    Args:
+        dataset: Dataset from which to delete records
+    """
+    r = await session.delete(str(dataset.url) + "/records")
+    response.successful(r)
@@ -0,0 +1,70 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.dataset.unified`
+
+See https://docs.tamr.com/reference/dataset-models
+"""
+from tamr_client._types import Operation, Project, UnifiedDataset, URL
+from tamr_client.aio import operation, response
+from tamr_client.aio.session import AsyncSession
+from tamr_client.dataset.unified import _from_json, NotFound
+
+
+async def from_project(session: AsyncSession, project: Project) -> UnifiedDataset:
+    """Get unified dataset of a project
+
+    Fetches the unified dataset of a given project from Tamr server
+
+    Args:
+        project: Tamr project of this Unified Dataset
+
+    Raises:
+        unified.NotFound: If no unified dataset could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    url = URL(instance=project.url.instance, path=f"{project.url.path}/unifiedDataset")
+    return await _by_url(session, url)
+
+
+async def _by_url(session: AsyncSession, url: URL) -> UnifiedDataset:
+    """Get dataset by URL
+
+    Fetches dataset from Tamr server
+
+    Args:
+        url: Dataset URL
+
+    Raises:
+        unified.NotFound: If no dataset could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.get(str(url))
+    if r.status_code == 404:
+        raise NotFound(str(url))
+    data = response.successful(r).json()
+    return _from_json(url, data)
+
+
+async def apply_changes(
+    session: AsyncSession, unified_dataset: UnifiedDataset
+) -> Operation:
+    """Applies changes to the unified dataset and waits for the operation to complete
+
+    Args:
+        unified_dataset: The Unified Dataset which will be committed
+    """
+    op = await _apply_changes_async(session, unified_dataset)
+    return await operation.wait(session, op)
+
+
+async def _apply_changes_async(
+    session: AsyncSession, unified_dataset: UnifiedDataset
+) -> Operation:
+    """Applies changes to the unified dataset
+
+    Args:
+        unified_dataset: The Unified Dataset which will be committed
+    """
+    r = await session.post(str(unified_dataset.url) + ":refresh")
+    return operation._from_response(unified_dataset.url.instance, r)
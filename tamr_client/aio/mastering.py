@@ -0,0 +1,151 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.mastering`
+
+See https://docs.tamr.com/docs/overall-workflow-mastering
+
+Each function waits for its operation to complete while letting other tasks run
+"""
+from typing import Optional
+
+from tamr_client._types import Instance, MasteringProject, Operation, Project
+from tamr_client.aio import operation, project as _project
+from tamr_client.aio.dataset import unified
+from tamr_client.aio.session import AsyncSession
+
+
+async def create(
+    session: AsyncSession,
+    instance: Instance,
+    name: str,
+    description: Optional[str] = None,
+    external_id: Optional[str] = None,
+    unified_dataset_name: Optional[str] = None,
+) -> Project:
+    """Create a Mastering project in Tamr.
+
+    Args:
+        instance: Tamr instance
+        name: Project name
+        description: Project description
+        external_id: External ID of the project
+        unified_dataset_name: Unified dataset name. If None, will be set to project name + _'unified_dataset'
+
+    Returns:
+        Project created in Tamr
+
+    Raises:
+        project.AlreadyExists: If a project with these specifications already exists.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    return await _project._create(
+        session=session,
+        instance=instance,
+        name=name,
+        project_type="DEDUP",
+        description=description,
+        external_id=external_id,
+        unified_dataset_name=unified_dataset_name,
+    )
+
+
+async def update_unified_dataset(
+    session: AsyncSession, project: MasteringProject
+) -> Operation:
+    """Apply changes to the unified dataset and wait for the operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    unified_dataset = await unified.from_project(session, project)
+    op = await unified._apply_changes_async(session, unified_dataset)
+    return await operation.wait(session, op)
+
+
+async def estimate_pairs(session: AsyncSession, project: MasteringProject) -> Operation:
+    """Update the estimated pair counts and wait for the operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/estimatedPairCounts:refresh")
+
+
+async def generate_pairs(session: AsyncSession, project: MasteringProject) -> Operation:
+    """Generate pairs according to the binning model and wait for the operation
+    to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/recordPairs:refresh")
+
+
+async def apply_feedback(session: AsyncSession, project: MasteringProject) -> Operation:
+    """Train the pair-matching model according to verified labels and wait for the
+    operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/recordPairsWithPredictions/model:refresh")
+
+
+async def update_pair_results(
+    session: AsyncSession, project: MasteringProject
+) -> Operation:
+    """Update record pair predictions according to the latest pair-matching model and
+    wait for the operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/recordPairsWithPredictions:refresh")
+
+
+async def update_high_impact_pairs(
+    session: AsyncSession, project: MasteringProject
+) -> Operation:
+    """Produce new high-impact pairs according to the latest pair-matching model and
+    wait for the operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/highImpactPairs:refresh")
+
+
+async def update_cluster_results(
+    session: AsyncSession, project: MasteringProject
+) -> Operation:
+    """Generate clusters based on the latest pair-matching model and wait for the
+    operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/recordClusters:refresh")
+
+
+async def publish_clusters(
+    session: AsyncSession, project: MasteringProject
+) -> Operation:
+    """Publish current record clusters and wait for the operation to complete
+
+    Args:
+        project: Tamr Mastering project
+    """
+    return await _refresh(session, project, "/publishedClustersWithData:refresh")
+
+
+async def _refresh(
+    session: AsyncSession, project: MasteringProject, path: str
+) -> Operation:
+    op = await _refresh_async(session, project, path)
+    return await operation.wait(session, op)
+
+
+async def _refresh_async(
+    session: AsyncSession, project: MasteringProject, path: str
+) -> Operation:
+    r = await session.post(str(project.url) + path)
+    return operation._from_response(project.url.instance, r)
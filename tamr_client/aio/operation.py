@@ -0,0 +1,149 @@
+"""
+Asynchronous counterpart of :mod:`tamr_client.operation`
+
+See https://docs.tamr.com/new/reference/the-operation-object
+"""
+import asyncio
+from time import time as now
+from typing import Optional
+
+import httpx
+
+from tamr_client import operation as _operation
+from tamr_client._types import (
+    AnyPollStrategy,
+    FixedPoll,
+    Instance,
+    Operation,
+    URL,
+    WaitStats,
+)
+from tamr_client.aio import response
+from tamr_client.aio.session import _poll_timeout, AsyncSession
+from tamr_client.operation import Failed, NotFound, succeeded
+
+
+async def check(session: AsyncSession, operation: Operation):
+    """Waits for the operation to finish and raises an exception if the operation was not successful.
+
+    Args:
+        operation: Operation to be checked.
+
+    Raises:
+        Failed: If the operation failed.
+    """
+    op = await wait(session, operation)
+    if not succeeded(op):
+        raise Failed(
+            f"Checked operation '{str(op.url)}', but it failed with status: {op.status}"
+        )
+
+
+async def poll(session: AsyncSession, operation: Operation) -> Operation:
+    """Poll this operation for server-side updates.
+
+    Does not update the :class:`~tamr_client.operation.Operation` object.
+    Instead, returns a new :class:`~tamr_client.operation.Operation`.
+
+    Args:
+        operation: Operation to be polled.
+    """
+    return await _by_url(session, operation.url)
+
+
+async def wait(
+    session: AsyncSession,
+    operation: Operation,
+    *,
+    poll_interval_seconds: int = 3,
+    timeout_seconds: Optional[int] = None,
+    strategy: Optional[AnyPollStrategy] = None,
+    stats: Optional[WaitStats] = None,
+) -> Operation:
+    """Continuously polls for this operation's server-side state.
+
+    Other tasks run while waiting between polls, so that many operations can be waited on
+    concurrently, e.g. with :func:`asyncio.gather`.
+
+    Args:
+        operation: Operation to be polled.
+        poll_interval_seconds: Time interval (in seconds) between subsequent polls.
+        timeout_seconds: Time (in seconds) to wait for operation to resolve.
+        strategy: Strategy for the delays between polls.
+            See :func:`tamr_client.operation.wait`.
+        stats: Statistics updated with the polls of this wait.
+
+    Raises:
+        TimeoutError: If operation takes longer than `timeout_seconds` to resolve.
+    """
+    if strategy is None:
+        strategy = FixedPoll(poll_interval_seconds)
+    started = previous = now()
+    polls = 0
+    while timeout_seconds is None or now() - started < timeout_seconds:
+        if _operation._resolved(operation):
+            _operation._observe(strategy, stats, operation, polls, started, previous)
+            return operation
+        if (
+            operation.status is not None
+            and operation.status["state"] in _operation._UNRESOLVED
+        ):
+            delay = _operation._delay(
+                strategy, operation, polls, started, timeout_seconds
+            )
+            await asyncio.sleep(delay)
+        previous = now()
+        operation = await poll(session, operation)
+        polls += 1
+        if stats is not None:
+            stats.polls += 1
+    if stats is not None:
+        stats.wait_seconds += now() - started
+    raise TimeoutError(
+        f"Waiting for operation took longer than {timeout_seconds} seconds."
+    )
+
+
+async def by_resource_id(
+    session: AsyncSession, instance: Instance, resource_id: str
+) -> Operation:
+    """Get operation by ID
+
+    Args:
+        resource_id: The ID of the operation
+    """
+    url = URL(instance=instance, path=f"operations/{resource_id}")
+    r = await session.get(str(url))
+    return _from_response(instance, r)
+
+
+def _from_response(instance: Instance, response: httpx.Response) -> Operation:
+    """Make operation from the response of the request that started it
+
+    See :func:`tamr_client.operation._from_response`
+
+    Args:
+        response: HTTP Response from the request that started the operation.
+    """
+    data = None if response.status_code == 204 else response.json()
+    return _operation._from_response_json(instance, data)
+
+
+async def _by_url(session: AsyncSession, url: URL) -> Operation:
+    """Get operation by URL
+
+    Fetches operation from Tamr server
+
+    Args:
+        url: Operation URL
+
+    Raises:
+        operation.NotFound: If no operation could be found at the specified URL.
+            Corresponds to a 404 HTTP error.
+        httpx.HTTPStatusError: If any other HTTP error is encountered.
+    """
+    r = await session.get(str(url), timeout=_poll_timeout(session))
+    if r.status_code == 404:
+        raise NotFound(str(url))
+    data = response.successful(r).json()
+    return _operation._from_json(url, data)
@@ -0,0 +1,90 @@
+"""
+Utilities for working with :class:`httpx.Response`
+"""
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional
+
+import httpx
+
+from tamr_client import codec as _codec
+from tamr_client import response as _response
+from tamr_client._types import Codec, InternStats, JsonDict
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def successful(response: httpx.Response) -> httpx.Response:
+    """Ensure response does not contain an HTTP error.
+
+    Delegates to :meth:`httpx.Response.raise_for_status`
+
+    Returns:
+        The response being checked.
+
+    Raises:
+        httpx.HTTPStatusError: If an HTTP error is encountered.
+    """
+    response.raise_for_status()
+    return response
+
+
+async def ndjson(
+    response: httpx.Response,
+    *,
+    codec: Optional[Codec] = None,
+    chunk_size: int = _CHUNK_SIZE,
+    intern: Optional[Iterable[str]] = None,
+    intern_stats: Optional[InternStats] = None,
+) -> AsyncIterator[JsonDict]:
+    """Stream newline-delimited JSON from the response body
+
+    Asynchronous counterpart of :func:`tamr_client.response.ndjson`.
+    The body is read in large chunks, each split into a batch of lines at once.
+    Empty lines are skipped.
+
+    **Recommended**: For memory efficiency, send the request corresponding to this response
+    with :meth:`httpx.AsyncClient.stream`.
+
+    Args:
+        response: Response whose body should be streamed as newline-delimited JSON.
+        codec: JSON codec used to parse each line. By default the fastest installed codec.
+        chunk_size: Size (in bytes) of each read from the response body. Defaults to 1 MiB.
+        intern: Keys of the values to intern. By default no values are interned
+        intern_stats: Statistics updated while interning, including the memory saved
+
+    Returns
+        Asynchronous generator yielding each line of the response body, parsed as JSON
+    """
+    loads = (codec or _codec.default()).loads
+    if intern is not None:
+        loads = _response._interning(loads, intern, intern_stats or InternStats())
+    async for lines in _line_batches(response.aiter_bytes(chunk_size)):
+        for line in lines:
+            if line:
+                yield loads(line)
+
+
+async def _line_batches(chunks: AsyncIterable[bytes]) -> AsyncIterator[List[bytes]]:
+    """Split a stream of chunks into batches of lines
+
+    See :func:`tamr_client.response._line_batches`
+
+    Args:
+        chunks: Stream of chunks, split at arbitrary positions
+
+    Returns:
+        Asynchronous generator yielding all complete lines buffered after each chunk
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        start = len(buffer)
+        buffer += chunk
+        end = buffer.rfind(b"\n", start)
+        if end < 0:
+            continue
+        with memoryview(buffer) as view:
+            lines = _response._split_lines(bytes(view[:end]))
+        # deleting from the start of a bytearray only advances its start, without copying
+        del buffer[: end + 1]
+        yield lines
+    if buffer:
+        yield _response._split_lines(bytes(buffer))
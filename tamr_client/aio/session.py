@@ -0,0 +1,222 @@
+"""
+Asynchronous sessions, sending requests over an :mod:`httpx` connection pool
+"""
+import time
+from typing import Any, Generator, Optional, Union
+
+import httpx
+
+from tamr_client import codec as _codec
+from tamr_client import session as _session
+from tamr_client import timeout as _timeout
+from tamr_client._types import Codec, Timeout
+from tamr_client._types.auth import JwtTokenAuth, UsernamePasswordAuth
+
+_LOGIN_PATH = "/api/versioned/v1/instance:login"
+
+
+class _HttpxAuth(httpx.Auth):
+    """Adapts an authentication of :mod:`tamr_client` to :mod:`httpx` requests
+
+    Args:
+        auth: Authentication setting the headers of each request
+    """
+
+    def __init__(self, auth: Union[UsernamePasswordAuth, JwtTokenAuth]):
+        self._auth = auth
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        yield self._auth(request)
+
+
+class AsyncSession(httpx.AsyncClient):
+    """Asynchronous counterpart of :class:`~tamr_client.Session`
+
+    Like :class:`~tamr_client.Session`, logs in with the stored username and password when the
+    server rejects the credentials of a request, then resends the request with the auth cookie.
+    Streamed bodies (e.g. of :func:`~tamr_client.aio.record.upsert`) can only be sent once,
+    so the session logs in before sending them unless its auth token is known to remain valid.
+    A streamed body sent with a valid token that was revoked is not sent again: the response
+    ``401 Unauthorized`` is returned.
+
+    Like :class:`~tamr_client.Session`, requests time out according to a
+    :class:`~tamr_client.Timeout` policy, by default ``Timeout()``: requests with a streamed
+    body or response (e.g. of :func:`~tamr_client.aio.record.upsert` and
+    :func:`~tamr_client.aio.record.stream`) wait for data up to the `stream` timeout,
+    polls of operations up to the `poll` timeout, and other requests up to the `read`
+    timeout. Requests that time out raise :class:`httpx.ConnectTimeout` or
+    :class:`httpx.ReadTimeout`.
+
+    Use as an asynchronous context manager, or call :meth:`aclose`, to close its connections.
+
+    Args:
+        **kwargs: Keyword arguments passed to :class:`httpx.AsyncClient`. A `timeout` passed
+            here applies to all requests, instead of the timeout policy
+    """
+
+    def __init__(self, **kwargs: Any):
+        policy = None if "timeout" in kwargs else Timeout()
+        kwargs.setdefault("timeout", _httpx_timeout(policy, _timeout.METADATA))
+        super().__init__(**kwargs)
+        self._timeout_policy: Optional[Timeout] = policy
+        self._stored_auth: Optional[Union[UsernamePasswordAuth, JwtTokenAuth]] = None
+        self._codec: Optional[Codec] = None
+        self._auth_token: Optional[str] = None
+        self._auth_token_expiry: Optional[float] = None
+        # time the auth token was obtained by logging in, if known
+        self._auth_token_time: Optional[float] = None
+
+    async def send(
+        self, request: httpx.Request, *, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        # unlike a body in memory, a streamed body cannot be sent again once rejected
+        streamed = not isinstance(request.stream, httpx.ByteStream)
+        if (
+            (stream or streamed)
+            and self._timeout_policy is not None
+            and request.extensions.get("timeout") == self.timeout.as_dict()
+        ):
+            # the request has the default timeouts of the session, for metadata
+            timeout = _httpx_timeout(self._timeout_policy, _timeout.STREAM)
+            request.extensions = {**request.extensions, "timeout": timeout.as_dict()}
+        kwargs["stream"] = stream
+        if (
+            streamed
+            and self._stored_auth is not None
+            and self.auth is None
+            and request.url.path != _LOGIN_PATH
+            and not _session._fresh(self._auth_token_expiry, self._auth_token_time)
+        ):
+            # log in before sending, rather than after the request is rejected
+            await self._set_auth_cookie(str(request.url))
+            request.headers.pop("Cookie", None)
+            self.cookies.set_cookie_header(request)
+        response = await super().send(request, **kwargs)
+        if response.status_code != 401 or request.url.path == _LOGIN_PATH:
+            return response
+        await response.aread()
+        if "credentials" not in response.text.lower() or streamed:
+            return response
+        first_response = response
+        await self._set_auth_cookie(str(request.url))
+        # the retried request carries the new cookie, and credentials only if login failed
+        headers = request.headers.copy()
+        headers.pop("Authorization", None)
+        headers.pop("Cookie", None)
+        retry = httpx.Request(
+            request.method, request.url, headers=headers, stream=request.stream
+        )
+        self.cookies.set_cookie_header(retry)
+        response = await super().send(retry, **kwargs)
+        if response.status_code == 401:
+            await response.aread()
+            if "credentials" in response.text.lower():
+                # Login credentials are bad, return original response
+                await response.aclose()
+                response = first_response
+        return response
+
+    async def _set_auth_cookie(self, parent_url: str):
+        """Fetch and store an auth token for the given client configuration"""
+        # No-op if _stored_auth is None
+        if self._stored_auth is None:
+            return
+
+        # Fetch auth token and store as cookie
+        socket_address = parent_url.split("/api/")[0]
+        if not isinstance(self._stored_auth, UsernamePasswordAuth):
+            raise TypeError(
+                "Auth cookie only supported for UsernamePasswordAuth authentication"
+            )
+        obtained = time.time()
+        r = await self.post(
+            socket_address + _LOGIN_PATH,
+            json={
+                "username": self._stored_auth.username,
+                "password": self._stored_auth.password,
+            },
+        )
+        if r.status_code == 200:
+            auth_token = r.json()["token"]
+            self.cookies.set("authToken", auth_token)
+            self._auth_token = auth_token
+            self._auth_token_expiry = _session._token_expiry(auth_token)
+            self._auth_token_time = obtained
+            # Clear session auth if cookie is retrieved
+            self.auth = None
+        else:
+            # Set session auth from client auth in case it has been cleared
+            # Allow the following call to pass credentials in header
+            self.auth = _HttpxAuth(self._stored_auth)
+
+
+def from_auth(
+    auth: Union[UsernamePasswordAuth, JwtTokenAuth],
+    *,
+    codec: Optional[str] = None,
+    limits: Optional[httpx.Limits] = None,
+    timeout: Optional[Timeout] = Timeout(),
+) -> AsyncSession:
+    """Create a new authenticated asynchronous session
+
+    Args:
+        auth: Authentication
+        codec: Name of the JSON codec used to encode and decode records for this session.
+            By default the fastest installed codec. See :mod:`tamr_client.codec`
+        limits: Limits of the connection pool, e.g. the maximum number of concurrent
+            connections. By default those of :class:`httpx.AsyncClient`
+        timeout: Policy for timing out requests, with connect and read timeouts for
+            requests of metadata, record streams and polls of operations.
+            Requests do not time out if `None`. A `timeout` passed to a request of the session
+            takes precedence
+
+    Raises:
+        codec.NotFound: If no codec is registered under the name `codec`
+
+    Example:
+        >>> from tamr_client import aio
+        >>> async with aio.session.from_auth(auth) as s:
+        ...     datasets = await aio.dataset.get_all(s, instance)
+    """
+    s = AsyncSession() if limits is None else AsyncSession(limits=limits)
+    if codec is not None:
+        s._codec = _codec.get(codec)
+    s._timeout_policy = timeout
+    s.timeout = _httpx_timeout(timeout, _timeout.METADATA)
+    if isinstance(auth, UsernamePasswordAuth):
+        s._stored_auth = auth  # flag attempt to set session cookie during requests
+    else:
+        s.auth = _HttpxAuth(
+            auth
+        )  # do not flag to attempt to set session cookie in requests
+    return s
+
+
+def _codec_of(session: AsyncSession) -> Codec:
+    """Get the codec selected for this session, or the default codec"""
+    return session._codec or _codec.default()
+
+
+def _httpx_timeout(policy: Optional[Timeout], profile: str) -> httpx.Timeout:
+    """Timeouts of a request of an asynchronous session
+
+    Writing a request body and waiting for a connection of the pool do not time out,
+    as with :class:`~tamr_client.Session`.
+
+    Args:
+        policy: Timeout policy. No timeouts if `None`
+        profile: Profile of the request, one of ``"metadata"``, ``"stream"`` or ``"poll"``
+    """
+    if policy is None:
+        return httpx.Timeout(None)
+    connect, read = _timeout._timeouts(policy, profile)
+    return httpx.Timeout(None, connect=connect, read=read)
+
+
+def _poll_timeout(session: AsyncSession) -> httpx.Timeout:
+    """Timeouts of a poll of an operation, according to the policy of a session"""
+    if session._timeout_policy is None:
+        return session.timeout
+    return _httpx_timeout(session._timeout_policy, _timeout.POLL)
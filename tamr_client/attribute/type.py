@@ -2,6 +2,8 @@
 See https://docs.tamr.com/reference#attribute-types
 """
 import logging
+import os
+from typing import TYPE_CHECKING
 
 from tamr_client._types import (
     Array,
@@ -22,6 +24,10 @@ from tamr_client._types import (  # noqa: F401
 )
 from tamr_client.attribute import sub
 
+BUILDING_DOCS = os.environ.get("TAMR_CLIENT_DOCS") == "1"
+if TYPE_CHECKING or BUILDING_DOCS:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,3 +90,42 @@ def to_json(attr_type: AttributeType) -> JsonDict:
         }
     else:
         raise TypeError(attr_type)
+
+
+def to_arrow(attr_type: AttributeType) -> "pa.DataType":
+    """Convert attribute type to an Apache Arrow data type
+
+    Requires the `pyarrow` package.
+    Arrays are converted to lists, maps to maps with string keys and records to structs,
+    e.g. `GEOSPATIAL` is converted to a struct of nested lists of doubles.
+
+    Args:
+        attr_type: Attribute type to convert
+
+    Raises:
+        TypeError: If `attr_type` is not an attribute type
+    """
+    import pyarrow as pa
+
+    if isinstance(attr_type, PrimitiveType):
+        primitives = {
+            BOOLEAN: pa.bool_(),
+            DOUBLE: pa.float64(),
+            INT: pa.int32(),
+            LONG: pa.int64(),
+            STRING: pa.string(),
+        }
+        return primitives[attr_type]
+    elif isinstance(attr_type, Array):
+        return pa.list_(to_arrow(attr_type.inner_type))
+    elif isinstance(attr_type, Map):
+        return pa.map_(pa.string(), to_arrow(attr_type.inner_type))
+    elif isinstance(attr_type, Record):
+        return pa.struct(
+            [
+                pa.field(attr.name, to_arrow(attr.type), nullable=attr.is_nullable)
+                for attr in attr_type.attributes
+            ]
+        )
+    else:
+        raise TypeError(attr_type)
@@ -0,0 +1,197 @@
+"""
+Registry of JSON codecs used to encode and decode records.
+
+The standard library :mod:`json` module is always available.
+Faster codecs are registered when their (optional) packages are installed:
+
+- ``"orjson"`` via `orjson <https://github.com/ijl/orjson>`_
+- ``"ujson"`` via `ujson <https://github.com/ultrajson/ultrajson>`_
+
+All codecs handle non-finite floats (``NaN``, ``Infinity``, ``-Infinity``) exactly like the
+standard library: any object containing such a value is encoded by the standard library,
+so its serialization is byte-for-byte identical whichever codec is selected.
+"""
+import importlib
+import json
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from tamr_client._types import Codec, Session
+from tamr_client.exception import TamrClientException
+
+
+class NotFound(TamrClientException):
+    """Raised when referencing a codec by name that is not registered."""
+
+    pass
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+STDLIB = Codec(name="json", dumps=_stdlib_dumps, loads=_stdlib_loads)
+
+_registry: Dict[str, Codec] = {STDLIB.name: STDLIB}
+
+# codecs in order of preference, fastest first
+_preference = ["orjson", "ujson", STDLIB.name]
+
+
+def register(codec: Codec):
+    """Register a codec so that it can be selected by name
+
+    Replaces any codec previously registered under the same name.
+
+    Args:
+        codec: Codec to register
+    """
+    _registry[codec.name] = codec
+
+
+def get(name: str) -> Codec:
+    """Get a registered codec by name
+
+    Args:
+        name: Name of the codec e.g. ``"orjson"``
+
+    Raises:
+        codec.NotFound: If no codec is registered under that name,
+            e.g. because its package is not installed
+    """
+    codec = _registry.get(name)
+    if codec is None:
+        raise NotFound(
+            f"No codec registered with name '{name}'. Available codecs: {names()}"
+        )
+    return codec
+
+
+def names() -> List[str]:
+    """Names of all registered codecs"""
+    return list(_registry)
+
+
+def default() -> Codec:
+    """The fastest registered codec"""
+    for name in _preference:
+        if name in _registry:
+            return _registry[name]
+    return STDLIB
+
+
+def _from_session(session: Session) -> Codec:
+    """Get the codec selected for this session, or the default codec
+
+    Args:
+        session: Session with an optional selected codec
+    """
+    codec: Optional[Codec] = getattr(session, "_codec", None)
+    return codec or default()
+
+
+def _projection(codec: Codec, columns: Iterable[str]) -> Codec:
+    """Get a codec parsing only the specified top-level keys of JSON objects
+
+    Objects without nested objects are not fully parsed: each key is found by a scan of the
+    serialized object, and only its value is parsed, so that the cost of parsing an object
+    depends on the number of `columns` rather than on the size of the object.
+    Other objects (or objects missing a key) are parsed with `codec`, then projected.
+
+    Args:
+        codec: Codec used to serialize values, and to parse objects that cannot be scanned
+        columns: Keys to keep. Keys missing from an object are omitted from its projection
+
+    Returns:
+        Codec whose ``loads`` returns the projection of each object on `columns`
+    """
+    columns = list(dict.fromkeys(columns))
+    patterns = [
+        (name, re.compile(re.escape(json.dumps(name, ensure_ascii=False)) + r"\s*:\s*"))
+        for name in columns
+    ]
+    decode = json.JSONDecoder().raw_decode
+
+    def loads(data: Union[bytes, str]) -> Any:
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        # without nested objects (nor braces within strings), any unescaped key is top-level
+        if text.count("{") == 1:
+            projected = {}
+            for name, pattern in patterns:
+                match = pattern.search(text)
+                if match is None or text[match.start() - 1] == "\\":
+                    # possibly a differently escaped key, or a key within a string
+                    break
+                projected[name] = decode(text, match.end())[0]
+            else:
+                return projected
+        obj = codec.loads(data)
+        return {name: obj[name] for name in columns if name in obj}
+
+    return Codec(name=codec.name, dumps=codec.dumps, loads=loads)
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """Check if a JSON-compatible object contains a non-finite float
+
+    Args:
+        obj: JSON-compatible object
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+def _import(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_orjson = _import("orjson")
+if _orjson is not None:
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        try:
+            data = _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers larger than 64 bits
+            return _stdlib_dumps(obj)
+        # orjson encodes non-finite floats as `null`
+        if b"null" in data and _has_nonfinite(obj):
+            return _stdlib_dumps(obj)
+        return data
+
+    def _orjson_loads(data: Union[bytes, str]) -> Any:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # e.g. `NaN` literals
+            return _stdlib_loads(data)
+
+    register(Codec(name="orjson", dumps=_orjson_dumps, loads=_orjson_loads))
+
+_ujson = _import("ujson")
+if _ujson is not None:
+
+    def _ujson_dumps(obj: Any) -> bytes:
+        try:
+            data = _ujson.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False, allow_nan=False
+            )
+        except (TypeError, OverflowError):
+            # e.g. non-finite floats
+            return _stdlib_dumps(obj)
+        return data.encode("utf-8")
+
+    register(Codec(name="ujson", dumps=_ujson_dumps, loads=_ujson.loads))
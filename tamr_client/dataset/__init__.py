@@ -1,4 +1,4 @@
-from tamr_client.dataset import dataframe, record, unified
+from tamr_client.dataset import dataframe, export, ingest, record, unified
 from tamr_client.dataset._dataset import (
     _materialize_async,
     AlreadyExists,
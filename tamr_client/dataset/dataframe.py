@@ -2,21 +2,48 @@
 Convenient functionality for interacting with pandas DataFrames.
 """
 
-import json
+from itertools import islice
 import os
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 import requests
 
 from tamr_client import attribute, dataset, primary_key
-from tamr_client._types import Dataset, Instance, JsonDict, Session
-from tamr_client.dataset import record
+from tamr_client._types import (
+    Attribute,
+    AttributeType,
+    BOOLEAN,
+    Dataset,
+    DEFAULT,
+    DOUBLE,
+    Instance,
+    INT,
+    JsonDict,
+    LONG,
+    PrefetchStats,
+    Session,
+    STRING,
+    UploadOptions,
+)
+from tamr_client.dataset import _dataset, record
 from tamr_client.exception import TamrClientException
 
 BUILDING_DOCS = os.environ.get("TAMR_CLIENT_DOCS") == "1"
 if TYPE_CHECKING or BUILDING_DOCS:
     import pandas as pd
 
+_CHUNK_SIZE = 10_000
+
+# nullable pandas dtypes for primitive attribute types, other types are read as Python objects
+_DTYPES: Dict[AttributeType, str] = {
+    BOOLEAN: "boolean",
+    DOUBLE: "float64",
+    INT: "Int32",
+    LONG: "Int64",
+    STRING: "string",
+}
+_OBJECT = "object"
+
 
 class CreationFailure(TamrClientException):
     """Raised when a dataset could not be created from a pandas DataFrame"""
@@ -30,6 +57,7 @@ def upsert(
     df: "pd.DataFrame",
     *,
     primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
 ) -> JsonDict:
     """Upserts a record for each row of `df` with attributes for each column in `df`.
 
@@ -38,6 +66,8 @@ def upsert(
         df: The DataFrame containing records to be upserted
         primary_key_name: The primary key of the dataset.  Must be a column of `df`. By default the
             key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
 
     Returns:
         JSON response body from the server
@@ -53,16 +83,161 @@ def upsert(
     # preconditions
     _check_primary_key(df, primary_key_name)
 
-    # promote primary key column to index
-    if primary_key_name in df.columns:
-        df = df.set_index(primary_key_name)
+    records = _to_ndjson(df, primary_key_name=primary_key_name)
+    return record.upsert_raw(
+        session, dataset, records, primary_key_name=primary_key_name, options=options
+    )
+
+
+def _to_ndjson(
+    df: "pd.DataFrame", *, primary_key_name: str, chunk_size: int = _CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Serialize each row of `df` as a JSON object, one chunk of rows at a time
+
+    Rows are serialized column-wise via :meth:`pandas.DataFrame.to_json`, which handles `np.nan`
+    values by serializing them as `null`.
+    The primary key is serialized first so that it can be found without parsing each row.
+
+    Args:
+        df: The DataFrame to serialize
+        primary_key_name: The primary key of the rows. Must be a column of `df` or the index of `df`
+        chunk_size: Number of rows serialized at once
+
+    Returns:
+        Python generator yielding each row as a UTF-8 encoded JSON object
+    """
+    columns = [primary_key_name] + [c for c in df.columns if c != primary_key_name]
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        if primary_key_name not in chunk.columns:
+            chunk = chunk.reset_index()
+        lines = chunk[columns].to_json(orient="records", lines=True)
+        yield from lines.encode("utf-8").splitlines()
+
+
+def read(
+    session: Session,
+    dataset: Dataset,
+    *,
+    chunksize: int = _CHUNK_SIZE,
+    columns: Optional[Iterable[str]] = None,
+    unwrap: bool = False,
+    categorical: bool = False,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+) -> Iterator["pd.DataFrame"]:
+    """Read the records of `dataset` as DataFrames of up to `chunksize` rows each
+
+    Each DataFrame has a column for each attribute of `dataset`, with a dtype chosen from the
+    attribute type:
+
+    - `BOOLEAN`: `"boolean"`
+    - `DOUBLE`: `"float64"`
+    - `INT`: `"Int32"`
+    - `LONG`: `"Int64"`
+    - `STRING`: `"string"`
+    - any other type: `"object"`, holding parsed JSON values e.g. lists for arrays
+
+    Only one chunk of records is held in memory at a time.
+
+    Args:
+        dataset: Dataset from which to read records
+        chunksize: Maximum number of rows per DataFrame
+        columns: Names of the attributes to read, in the order of the DataFrame columns.
+            Only those attributes are parsed, as by :func:`~tamr_client.record.stream`.
+            By default all attributes are read
+        unwrap: Whether to unwrap single-element values of `Array(STRING)` attributes into
+            scalars. Empty arrays are read as missing values. If a chunk of a column has an
+            array with several elements, that chunk keeps its arrays and the `"object"` dtype
+        categorical: Whether to read unwrapped columns with the `"category"` dtype instead of
+            `"string"`. Categories are inferred separately for each chunk
+        prefetch: Maximum number of batches of records read ahead by a background thread.
+            By default records are read as they are consumed
+        stats: Statistics updated while prefetching
+
+    Returns:
+        Python generator yielding DataFrames
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `chunksize` is not positive, if `categorical` is set without `unwrap`,
+            if `prefetch` is negative or if a column is not an attribute of `dataset`
+    """
+    import pandas as pd
+
+    if chunksize < 1:
+        raise ValueError(f"Chunk size must be positive, but was {chunksize}")
+    if categorical and not unwrap:
+        raise ValueError("Categorical columns require unwrapping arrays")
 
-    # serialize records via to_json to handle `np.nan` values
-    serialized_records = ((pk, row.to_json()) for pk, row in df.iterrows())
-    records = (
-        {primary_key_name: pk, **json.loads(row)} for pk, row in serialized_records
+    attributes = record._select(_dataset.attributes(session, dataset), columns)
+    if columns is not None:
+        columns = [attr.name for attr in attributes]
+    records = record.stream(
+        session, dataset, columns=columns, prefetch=prefetch, stats=stats
     )
-    return record.upsert(session, dataset, records, primary_key_name=primary_key_name)
+    while True:
+        rows = list(islice(records, chunksize))
+        if not rows:
+            return
+        yield pd.DataFrame(
+            {
+                attr.name: _to_column(
+                    [row.get(attr.name) for row in rows],
+                    attr,
+                    unwrap=unwrap,
+                    categorical=categorical,
+                )
+                for attr in attributes
+            }
+        )
+        # release the parsed records before parsing the next chunk
+        del rows
+
+
+def _to_column(
+    values: List[Any], attr: Attribute, *, unwrap: bool, categorical: bool
+) -> "pd.Series":
+    """Convert the values of an attribute into a pandas Series of the matching dtype
+
+    Args:
+        values: Parsed JSON values of the attribute
+        attr: Attribute of the values
+        unwrap: Whether to unwrap single-element arrays of an `Array(STRING)` attribute
+        categorical: Whether to make unwrapped arrays categorical
+
+    Returns:
+        Column of a DataFrame
+    """
+    import pandas as pd
+
+    dtype = _DTYPES.get(attr.type, _OBJECT)
+    if unwrap and attr.type == DEFAULT:
+        values, unwrapped = _unwrap(values)
+        if unwrapped:
+            dtype = "category" if categorical else _DTYPES[STRING]
+    return pd.Series(values, dtype=dtype)
+
+
+def _unwrap(values: List[Any]) -> Tuple[List[Any], bool]:
+    """Unwrap single-element arrays into their element, and empty arrays into `None`
+
+    Args:
+        values: Arrays, or `None` for missing values
+
+    Returns:
+        Unwrapped values and whether all arrays were unwrapped.
+        If any array has several elements, `values` is returned unchanged
+    """
+    unwrapped: List[Any] = []
+    for v in values:
+        if v is None or not v:
+            unwrapped.append(None)
+        elif len(v) == 1:
+            unwrapped.append(v[0])
+        else:
+            return values, False
+    return unwrapped, True
 
 
 def create(
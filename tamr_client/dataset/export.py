@@ -0,0 +1,602 @@
+"""
+Export datasets to local files.
+
+Records are streamed from Tamr and written to one or more files ("shards"), rolling over to a new
+shard once the current shard reaches a size limit. Shards are written by a background thread,
+so that writing (and compressing) a shard overlaps with reading and encoding records.
+At most a few chunks of records are held in memory at a time, whatever the size of the dataset.
+
+Each export also writes a manifest ``<prefix>.manifest.json`` listing its shards, with their
+number of records, size and SHA-256 checksum.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import queue
+import re
+import threading
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from tamr_client import attribute, codec
+from tamr_client._types import (
+    AnyDataset,
+    Array,
+    AttributeType,
+    Dataset,
+    ExportManifest,
+    ExportShard,
+    PrimitiveType,
+    Session,
+)
+from tamr_client.dataset import record
+
+BUILDING_DOCS = os.environ.get("TAMR_CLIENT_DOCS") == "1"
+if TYPE_CHECKING or BUILDING_DOCS:
+    import pyarrow as pa
+
+_SHARD_BYTES = 128 * 1024 * 1024
+_CHUNK_BYTES = 1024 * 1024
+_ROW_GROUP_SIZE = 64 * 1024
+_COMPRESSION_LEVEL = 6
+# maximum number of chunks waiting for the writer thread
+_WRITER_QUEUE_SIZE = 8
+_STOP_POLL_SECONDS = 0.1
+_STOP = object()
+
+# a chunk of records: number of records, data to write and its size in bytes
+_Piece = Tuple[int, Any, int]
+
+
+def to_ndjson(
+    session: Session,
+    dataset: AnyDataset,
+    directory: Union[str, Path],
+    *,
+    prefix: Optional[str] = None,
+    shard_bytes: int = _SHARD_BYTES,
+    compression_level: int = _COMPRESSION_LEVEL,
+) -> ExportManifest:
+    """Export the records of `dataset` to gzip-compressed newline-delimited JSON files
+
+    Records are written as sent by Tamr, without being parsed.
+    Shards are named ``<prefix>-00000.ndjson.gz``, ``<prefix>-00001.ndjson.gz``, etc.
+
+    Args:
+        dataset: Dataset to export
+        directory: Directory receiving the files, created if it does not exist
+        prefix: Prefix of the file names. By default the name of `dataset`
+        shard_bytes: Size (in bytes, before compression) after which a new shard is started
+        compression_level: Compression level, from 0 (no compression) to 9 (best compression)
+
+    Returns:
+        Manifest of the export
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `shard_bytes` is not positive or `compression_level` is not supported
+    """
+    _check_shard_bytes(shard_bytes)
+    # fail early on an unsupported level
+    record._compressor("gzip", compression_level)
+
+    def open_shard(path: Path) -> "_FileShard":
+        return _FileShard(
+            path, compressor=record._compressor("gzip", compression_level)
+        )
+
+    lines = record.stream_raw(session, dataset)
+    pieces = _line_pieces(lines, min(shard_bytes, _CHUNK_BYTES))
+    return _export(
+        dataset,
+        directory,
+        pieces,
+        open_shard,
+        format="ndjson.gz",
+        prefix=prefix,
+        shard_bytes=shard_bytes,
+    )
+
+
+def to_csv(
+    session: Session,
+    dataset: Dataset,
+    directory: Union[str, Path],
+    *,
+    prefix: Optional[str] = None,
+    shard_bytes: int = _SHARD_BYTES,
+    array_delimiter: str = "|",
+) -> ExportManifest:
+    """Export the records of `dataset` to CSV files
+
+    Each shard starts with a header row, with a column for each attribute of `dataset`.
+    Values are flattened into a single CSV field:
+
+    - missing values are written as empty fields
+    - booleans are written as `true` or `false`
+    - arrays of primitive values (e.g. the default `Array(STRING)` type) are written as their
+      elements joined by `array_delimiter`, skipping missing elements
+    - any other complex value (e.g. maps, records, nested arrays) is written as JSON
+
+    Shards are named ``<prefix>-00000.csv``, ``<prefix>-00001.csv``, etc.
+
+    Args:
+        dataset: Dataset to export
+        directory: Directory receiving the files, created if it does not exist
+        prefix: Prefix of the file names. By default the name of `dataset`
+        shard_bytes: Size (in bytes) after which a new shard is started
+        array_delimiter: Delimiter between the elements of arrays
+
+    Returns:
+        Manifest of the export
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `shard_bytes` is not positive
+    """
+    _check_shard_bytes(shard_bytes)
+
+    attributes = attribute._get_all_from_parent(session, dataset)
+    names = [attr.name for attr in attributes]
+    dumps = codec._from_session(session).dumps
+    formatters = [
+        _csv_formatter(attr.type, array_delimiter=array_delimiter, dumps=dumps)
+        for attr in attributes
+    ]
+    header = _csv_rows([names])
+
+    def open_shard(path: Path) -> "_FileShard":
+        return _FileShard(path, header=header)
+
+    rows = (
+        [format(r.get(name)) for name, format in zip(names, formatters)]
+        for r in record.stream(session, dataset)
+    )
+    pieces = _csv_pieces(rows, min(shard_bytes, _CHUNK_BYTES))
+    return _export(
+        dataset,
+        directory,
+        pieces,
+        open_shard,
+        format="csv",
+        prefix=prefix,
+        shard_bytes=shard_bytes,
+    )
+
+
+def to_parquet(
+    session: Session,
+    dataset: Dataset,
+    directory: Union[str, Path],
+    *,
+    prefix: Optional[str] = None,
+    shard_bytes: int = _SHARD_BYTES,
+    row_group_size: int = _ROW_GROUP_SIZE,
+    compression: str = "snappy",
+) -> ExportManifest:
+    """Export the records of `dataset` to Parquet files
+
+    Requires the `pyarrow` package.
+    Records are converted to Apache Arrow record batches as by
+    :func:`~tamr_client.record.stream_arrow`, and each record batch is written as a row group.
+    Shards are named ``<prefix>-00000.parquet``, ``<prefix>-00001.parquet``, etc.
+
+    Args:
+        dataset: Dataset to export
+        directory: Directory receiving the files, created if it does not exist
+        prefix: Prefix of the file names. By default the name of `dataset`
+        shard_bytes: Size (in bytes, of the uncompressed Arrow data) after which a new shard
+            is started
+        row_group_size: Maximum number of records per row group
+        compression: Parquet compression codec e.g. ``"snappy"``, ``"gzip"`` or ``"none"``
+
+    Returns:
+        Manifest of the export
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `shard_bytes` or `row_group_size` is not positive
+    """
+    _check_shard_bytes(shard_bytes)
+    if row_group_size < 1:
+        raise ValueError(f"Row group size must be positive, but was {row_group_size}")
+
+    schema = record._arrow_schema(attribute._get_all_from_parent(session, dataset))
+
+    def open_shard(path: Path) -> "_ParquetShard":
+        return _ParquetShard(path, schema=schema, compression=compression)
+
+    records = record.stream(session, dataset)
+    batches = record._arrow_batches(records, schema, batch_size=row_group_size)
+    pieces = ((batch.num_rows, batch, batch.nbytes) for batch in batches)
+    return _export(
+        dataset,
+        directory,
+        pieces,
+        open_shard,
+        format="parquet",
+        prefix=prefix,
+        shard_bytes=shard_bytes,
+    )
+
+
+def _check_shard_bytes(shard_bytes: int):
+    if shard_bytes < 1:
+        raise ValueError(f"Shard bytes must be positive, but was {shard_bytes}")
+
+
+def _export(
+    dataset: AnyDataset,
+    directory: Union[str, Path],
+    pieces: Iterable[_Piece],
+    open_shard: Callable[[Path], Any],
+    *,
+    format: str,
+    prefix: Optional[str],
+    shard_bytes: int,
+) -> ExportManifest:
+    """Write chunks of records to shards and write the manifest of the export
+
+    Args:
+        dataset: Exported dataset
+        directory: Directory receiving the files
+        pieces: Chunks of records to write
+        open_shard: Opens a shard file for writing
+        format: File format, also used as the extension of shard files
+        prefix: Prefix of the file names. By default the name of `dataset`
+        shard_bytes: Size (in bytes) after which a new shard is started
+
+    Returns:
+        Manifest of the export
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    if prefix is None:
+        prefix = re.sub(r"[^\w.-]", "_", dataset.name)
+
+    shards = _write_shards(
+        pieces,
+        lambda index: path / f"{prefix}-{index:05d}.{format}",
+        open_shard,
+        shard_bytes=shard_bytes,
+    )
+    manifest = ExportManifest(
+        dataset_name=dataset.name, format=format, shards=tuple(shards)
+    )
+    with open(path / f"{prefix}.manifest.json", "w") as f:
+        json.dump(_manifest_json(manifest), f, indent=2)
+    return manifest
+
+
+def _manifest_json(manifest: ExportManifest) -> Any:
+    """Serialize an export manifest to JSON
+
+    Args:
+        manifest: Manifest to serialize
+    """
+    return {
+        "datasetName": manifest.dataset_name,
+        "format": manifest.format,
+        "rows": manifest.rows,
+        "shards": [
+            {
+                "path": shard.path,
+                "rows": shard.rows,
+                "bytes": shard.bytes,
+                "sha256": shard.sha256,
+            }
+            for shard in manifest.shards
+        ],
+    }
+
+
+def _write_shards(
+    pieces: Iterable[_Piece],
+    shard_path: Callable[[int], Path],
+    open_shard: Callable[[Path], Any],
+    *,
+    shard_bytes: int,
+) -> List[ExportShard]:
+    """Write chunks of records to shards in a background thread
+
+    A new shard is started before a chunk once the current shard holds `shard_bytes` or more.
+    At least one (possibly empty) shard is always written.
+    Chunks are handed to the writer thread through a bounded queue, so that reading records
+    waits for writing when writing is the bottleneck.
+
+    Args:
+        pieces: Chunks of records to write
+        shard_path: Path of the shard with the given index
+        open_shard: Opens a shard file for writing
+        shard_bytes: Size (in bytes) after which a new shard is started
+
+    Returns:
+        Shards written, in order
+
+    Raises:
+        Exception: Any exception raised while writing
+    """
+    q: "queue.Queue[Any]" = queue.Queue(_WRITER_QUEUE_SIZE)
+    failed = threading.Event()
+    errors: List[BaseException] = []
+    shards: List[ExportShard] = []
+
+    def write():
+        current = None
+        while True:
+            item = q.get()
+            if item is _STOP:
+                break
+            if failed.is_set():
+                # keep draining so that the reader is never blocked
+                continue
+            try:
+                current = _apply(item, current, open_shard, shards)
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+        if current is not None:
+            # the export was interrupted, close the incomplete shard
+            try:
+                current[1].close()
+            except Exception:
+                pass
+
+    def put(item: Any):
+        while not failed.is_set():
+            try:
+                q.put(item, timeout=_STOP_POLL_SECONDS)
+                return
+            except queue.Full:
+                pass
+        raise errors[0]
+
+    writer = threading.Thread(target=write, name="tamr-client-export", daemon=True)
+    writer.start()
+    try:
+        for item in _shard_actions(pieces, shard_path, shard_bytes=shard_bytes):
+            put(item)
+    finally:
+        q.put(_STOP)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return shards
+
+
+def _shard_actions(
+    pieces: Iterable[_Piece], shard_path: Callable[[int], Path], *, shard_bytes: int
+) -> Iterator[Tuple[str, Any]]:
+    """Plan the writing of chunks of records to shards
+
+    Args:
+        pieces: Chunks of records to write
+        shard_path: Path of the shard with the given index
+        shard_bytes: Size (in bytes) after which a new shard is started
+
+    Returns:
+        Python generator yielding ``("open", path)``, ``("write", data)`` and
+        ``("close", rows)`` actions
+    """
+    index = 0
+    rows = 0
+    nbytes = 0
+    yield "open", shard_path(index)
+    for piece_rows, piece, piece_nbytes in pieces:
+        if nbytes >= shard_bytes:
+            yield "close", rows
+            index += 1
+            rows = 0
+            nbytes = 0
+            yield "open", shard_path(index)
+        yield "write", piece
+        rows += piece_rows
+        nbytes += piece_nbytes
+    yield "close", rows
+
+
+def _apply(
+    action: Tuple[str, Any],
+    current: Optional[Tuple[Path, Any]],
+    open_shard: Callable[[Path], Any],
+    shards: List[ExportShard],
+) -> Optional[Tuple[Path, Any]]:
+    """Apply an action from :func:`_shard_actions` in the writer thread
+
+    Args:
+        action: Action to apply
+        current: Path of the open shard and the shard itself, if a shard is open
+        open_shard: Opens a shard file for writing
+        shards: Shards written so far, extended when a shard is closed
+
+    Returns:
+        Path of the open shard and the shard itself, if a shard is open
+    """
+    name, value = action
+    if name == "open":
+        return value, open_shard(value)
+    # a shard is always open when writing to or closing it
+    path, shard = cast(Tuple[Path, Any], current)
+    if name == "write":
+        shard.write(value)
+        return current
+    nbytes, sha256 = shard.close()
+    shards.append(ExportShard(path=path.name, rows=value, bytes=nbytes, sha256=sha256))
+    return None
+
+
+class _FileShard:
+    """Shard file written as bytes, optionally compressed
+
+    Args:
+        path: Path of the file
+        header: Bytes written at the start of the file
+        compressor: Compresses the bytes written, e.g. from :func:`zlib.compressobj`
+    """
+
+    def __init__(self, path: Path, *, header: bytes = b"", compressor: Any = None):
+        self._file = open(path, "wb")
+        self._sha256 = hashlib.sha256()
+        self._nbytes = 0
+        self._compressor = compressor
+        if header:
+            self.write(header)
+
+    def write(self, data: bytes):
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._write(data)
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._sha256.update(data)
+        self._nbytes += len(data)
+
+    def close(self) -> Tuple[int, str]:
+        """Close the file
+
+        Returns:
+            Size of the file and its SHA-256 checksum
+        """
+        if self._compressor is not None:
+            self._write(self._compressor.flush())
+        self._file.close()
+        return self._nbytes, self._sha256.hexdigest()
+
+
+class _ParquetShard:
+    """Shard file written as Parquet, one row group per record batch
+
+    The file is written by the Parquet writer of `pyarrow`,
+    so its checksum is computed by reading it back once it is closed.
+
+    Args:
+        path: Path of the file
+        schema: Schema of the record batches
+        compression: Parquet compression codec
+    """
+
+    def __init__(self, path: Path, *, schema: "pa.Schema", compression: str):
+        import pyarrow.parquet as pq
+
+        self._path = path
+        self._writer = pq.ParquetWriter(str(path), schema, compression=compression)
+
+    def write(self, batch: "pa.RecordBatch"):
+        self._writer.write_batch(batch)
+
+    def close(self) -> Tuple[int, str]:
+        """Close the file
+
+        Returns:
+            Size of the file and its SHA-256 checksum
+        """
+        self._writer.close()
+        sha256 = hashlib.sha256()
+        with open(self._path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_BYTES), b""):
+                sha256.update(chunk)
+        return self._path.stat().st_size, sha256.hexdigest()
+
+
+def _line_pieces(lines: Iterable[bytes], chunk_bytes: int) -> Iterator[_Piece]:
+    """Group lines into newline-delimited chunks of about `chunk_bytes` bytes
+
+    Args:
+        lines: Lines without trailing newline
+        chunk_bytes: Size (in bytes) after which a chunk is completed
+    """
+    chunk: List[bytes] = []
+    nbytes = 0
+    for line in lines:
+        chunk.append(line)
+        nbytes += len(line) + 1
+        if nbytes >= chunk_bytes:
+            yield len(chunk), b"\n".join(chunk) + b"\n", nbytes
+            chunk = []
+            nbytes = 0
+    if chunk:
+        yield len(chunk), b"\n".join(chunk) + b"\n", nbytes
+
+
+def _csv_pieces(rows: Iterable[List[Any]], chunk_bytes: int) -> Iterator[_Piece]:
+    """Encode rows into CSV chunks of about `chunk_bytes` bytes
+
+    Args:
+        rows: Fields of each row
+        chunk_bytes: Size (in bytes) after which a chunk is completed
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        # the size in characters is a lower bound of the encoded size
+        if buffer.tell() >= chunk_bytes:
+            data = buffer.getvalue().encode("utf-8")
+            yield count, data, len(data)
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    if count:
+        data = buffer.getvalue().encode("utf-8")
+        yield count, data, len(data)
+
+
+def _csv_rows(rows: Iterable[List[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_formatter(
+    attr_type: AttributeType, *, array_delimiter: str, dumps: Callable[[Any], bytes]
+) -> Callable[[Any], Any]:
+    """Get a function flattening values of an attribute type into a CSV field
+
+    Args:
+        attr_type: Type of the attribute
+        array_delimiter: Delimiter between the elements of arrays of primitive values
+        dumps: Serializes complex values as JSON
+    """
+    if isinstance(attr_type, PrimitiveType):
+        return _csv_scalar
+    if isinstance(attr_type, Array) and isinstance(attr_type.inner_type, PrimitiveType):
+
+        def join(value: Any) -> Any:
+            if value is None:
+                return ""
+            return array_delimiter.join(
+                str(_csv_scalar(v)) for v in value if v is not None
+            )
+
+        return join
+
+    def to_json(value: Any) -> Any:
+        if value is None:
+            return ""
+        return dumps(value).decode("utf-8")
+
+    return to_json
+
+
+def _csv_scalar(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
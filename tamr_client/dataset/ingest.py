@@ -0,0 +1,481 @@
+"""
+Load local files into datasets.
+
+Files are read incrementally and their records are sent through the same batched upload machinery
+as :func:`~tamr_client.record.upsert`, so that memory stays bounded whatever the size of the files:
+
+- newline-delimited JSON files are memory-mapped, and each record is wrapped into a CREATE command
+  straight from the mapped bytes, without being parsed
+- CSV files are read row by row
+- Parquet files are read one row group at a time
+
+Progress can be followed with a callback, called with an :class:`~tamr_client.IngestProgress`
+every 10,000 records and once each file is uploaded.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import glob
+import mmap
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tamr_client import codec, primary_key
+from tamr_client._types import (
+    Codec,
+    Dataset,
+    IngestProgress,
+    JsonDict,
+    Session,
+    UploadOptions,
+)
+from tamr_client.dataset import record
+
+_PROGRESS_RECORDS = 10_000
+_CONCURRENCY = 4
+_WHITESPACE = b" \t\r"
+_FORMATS = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+PathLike = Union[str, Path]
+Progress = Callable[[IngestProgress], None]
+# a record read from a file: bytes of the file read so far, record ID and serialized command
+_Update = Tuple[int, Any, bytes]
+
+
+def from_ndjson(
+    session: Session,
+    dataset: Dataset,
+    path: PathLike,
+    *,
+    primary_key_name: Optional[str] = None,
+    progress: Optional[Progress] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update a record for each line of a newline-delimited JSON file
+
+    The file is memory-mapped and each line is copied only once, into its CREATE command.
+    The primary key value of each record is found as by :func:`~tamr_client.record.upsert_raw`.
+    Blank lines are skipped.
+
+    Args:
+        dataset: Dataset to receive record updates
+        path: Path of the file
+        primary_key_name: The primary key for these records, which must be a key in each record.
+            By default the key_attribute_name of dataset
+        progress: Called with the progress of the ingestion every 10,000 records,
+            and once all records are uploaded
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name not in a record
+    """
+    primary_key_name = _primary_key_name(dataset, primary_key_name)
+    updates = _ndjson_updates(
+        path, primary_key_name=primary_key_name, codec=codec._from_session(session)
+    )
+    return _ingest(
+        session,
+        dataset,
+        path,
+        updates,
+        progress=progress,
+        options=options,
+    )
+
+
+def from_csv(
+    session: Session,
+    dataset: Dataset,
+    path: PathLike,
+    *,
+    primary_key_name: Optional[str] = None,
+    progress: Optional[Progress] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update a record for each row of a CSV file
+
+    The file must be UTF-8 encoded, with a header row naming the attribute of each column.
+    All values are read as strings, and empty fields are read as missing values.
+
+    Args:
+        dataset: Dataset to receive record updates
+        path: Path of the file
+        primary_key_name: The primary key for these records, which must be a column of the file.
+            By default the key_attribute_name of dataset
+        progress: Called with the progress of the ingestion every 10,000 records,
+            and once all records are uploaded
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name is not a column of the file
+    """
+    primary_key_name = _primary_key_name(dataset, primary_key_name)
+    updates = _csv_updates(
+        path,
+        primary_key_name=primary_key_name,
+        dumps=codec._from_session(session).dumps,
+    )
+    return _ingest(
+        session,
+        dataset,
+        path,
+        updates,
+        progress=progress,
+        options=options,
+    )
+
+
+def from_parquet(
+    session: Session,
+    dataset: Dataset,
+    path: PathLike,
+    *,
+    primary_key_name: Optional[str] = None,
+    progress: Optional[Progress] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update a record for each row of a Parquet file
+
+    Requires the `pyarrow` package.
+    The file is read one row group at a time, and rows are serialized column by column
+    as by :func:`~tamr_client.record.upsert_arrow`.
+
+    Args:
+        dataset: Dataset to receive record updates
+        path: Path of the file
+        primary_key_name: The primary key for these records, which must be a column of the file.
+            By default the key_attribute_name of dataset
+        progress: Called with the progress of the ingestion every 10,000 records,
+            and once all records are uploaded
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name is not a column of the file
+    """
+    primary_key_name = _primary_key_name(dataset, primary_key_name)
+    updates = _parquet_updates(
+        path,
+        primary_key_name=primary_key_name,
+        dumps=codec._from_session(session).dumps,
+    )
+    return _ingest(
+        session,
+        dataset,
+        path,
+        updates,
+        progress=progress,
+        options=options,
+    )
+
+
+def from_files(
+    session: Session,
+    dataset: Dataset,
+    paths: Union[PathLike, Iterable[PathLike]],
+    *,
+    format: Optional[str] = None,
+    concurrency: int = _CONCURRENCY,
+    primary_key_name: Optional[str] = None,
+    progress: Optional[Progress] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update the records of several files, loading files concurrently
+
+    Each file is loaded as by :func:`from_ndjson`, :func:`from_csv` or :func:`from_parquet`,
+    depending on its format. Records of different files are uploaded in separate requests,
+    so records with the same primary key in several files may be applied in any order.
+
+    Args:
+        dataset: Dataset to receive record updates
+        paths: A directory, from which all files with a known extension are loaded;
+            a glob pattern e.g. ``"exports/*.parquet"``; or a list of file paths
+        format: Format of all files, one of ``"ndjson"``, ``"csv"`` or ``"parquet"``.
+            By default the format of each file is inferred from its extension:
+            ``.ndjson`` and ``.jsonl`` for newline-delimited JSON, ``.csv`` and ``.parquet``
+        concurrency: Maximum number of files loaded at once
+        primary_key_name: The primary key for these records. By default the key_attribute_name
+            of dataset
+        progress: Called with the progress of the ingestion of each file every 10,000 records,
+            and once all records of the file are uploaded. May be called from several threads
+        options: Options for sending the records of each file. By default all records of a
+            file are streamed in a single request
+
+    Returns:
+        JSON response body from server, merged for all files
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name is not in a record
+        FileNotFoundError: If no file matches `paths`
+        ValueError: If the format of a file is not supported, or if `concurrency` is not positive
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be positive, but was {concurrency}")
+    files = _expand(paths)
+    if not files:
+        raise FileNotFoundError(f"No files found for: {paths}")
+    loaders = [_loader(format or _format(f)) for f in files]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                load,
+                session,
+                dataset,
+                f,
+                primary_key_name=primary_key_name,
+                progress=progress,
+                options=options,
+            )
+            for f, load in zip(files, loaders)
+        ]
+        try:
+            return record._merge_responses(f.result() for f in futures)
+        finally:
+            # after a failure, files that are not loaded yet are skipped
+            for f in futures:
+                f.cancel()
+
+
+def _primary_key_name(dataset: Dataset, primary_key_name: Optional[str]) -> str:
+    """Get the primary key of records loaded into `dataset`
+
+    Raises:
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+    """
+    if primary_key_name is None:
+        return dataset.key_attribute_names[0]
+    if primary_key_name not in dataset.key_attribute_names:
+        raise primary_key.NotFound(
+            f"Primary key: {primary_key_name} is not in dataset key attribute names: {dataset.key_attribute_names}"
+        )
+    return primary_key_name
+
+
+def _ingest(
+    session: Session,
+    dataset: Dataset,
+    path: PathLike,
+    updates: Iterable[_Update],
+    *,
+    progress: Optional[Progress],
+    options: UploadOptions,
+) -> JsonDict:
+    """Upload the records read from a file, reporting progress
+
+    Args:
+        dataset: Dataset to receive record updates
+        path: Path of the file
+        updates: Records read from the file
+        progress: Called with the progress of the ingestion
+        options: Options for sending the records
+    """
+    total_bytes = os.path.getsize(path)
+    records = 0
+
+    def keyed_updates() -> Iterator[Tuple[Any, bytes]]:
+        nonlocal records
+        for bytes_read, record_id, command in updates:
+            yield record_id, command
+            records += 1
+            if progress is not None and records % _PROGRESS_RECORDS == 0:
+                progress(
+                    IngestProgress(
+                        path=str(path),
+                        records=records,
+                        bytes_read=bytes_read,
+                        total_bytes=total_bytes,
+                    )
+                )
+
+    r = record._update_serialized(session, dataset, keyed_updates(), options=options)
+    if progress is not None:
+        progress(
+            IngestProgress(
+                path=str(path),
+                records=records,
+                bytes_read=total_bytes,
+                total_bytes=total_bytes,
+                done=True,
+            )
+        )
+    return r
+
+
+def _ndjson_updates(
+    path: PathLike, *, primary_key_name: str, codec: Codec
+) -> Iterator[_Update]:
+    """Read the records of a newline-delimited JSON file as CREATE commands
+
+    Args:
+        path: Path of the file
+        primary_key_name: The primary key for these records, which must be a key in each record
+        codec: Codec used to parse records whose primary key cannot be found by a scan
+    """
+    pattern = record._raw_key_pattern(primary_key_name)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # empty files cannot be memory-mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                next_start = size if end == -1 else end + 1
+                if end == -1:
+                    end = size
+                while start < end and mm[start] in _WHITESPACE:
+                    start += 1
+                while end > start and mm[end - 1] in _WHITESPACE:
+                    end -= 1
+                if start < end:
+                    key = record._raw_key(
+                        mm,
+                        start,
+                        end,
+                        primary_key_name=primary_key_name,
+                        pattern=pattern,
+                        codec=codec,
+                    )
+                    # copy the record once, straight from the mapped file into the command
+                    with memoryview(mm) as view:
+                        command = b"".join(
+                            (
+                                b'{"action": "CREATE", "recordId": ',
+                                key,
+                                b', "record": ',
+                                view[start:end],
+                                b"}",
+                            )
+                        )
+                    # partition by value, as scanned and re-serialized keys may differ
+                    yield next_start, codec.loads(key), command
+                start = next_start
+
+
+def _csv_updates(
+    path: PathLike, *, primary_key_name: str, dumps: Callable[[Any], bytes]
+) -> Iterator[_Update]:
+    """Read the rows of a CSV file as serialized CREATE commands
+
+    Args:
+        path: Path of the file
+        primary_key_name: The primary key for these records, which must be a column of the file
+        dumps: Serializes commands as JSON
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None or primary_key_name not in reader.fieldnames:
+            raise primary_key.NotFound(
+                f"Primary key: {primary_key_name} is not in CSV columns: {reader.fieldnames}"
+            )
+        for row in reader:
+            r: Dict[str, Any] = {k: (v if v else None) for k, v in row.items()}
+            command = record._create_command(r, primary_key_name=primary_key_name)
+            # the raw file position includes the text read ahead by the decoder
+            yield f.buffer.tell(), command["recordId"], dumps(command)
+
+
+def _parquet_updates(
+    path: PathLike, *, primary_key_name: str, dumps: Callable[[Any], bytes]
+) -> Iterator[_Update]:
+    """Read the rows of a Parquet file as serialized CREATE commands, one row group at a time
+
+    Args:
+        path: Path of the file
+        primary_key_name: The primary key for these records, which must be a column of the file
+        dumps: Serializes values as JSON
+    """
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(str(path))
+    bytes_read = 0
+    for i in range(pf.num_row_groups):
+        row_group = pf.metadata.row_group(i)
+        bytes_read += sum(
+            row_group.column(j).total_compressed_size
+            for j in range(row_group.num_columns)
+        )
+        for batch in pf.read_row_group(i).to_batches():
+            for record_id, command in record._arrow_create_commands(
+                batch, primary_key_name=primary_key_name, dumps=dumps
+            ):
+                yield bytes_read, record_id, command
+
+
+def _expand(paths: Union[PathLike, Iterable[PathLike]]) -> List[Path]:
+    """Expand a directory, a glob pattern or a list of paths into a list of files
+
+    Args:
+        paths: A directory, a glob pattern or a list of file paths
+    """
+    if not isinstance(paths, (str, Path)):
+        return [Path(p) for p in paths]
+    path = Path(paths)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.is_file() and p.suffix in _FORMATS)
+    if path.exists():
+        return [path]
+    return sorted(Path(p) for p in glob.glob(str(paths), recursive=True))
+
+
+def _format(path: Path) -> str:
+    """Infer the format of a file from its extension
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    try:
+        return _FORMATS[path.suffix]
+    except KeyError:
+        raise ValueError(
+            f"Cannot infer the format of {path}, extension must be one of {list(_FORMATS)}"
+        )
+
+
+def _loader(format: str) -> Callable[..., JsonDict]:
+    """Get the function loading files of a format
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    loaders = {"ndjson": from_ndjson, "csv": from_csv, "parquet": from_parquet}
+    try:
+        return loaders[format]
+    except KeyError:
+        raise ValueError(f"Format must be one of {list(loaders)}, but was '{format}'")
@@ -4,22 +4,295 @@ See https://docs.tamr.com/reference/record
 :func:`~tamr_client.record.delete` functions for all use cases they can handle. For more advanced use cases, the
 underlying :func:`~tamr_client.record._update` function can be used directly."
 """
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, ExitStack
+from functools import partial
+import io
+from itertools import islice
 import json
-from typing import cast, Dict, IO, Iterable, Iterator, Optional
+import os
+import queue
+import re
+import tempfile
+import threading
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
+import zlib
 
+from tamr_client import attribute
+from tamr_client import codec
 from tamr_client import primary_key
 from tamr_client import response
-from tamr_client._types import AnyDataset, Dataset, JsonDict, Session
+from tamr_client._types import (
+    AnyDataset,
+    Attribute,
+    Codec,
+    Dataset,
+    InternStats,
+    JsonDict,
+    PrefetchStats,
+    Row,
+    Session,
+    UploadOptions,
+)
 
+_PARALLEL_BATCH_SIZE = 10_000
+_BUFFER_SIZE = 1024 * 1024
+_SPOOL_MAX_MEMORY = 64 * 1024 * 1024
+_NEWLINE = ord("\n")
+_COMPRESSION_LEVEL = 6
+# `wbits` of the zlib container for each supported `Content-Encoding`
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+_ARROW_BATCH_SIZE = 10_000
 
-def _update(session: Session, dataset: Dataset, updates: Iterable[Dict]) -> JsonDict:
+BUILDING_DOCS = os.environ.get("TAMR_CLIENT_DOCS") == "1"
+if TYPE_CHECKING or BUILDING_DOCS:
+    import pyarrow as pa
+
+
+def _update(
+    session: Session,
+    dataset: Dataset,
+    updates: Iterable[Dict],
+    *,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
     """Send a batch of record creations/updates/deletions to this dataset.
     You probably want to use :func:`~tamr_client.record.upsert`
     or :func:`~tamr_client.record.delete` instead.
 
+    Updates are serialized with the JSON codec of `session`.
+
     Args:
         dataset: Dataset containing records to be updated
         updates: Each update should be formatted as specified in the `Public Docs for Dataset updates <https://docs.tamr.com/reference#modify-a-datasets-records>`_.
+        options: Options for sending the updates, e.g. in batches over several connections.
+            By default all updates are streamed in a single request
+
+    Returns:
+        JSON response body from server.
+        When batching, the responses for all batches are merged into a single response body.
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `workers` or `max_in_flight` is not positive
+        ValueError: If `compression` or `compression_level` is not supported
+    """
+    dumps = codec._from_session(session).dumps
+    keyed_updates = ((_record_id(update), dumps(update)) for update in updates)
+    return _update_serialized(session, dataset, keyed_updates, options=options)
+
+
+def _update_serialized(
+    session: Session,
+    dataset: Dataset,
+    keyed_updates: Iterable[Tuple[Any, bytes]],
+    *,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Send serialized record creations/updates/deletions to this dataset.
+
+    See :func:`~tamr_client.record._update`.
+
+    Args:
+        dataset: Dataset containing records to be updated
+        keyed_updates: Pairs of record ID and update serialized as JSON.
+            Record IDs only determine which worker sends each update
+
+    Returns:
+        JSON response body from server.
+        When batching, the responses for all batches are merged into a single response body.
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `workers` or `max_in_flight` is not positive
+        ValueError: If `compression` or `compression_level` is not supported
+    """
+    if options.compression is not None:
+        _compressor(options.compression, options.compression_level)
+    post = partial(
+        _post_updates,
+        session,
+        dataset,
+        compression=options.compression,
+        compression_level=options.compression_level,
+    )
+    batched = options.batch_size is not None or options.batch_bytes is not None
+    if options.workers > 1:
+        return _update_parallel(
+            post,
+            keyed_updates,
+            workers=options.workers,
+            batch_size=options.batch_size if batched else _PARALLEL_BATCH_SIZE,
+            batch_bytes=options.batch_bytes,
+            max_in_flight=options.max_in_flight,
+        )
+    if options.workers < 1:
+        raise ValueError(
+            f"Number of workers must be positive, but was {options.workers}"
+        )
+
+    stringified_updates = (update for _, update in keyed_updates)
+    if not batched:
+        if options.spool:
+            with _spool(stringified_updates) as body:
+                return post(body)
+        if options.buffer_size is not None:
+            return post(_coalesce(stringified_updates, options.buffer_size))
+        return post(stringified_updates)
+
+    batches = _batches(
+        stringified_updates, size=options.batch_size, nbytes=options.batch_bytes
+    )
+    return _merge_responses(post(b"\n".join(batch)) for batch in batches)
+
+
+def _update_parallel(
+    post: Callable[[bytes], JsonDict],
+    keyed_updates: Iterable[Tuple[Any, bytes]],
+    *,
+    workers: int,
+    batch_size: Optional[int] = None,
+    batch_bytes: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> JsonDict:
+    """Send batches of serialized updates to this dataset concurrently.
+
+    Each update is assigned to a worker by hashing its record ID, and each worker sends
+    its batches sequentially, so updates to the same record are applied in order.
+    Once any batch fails, no further batches are sent.
+
+    Args:
+        post: Sends a newline-delimited body of updates and returns the JSON response body
+        keyed_updates: Pairs of record ID and update serialized as JSON
+        workers: Number of concurrent connections used to send batches
+        batch_size: Maximum number of updates sent per request
+        batch_bytes: Maximum size (in bytes) of the serialized updates sent per request
+        max_in_flight: Maximum number of batches held in memory (queued or being sent) at once.
+            By default twice the number of workers
+
+    Returns:
+        JSON response bodies from server for all batches, merged into a single response body
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `max_in_flight` is not positive
+    """
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    if max_in_flight < 1:
+        raise ValueError(f"Max in flight must be positive, but was {max_in_flight}")
+
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+    failed = threading.Event()
+    queues: List["queue.Queue[Optional[List[bytes]]]"] = [
+        queue.Queue() for _ in range(workers)
+    ]
+
+    def send(q: "queue.Queue[Optional[List[bytes]]]") -> List[JsonDict]:
+        responses = []
+        error: Optional[BaseException] = None
+        while True:
+            batch = q.get()
+            if batch is None:
+                break
+            try:
+                # keep draining after a failure so that the producer is never blocked
+                if not failed.is_set():
+                    responses.append(post(b"\n".join(batch)))
+            except BaseException as e:
+                error = e
+                failed.set()
+            finally:
+                in_flight.release()
+        if error is not None:
+            raise error
+        return responses
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(send, q) for q in queues]
+        try:
+            pending: List[List[bytes]] = [[] for _ in range(workers)]
+            pending_nbytes = [0] * workers
+            for record_id, update in keyed_updates:
+                if failed.is_set():
+                    break
+                i = _partition(record_id, workers)
+                update_nbytes = len(update) + 1
+                if _is_full(
+                    pending[i],
+                    pending_nbytes[i],
+                    update_nbytes,
+                    size=batch_size,
+                    nbytes=batch_bytes,
+                ):
+                    in_flight.acquire()
+                    queues[i].put(pending[i])
+                    pending[i] = []
+                    pending_nbytes[i] = 0
+                pending[i].append(update)
+                pending_nbytes[i] += update_nbytes
+            for i, batch in enumerate(pending):
+                if batch and not failed.is_set():
+                    in_flight.acquire()
+                    queues[i].put(batch)
+        finally:
+            for q in queues:
+                q.put(None)
+        return _merge_responses(r for f in futures for r in f.result())
+
+
+def _record_id(update: Dict) -> Any:
+    """Get the record ID targeted by an update
+
+    Args:
+        update: Update formatted as specified in the `Public Docs for Dataset updates <https://docs.tamr.com/reference#modify-a-datasets-records>`_.
+    """
+    if "recordId" in update:
+        return update["recordId"]
+    return update.get("compositeRecordId")
+
+
+def _partition(record_id: Any, n: int) -> int:
+    """Deterministically assign a record ID to one of `n` partitions
+
+    Args:
+        record_id: Record ID (or composite record ID) of an update
+        n: Number of partitions
+    """
+    return zlib.crc32(json.dumps(record_id).encode("utf-8")) % n
+
+
+def _post_updates(
+    session: Session,
+    dataset: Dataset,
+    stringified_updates: Union[bytes, IO[bytes], Iterable[bytes]],
+    *,
+    compression: Optional[str] = None,
+    compression_level: int = _COMPRESSION_LEVEL,
+) -> JsonDict:
+    """Send serialized updates to this dataset in a single request.
+
+    Args:
+        dataset: Dataset containing records to be updated
+        stringified_updates: Updates serialized as JSON, either as a stream,
+            or as a single newline-delimited body or file
+        compression: Content encoding used to compress the request body
+        compression_level: Compression level, from 0 (no compression) to 9 (best compression)
 
     Returns:
         JSON response body from server
@@ -27,23 +300,243 @@ def _update(session: Session, dataset: Dataset, updates: Iterable[Dict]) -> Json
     Raises:
         requests.HTTPError: If an HTTP error is encountered
     """
-    stringified_updates = (json.dumps(update).encode("utf-8") for update in updates)
+    body = stringified_updates
+    if compression is not None:
+        body = _compress(body, compression=compression, level=compression_level)
     # `requests` accepts a generator for `data` param, but stubs for `requests` in https://github.com/python/typeshed expects this to be a file-like object
-    io_updates = cast(IO, stringified_updates)
-    r = session.post(
+    io_updates = cast(IO, body)
+    # record updates are idempotent, so batches can be replayed by the retry policy
+    r = session.request(
+        "POST",
         str(dataset.url) + ":updateRecords",
-        headers={"Content-Encoding": "utf-8"},
+        headers={"Content-Encoding": compression or "utf-8"},
         data=io_updates,
+        idempotent=True,
+        profile="stream",
     )
     return response.successful(r).json()
 
 
+def _compressor(compression: str, level: int) -> Any:
+    """Create a compressor for a `Content-Encoding`
+
+    Args:
+        compression: Content encoding, either "gzip" or "deflate"
+        level: Compression level, from 0 (no compression) to 9 (best compression)
+
+    Raises:
+        ValueError: If `compression` or `level` is not supported
+    """
+    if compression not in _WBITS:
+        raise ValueError(
+            f"Compression must be one of {list(_WBITS)}, but was '{compression}'"
+        )
+    if not 0 <= level <= 9:
+        raise ValueError(f"Compression level must be from 0 to 9, but was {level}")
+    return zlib.compressobj(level, zlib.DEFLATED, _WBITS[compression])
+
+
+def _compress(
+    body: Union[bytes, IO[bytes], Iterable[bytes]], *, compression: str, level: int
+) -> Union[bytes, Iterator[bytes]]:
+    """Compress a request body
+
+    A body given as bytes is compressed at once, so that its size is still known.
+    Otherwise the body is compressed incrementally as it is sent, without being held in memory.
+
+    Args:
+        body: Request body, as bytes, as a file, or as a stream of chunks
+        compression: Content encoding, either "gzip" or "deflate"
+        level: Compression level, from 0 (no compression) to 9 (best compression)
+
+    Raises:
+        ValueError: If `compression` or `level` is not supported
+    """
+    compressor = _compressor(compression, level)
+    if isinstance(body, bytes):
+        return compressor.compress(body) + compressor.flush()
+    chunks: Iterable[bytes] = body
+    if hasattr(body, "read"):
+        f = cast(IO[bytes], body)
+        chunks = iter(lambda: f.read(_BUFFER_SIZE), b"")
+
+    def compressed() -> Iterator[bytes]:
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            # the compressor holds back output until it has enough input
+            if data:
+                yield data
+        yield compressor.flush()
+
+    return compressed()
+
+
+def _coalesce(
+    stringified_updates: Iterable[bytes], buffer_size: int
+) -> Iterator[bytes]:
+    """Pack serialized updates into newline-delimited chunks of about `buffer_size` bytes.
+
+    Updates are copied into a single preallocated buffer, so that the transport sends
+    few large chunks instead of one small chunk per update.
+
+    Args:
+        stringified_updates: Updates serialized as JSON
+        buffer_size: Size (in bytes) of the buffer. Updates larger than the buffer are sent
+            in chunks of their own
+
+    Returns:
+        Python generator yielding chunks of newline-delimited updates
+
+    Raises:
+        ValueError: If `buffer_size` is not positive
+    """
+    if buffer_size < 1:
+        raise ValueError(f"Buffer size must be positive, but was {buffer_size}")
+
+    buffer = memoryview(bytearray(buffer_size))
+    end = 0
+    for update in stringified_updates:
+        update_end = end + len(update) + 1
+        if update_end > buffer_size:
+            if end > 0:
+                yield bytes(buffer[:end])
+                end = 0
+                update_end = len(update) + 1
+            if update_end > buffer_size:
+                yield update + b"\n"
+                continue
+        buffer[end : update_end - 1] = update
+        buffer[update_end - 1] = _NEWLINE
+        end = update_end
+    if end > 0:
+        yield bytes(buffer[:end])
+
+
+@contextmanager
+def _spool(stringified_updates: Iterable[bytes]) -> Iterator[Union[bytes, IO[bytes]]]:
+    """Write serialized updates to a newline-delimited body of known size.
+
+    The body is kept in memory until it grows larger than 64 MiB,
+    after which it is written to a temporary file.
+    Sending a body of known size lets `requests` set the `Content-Length` of the request
+    instead of using chunked encoding.
+
+    Args:
+        stringified_updates: Updates serialized as JSON
+
+    Returns:
+        Context manager providing the body, as bytes or as a file positioned at its start.
+        The file is closed when exiting the context.
+    """
+    with ExitStack() as stack:
+        f: IO[bytes] = io.BytesIO()
+        in_memory = True
+        for chunk in _coalesce(stringified_updates, _BUFFER_SIZE):
+            f.write(chunk)
+            if in_memory and f.tell() > _SPOOL_MAX_MEMORY:
+                spilled = stack.enter_context(tempfile.TemporaryFile())
+                spilled.write(cast(io.BytesIO, f).getbuffer())
+                f = spilled
+                in_memory = False
+        if in_memory:
+            yield cast(io.BytesIO, f).getvalue()
+        else:
+            f.seek(0)
+            yield f
+
+
+def _batches(
+    stringified_updates: Iterable[bytes],
+    *,
+    size: Optional[int] = None,
+    nbytes: Optional[int] = None,
+) -> Iterator[List[bytes]]:
+    """Group serialized updates into batches bounded in number and in size.
+
+    Only one batch is held in memory at a time.
+
+    Args:
+        stringified_updates: Updates serialized as JSON
+        size: Maximum number of updates per batch
+        nbytes: Maximum size (in bytes) of each batch, including newline delimiters
+
+    Returns:
+        Python generator yielding batches of serialized updates
+
+    Raises:
+        ValueError: If `size` or `nbytes` is not positive
+    """
+    if size is not None and size < 1:
+        raise ValueError(f"Batch size must be positive, but was {size}")
+    if nbytes is not None and nbytes < 1:
+        raise ValueError(f"Batch bytes must be positive, but was {nbytes}")
+
+    batch: List[bytes] = []
+    batch_nbytes = 0
+    for update in stringified_updates:
+        update_nbytes = len(update) + 1
+        if _is_full(batch, batch_nbytes, update_nbytes, size=size, nbytes=nbytes):
+            yield batch
+            batch = []
+            batch_nbytes = 0
+        batch.append(update)
+        batch_nbytes += update_nbytes
+    if batch:
+        yield batch
+
+
+def _is_full(
+    batch: List[bytes],
+    batch_nbytes: int,
+    update_nbytes: int,
+    *,
+    size: Optional[int] = None,
+    nbytes: Optional[int] = None,
+) -> bool:
+    """Check if a batch must be sent before another update can be added to it
+
+    Args:
+        batch: Serialized updates in the batch
+        batch_nbytes: Size (in bytes) of the batch
+        update_nbytes: Size (in bytes) of the update to be added
+        size: Maximum number of updates per batch
+        nbytes: Maximum size (in bytes) of each batch
+    """
+    if not batch:
+        return False
+    if size is not None and len(batch) >= size:
+        return True
+    return nbytes is not None and batch_nbytes + update_nbytes > nbytes
+
+
+def _merge_responses(responses: Iterable[JsonDict]) -> JsonDict:
+    """Merge the response bodies of several `:updateRecords` requests into one.
+
+    Args:
+        responses: JSON response bodies from server
+
+    Returns:
+        A single response body summarizing all commands processed
+    """
+    merged: JsonDict = {
+        "numCommandsProcessed": 0,
+        "allCommandsSucceeded": True,
+        "validationErrors": [],
+    }
+    for r in responses:
+        merged["numCommandsProcessed"] += r.get("numCommandsProcessed", 0)
+        merged["allCommandsSucceeded"] &= r.get("allCommandsSucceeded", True)
+        merged["validationErrors"].extend(r.get("validationErrors", []))
+    return merged
+
+
 def upsert(
     session: Session,
     dataset: Dataset,
     records: Iterable[Dict],
     *,
     primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
 ) -> JsonDict:
     """Create or update the specified records.
 
@@ -52,9 +545,11 @@ def upsert(
         records: The records to update, as dictionaries
         primary_key_name: The primary key for these records, which must be a key in each record dictionary.
             By default the key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
 
     Returns:
-        JSON response body from server
+        JSON response body from server. When batching, the responses for all batches are merged
 
     Raises:
         requests.HTTPError: If an HTTP error is encountered
@@ -71,7 +566,12 @@ def upsert(
     updates = (
         _create_command(record, primary_key_name=primary_key_name) for record in records
     )
-    return _update(session, dataset, updates)
+    return _update(
+        session,
+        dataset,
+        updates,
+        options=options,
+    )
 
 
 def delete(
@@ -80,6 +580,7 @@ def delete(
     records: Iterable[Dict],
     *,
     primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
 ) -> JsonDict:
     """Deletes the specified records, based on primary key values.  Does not check that other attribute values match.
 
@@ -88,9 +589,11 @@ def delete(
         records: The records to update, as dictionaries
         primary_key_name: The primary key for these records, which must be a key in each record dictionary.
             By default the key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
 
     Returns:
-        JSON response body from server
+        JSON response body from server. When batching, the responses for all batches are merged
 
     Raises:
         requests.HTTPError: If an HTTP error is encountered
@@ -107,7 +610,158 @@ def delete(
     updates = (
         _delete_command(record, primary_key_name=primary_key_name) for record in records
     )
-    return _update(session, dataset, updates)
+    return _update(
+        session,
+        dataset,
+        updates,
+        options=options,
+    )
+
+
+def upsert_raw(
+    session: Session,
+    dataset: Dataset,
+    records: Iterable[bytes],
+    *,
+    primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update the specified records, given as serialized JSON objects.
+
+    Records are wrapped into CREATE commands by byte concatenation, without being parsed.
+    The primary key value of each record is found by a lightweight scan of its bytes,
+    falling back to parsing the record with the JSON codec of `session` when the scan is
+    ambiguous (e.g. when the primary key is preceded by nested values or escaped characters).
+
+    Together with :func:`~tamr_client.record.stream_raw`, this allows copying records
+    between datasets or files without parsing and re-serializing them.
+
+    Args:
+        dataset: Dataset to receive record updates
+        records: The records to update, each as a UTF-8 encoded JSON object
+            e.g. a line of a newline-delimited JSON file
+        primary_key_name: The primary key for these records, which must be a key in each record.
+            By default the key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name not in a record
+    """
+    if primary_key_name is None:
+        primary_key_name = dataset.key_attribute_names[0]
+
+    if primary_key_name not in dataset.key_attribute_names:
+        raise primary_key.NotFound(
+            f"Primary key: {primary_key_name} is not in dataset key attribute names: {dataset.key_attribute_names}"
+        )
+    c = codec._from_session(session)
+    pattern = _raw_key_pattern(primary_key_name)
+    keyed_updates = (
+        _raw_create_command(
+            record, primary_key_name=primary_key_name, pattern=pattern, codec=c
+        )
+        for record in records
+    )
+    return _update_serialized(session, dataset, keyed_updates, options=options)
+
+
+def _raw_key_pattern(primary_key_name: str) -> Pattern[bytes]:
+    """Pattern matching a primary key and its scalar value within a serialized record
+
+    Args:
+        primary_key_name: The primary key for records
+    """
+    key = re.escape(json.dumps(primary_key_name).encode("utf-8"))
+    return re.compile(
+        key + rb'\s*:\s*("[^"\\]*"|-?[0-9][0-9.eE+-]*|true|false|null)\s*[,}]'
+    )
+
+
+def _raw_create_command(
+    record: bytes, *, primary_key_name: str, pattern: Pattern[bytes], codec: Codec
+) -> Tuple[Any, bytes]:
+    """Generates the CREATE command for a serialized record, without parsing the record
+
+    Args:
+        record: The record to create, as a UTF-8 encoded JSON object
+        primary_key_name: The primary key for this record, which must be a key in the record
+        pattern: Pattern matching the primary key and its value,
+            from :func:`~tamr_client.record._raw_key_pattern`
+        codec: Codec used to parse the record if its primary key cannot be found by a scan
+
+    Returns:
+        The primary key value, and the serialized CREATE command
+
+    Raises:
+        primary_key.NotFound: If primary_key_name not in the record
+    """
+    record = record.strip()
+    key = _raw_key(
+        record,
+        0,
+        len(record),
+        primary_key_name=primary_key_name,
+        pattern=pattern,
+        codec=codec,
+    )
+    command = (
+        b'{"action": "CREATE", "recordId": ' + key + b', "record": ' + record + b"}"
+    )
+    # partition by value, as scanned and re-serialized keys may differ for the same value
+    return codec.loads(key), command
+
+
+def _raw_key(
+    buffer: Any,
+    start: int,
+    end: int,
+    *,
+    primary_key_name: str,
+    pattern: Pattern[bytes],
+    codec: Codec,
+) -> bytes:
+    """Find the serialized primary key value of a record, without parsing the record
+
+    Args:
+        buffer: Bytes-like object (e.g. bytes or a memory-mapped file) containing the record
+        start: Index of the first byte of the record in `buffer`, which must be `{`
+        end: Index after the last byte of the record in `buffer`
+        primary_key_name: The primary key for this record, which must be a key in the record
+        pattern: Pattern matching the primary key and its value,
+            from :func:`~tamr_client.record._raw_key_pattern`
+        codec: Codec used to parse the record if its primary key cannot be found by a scan
+
+    Returns:
+        The primary key value serialized as JSON
+
+    Raises:
+        primary_key.NotFound: If primary_key_name not in the record
+    """
+    match = pattern.search(buffer, start, end)
+    if match is not None:
+        prefix = buffer[start + 1 : match.start()]
+        # the match is a top-level key only if no nested value or escaped character precedes it,
+        # and only if it is not inside a string
+        if (
+            b"{" not in prefix
+            and b"[" not in prefix
+            and b"\\" not in prefix
+            and prefix.count(b'"') % 2 == 0
+        ):
+            return match.group(1)
+    record = buffer[start:end]
+    try:
+        return codec.dumps(codec.loads(record)[primary_key_name])
+    except KeyError:
+        raise primary_key.NotFound(
+            f"Primary key: {primary_key_name} is not in record: {record[:100]!r}"
+        )
 
 
 def _create_command(record: Dict, *, primary_key_name: str) -> Dict:
@@ -138,17 +792,390 @@ def _delete_command(record: Dict, *, primary_key_name: str) -> Dict:
     return {"action": "DELETE", "recordId": record[primary_key_name]}
 
 
-def stream(session: Session, dataset: AnyDataset) -> Iterator[JsonDict]:
+def stream(
+    session: Session,
+    dataset: AnyDataset,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+    intern: Optional[Iterable[str]] = None,
+    intern_stats: Optional[InternStats] = None,
+) -> Iterator[JsonDict]:
     """Stream the records in this dataset as Python dictionaries.
 
+    Records are parsed with the JSON codec of `session`.
+    If `columns` is specified, only those attributes are parsed for records without nested
+    objects, and other records are projected onto `columns` as soon as they are parsed,
+    so that reading a few attributes of a wide dataset is faster and uses less memory.
+
     Args:
         dataset: Dataset from which to stream records
+        columns: Names of the attributes to keep in each record. Attributes missing from a
+            record are omitted. By default all attributes are kept
+        prefetch: Maximum number of batches of records read ahead by a background thread,
+            so that network reads overlap with parsing. By default records are read as they
+            are consumed
+        stats: Statistics updated while prefetching, including the queue depth and whether
+            reading or parsing is the bottleneck
+        intern: Names of the attributes whose strings are interned, so that records holding
+            repeated values, e.g. source names or cluster IDs, share a single string for each
+            distinct value. See :func:`~tamr_client.response.ndjson`
+        intern_stats: Statistics updated while interning, including the memory saved
 
     Returns:
         Python generator yielding records
+
+    Raises:
+        ValueError: If `prefetch` is negative
     """
+    c = codec._from_session(session)
+    if columns is not None:
+        c = codec._projection(c, columns)
     with session.get(str(dataset.url) + "/records", stream=True) as r:
-        yield from response.ndjson(r)
+        yield from response.ndjson(
+            r,
+            codec=c,
+            prefetch=prefetch,
+            stats=stats,
+            intern=intern,
+            intern_stats=intern_stats,
+        )
+
+
+def stream_raw(
+    session: Session,
+    dataset: AnyDataset,
+    *,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+) -> Iterator[bytes]:
+    """Stream the records in this dataset as serialized JSON objects, without parsing them.
+
+    Together with :func:`~tamr_client.record.upsert_raw`, this allows copying records
+    between datasets or files without parsing and re-serializing them.
+
+    Args:
+        dataset: Dataset from which to stream records
+        prefetch: Maximum number of batches of records read ahead by a background thread.
+            By default records are read as they are consumed
+        stats: Statistics updated while prefetching
+
+    Returns:
+        Python generator yielding each record as a UTF-8 encoded JSON object,
+        without a trailing newline
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `prefetch` is negative
+    """
+    with session.get(str(dataset.url) + "/records", stream=True) as r:
+        response.successful(r)
+        for lines in response._read_line_batches(r, prefetch=prefetch, stats=stats):
+            yield from filter(None, lines)
+
+
+def stream_rows(
+    session: Session,
+    dataset: Dataset,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+    intern: Optional[Iterable[str]] = None,
+    intern_stats: Optional[InternStats] = None,
+) -> Iterator[Row]:
+    """Stream the records in this dataset as compact, read-only rows.
+
+    A :class:`~tamr_client.Row` class is generated for `dataset` from its attributes,
+    so that each row holds a tuple of values and shares its keys with all other rows,
+    instead of repeating every key like the dictionaries from :func:`~tamr_client.record.stream`.
+    Rows support the same read access as dictionaries, and attributes missing from a record
+    have a value of `None`.
+
+    Args:
+        dataset: Dataset from which to stream records
+        columns: Names of the attributes to read, in the order of the keys of each row.
+            Only those attributes are parsed, as by :func:`~tamr_client.record.stream`.
+            By default all attributes are read
+        prefetch: Maximum number of batches of records read ahead by a background thread.
+            By default records are read as they are consumed
+        stats: Statistics updated while prefetching
+        intern: Names of the attributes whose strings are interned,
+            as by :func:`~tamr_client.record.stream`
+        intern_stats: Statistics updated while interning, including the memory saved
+
+    Returns:
+        Python generator yielding rows
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `prefetch` is negative or if a column is not an attribute of `dataset`
+    """
+    attributes = _select(attribute._get_all_from_parent(session, dataset), columns)
+    keys = tuple(attr.name for attr in attributes)
+    row_type = _row_type(keys)
+    records = stream(
+        session,
+        dataset,
+        columns=None if columns is None else keys,
+        prefetch=prefetch,
+        stats=stats,
+        intern=intern,
+        intern_stats=intern_stats,
+    )
+    for r in records:
+        yield row_type(tuple(map(r.get, keys)))
+
+
+def _row_type(keys: Tuple[str, ...]) -> Type[Row]:
+    """Generate a :class:`~tamr_client.Row` class for rows with the specified keys
+
+    Args:
+        keys: Keys shared by all rows of the class, in order
+    """
+    namespace = {
+        "__slots__": (),
+        "_keys": keys,
+        "_index": {key: i for i, key in enumerate(keys)},
+    }
+    return type(Row.__name__, (Row,), namespace)
+
+
+def stream_arrow(
+    session: Session,
+    dataset: Dataset,
+    *,
+    batch_size: int = _ARROW_BATCH_SIZE,
+    columns: Optional[Iterable[str]] = None,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+) -> Iterator["pa.RecordBatch"]:
+    """Stream the records in this dataset as Apache Arrow record batches.
+
+    Requires the `pyarrow` package.
+    The schema of the record batches has a field for each attribute of `dataset`,
+    with the type given by :func:`~tamr_client.attribute.type.to_arrow`.
+    Each record batch is built from the records parsed from the stream since the previous batch,
+    so only one batch of records is held in memory at a time.
+
+    Args:
+        dataset: Dataset from which to stream records
+        batch_size: Maximum number of records per record batch
+        columns: Names of the attributes to read, in the order of the fields of the schema.
+            Only those attributes are parsed, as by :func:`~tamr_client.record.stream`.
+            By default all attributes are read
+        prefetch: Maximum number of batches of records read ahead by a background thread.
+            By default records are read as they are consumed
+        stats: Statistics updated while prefetching
+
+    Returns:
+        Python generator yielding record batches
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        ValueError: If `batch_size` is not positive, if `prefetch` is negative
+            or if a column is not an attribute of `dataset`
+    """
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be positive, but was {batch_size}")
+
+    attributes = _select(attribute._get_all_from_parent(session, dataset), columns)
+    schema = _arrow_schema(attributes)
+    if columns is not None:
+        columns = [attr.name for attr in attributes]
+    records = stream(session, dataset, columns=columns, prefetch=prefetch, stats=stats)
+    yield from _arrow_batches(records, schema, batch_size=batch_size)
+
+
+def _select(
+    attributes: Iterable[Attribute], columns: Optional[Iterable[str]]
+) -> Tuple[Attribute, ...]:
+    """Select attributes by name
+
+    Args:
+        attributes: Attributes of a dataset
+        columns: Names of the attributes to select, in order. By default all attributes
+
+    Raises:
+        ValueError: If a column is not the name of an attribute
+    """
+    if columns is None:
+        return tuple(attributes)
+    by_name = {attr.name: attr for attr in attributes}
+    columns = list(dict.fromkeys(columns))
+    unknown = [name for name in columns if name not in by_name]
+    if unknown:
+        raise ValueError(f"Columns {unknown} are not attributes: {list(by_name)}")
+    return tuple(by_name[name] for name in columns)
+
+
+def _arrow_batches(
+    records: Iterable[JsonDict], schema: "pa.Schema", *, batch_size: int
+) -> Iterator["pa.RecordBatch"]:
+    """Build Apache Arrow record batches from records, one batch of records at a time
+
+    Args:
+        records: Records to convert
+        schema: Schema of the record batches
+        batch_size: Maximum number of records per record batch
+    """
+    import pyarrow as pa
+
+    records = iter(records)
+    while True:
+        rows = list(islice(records, batch_size))
+        if not rows:
+            return
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def upsert_arrow(
+    session: Session,
+    dataset: Dataset,
+    batches: Iterable["pa.RecordBatch"],
+    *,
+    primary_key_name: Optional[str] = None,
+    options: UploadOptions = UploadOptions(),
+) -> JsonDict:
+    """Create or update a record for each row of the specified Apache Arrow record batches.
+
+    Requires the `pyarrow` package.
+    Records are serialized column by column with the JSON codec of `session`,
+    without building a Python dictionary for each row.
+
+    Args:
+        dataset: Dataset to receive record updates
+        batches: Record batches with a column for each attribute to update
+        primary_key_name: The primary key for these records, which must be a column of each batch.
+            By default the key_attribute_name of dataset
+        options: Options for sending the records, e.g. in batches over several connections.
+            By default all records are streamed in a single request
+
+    Returns:
+        JSON response body from server. When batching, the responses for all batches are merged
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered
+        primary_key.NotFound: If primary_key_name does not match dataset primary key
+        primary_key.NotFound: If primary_key_name is not a column of a record batch
+    """
+    if primary_key_name is None:
+        primary_key_name = dataset.key_attribute_names[0]
+
+    if primary_key_name not in dataset.key_attribute_names:
+        raise primary_key.NotFound(
+            f"Primary key: {primary_key_name} is not in dataset key attribute names: {dataset.key_attribute_names}"
+        )
+    dumps = codec._from_session(session).dumps
+    keyed_updates = (
+        update
+        for batch in batches
+        for update in _arrow_create_commands(
+            batch, primary_key_name=primary_key_name, dumps=dumps
+        )
+    )
+    return _update_serialized(session, dataset, keyed_updates, options=options)
+
+
+def _arrow_schema(attributes: Iterable[Attribute]) -> "pa.Schema":
+    """Apache Arrow schema with a field for each attribute
+
+    Args:
+        attributes: Attributes of a dataset
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field(
+                attr.name,
+                attribute.type.to_arrow(attr.type),
+                nullable=attr.is_nullable,
+            )
+            for attr in attributes
+        ]
+    )
+
+
+def _arrow_create_commands(
+    batch: "pa.RecordBatch", *, primary_key_name: str, dumps: Callable[[Any], bytes]
+) -> Iterator[Tuple[Any, bytes]]:
+    """Generates the serialized CREATE command for each row of a record batch
+
+    Each column is converted to Python values and serialized at once,
+    then the serialized values of each row are joined into a JSON object.
+
+    Args:
+        batch: Record batch with a column for each attribute
+        primary_key_name: The primary key for these records, which must be a column of `batch`
+        dumps: Serializes a value as JSON
+
+    Returns:
+        Python generator yielding pairs of primary key value and serialized CREATE command
+
+    Raises:
+        primary_key.NotFound: If primary_key_name is not a column of `batch`
+    """
+    names = batch.schema.names
+    if primary_key_name not in names:
+        raise primary_key.NotFound(
+            f"Primary key: {primary_key_name} is not in record batch columns: {names}"
+        )
+    record_ids = batch.column(names.index(primary_key_name)).to_pylist()
+    keys = [json.dumps(name).encode("utf-8") + b": " for name in names]
+    columns = [
+        list(map(dumps, _from_arrow(batch.column(i).to_pylist(), field.type)))
+        for i, field in enumerate(batch.schema)
+    ]
+    serialized_ids = columns[names.index(primary_key_name)]
+    for record_id, key, row in zip(record_ids, serialized_ids, zip(*columns)):
+        record = b"{" + b", ".join(map(bytes.__add__, keys, row)) + b"}"
+        command = (
+            b'{"action": "CREATE", "recordId": ' + key + b', "record": ' + record + b"}"
+        )
+        yield record_id, command
+
+
+def _from_arrow(values: List[Any], arrow_type: "pa.DataType") -> List[Any]:
+    """Convert the Python values of an Apache Arrow column into JSON-compatible values
+
+    Maps are converted from lists of key-value pairs into dictionaries.
+    Columns without maps are returned unchanged.
+
+    Args:
+        values: Values of the column, from :meth:`pyarrow.Array.to_pylist`
+        arrow_type: Type of the column
+    """
+    if not _has_map(arrow_type):
+        return values
+    return [_from_arrow_value(v, arrow_type) for v in values]
+
+
+def _from_arrow_value(value: Any, arrow_type: "pa.DataType") -> Any:
+    import pyarrow as pa
+
+    if value is None:
+        return None
+    if isinstance(arrow_type, pa.MapType):
+        return {k: _from_arrow_value(v, arrow_type.item_type) for k, v in value}
+    if isinstance(arrow_type, pa.ListType):
+        return [_from_arrow_value(v, arrow_type.value_type) for v in value]
+    if isinstance(arrow_type, pa.StructType):
+        return {f.name: _from_arrow_value(value[f.name], f.type) for f in arrow_type}
+    return value
+
+
+def _has_map(arrow_type: "pa.DataType") -> bool:
+    import pyarrow as pa
+
+    if isinstance(arrow_type, pa.MapType):
+        return True
+    if isinstance(arrow_type, pa.ListType):
+        return _has_map(arrow_type.value_type)
+    if isinstance(arrow_type, pa.StructType):
+        return any(_has_map(f.type) for f in arrow_type)
+    return False
 
 
 def delete_all(session: Session, dataset: AnyDataset):
@@ -1,16 +1,35 @@
 """
 See https://docs.tamr.com/new/reference/the-operation-object
 """
+from collections import deque
 from copy import deepcopy
+from datetime import datetime, timezone
+import random
+import statistics
 from time import sleep, time as now
 from typing import Optional
 
 import requests
 
 from tamr_client import response
-from tamr_client._types import Instance, JsonDict, Operation, Session, URL
+from tamr_client._types import (
+    AnyPollStrategy,
+    BackoffPoll,
+    EstimatedPoll,
+    FixedPoll,
+    Instance,
+    JsonDict,
+    Operation,
+    PollStrategy,
+    Session,
+    URL,
+    WaitStats,
+)
 from tamr_client.exception import TamrClientException
 
+_UNRESOLVED = ["PENDING", "RUNNING"]
+_RESOLVED = ["CANCELED", "SUCCEEDED", "FAILED"]
+
 
 class NotFound(TamrClientException):
     """Raised when referencing an operation that does not exist on the server."""
@@ -58,6 +77,8 @@ def wait(
     *,
     poll_interval_seconds: int = 3,
     timeout_seconds: Optional[int] = None,
+    strategy: Optional[AnyPollStrategy] = None,
+    stats: Optional[WaitStats] = None,
 ) -> Operation:
     """Continuously polls for this operation's server-side state.
 
@@ -65,24 +86,204 @@ def wait(
         operation: Operation to be polled.
         poll_interval_seconds: Time interval (in seconds) between subsequent polls.
         timeout_seconds: Time (in seconds) to wait for operation to resolve.
+        strategy: Strategy for the delays between polls, e.g. :class:`~tamr_client.BackoffPoll`
+            to resolve short operations quickly while polling long operations rarely.
+            By default polls every `poll_interval_seconds`.
+        stats: Statistics updated with the polls of this wait and how late they observed
+            the end of the operation.
 
     Raises:
         TimeoutError: If operation takes longer than `timeout_seconds` to resolve.
     """
-    started = now()
+    if strategy is None:
+        strategy = FixedPoll(poll_interval_seconds)
+    started = previous = now()
+    polls = 0
     while timeout_seconds is None or now() - started < timeout_seconds:
-        if operation.status is None:
-            return operation
-        elif operation.status["state"] in ["PENDING", "RUNNING"]:
-            sleep(poll_interval_seconds)
-        elif operation.status["state"] in ["CANCELED", "SUCCEEDED", "FAILED"]:
+        if _resolved(operation):
+            _observe(strategy, stats, operation, polls, started, previous)
             return operation
+        if operation.status is not None and operation.status["state"] in _UNRESOLVED:
+            sleep(_delay(strategy, operation, polls, started, timeout_seconds))
+        previous = now()
         operation = poll(session, operation)
+        polls += 1
+        if stats is not None:
+            stats.polls += 1
+    if stats is not None:
+        stats.wait_seconds += now() - started
     raise TimeoutError(
         f"Waiting for operation took longer than {timeout_seconds} seconds."
     )
 
 
+def _resolved(operation: Operation) -> bool:
+    """Whether waiting for an operation is over"""
+    return operation.status is None or operation.status["state"] in _RESOLVED
+
+
+def _delay(
+    strategy: AnyPollStrategy,
+    operation: Operation,
+    polls: int,
+    started: float,
+    timeout_seconds: Optional[int],
+) -> float:
+    """Delay (in seconds) before the next poll, without waiting past the timeout
+
+    Args:
+        strategy: Strategy for the delays between polls
+        operation: Unresolved operation
+        polls: Number of polls made so far
+        started: Time when the wait started
+        timeout_seconds: Time (in seconds) to wait for the operation to resolve
+    """
+    delay = _strategy_delay(strategy, operation, polls)
+    if timeout_seconds is not None:
+        delay = min(delay, timeout_seconds - (now() - started))
+    return max(delay, 0.0)
+
+
+def _observe(
+    strategy: AnyPollStrategy,
+    stats: Optional[WaitStats],
+    operation: Operation,
+    polls: int,
+    started: float,
+    previous: float,
+):
+    """Record the end of a wait for an operation
+
+    The lateness of the wait is the time between the end of the operation and the poll that
+    observed it, at most the time since the previous poll, in case the clocks of the client
+    and of the server do not agree.
+
+    Args:
+        strategy: Strategy for the delays between polls, learning from the operation
+        stats: Statistics updated with the wait
+        operation: Resolved operation
+        polls: Number of polls made while waiting
+        started: Time when the wait started
+        previous: Time when the last poll was sent
+    """
+    if operation.status is not None:
+        _learn(strategy, operation)
+    if stats is None:
+        return
+    observed = now()
+    stats.waits += 1
+    stats.wait_seconds += observed - started
+    end = _timestamp((operation.status or {}).get("endTime"))
+    if polls > 0 and end is not None:
+        late = min(max(observed - end, 0.0), observed - previous)
+        stats.ended += 1
+        stats.late_seconds += late
+        stats.max_late_seconds = max(stats.max_late_seconds, late)
+
+
+def _strategy_delay(
+    strategy: AnyPollStrategy, operation: Operation, polls: int
+) -> float:
+    """Delay (in seconds) before the next poll of an unresolved operation, according to
+    a strategy
+
+    Args:
+        strategy: Strategy for the delays between polls
+        operation: Operation, as of the last poll
+        polls: Number of polls made so far while waiting for the operation
+    """
+    if isinstance(strategy, FixedPoll):
+        return strategy.interval
+    if isinstance(strategy, BackoffPoll):
+        return _backoff_delay(strategy, polls)
+    if isinstance(strategy, EstimatedPoll):
+        return _estimated_delay(strategy, operation, polls)
+    return strategy.delay(operation, polls)
+
+
+def _learn(strategy: AnyPollStrategy, operation: Operation):
+    """Let a strategy learn from a resolved operation, e.g. its duration
+
+    Args:
+        strategy: Strategy for the delays between polls
+        operation: Resolved operation
+    """
+    if isinstance(strategy, EstimatedPoll):
+        _learn_duration(strategy, operation)
+    elif isinstance(strategy, PollStrategy):
+        strategy.observe(operation)
+
+
+def _backoff_delay(strategy: BackoffPoll, polls: int) -> float:
+    """Delay (in seconds) before the next poll, growing exponentially with `polls`
+
+    See :class:`~tamr_client.BackoffPoll`
+    """
+    backoff = min(strategy.backoff * strategy.factor**polls, strategy.backoff_max)
+    return backoff * (1 - strategy.jitter * random.random())
+
+
+def _estimated_delay(
+    strategy: EstimatedPoll, operation: Operation, polls: int
+) -> float:
+    """Delay (in seconds) until shortly after an operation is expected to resolve
+
+    See :class:`~tamr_client.EstimatedPoll`
+    """
+    estimate = remaining(strategy, operation)
+    if estimate is None or estimate <= 0:
+        return _strategy_delay(strategy.fallback, operation, polls)
+    return min(estimate + strategy.margin, strategy.interval_max)
+
+
+def _learn_duration(strategy: EstimatedPoll, operation: Operation):
+    """Record the duration of a resolved operation, if it succeeded
+
+    See :class:`~tamr_client.EstimatedPoll`
+    """
+    status = operation.status or {}
+    start = _timestamp(status.get("startTime"))
+    end = _timestamp(status.get("endTime"))
+    if status.get("state") != "SUCCEEDED" or start is None or end is None:
+        return
+    durations = strategy.durations.setdefault(
+        operation.type, deque(maxlen=strategy.history)
+    )
+    durations.append(max(end - start, 0.0))
+
+
+def remaining(strategy: EstimatedPoll, operation: Operation) -> Optional[float]:
+    """Estimated time (in seconds) until an operation resolves, if known
+
+    Estimated from the ``startTime`` of the operation and from the durations of the
+    previous operations of the same type learned by a strategy
+
+    Args:
+        strategy: Strategy learning the durations of operations
+        operation: Unresolved operation
+    """
+    durations = strategy.durations.get(operation.type)
+    start = _timestamp((operation.status or {}).get("startTime"))
+    if not durations or start is None:
+        return None
+    return statistics.median(durations) - (now() - start)
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    """Time (in seconds since the epoch) of a timestamp of an operation, e.g.
+    ``"2020-06-12T18:21:42.288Z"``, if valid
+    """
+    if not value:
+        return None
+    for format in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]:
+        try:
+            parsed = datetime.strptime(value, format)
+        except ValueError:
+            continue
+        return parsed.replace(tzinfo=timezone.utc).timestamp()
+    return None
+
+
 def succeeded(operation: Operation) -> bool:
     """Convenience method for checking if operation was successful."""
     return operation.status is not None and operation.status["state"] == "SUCCEEDED"
@@ -112,13 +313,25 @@ def _from_response(instance: Instance, response: requests.Response) -> Operation
     Args:
         response: HTTP Response from the request that started the operation.
     """
-    if response.status_code == 204:
+    data = None if response.status_code == 204 else response.json()
+    return _from_response_json(instance, data)
+
+
+def _from_response_json(instance: Instance, data: Optional[JsonDict]) -> Operation:
+    """Make operation from the JSON body of the response that started it
+
+    See :func:`~tamr_client.operation._from_response`
+
+    Args:
+        data: JSON body of the response, or `None` for a `HTTP 204 No Content` response
+    """
+    if data is None:
         # Operation was successful, but the response contains no content.
         # Create a dummy operation to represent this.
         _never = "0000-00-00T00:00:00.000Z"
         _description = """Tamr returned HTTP 204 for this operation, indicating that all
             results that would be produced by the operation are already up-to-date."""
-        resource_json = {
+        data = {
             "id": "-1",
             "type": "NOOP",
             "description": _description,
@@ -132,11 +345,9 @@ def _from_response(instance: Instance, response: requests.Response) -> Operation
             "lastModified": {"username": "", "time": _never, "version": "-1"},
             "relativeId": "operations/-1",
         }
-    else:
-        resource_json = response.json()
-    _id = resource_json["id"]
+    _id = data["id"]
     _url = URL(instance=instance, path=f"operations/{_id}")
-    return _from_json(_url, resource_json)
+    return _from_json(_url, data)
 
 
 def _by_url(session: Session, url: URL) -> Operation:
@@ -152,7 +363,7 @@ def _by_url(session: Session, url: URL) -> Operation:
             Corresponds to a 404 HTTP error.
         requests.HTTPError: If any other HTTP error is encountered.
     """
-    r = session.get(str(url))
+    r = session.request("GET", str(url), profile="poll")
     if r.status_code == 404:
         raise NotFound(str(url))
     data = response.successful(r).json()
@@ -1,13 +1,23 @@
-import json
 import logging
-from typing import Iterator
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
 
-from tamr_client._types import JsonDict
+from tamr_client import codec as _codec
+from tamr_client import timeout as _timeout
+from tamr_client._types import Codec, InternStats, JsonDict, PrefetchStats
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 1024 * 1024
+_STOP_POLL_SECONDS = 0.1
+_DONE = object()
+
 
 def successful(response: requests.Response) -> requests.Response:
     """Ensure response does not contain an HTTP error.
@@ -31,20 +41,57 @@ def successful(response: requests.Response) -> requests.Response:
     return response
 
 
-def ndjson(response: requests.Response, **kwargs) -> Iterator[JsonDict]:
+def ndjson(
+    response: requests.Response,
+    *,
+    codec: Optional[Codec] = None,
+    chunk_size: int = _CHUNK_SIZE,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+    intern: Optional[Iterable[str]] = None,
+    intern_stats: Optional[InternStats] = None,
+    **kwargs,
+) -> Iterator[JsonDict]:
     """Stream newline-delimited JSON from the response body
 
     Analog to :func:`requests.Response.json` but for ``.ndjson``-formatted body.
 
+    The body is read in large chunks, each split into a batch of lines at once.
+    Empty lines are skipped.
+
+    If `prefetch` is positive, a background thread reads the body into a queue of up to
+    `prefetch` batches of lines, while the consuming thread parses them,
+    so that waiting on the network overlaps with parsing.
+
+    If `intern` is specified, the strings of those keys (and the strings within their arrays)
+    are interned: each repeat of a string is replaced by the first string equal to it,
+    so that holding many parsed objects sharing a few distinct values, e.g. source names
+    or cluster IDs, takes less memory.
+
     **Recommended**: For memory efficiency, use ``stream=True`` when sending the request corresponding to this response.
 
     Args:
         response: Response whose body should be streamed as newline-delimited JSON.
+        codec: JSON codec used to parse each line. By default the fastest installed codec.
+        chunk_size: Size (in bytes) of each read from the response body. Defaults to 1 MiB.
+        prefetch: Maximum number of batches of lines read ahead by a background thread.
+            By default the body is read by the consuming thread
+        stats: Statistics updated while prefetching, e.g. to find out if reading or parsing
+            is the bottleneck
+        intern: Keys of the values to intern. By default no values are interned
+        intern_stats: Statistics updated while interning, including the memory saved
         **kwargs: Keyword arguments passed to underlying :func:`requests.Response.iter_lines` call.
+            If specified, lines are read and parsed one at a time via
+            :func:`requests.Response.iter_lines` instead.
 
     Returns
         Each line of the response body, parsed as JSON
 
+    Raises:
+        ValueError: If `prefetch` is negative
+        tamr_client.timeout.ReadTimeout: If the server sent no data within the read timeout
+            of the request
+
     Example:
         >>> import tamr_client as tc
         >>> s = tc.session.from_auth(...)
@@ -53,5 +100,230 @@ def ndjson(response: requests.Response, **kwargs) -> Iterator[JsonDict]:
         ...     assert data['my key'] == 'my_value'
 
     """
-    for line in response.iter_lines(**kwargs):
-        yield json.loads(line)
+    loads = (codec or _codec.default()).loads
+    if intern is not None:
+        loads = _interning(loads, intern, intern_stats or InternStats())
+    if kwargs:
+        read = response.iter_lines(chunk_size=chunk_size, **kwargs)
+        for line in _read_timeouts(response, read):
+            yield loads(line)
+        return
+    for lines in _read_line_batches(
+        response, chunk_size=chunk_size, prefetch=prefetch, stats=stats
+    ):
+        # parse lazily: holding a whole batch of parsed records triggers costly garbage collections
+        yield from map(loads, filter(None, lines))
+
+
+def _interning(
+    loads: Callable[[Union[bytes, str]], Any], keys: Iterable[str], stats: InternStats
+) -> Callable[[Union[bytes, str]], Any]:
+    """Wrap a JSON parser to intern the strings of the specified keys of each object
+
+    Strings are interned in a pool owned by the returned parser, rather than via
+    :func:`sys.intern`, so that they are released along with the parsed objects.
+
+    Args:
+        loads: Parses a line of JSON
+        keys: Keys of the values to intern
+        stats: Statistics updated for each interned string
+
+    Returns:
+        Parser returning objects whose strings for `keys` are interned
+    """
+    keys = list(dict.fromkeys(keys))
+    pool: Dict[str, str] = {}
+
+    def intern(value: Any) -> Any:
+        if isinstance(value, str):
+            stats.strings += 1
+            interned = pool.setdefault(value, value)
+            if interned is value:
+                stats.unique += 1
+            else:
+                stats.bytes_saved += sys.getsizeof(value)
+            return interned
+        if isinstance(value, list):
+            for i, v in enumerate(value):
+                value[i] = intern(v)
+        return value
+
+    def interned_loads(data: Union[bytes, str]) -> Any:
+        obj = loads(data)
+        if isinstance(obj, dict):
+            for key in keys:
+                if key in obj:
+                    obj[key] = intern(obj[key])
+        return obj
+
+    return interned_loads
+
+
+def _read_line_batches(
+    response: requests.Response,
+    *,
+    chunk_size: int = _CHUNK_SIZE,
+    prefetch: int = 0,
+    stats: Optional[PrefetchStats] = None,
+) -> Iterator[List[bytes]]:
+    """Read the response body as batches of lines
+
+    See :func:`~tamr_client.response.ndjson` for the available options.
+
+    Args:
+        response: Response whose body should be read as lines
+
+    Returns:
+        Python generator yielding batches of lines, which may be empty
+
+    Raises:
+        ValueError: If `prefetch` is negative
+        tamr_client.timeout.ReadTimeout: If the server sent no data within the read timeout
+            of the request
+    """
+    if prefetch < 0:
+        raise ValueError(f"Prefetch must not be negative, but was {prefetch}")
+    chunks = _read_timeouts(response, response.iter_content(chunk_size))
+    batches = _line_batches(chunks)
+    if prefetch > 0:
+        return _prefetch(batches, prefetch, stats or PrefetchStats())
+    return batches
+
+
+def _read_timeouts(response: requests.Response, data: Iterable[Any]) -> Iterator[Any]:
+    """Data read from a response body, raising a read timeout as such
+
+    :mod:`requests` raises a read timeout while the body is read as a
+    :class:`requests.exceptions.ConnectionError`, as if the connection was lost.
+
+    Args:
+        response: Response whose body is read
+        data: Data read from the body, e.g. by :func:`requests.Response.iter_content`
+
+    Raises:
+        tamr_client.timeout.ReadTimeout: If the server sent no data within the read timeout
+            of the request
+    """
+    try:
+        yield from data
+    except requests.exceptions.ConnectionError as e:
+        if not (e.args and isinstance(e.args[0], ReadTimeoutError)):
+            raise
+        method = response.request.method if response.request else None
+        raise _timeout.ReadTimeout(
+            f"Server stopped sending data for {method} {response.url}: {e.args[0]}",
+            request=response.request,
+            response=response,
+        ) from e
+
+
+def _line_batches(chunks: Iterable[bytes]) -> Iterator[List[bytes]]:
+    """Split a stream of chunks into batches of lines
+
+    Chunks are accumulated in a single reusable buffer, and only new data is scanned for newlines.
+
+    Args:
+        chunks: Stream of chunks, split at arbitrary positions
+
+    Returns:
+        Python generator yielding all complete lines buffered after each chunk.
+        Lines are stripped of their `\\n` or `\\r\\n` delimiter, and may be empty
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        start = len(buffer)
+        buffer += chunk
+        end = buffer.rfind(b"\n", start)
+        if end < 0:
+            continue
+        with memoryview(buffer) as view:
+            lines = _split_lines(bytes(view[:end]))
+        # deleting from the start of a bytearray only advances its start, without copying
+        del buffer[: end + 1]
+        yield lines
+    if buffer:
+        yield _split_lines(bytes(buffer))
+
+
+def _split_lines(data: bytes) -> List[bytes]:
+    """Split newline-delimited data into lines, stripped of their `\\n` or `\\r\\n` delimiter
+
+    A JSON document never contains a raw carriage return outside of whitespace,
+    so carriage returns are only looked for when there is one in `data`.
+
+    Args:
+        data: Lines, without a trailing delimiter
+    """
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n")
+        if data.endswith(b"\r"):
+            data = data[:-1]
+    return data.split(b"\n")
+
+
+def _prefetch(
+    batches: Iterator[List[bytes]], capacity: int, stats: PrefetchStats
+) -> Iterator[List[bytes]]:
+    """Read batches of lines ahead of their consumer in a background thread
+
+    Args:
+        batches: Batches of lines to read, e.g. from a response body
+        capacity: Maximum number of batches held in the queue
+        stats: Statistics updated while prefetching
+
+    Returns:
+        Python generator yielding the same batches of lines.
+        Errors raised while reading are re-raised in the consuming thread
+    """
+    stats.capacity = capacity
+    q: "queue.Queue[Any]" = queue.Queue(capacity)
+    stopped = threading.Event()
+
+    def put(item: Any):
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            stats.reader_waits += 1
+            start = time.perf_counter()
+            # stop waiting once the consumer is gone
+            while not stopped.is_set():
+                try:
+                    q.put(item, timeout=_STOP_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    pass
+            stats.reader_wait_seconds += time.perf_counter() - start
+        stats.depth = q.qsize()
+        stats.max_depth = max(stats.max_depth, stats.depth)
+
+    def read():
+        try:
+            for batch in batches:
+                if stopped.is_set():
+                    return
+                stats.batches += 1
+                put(batch)
+            put(_DONE)
+        except BaseException as e:
+            put(e)
+
+    reader = threading.Thread(target=read, name="tamr-client-prefetch", daemon=True)
+    reader.start()
+    try:
+        while True:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                stats.consumer_waits += 1
+                start = time.perf_counter()
+                item = q.get()
+                stats.consumer_wait_seconds += time.perf_counter() - start
+            stats.depth = q.qsize()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+        reader.join()
+    finally:
+        stopped.set()
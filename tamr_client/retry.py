@@ -0,0 +1,147 @@
+import random
+import time
+from typing import Any, Callable, Optional
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+
+from tamr_client._types.retry import Retry, RetryStats
+
+
+def _send(
+    send: Callable[..., requests.Response],
+    method: str,
+    url: str,
+    *args: Any,
+    retry: Optional[Retry],
+    stats: RetryStats,
+    idempotent: Optional[bool] = None,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a request, retrying it according to a policy
+
+    Args:
+        send: Sends a request, with the signature of :meth:`requests.Session.request`
+        method: HTTP method
+        url: URL of the request
+        *args: Positional arguments passed to `send`
+        retry: Retry policy. No retries if `None`
+        stats: Statistics updated with the retries of the request
+        idempotent: Whether the request can be sent more than once without changing
+            its effect. By default whether its method is in the methods of `retry`
+        **kwargs: Keyword arguments passed to `send`
+
+    Returns:
+        Response to the last attempt
+
+    Raises:
+        requests.exceptions.ConnectionError: If the last attempt failed to connect
+        requests.exceptions.Timeout: If the last attempt timed out, e.g. with
+            :class:`~tamr_client.timeout.ReadTimeout`
+    """
+    with stats._lock:
+        stats.requests += 1
+    if retry is None:
+        return send(method, url, *args, **kwargs)
+    if idempotent is None:
+        idempotent = method.upper() in retry.methods
+    body: Any = kwargs.get("data")
+    position = _position(body)
+    replayable = position is not None or _replayable(body)
+
+    for attempt in range(retry.total + 1):
+        if attempt > 0 and position is not None:
+            body.seek(position)
+        try:
+            r = send(method, url, *args, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if not ((idempotent and replayable) or _not_sent(e)):
+                raise
+            if not _count_retry(retry, stats, attempt, type(e).__name__):
+                raise
+            retry_after = None
+        else:
+            if r.status_code not in retry.statuses or not (idempotent and replayable):
+                return r
+            if not _count_retry(retry, stats, attempt, str(r.status_code)):
+                return r
+            retry_after = _retry_after(r)
+            r.close()
+        delay = _delay(retry, attempt, retry_after)
+        with stats._lock:
+            stats.wait_seconds += delay
+        time.sleep(delay)
+    raise AssertionError("unreachable: the last attempt returns or raises")
+
+
+def _count_retry(retry: Retry, stats: RetryStats, attempt: int, reason: str) -> bool:
+    """Count the retry of a failed attempt, or the exhausted request if the attempt may not
+    be retried within the limits of a policy
+
+    Returns:
+        Whether the attempt may be retried
+    """
+    with stats._lock:
+        if not _may_retry(retry, stats, attempt):
+            stats.exhausted += 1
+            return False
+        stats.retries += 1
+        stats.retried += attempt == 0
+        stats.reasons[reason] = stats.reasons.get(reason, 0) + 1
+        return True
+
+
+def _may_retry(retry: Retry, stats: RetryStats, attempt: int) -> bool:
+    """Whether a failed attempt may be retried within the limits of a policy"""
+    if attempt >= retry.total:
+        return False
+    return retry.budget is None or stats.retries < retry.budget
+
+
+def _delay(retry: Retry, attempt: int, retry_after: Optional[float] = None) -> float:
+    """Delay (in seconds) before a retry
+
+    Args:
+        retry: Retry policy
+        attempt: Number of the failed attempt, starting from 0
+        retry_after: Delay requested by the server, if any
+    """
+    backoff = min(retry.backoff * 2**attempt, retry.backoff_max)
+    delay = backoff * (1 - retry.jitter * random.random())
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, retry.backoff_max))
+    return delay
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Delay (in seconds) requested by the ``Retry-After`` header of a response, if any
+
+    Only delays in seconds are supported, not HTTP dates.
+    """
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return None
+
+
+def _not_sent(error: requests.exceptions.RequestException) -> bool:
+    """Whether a request failed before being sent, so that it can be retried safely"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _position(body: Any) -> Optional[int]:
+    """Position of a seekable file body, to rewind it before a retry. `None` otherwise"""
+    try:
+        return body.tell() if body.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _replayable(body: Any) -> bool:
+    """Whether a request body can be sent again, i.e. is not a stream"""
+    return body is None or isinstance(body, (bytes, str, dict, list, tuple))
@@ -1,18 +1,519 @@
-from typing import Union
+import base64
+from functools import partial
+import json
+import socket
+import time
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from tamr_client._types import Session
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.poolmanager import PoolManager
+
+from tamr_client import codec as _codec
+from tamr_client import retry as _retry
+from tamr_client import timeout as _timeout
+from tamr_client import token_cache as _token_cache
+from tamr_client._types import (
+    PoolStats,
+    Retry,
+    RetryStats,
+    Session,
+    Timeout,
+    TokenCache,
+)
 from tamr_client._types.auth import JwtTokenAuth, UsernamePasswordAuth
+from tamr_client.exception import TamrClientException
+
+_LOGIN_PATH = "/api/versioned/v1/instance:login"
+# refresh auth tokens this long (in seconds) before they expire
+_TOKEN_REFRESH_MARGIN = 60.0
+# unacknowledged keep-alive probes before the OS closes a connection
+_KEEPALIVE_PROBES = 3
+# streamed bodies are recorded in memory up to this size (in bytes), to send them again
+_REPLAY_MAX_SIZE = 64 * 1024 * 1024
+
+
+class StreamNotRecorded(TamrClientException):
+    """Raised when a streamed request body rejected with an expired auth token cannot be sent
+    again, because it was larger than the recorded size
+    """
+
+    pass
 
 
-def from_auth(auth: Union[UsernamePasswordAuth, JwtTokenAuth]) -> Session:
+def from_auth(
+    auth: Union[UsernamePasswordAuth, JwtTokenAuth],
+    *,
+    codec: Optional[str] = None,
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    tcp_keepalive: Optional[int] = None,
+    retry: Optional[Retry] = None,
+    retry_stats: Optional[RetryStats] = None,
+    token_cache: Optional[TokenCache] = None,
+    timeout: Optional[Timeout] = Timeout(),
+) -> Session:
     """Create a new authenticated session
 
+    Connections are kept open and reused by subsequent requests to the same host.
+    When sending requests from several threads, e.g. with :func:`~tamr_client.record.upsert`
+    and the `workers` of :class:`~tamr_client.UploadOptions`, set `pool_maxsize` to at least the
+    number of threads: otherwise connections beyond `pool_maxsize` are discarded after each
+    request instead of being reused, unless `pool_block` is set.
+
+    With :class:`~tamr_client.UsernamePasswordAuth`, the session logs in to get an auth token
+    before sending a streamed body (e.g. by :func:`~tamr_client.record.upsert`), and logs in
+    again before the token expires. Unless the token is known to remain valid (it was just
+    obtained, or it expires in more than a minute), streamed bodies are recorded in memory
+    while they are sent, so that they are sent again in full if the token is rejected.
+    Bodies larger than 64 MiB are not recorded: if their token is rejected,
+    :class:`~tamr_client.session.StreamNotRecorded` is raised. A streamed body sent with a
+    valid token that was revoked is not sent again: the response ``401 Unauthorized``
+    is returned.
+
     Args:
         auth: Authentication
+        codec: Name of the JSON codec used to encode and decode records for this session.
+            By default the fastest installed codec. See :mod:`tamr_client.codec`
+        pool_connections: Number of hosts whose connection pools are kept
+        pool_maxsize: Maximum number of connections kept open for reuse, per host
+        pool_block: Whether requests wait for a connection of the pool to be available
+            when `pool_maxsize` connections are in use, instead of opening a new connection
+        tcp_keepalive: Idle time (in seconds) after which the OS sends TCP keep-alive probes,
+            so that idle connections are not silently dropped by firewalls or load balancers.
+            By default keep-alive probes are not sent
+        retry: Policy for retrying requests that failed transiently, e.g. with
+            ``503 Service Unavailable``. By default requests are not retried
+        retry_stats: Statistics updated with the retries of the requests of this session
+        token_cache: Cache of auth tokens shared with other sessions, e.g. of other worker
+            processes, so that they log in once instead of once per session.
+            Only used with :class:`~tamr_client.UsernamePasswordAuth`
+        timeout: Policy for timing out requests, with connect and read timeouts for
+            requests of metadata, record streams and polls of operations.
+            Requests do not time out if `None`. A `timeout` passed to a request of the session
+            takes precedence
+
+    Raises:
+        codec.NotFound: If no codec is registered under the name `codec`
+        ValueError: If `tcp_keepalive` is less than 1 second
+
+    Requests of the session raise :class:`~tamr_client.timeout.ConnectTimeout` or
+    :class:`~tamr_client.timeout.ReadTimeout` when they time out.
     """
     s = Session()
+    adapter = _PoolAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        socket_options=_socket_options(tcp_keepalive),
+    )
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    s._send_request = _request
+    if codec is not None:
+        s._codec = _codec.get(codec)
+    s._retry = retry
+    s._timeout = timeout
+    if retry_stats is not None:
+        s._retry_stats = retry_stats
     if isinstance(auth, UsernamePasswordAuth):
         s._stored_auth = auth  # flag attempt to set session cookie during requests
+        s._token_cache = token_cache
     else:
         s.auth = auth  # do not flag to attempt to set session cookie in requests
     return s
+
+
+def _request(
+    session: Session,
+    send: Callable[..., requests.Response],
+    *args: Any,
+    idempotent: Optional[bool] = None,
+    profile: Optional[str] = None,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a request of a session, according to its policies
+
+    Logs in to get an auth token before sending a streamed body, or when the token of the
+    session expires, and again when the server rejects the credentials of the request.
+    Requests are timed out and retried according to the policies of the session.
+
+    Args:
+        session: Session sending the request
+        send: Sends a request, with the signature of :meth:`requests.Session.request`
+        *args: Positional arguments passed to `send`
+        idempotent: Whether the request can be retried even if its method is not idempotent,
+            e.g. for a batch of record updates. See :class:`~tamr_client.Retry`
+        profile: Profile of the request for its timeouts, one of ``"metadata"``,
+            ``"stream"`` or ``"poll"``. By default ``"stream"`` for streamed responses
+            and for bodies given as a file or a generator, ``"metadata"`` otherwise
+        **kwargs: Keyword arguments passed to `send`
+    """
+    url = args[1] if len(args) > 1 else kwargs["url"]
+    body: Any = kwargs.get("data")
+    if profile is None:
+        # files and generators are record uploads, e.g. by `record.upsert`
+        streamed = kwargs.get("stream") or not _retry._replayable(body)
+        profile = _timeout.STREAM if streamed else _timeout.METADATA
+    if session._stored_auth is not None and not url.endswith(_LOGIN_PATH):
+        streamed = _retry._position(body) is None and not _retry._replayable(body)
+        with session._auth_lock:
+            if session._auth_token is None and session._token_cache is not None:
+                _use_cached_token(session, url)
+            if _needs_login(session, streamed):
+                # log in before sending, rather than after the request is rejected
+                _set_auth_cookie(session, url)
+        if streamed and not _token_fresh(session):
+            # record the streamed body, to send it again after logging in
+            body = kwargs["data"] = _Replayable(body)
+    position = _retry._position(body)
+    send = partial(
+        _retry._send,
+        partial(
+            _timeout._send,
+            send,
+            policy=session._timeout,
+            profile=profile,
+        ),
+        retry=session._retry,
+        stats=session._retry_stats,
+        idempotent=idempotent,
+    )
+    try:
+        logins = session._logins
+        response = send(*args, **kwargs)
+        if response.status_code == 401 and "credentials" in response.text.lower():
+            first_response = response
+            with session._auth_lock:
+                # unless another thread already logged in since the request was sent
+                if session._logins == logins:
+                    _set_auth_cookie(session, url)
+            if isinstance(body, _Replayable):
+                if not body.recorded:
+                    raise StreamNotRecorded(
+                        f"Request body rejected with an expired auth token: {url}. "
+                        f"The body was larger than the {_REPLAY_MAX_SIZE} bytes recorded"
+                        " to send it again."
+                    )
+                kwargs["data"] = body.replay()
+            elif position is not None:
+                body.seek(position)
+            elif not _retry._replayable(body):
+                # the streamed body was not recorded, so cannot be sent again
+                return response
+            response = send(*args, **kwargs)
+            if response.status_code == 401 and "credentials" in response.text.lower():
+                # Login credentials are bad, return original response
+                response = first_response
+    finally:
+        if isinstance(body, _Replayable):
+            body.close()
+    return response
+
+
+def _needs_login(session: Session, streamed: bool) -> bool:
+    """Whether to log in before sending a request
+
+    Args:
+        streamed: Whether the body of the request is a stream, that would have to be
+            recorded to be sent again if the request was rejected
+    """
+    if session.auth is not None:
+        # credentials are sent with each request
+        return False
+    if session._auth_token is None:
+        return streamed
+    return _expiring(session._auth_token_expiry)
+
+
+def _token_fresh(session: Session) -> bool:
+    """Whether requests are authenticated with an auth token known not to expire soon
+
+    Such requests are only rejected if the token was revoked, so their streamed bodies
+    are not recorded.
+    """
+    return (
+        session.auth is None
+        and session._auth_token is not None
+        and _fresh(session._auth_token_expiry, session._auth_token_time)
+    )
+
+
+def _fresh(expiry: Optional[float], obtained: Optional[float]) -> bool:
+    """Whether an auth token is known not to expire soon
+
+    Args:
+        expiry: Expiration time of the token (in seconds since the epoch), if known
+        obtained: Time the token was obtained by logging in (in seconds since the epoch),
+            if known
+    """
+    if expiry is not None:
+        return not _expiring(expiry)
+    # the expiration of opaque tokens is unknown, but they do not expire right away
+    return obtained is not None and time.time() < obtained + _TOKEN_REFRESH_MARGIN
+
+
+def _use_cached_token(session: Session, url: str):
+    """Authenticate with the cached auth token, if any and not about to expire"""
+    if session._token_cache is None or not isinstance(
+        session._stored_auth, UsernamePasswordAuth
+    ):
+        return
+    origin = url.split("/api/")[0]
+    cached = _token_cache._load(
+        session._token_cache, origin, session._stored_auth.username
+    )
+    if cached is not None and not _expiring(cached[1]):
+        _set_token(session, *cached)
+
+
+def _set_auth_cookie(session: Session, parent_url: str):
+    """Fetch and store an auth token for the given client configuration"""
+    # No-op if _stored_auth is None
+    if session._stored_auth is None:
+        return
+
+    # Fetch auth token and store as cookie
+    socket_address = parent_url.split("/api/")[0]
+    if not isinstance(session._stored_auth, UsernamePasswordAuth):
+        raise TypeError(
+            "Auth cookie only supported for UsernamePasswordAuth authentication"
+        )
+    with session._auth_lock:
+        session._logins += 1
+        if session._token_cache is None:
+            _login(session, socket_address)
+            return
+        username = session._stored_auth.username
+        with _token_cache._locked(session._token_cache):
+            cached = _token_cache._load(session._token_cache, socket_address, username)
+            if (
+                cached is not None
+                and cached[0] != session._auth_token
+                and not _expiring(cached[1])
+            ):
+                # another session logged in since this session got its token
+                _set_token(session, *cached)
+            elif _login(session, socket_address) and session._auth_token is not None:
+                _token_cache._store(
+                    session._token_cache,
+                    socket_address,
+                    username,
+                    session._auth_token,
+                    session._auth_token_expiry,
+                )
+
+
+def _login(session: Session, socket_address: str) -> bool:
+    """Log in to get an auth token
+
+    Args:
+        socket_address: Origin of the Tamr instance
+
+    Returns:
+        Whether the login succeeded
+    """
+    assert isinstance(session._stored_auth, UsernamePasswordAuth)
+    obtained = time.time()
+    r = session.post(
+        socket_address + _LOGIN_PATH,
+        json={
+            "username": session._stored_auth.username,
+            "password": session._stored_auth.password,
+        },
+    )
+    if r.status_code == 200:
+        auth_token = r.json()["token"]
+        _set_token(session, auth_token, _token_expiry(auth_token), obtained=obtained)
+        return True
+    # Set session auth from client auth in case it has been cleared
+    # Allow the following call to pass credentials in header
+    session.auth = session._stored_auth
+    return False
+
+
+def _set_token(
+    session: Session,
+    auth_token: str,
+    expiry: Optional[float],
+    *,
+    obtained: Optional[float] = None,
+):
+    """Authenticate subsequent requests with an auth token
+
+    Args:
+        auth_token: Auth token
+        expiry: Expiration time of the token (in seconds since the epoch), if known
+        obtained: Time the token was obtained by logging in (in seconds since the epoch),
+            if known
+    """
+    session.cookies.set("authToken", auth_token)  # TODO: Set domain for security
+    session._auth_token = auth_token
+    session._auth_token_expiry = expiry
+    session._auth_token_time = obtained
+    # Clear session auth if cookie is retrieved
+    session.auth = None
+
+
+def _expiring(expiry: Optional[float]) -> bool:
+    """Whether an auth token expiring at `expiry` (if known) should be refreshed"""
+    return expiry is not None and time.time() >= expiry - _TOKEN_REFRESH_MARGIN
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Expiration time of an auth token, if it is a JSON Web Token with an expiration claim
+
+    Args:
+        token: Auth token
+
+    Returns:
+        Expiration time, in seconds since the epoch
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims: Any = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def pool_stats(session: Session) -> PoolStats:
+    """Get a snapshot of the connection pools of a session
+
+    Args:
+        session: Session whose connection pools are inspected
+    """
+    pools = []
+    adapters = {id(a): a for a in session.adapters.values()}.values()
+    for adapter in adapters:
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        for manager in [adapter.poolmanager, *adapter.proxy_manager.values()]:
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is not None and pool.pool is not None:
+                    pools.append(pool)
+
+    maxsize = in_use = idle = connections = requests = 0
+    for pool in pools:
+        # the queue of a pool holds its idle connections, and `None` for each free slot
+        queued = list(pool.pool.queue)
+        maxsize += pool.pool.maxsize
+        in_use += max(pool.pool.maxsize - len(queued), 0)
+        idle += sum(conn is not None for conn in queued)
+        connections += pool.num_connections
+        requests += pool.num_requests
+    return PoolStats(
+        pools=len(pools),
+        maxsize=maxsize,
+        in_use=in_use,
+        idle=idle,
+        connections=connections,
+        requests=requests,
+    )
+
+
+class _PoolAdapter(HTTPAdapter):
+    """Transport adapter setting socket options on the connections of its pools
+
+    Args:
+        socket_options: Options set on each socket, as in
+            :attr:`urllib3.connection.HTTPConnection.default_socket_options`
+        **kwargs: Keyword arguments passed to :class:`requests.adapters.HTTPAdapter`
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_socket_options"]
+
+    def __init__(self, *, socket_options: List[Tuple[int, int, int]], **kwargs: Any):
+        # set before the pool manager is initialized by the base class
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **pool_kwargs: Any):
+        pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> PoolManager:
+        proxy_kwargs.setdefault("socket_options", self._socket_options)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def _socket_options(tcp_keepalive: Optional[int]) -> List[Tuple[int, int, int]]:
+    """Socket options of connections, with TCP keep-alive if requested
+
+    Args:
+        tcp_keepalive: Idle time (in seconds) before keep-alive probes are sent, also used as
+            the interval between probes. `None` to not send keep-alive probes
+    """
+    options = list(HTTPConnection.default_socket_options)
+    if tcp_keepalive is None:
+        return options
+    if tcp_keepalive < 1:
+        raise ValueError(
+            f"TCP keep-alive must be at least 1 second, but was {tcp_keepalive}"
+        )
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # names of the keep-alive settings differ between platforms, e.g. TCP_KEEPALIVE on macOS
+    for name, value in [
+        ("TCP_KEEPIDLE", tcp_keepalive),
+        ("TCP_KEEPALIVE", tcp_keepalive),
+        ("TCP_KEEPINTVL", tcp_keepalive),
+        ("TCP_KEEPCNT", _KEEPALIVE_PROBES),
+    ]:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _Replayable:
+    """Streamed request body recording its chunks as they are sent, to send them again
+
+    Chunks are recorded in memory up to 64 MiB. Larger bodies are not recorded.
+
+    Args:
+        chunks: Chunks of the body
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self._chunks = iter(chunks)
+        self._recorded: Optional[List[bytes]] = []
+        self._size = 0
+
+    @property
+    def recorded(self) -> bool:
+        """Whether all the chunks sent so far were recorded"""
+        return self._recorded is not None
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            self._size += len(data)
+            if self._size > _REPLAY_MAX_SIZE:
+                self._recorded = None
+            elif self._recorded is not None:
+                self._recorded.append(data)
+            yield data
+
+    def replay(self) -> Iterator[bytes]:
+        """Chunks of the whole body: the chunks sent so far, then the chunks not sent yet"""
+        if self._recorded is None:
+            raise ValueError("Chunks of the body were not recorded")
+        yield from list(self._recorded)
+        yield from self
+
+    def close(self):
+        self._recorded = None
@@ -0,0 +1,104 @@
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+
+from tamr_client._types.timeout import Timeout
+from tamr_client.exception import TamrClientException
+
+METADATA = "metadata"
+STREAM = "stream"
+POLL = "poll"
+
+
+class ConnectTimeout(TamrClientException, requests.exceptions.ConnectTimeout):
+    """Raised when a connection could not be established within the connect timeout
+
+    The request was not sent, so it can always be retried.
+    """
+
+    pass
+
+
+class ReadTimeout(TamrClientException, requests.exceptions.ReadTimeout):
+    """Raised when the server sent no data within the read timeout of a request
+
+    The request may have been processed by the server.
+    """
+
+    pass
+
+
+def _timeouts(policy: Timeout, profile: str) -> Tuple[Optional[float], Optional[float]]:
+    """Connect and read timeouts of a request
+
+    Args:
+        policy: Timeout policy
+        profile: Profile of the request, one of ``"metadata"``, ``"stream"`` or ``"poll"``
+
+    Raises:
+        ValueError: If `profile` is not supported
+    """
+    reads = {METADATA: policy.read, STREAM: policy.stream, POLL: policy.poll}
+    if profile not in reads:
+        raise ValueError(
+            f"Timeout profile must be one of {list(reads)}, but was '{profile}'"
+        )
+    return policy.connect, reads[profile]
+
+
+def _send(
+    send: Callable[..., requests.Response],
+    method: str,
+    url: str,
+    *args: Any,
+    policy: Optional[Timeout],
+    profile: str,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a request, timing out according to a policy
+
+    A `timeout` passed in `kwargs` takes precedence over the policy.
+
+    Args:
+        send: Sends a request, with the signature of :meth:`requests.Session.request`
+        method: HTTP method
+        url: URL of the request
+        *args: Positional arguments passed to `send`
+        policy: Timeout policy. No timeouts if `None`
+        profile: Profile of the request, one of ``"metadata"``, ``"stream"`` or ``"poll"``
+        **kwargs: Keyword arguments passed to `send`
+
+    Raises:
+        ConnectTimeout: If a connection could not be established in time
+        ReadTimeout: If the server sent no data in time
+    """
+    if policy is not None:
+        kwargs.setdefault("timeout", _timeouts(policy, profile))
+    try:
+        return send(method, url, *args, **kwargs)
+    except requests.exceptions.ConnectTimeout as e:
+        if isinstance(e, ConnectTimeout):
+            raise
+        connect, _ = _seconds(kwargs.get("timeout"))
+        raise ConnectTimeout(
+            f"Connecting for {method} {url} took longer than {connect} seconds",
+            request=e.request,
+            response=e.response,
+        ) from e
+    except requests.exceptions.ReadTimeout as e:
+        if isinstance(e, ReadTimeout):
+            raise
+        _, read = _seconds(kwargs.get("timeout"))
+        raise ReadTimeout(
+            f"Server sent no data for {method} {url} within {read} seconds",
+            request=e.request,
+            response=e.response,
+        ) from e
+
+
+def _seconds(timeout: Any) -> Tuple[Optional[float], Optional[float]]:
+    """Connect and read timeouts of a `timeout` argument of :mod:`requests`"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return connect, read
+    return timeout, timeout
@@ -0,0 +1,108 @@
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from tamr_client._types.token_cache import TokenCache
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def _locked(cache: TokenCache) -> Iterator[None]:
+    """Context holding the lock of a token cache, to log in and store a token atomically
+
+    Args:
+        cache: Token cache to lock
+    """
+    path = Path(cache.path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(str(path) + ".lock", "a+b") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _load(
+    cache: TokenCache, origin: str, username: Union[bytes, str]
+) -> Optional[Tuple[str, Optional[float]]]:
+    """Cached auth token of a user, with its expiration time if known
+
+    Args:
+        cache: Token cache
+        origin: Origin of the Tamr instance, e.g. ``"http://localhost:9100"``
+        username: Name of the user
+
+    Returns:
+        Token and expiration time (in seconds since the epoch), or `None` if no token is cached
+    """
+    try:
+        entry = _read(cache)[origin][_key(username)]
+        expiry = entry.get("expiry")
+        return str(entry["token"]), None if expiry is None else float(expiry)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _store(
+    cache: TokenCache,
+    origin: str,
+    username: Union[bytes, str],
+    token: str,
+    expiry: Optional[float],
+):
+    """Cache the auth token of a user, replacing the file so that readers never see it partly
+    written. Hold the lock of the cache while storing, so that no other token is lost
+
+    Args:
+        cache: Token cache
+        origin: Origin of the Tamr instance, e.g. ``"http://localhost:9100"``
+        username: Name of the user
+        token: Auth token
+        expiry: Expiration time of the token (in seconds since the epoch), if known
+    """
+    path = Path(cache.path)
+    tokens = _read(cache)
+    if not isinstance(tokens.get(origin), dict):
+        tokens[origin] = {}
+    tokens[origin][_key(username)] = {"token": token, "expiry": expiry}
+    # created only readable by its owner
+    fd, temp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(tokens, f)
+        os.replace(temp, str(path))
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def _key(username: Union[bytes, str]) -> str:
+    """Key of the tokens of a user in a token cache"""
+    return username.decode("utf-8") if isinstance(username, bytes) else username
+
+
+def _read(cache: TokenCache) -> Any:
+    """Contents of a token cache, empty if the file is missing or invalid"""
+    try:
+        with open(str(cache.path)) as f:
+            tokens = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return tokens if isinstance(tokens, dict) else {}
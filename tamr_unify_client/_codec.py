@@ -0,0 +1,143 @@
+"""Registry of JSON codecs used to encode and decode records.
+
+The standard library :mod:`json` module is always available.
+Faster codecs are registered when their (optional) packages are installed:
+``"orjson"`` via `orjson <https://github.com/ijl/orjson>`_ and ``"ujson"`` via
+`ujson <https://github.com/ultrajson/ultrajson>`_.
+
+Every codec handles non-finite floats (``NaN``, ``Infinity``, ``-Infinity``) exactly like the
+standard library: any object containing such a value is encoded by the standard library,
+so its serialization is byte-for-byte identical whichever codec is selected.
+The exception is ``ignore_nan``, which ``"orjson"`` supports natively by encoding them as ``null``.
+"""
+from collections import namedtuple
+import importlib
+import json
+import math
+
+from tamr_unify_client._ignore_nan_encoder import IgnoreNanEncoder
+
+Codec = namedtuple("Codec", ["name", "dumps", "loads"])
+Codec.__doc__ = """A JSON codec.
+
+``dumps(obj, *, allow_nan=True, ignore_nan=False)`` serializes to UTF-8 encoded bytes, with the
+same semantics as :func:`json.dumps` for `allow_nan`. If `ignore_nan` is set, non-finite floats
+are encoded as ``null``. ``loads(data)`` deserializes from bytes or a string.
+"""
+
+
+# reused like the default encoder of `json.dumps`, which has the same settings
+_ignore_nan_encoder = IgnoreNanEncoder()
+
+
+def _stdlib_dumps(obj, *, allow_nan=True, ignore_nan=False):
+    if ignore_nan:
+        return _ignore_nan_encoder.encode(obj).encode("utf-8")
+    return json.dumps(obj, allow_nan=allow_nan).encode("utf-8")
+
+
+STDLIB = Codec("json", _stdlib_dumps, json.loads)
+
+_registry = {STDLIB.name: STDLIB}
+
+# codecs in order of preference, fastest first
+_preference = ["orjson", "ujson", STDLIB.name]
+
+
+def register(codec):
+    """Register a codec so that it can be selected by name.
+
+    :param codec: Codec to register. Replaces any codec registered under the same name.
+    :type codec: :class:`Codec`
+    """
+    _registry[codec.name] = codec
+
+
+def get(name):
+    """Get a registered codec by name.
+
+    :param name: Name of the codec, e.g. ``"orjson"``.
+    :type name: str
+    :rtype: :class:`Codec`
+    :raises KeyError: If no codec is registered under that name, e.g. because its package is not installed.
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(
+            f"No codec registered with name '{name}'. Available codecs: {list(_registry)}"
+        )
+
+
+def default():
+    """The fastest registered codec.
+
+    :rtype: :class:`Codec`
+    """
+    for name in _preference:
+        if name in _registry:
+            return _registry[name]
+    return STDLIB
+
+
+def has_nonfinite(obj):
+    """Check if a JSON-compatible object contains a non-finite float.
+
+    :param obj: JSON-compatible object.
+    :rtype: bool
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(has_nonfinite(v) for v in obj)
+    return False
+
+
+def _import(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_orjson = _import("orjson")
+if _orjson is not None:
+
+    def _orjson_dumps(obj, *, allow_nan=True, ignore_nan=False):
+        try:
+            data = _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers larger than 64 bits
+            return _stdlib_dumps(obj, allow_nan=allow_nan, ignore_nan=ignore_nan)
+        # orjson encodes non-finite floats as `null`, as requested by `ignore_nan`
+        if ignore_nan:
+            return data
+        if b"null" in data and has_nonfinite(obj):
+            return _stdlib_dumps(obj, allow_nan=allow_nan, ignore_nan=ignore_nan)
+        return data
+
+    def _orjson_loads(data):
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # e.g. `NaN` literals
+            return json.loads(data)
+
+    register(Codec("orjson", _orjson_dumps, _orjson_loads))
+
+_ujson = _import("ujson")
+if _ujson is not None:
+
+    def _ujson_dumps(obj, *, allow_nan=True, ignore_nan=False):
+        try:
+            data = _ujson.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False, allow_nan=False
+            )
+        except (TypeError, OverflowError):
+            # e.g. non-finite floats
+            return _stdlib_dumps(obj, allow_nan=allow_nan, ignore_nan=ignore_nan)
+        return data.encode("utf-8")
+
+    register(Codec("ujson", _ujson_dumps, _ujson.loads))
@@ -1,6 +1,10 @@
 """Adaptation of the Python standard library JSONEncoder to encode `NaN` as 'null'
 Compare to https://github.com/python/cpython/blob/3.9/Lib/json/encoder.py
 The only functional difference is in the definition of `floatstr` where 'NaN', 'Infinity', and '-Infinity' are encoded as 'null'
+
+One-shot encoding (e.g. via `json.dumps`) stays on the C accelerated encoder: objects are first
+encoded as-is, and only objects containing non-finite floats are sanitized and encoded again.
+Incremental encoding (e.g. via `json.dump`) uses the pure Python encoder.
 """
 from json import JSONEncoder
 from json.encoder import (
@@ -8,6 +12,7 @@ from json.encoder import (
     py_encode_basestring,
     py_encode_basestring_ascii,
 )
+from math import isfinite
 
 try:
     from _json import encode_basestring_ascii as c_encode_basestring_ascii
@@ -25,9 +30,46 @@ except ImportError:
 INFINITY = float("inf")
 encode_basestring = c_encode_basestring or py_encode_basestring
 encode_basestring_ascii = c_encode_basestring_ascii or py_encode_basestring_ascii
+_CONTAINERS = (dict, list, tuple)
+
+
+def sanitize(o):
+    """Copy a JSON-compatible object, replacing non-finite floats with `None`
+
+    Floats used as dictionary keys are replaced too, so that they are encoded as 'null'.
+    Scalars are handled inline rather than recursively, since records are mostly flat.
+    """
+    if isinstance(o, dict):
+        return {
+            (sanitize(k) if isinstance(k, float) else k): (
+                sanitize(v)
+                if isinstance(v, _CONTAINERS)
+                else None
+                if isinstance(v, float) and not isfinite(v)
+                else v
+            )
+            for k, v in o.items()
+        }
+    if isinstance(o, (list, tuple)):
+        return [
+            sanitize(v)
+            if isinstance(v, _CONTAINERS)
+            else None
+            if isinstance(v, float) and not isfinite(v)
+            else v
+            for v in o
+        ]
+    if isinstance(o, float) and not isfinite(o):
+        return None
+    return o
 
 
 class IgnoreNanEncoder(JSONEncoder):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # the C accelerated encoder must raise on non-finite floats, so that they are detected
+        self.allow_nan = False
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
@@ -35,6 +77,13 @@ class IgnoreNanEncoder(JSONEncoder):
             for chunk in JSONEncoder().iterencode(bigobject):
                 mysocket.write(chunk)
         """
+        if _one_shot and c_make_encoder is not None and self.indent is None:
+            try:
+                return super().iterencode(o, _one_shot)
+            except ValueError:
+                # non-finite float
+                return super().iterencode(sanitize(o), _one_shot)
+
         if self.check_circular:
             markers = {}
         else:
@@ -0,0 +1,203 @@
+"""Fast reading of newline-delimited JSON response bodies.
+
+The body is read in large chunks, each split into a batch of lines at once,
+instead of reading small chunks and splitting them one line at a time via
+:func:`requests.Response.iter_lines`.
+"""
+
+import json
+import queue
+import re
+import threading
+import time
+
+from tamr_unify_client.dataset.prefetch import PrefetchStats
+from tamr_unify_client.timeout import read_timeouts
+
+CHUNK_SIZE = 1024 * 1024
+_STOP_POLL_SECONDS = 0.1
+_DONE = object()
+
+
+def parse(response, loads, chunk_size=CHUNK_SIZE, *, prefetch=0, stats=None):
+    """Stream newline-delimited JSON from a response body. Empty lines are skipped.
+
+    If `prefetch` is positive, a background thread reads the body into a queue of up to
+    `prefetch` batches of lines, while the consuming thread parses them.
+
+    :param response: Response whose body is newline-delimited JSON.
+    :type response: :class:`requests.Response`
+    :param loads: Parses a line of JSON, e.g. the ``loads`` of a JSON codec.
+    :type loads: callable
+    :param chunk_size: Size (in bytes) of each read from the response body.
+    :type chunk_size: int
+    :param prefetch: Maximum number of batches of lines read ahead by a background thread.
+    :type prefetch: int
+    :param stats: Statistics updated while prefetching.
+    :type stats: :class:`~tamr_unify_client.dataset.prefetch.PrefetchStats`
+    :return: Each line of the response body, parsed as JSON.
+    :rtype: Python generator
+    :raises ValueError: If `prefetch` is negative.
+    :raises ~tamr_unify_client.timeout.ReadTimeout: If the server sent no data within the
+        read timeout of the request.
+    """
+    if prefetch < 0:
+        raise ValueError(f"Prefetch must not be negative, but was {prefetch}")
+    chunks = read_timeouts(response, response.iter_content(chunk_size))
+    batches = line_batches(chunks)
+    if prefetch > 0:
+        batches = prefetched(batches, prefetch, stats or PrefetchStats())
+    for lines in batches:
+        # parse lazily: holding a whole batch of parsed records triggers costly garbage collections
+        yield from map(loads, filter(None, lines))
+
+
+def projection(loads, columns):
+    """Wrap a JSON parser to keep only the specified top-level keys of each object.
+
+    Objects without nested objects are not fully parsed: each key is found by a scan of the
+    serialized object, and only its value is parsed, so that the cost of parsing an object
+    depends on the number of `columns` rather than on the size of the object.
+    Other objects (or objects missing a key) are parsed with `loads`, then projected.
+
+    :param loads: Parses a line of JSON, e.g. the ``loads`` of a JSON codec.
+    :type loads: callable
+    :param columns: Keys to keep. Keys missing from an object are omitted from its projection.
+    :type columns: iterable[str]
+    :return: Parser returning the projection of each object on `columns`.
+    :rtype: callable
+    """
+    columns = list(dict.fromkeys(columns))
+    patterns = [
+        (name, re.compile(re.escape(json.dumps(name, ensure_ascii=False)) + r"\s*:\s*"))
+        for name in columns
+    ]
+    decode = json.JSONDecoder().raw_decode
+
+    def projected_loads(data):
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        # without nested objects (nor braces within strings), any unescaped key is top-level
+        if text.count("{") == 1:
+            projected = {}
+            for name, pattern in patterns:
+                match = pattern.search(text)
+                if match is None or text[match.start() - 1] == "\\":
+                    # possibly a differently escaped key, or a key within a string
+                    break
+                projected[name] = decode(text, match.end())[0]
+            else:
+                return projected
+        obj = loads(data)
+        return {name: obj[name] for name in columns if name in obj}
+
+    return projected_loads
+
+
+def line_batches(chunks):
+    """Split a stream of chunks into batches of lines.
+
+    Chunks are accumulated in a single reusable buffer, and only new data is scanned for newlines.
+
+    :param chunks: Stream of chunks, split at arbitrary positions.
+    :type chunks: iterable[bytes]
+    :return: All complete lines buffered after each chunk.
+        Lines are stripped of their ``\\n`` or ``\\r\\n`` delimiter, and may be empty.
+    :rtype: Python generator yielding list[bytes]
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        start = len(buffer)
+        buffer += chunk
+        end = buffer.rfind(b"\n", start)
+        if end < 0:
+            continue
+        with memoryview(buffer) as view:
+            lines = split_lines(bytes(view[:end]))
+        # deleting from the start of a bytearray only advances its start, without copying
+        del buffer[: end + 1]
+        yield lines
+    if buffer:
+        yield split_lines(bytes(buffer))
+
+
+def split_lines(data):
+    """Split newline-delimited data into lines, stripped of their ``\\n`` or ``\\r\\n`` delimiter.
+
+    A JSON document never contains a raw carriage return outside of whitespace,
+    so carriage returns are only looked for when there is one in `data`.
+
+    :param data: Lines, without a trailing delimiter.
+    :type data: bytes
+    :rtype: list[bytes]
+    """
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n")
+        if data.endswith(b"\r"):
+            data = data[:-1]
+    return data.split(b"\n")
+
+
+def prefetched(batches, capacity, stats):
+    """Read batches of lines ahead of their consumer in a background thread.
+
+    :param batches: Batches of lines to read, e.g. from a response body.
+    :type batches: iterator[list[bytes]]
+    :param capacity: Maximum number of batches held in the queue.
+    :type capacity: int
+    :param stats: Statistics updated while prefetching.
+    :type stats: :class:`~tamr_unify_client.dataset.prefetch.PrefetchStats`
+    :return: The same batches of lines. Errors raised while reading are re-raised in the consuming thread.
+    :rtype: Python generator yielding list[bytes]
+    """
+    stats.capacity = capacity
+    q = queue.Queue(capacity)
+    stopped = threading.Event()
+
+    def put(item):
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            stats.reader_waits += 1
+            start = time.perf_counter()
+            # stop waiting once the consumer is gone
+            while not stopped.is_set():
+                try:
+                    q.put(item, timeout=_STOP_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    pass
+            stats.reader_wait_seconds += time.perf_counter() - start
+        stats.depth = q.qsize()
+        stats.max_depth = max(stats.max_depth, stats.depth)
+
+    def read():
+        try:
+            for batch in batches:
+                if stopped.is_set():
+                    return
+                stats.batches += 1
+                put(batch)
+            put(_DONE)
+        except BaseException as e:
+            put(e)
+
+    reader = threading.Thread(target=read, name="tamr-client-prefetch", daemon=True)
+    reader.start()
+    try:
+        while True:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                stats.consumer_waits += 1
+                start = time.perf_counter()
+                item = q.get()
+                stats.consumer_wait_seconds += time.perf_counter() - start
+            stats.depth = q.qsize()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+        reader.join()
+    finally:
+        stopped.set()
@@ -0,0 +1,354 @@
+"""Batched and parallel uploads of serialized record updates.
+
+Shared by endpoints accepting newline-delimited update commands, e.g. ``:updateRecords``.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, ExitStack
+import io
+import json
+import queue
+import tempfile
+import threading
+import zlib
+
+PARALLEL_BATCH_SIZE = 10_000
+BUFFER_SIZE = 1024 * 1024
+SPOOL_MAX_MEMORY = 64 * 1024 * 1024
+REPLAY_MAX_SIZE = 64 * 1024 * 1024
+_NEWLINE = ord("\n")
+COMPRESSION_LEVEL = 6
+# `wbits` of the zlib container for each supported `Content-Encoding`
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def compressor(compression, level=COMPRESSION_LEVEL):
+    """Create a compressor for a ``Content-Encoding``.
+
+    :param compression: Content encoding, either ``"gzip"`` or ``"deflate"``.
+    :type compression: str
+    :param level: Compression level, from 0 (no compression) to 9 (best compression).
+    :type level: int
+    :raises ValueError: If `compression` or `level` is not supported.
+    """
+    if compression not in _WBITS:
+        raise ValueError(
+            f"Compression must be one of {list(_WBITS)}, but was '{compression}'"
+        )
+    if not 0 <= level <= 9:
+        raise ValueError(f"Compression level must be from 0 to 9, but was {level}")
+    return zlib.compressobj(level, zlib.DEFLATED, _WBITS[compression])
+
+
+def compress(body, compression, level=COMPRESSION_LEVEL):
+    """Compress a request body.
+
+    A body given as bytes is compressed at once, so that its size is still known.
+    Otherwise the body is compressed incrementally as it is sent, without being held in memory.
+
+    :param body: Request body, as bytes, as a file, or as a stream of chunks.
+    :param compression: Content encoding, either ``"gzip"`` or ``"deflate"``.
+    :type compression: str
+    :param level: Compression level, from 0 (no compression) to 9 (best compression).
+    :type level: int
+    :return: Compressed body, as bytes or as a Python generator yielding bytes.
+    :raises ValueError: If `compression` or `level` is not supported.
+    """
+    c = compressor(compression, level)
+    if isinstance(body, bytes):
+        return c.compress(body) + c.flush()
+    chunks = body
+    if hasattr(body, "read"):
+        chunks = iter(lambda: body.read(BUFFER_SIZE), b"")
+
+    def compressed():
+        for chunk in chunks:
+            data = c.compress(chunk)
+            # the compressor holds back output until it has enough input
+            if data:
+                yield data
+        yield c.flush()
+
+    return compressed()
+
+
+def coalesce(stringified_updates, buffer_size):
+    """Pack serialized updates into newline-delimited chunks of about `buffer_size` bytes.
+
+    Updates are copied into a single preallocated buffer, so that the transport sends
+    few large chunks instead of one small chunk per update.
+
+    :param stringified_updates: Updates serialized as JSON.
+    :type stringified_updates: iterable[bytes]
+    :param buffer_size: Size (in bytes) of the buffer.
+        Updates larger than the buffer are sent in chunks of their own.
+    :type buffer_size: int
+    :return: Stream of chunks.
+    :rtype: Python generator yielding bytes
+    """
+    if buffer_size < 1:
+        raise ValueError(f"Buffer size must be positive, but was {buffer_size}")
+
+    buffer = memoryview(bytearray(buffer_size))
+    end = 0
+    for update in stringified_updates:
+        update_end = end + len(update) + 1
+        if update_end > buffer_size:
+            if end > 0:
+                yield bytes(buffer[:end])
+                end = 0
+                update_end = len(update) + 1
+            if update_end > buffer_size:
+                yield update + b"\n"
+                continue
+        buffer[end : update_end - 1] = update
+        buffer[update_end - 1] = _NEWLINE
+        end = update_end
+    if end > 0:
+        yield bytes(buffer[:end])
+
+
+@contextmanager
+def spool(stringified_updates):
+    """Write serialized updates to a newline-delimited body of known size.
+
+    The body is kept in memory until it grows larger than 64 MiB,
+    after which it is written to a temporary file.
+    A body of known size is sent with a ``Content-Length`` instead of chunked encoding.
+
+    :param stringified_updates: Updates serialized as JSON.
+    :type stringified_updates: iterable[bytes]
+    :return: Context manager providing the body, as bytes or as a file positioned at its start.
+        The file is closed when exiting the context.
+    """
+    with ExitStack() as stack:
+        f = io.BytesIO()
+        in_memory = True
+        for chunk in coalesce(stringified_updates, BUFFER_SIZE):
+            f.write(chunk)
+            if in_memory and f.tell() > SPOOL_MAX_MEMORY:
+                spilled = stack.enter_context(tempfile.TemporaryFile())
+                spilled.write(f.getbuffer())
+                f = spilled
+                in_memory = False
+        if in_memory:
+            yield f.getvalue()
+        else:
+            f.seek(0)
+            yield f
+
+
+class Replayable:
+    """Streamed request body recording its chunks as they are sent, to send them again.
+
+    Chunks are recorded in memory up to 64 MiB. Larger bodies are not recorded.
+
+    :param chunks: Chunks of the body.
+    :type chunks: iterable[bytes] or iterable[str]
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._recorded = []
+        self._size = 0
+
+    @property
+    def recorded(self):
+        """Whether all the chunks sent so far were recorded.
+
+        :rtype: bool
+        """
+        return self._recorded is not None
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            self._size += len(data)
+            if self._size > REPLAY_MAX_SIZE:
+                self._recorded = None
+            elif self._recorded is not None:
+                self._recorded.append(data)
+            yield data
+
+    def replay(self):
+        """Chunks of the whole body: the chunks sent so far, then the chunks not sent yet.
+
+        :rtype: Python generator yielding bytes
+        """
+        if self._recorded is None:
+            raise ValueError("Chunks of the body were not recorded")
+        yield from list(self._recorded)
+        yield from self
+
+    def close(self):
+        """Discard the recorded chunks."""
+        self._recorded = None
+
+
+def batches(stringified_updates, *, size=None, nbytes=None):
+    """Group serialized updates into batches bounded in number and in size.
+
+    Only one batch is held in memory at a time.
+
+    :param stringified_updates: Updates serialized as JSON.
+    :type stringified_updates: iterable[bytes]
+    :param size: Maximum number of updates per batch.
+    :type size: int
+    :param nbytes: Maximum size (in bytes) of each batch, including newline delimiters.
+    :type nbytes: int
+    :return: Stream of batches.
+    :rtype: Python generator yielding list[bytes]
+    """
+    if size is not None and size < 1:
+        raise ValueError(f"Batch size must be positive, but was {size}")
+    if nbytes is not None and nbytes < 1:
+        raise ValueError(f"Batch bytes must be positive, but was {nbytes}")
+
+    batch = []
+    batch_nbytes = 0
+    for update in stringified_updates:
+        update_nbytes = len(update) + 1
+        if _is_full(batch, batch_nbytes, update_nbytes, size=size, nbytes=nbytes):
+            yield batch
+            batch = []
+            batch_nbytes = 0
+        batch.append(update)
+        batch_nbytes += update_nbytes
+    if batch:
+        yield batch
+
+
+def post_parallel(
+    post, keyed_updates, *, workers, size=None, nbytes=None, max_in_flight=None
+):
+    """Post batches of serialized updates concurrently.
+
+    Each update is assigned to a worker by hashing its record ID, and each worker posts
+    its batches sequentially, so updates to the same record are applied in order.
+    Once any batch fails, no further batches are posted.
+
+    :param post: Posts a newline-delimited body of updates and returns the JSON response body.
+    :type post: callable
+    :param keyed_updates: Pairs of record ID and update serialized as JSON.
+    :type keyed_updates: iterable[tuple]
+    :param workers: Number of concurrent workers.
+    :type workers: int
+    :param size: Maximum number of updates per batch.
+    :type size: int
+    :param nbytes: Maximum size (in bytes) of each batch.
+    :type nbytes: int
+    :param max_in_flight: Maximum number of batches held in memory (queued or being posted) at once.
+        By default twice the number of workers.
+    :type max_in_flight: int
+    :return: JSON response bodies for all batches, merged into a single response body.
+    :rtype: :py:class:`dict`
+    """
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    if max_in_flight < 1:
+        raise ValueError(f"Max in flight must be positive, but was {max_in_flight}")
+
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+    failed = threading.Event()
+    queues = [queue.Queue() for _ in range(workers)]
+
+    def send(q):
+        responses = []
+        error = None
+        while True:
+            batch = q.get()
+            if batch is None:
+                break
+            try:
+                # keep draining after a failure so that the producer is never blocked
+                if not failed.is_set():
+                    responses.append(post(b"\n".join(batch)))
+            except BaseException as e:
+                error = e
+                failed.set()
+            finally:
+                in_flight.release()
+        if error is not None:
+            raise error
+        return responses
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(send, q) for q in queues]
+        try:
+            pending = [[] for _ in range(workers)]
+            pending_nbytes = [0] * workers
+            for rid, update in keyed_updates:
+                if failed.is_set():
+                    break
+                i = partition(rid, workers)
+                update_nbytes = len(update) + 1
+                if _is_full(
+                    pending[i],
+                    pending_nbytes[i],
+                    update_nbytes,
+                    size=size,
+                    nbytes=nbytes,
+                ):
+                    in_flight.acquire()
+                    queues[i].put(pending[i])
+                    pending[i] = []
+                    pending_nbytes[i] = 0
+                pending[i].append(update)
+                pending_nbytes[i] += update_nbytes
+            for i, batch in enumerate(pending):
+                if batch and not failed.is_set():
+                    in_flight.acquire()
+                    queues[i].put(batch)
+        finally:
+            for q in queues:
+                q.put(None)
+        return merge_responses(r for f in futures for r in f.result())
+
+
+def merge_responses(responses):
+    """Merge the response bodies of several ``:updateRecords`` requests into one.
+
+    :param responses: JSON response bodies from server.
+    :type responses: iterable[dict]
+    :return: A single response body summarizing all commands processed.
+    :rtype: :py:class:`dict`
+    """
+    merged = {
+        "numCommandsProcessed": 0,
+        "allCommandsSucceeded": True,
+        "validationErrors": [],
+    }
+    for r in responses:
+        merged["numCommandsProcessed"] += r.get("numCommandsProcessed", 0)
+        merged["allCommandsSucceeded"] &= r.get("allCommandsSucceeded", True)
+        merged["validationErrors"].extend(r.get("validationErrors", []))
+    return merged
+
+
+def record_id(update):
+    """Get the record ID targeted by an update.
+
+    :param update: Update formatted as specified in the `Public Docs for Dataset updates <https://docs.tamr.com/reference#modify-a-datasets-records>`_.
+    :type update: dict
+    """
+    if "recordId" in update:
+        return update["recordId"]
+    return update.get("compositeRecordId")
+
+
+def partition(record_id, n):
+    """Deterministically assign a record ID to one of `n` partitions.
+
+    :param record_id: Record ID (or composite record ID) of an update.
+    :param n: Number of partitions.
+    :type n: int
+    :rtype: int
+    """
+    return zlib.crc32(json.dumps(record_id).encode("utf-8")) % n
+
+
+def _is_full(batch, batch_nbytes, update_nbytes, *, size=None, nbytes=None):
+    if not batch:
+        return False
+    if size is not None and len(batch) >= size:
+        return True
+    return nbytes is not None and batch_nbytes + update_nbytes > nbytes
@@ -1,5 +1,3 @@
-import json
-
 from tamr_unify_client.base_collection import BaseCollection
 from tamr_unify_client.categorization.category.resource import Category
 
@@ -89,7 +87,8 @@ class CategoryCollection(BaseCollection):
         :returns: JSON response from the server
         :rtype: :py:class:`dict`
         """
-        body = "\n".join([json.dumps(s) for s in creation_specs]).encode("utf-8")
+        dumps = self.client.json_codec.dumps
+        body = b"\n".join([dumps(s) for s in creation_specs])
         return (
             self.client.post(
                 self.api_path + ":bulk",
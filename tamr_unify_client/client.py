@@ -1,18 +1,35 @@
+import base64
+import copy
+from functools import partial
+import json
 import logging
+import threading
+import time
 from typing import Optional
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE
 import requests.auth
 import requests.exceptions
 
+from tamr_unify_client import _codec, _upload
 from tamr_unify_client.auth.username_password import UsernamePasswordAuth
 from tamr_unify_client.dataset.collection import DatasetCollection
+from tamr_unify_client.pool import PoolAdapter, PoolStats
 from tamr_unify_client.project.collection import ProjectCollection
 import tamr_unify_client.response as response
+import tamr_unify_client.retry as _retry
+from tamr_unify_client.retry import Retry, RetryStats
+import tamr_unify_client.timeout as _timeout
+from tamr_unify_client.timeout import Timeout
+from tamr_unify_client.token_cache import TokenCache
 
 logger = logging.getLogger(__name__)
 
+# refresh auth tokens this long (in seconds) before they expire
+TOKEN_REFRESH_MARGIN = 60.0
+
 response._monkey_patch()
 
 
@@ -30,6 +47,52 @@ class Client:
         port: Tamr instance main port
         base_path: Base API path. Requests made by this client will be relative to this path.
         session: Session to use for API calls. If none is provided, will use a new :class:`requests.Session`.
+        store_auth_cookie: Whether to log in and authenticate subsequent requests with an auth cookie.
+            Once logged in, the client logs in again before its auth token expires.
+            Unless the auth token is known to remain valid (it was just obtained, or it
+            expires in more than a minute), streamed request bodies (e.g. record updates)
+            are recorded in memory while they are sent, so that they are sent again in full
+            if the auth token is rejected. Bodies larger than 64 MiB are not recorded: if
+            their auth token is rejected, :class:`~tamr_unify_client.client.StreamNotRecorded`
+            is raised.
+        json_codec: Name of the JSON codec used to encode and decode records,
+            one of ``"json"``, ``"orjson"`` or ``"ujson"``.
+            By default the fastest installed codec. ``"orjson"`` and ``"ujson"`` require their
+            respective packages to be installed.
+        pool_maxsize: Maximum number of connections kept open for reuse, per host.
+            When sending requests from several threads, set to at least the number of
+            threads: otherwise connections beyond `pool_maxsize` are discarded after each
+            request instead of being reused, unless `pool_block` is set.
+            By default 10, as in :class:`requests.adapters.HTTPAdapter`.
+        pool_block: Whether requests wait for a connection of the pool to be available
+            when `pool_maxsize` connections are in use, instead of opening a new connection.
+        tcp_keepalive: Idle time (in seconds) after which the OS sends TCP keep-alive probes,
+            so that idle connections are not silently dropped by firewalls or load balancers.
+            By default keep-alive probes are not sent.
+
+            If any of `pool_maxsize`, `pool_block` or `tcp_keepalive` is specified,
+            a :class:`~tamr_unify_client.pool.PoolAdapter` is mounted on the session,
+            replacing the adapters of a provided `session`.
+        session_per_thread: Whether each thread sends requests with its own session, so that
+            the client and its resources (e.g. datasets and projects) can be used from many
+            threads. The sessions of all threads share the cookies, including the auth cookie
+            of a single login, and the connection pools of :attr:`Client.session`.
+            Other settings of :attr:`Client.session` (e.g. headers or ``verify``) are copied
+            to the session of a thread when it first sends a request.
+        retry: Policy for retrying requests that failed transiently, e.g. with
+            ``503 Service Unavailable``. By default requests are not retried.
+        retry_stats: Statistics updated with the retries of the requests of this client.
+            Also available as :attr:`Client.retry_stats`.
+        token_cache: Cache of auth tokens shared with other clients, e.g. of other worker
+            processes, so that they log in once instead of once per client.
+            Only used with :class:`~tamr_unify_client.auth.UsernamePasswordAuth`, when
+            logging in (see `store_auth_cookie`).
+        timeout: Policy for timing out requests, with connect and read timeouts for
+            requests of metadata, record streams and polls of operations.
+            Requests do not time out if ``None``. A ``timeout`` passed to
+            :func:`~tamr_unify_client.Client.request` takes precedence.
+            Requests that time out raise :class:`~tamr_unify_client.timeout.ConnectTimeout`
+            or :class:`~tamr_unify_client.timeout.ReadTimeout`.
 
     Example:
         >>> from tamr_unify_client import Client
@@ -49,6 +112,15 @@ class Client:
         base_path: str = "/api/versioned/v1/",
         session: Optional[requests.Session] = None,
         store_auth_cookie: bool = False,
+        json_codec: Optional[str] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[int] = None,
+        session_per_thread: bool = False,
+        retry: Optional[Retry] = None,
+        retry_stats: Optional[RetryStats] = None,
+        token_cache: Optional[TokenCache] = None,
+        timeout: Optional[Timeout] = Timeout(),
     ):
         self.auth = auth
         self.host = host
@@ -57,6 +129,29 @@ class Client:
         self.base_path = base_path
         self.session = session or requests.Session()
         self.session.auth = auth
+        if pool_maxsize is not None or pool_block or tcp_keepalive is not None:
+            adapter = PoolAdapter(
+                tcp_keepalive=tcp_keepalive,
+                pool_maxsize=pool_maxsize or DEFAULT_POOLSIZE,
+                pool_block=pool_block,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        self.json_codec = (
+            _codec.default() if json_codec is None else _codec.get(json_codec)
+        )
+        self._local = threading.local() if session_per_thread else None
+        self.retry = retry
+        self.retry_stats = retry_stats or RetryStats()
+        self.timeout = timeout
+        # serializes logins, so that threads rejected at once log in only once
+        self._auth_lock = threading.RLock()
+        self._logins = 0
+        self._auth_token = None
+        self._auth_token_expiry = None
+        # time the auth token was obtained by logging in, if known
+        self._auth_token_time = None
+        self.token_cache = token_cache
         if store_auth_cookie:
             self.set_auth_cookie()
 
@@ -80,7 +175,15 @@ class Client:
         else:
             return f"{self.protocol}://{self.host}:{self.port}"
 
-    def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        idempotent: Optional[bool] = None,
+        profile: Optional[str] = None,
+        **kwargs,
+    ) -> requests.Response:
         """Sends a request to Tamr.
 
         The URL for the request will be ``<origin>/<base_path>/<endpoint>``.
@@ -89,6 +192,13 @@ class Client:
         Args:
             method: The HTTP method to use (e.g. `'GET'` or `'POST'`)
             endpoint: API endpoint to call (relative to the Base API path for this client).
+            idempotent: Whether the request can be retried according to :attr:`Client.retry`
+                even if its method is not idempotent, e.g. for a batch of record updates.
+                By default whether its method is in the methods of :attr:`Client.retry`.
+            profile: Profile of the request for :attr:`Client.timeout`, one of
+                ``"metadata"``, ``"stream"`` or ``"poll"``. By default ``"stream"`` for
+                streamed responses (``stream=True``) and for bodies given as a file or
+                a generator, ``"metadata"`` otherwise.
 
         Returns:
             HTTP response from the Tamr server
@@ -101,24 +211,101 @@ class Client:
             url = self.origin + self.base_path + endpoint
 
         # Attempt request with auth cookie
-        response = self.session.request(method, url, **kwargs)
-        if (
-            response.status_code == 401
-            and "credentials" in response.text.lower()
-            and isinstance(self.auth, UsernamePasswordAuth)
-        ):
-            first_response = response
-            self.set_auth_cookie()
-            response = self.session.request(method, url, **kwargs)
-            if response.status_code == 401 and "credentials" in response.text.lower():
-                # Login credentials are bad, return original response
-                response = first_response
+        session = self._thread_session()
+        body = kwargs.get("data")
+        if profile is None:
+            # files and generators are record uploads, e.g. by `Dataset.upsert_records`
+            streamed = kwargs.get("stream") or not _retry._replayable(body)
+            profile = _timeout.STREAM if streamed else _timeout.METADATA
+        if self._logged_in() and not url.endswith("instance:login"):
+            if self._token_expiring():
+                # log in again before sending, rather than after the request is rejected
+                with self._auth_lock:
+                    if self._token_expiring():
+                        self.set_auth_cookie()
+                session.auth = self.session.auth
+            streamed = _retry._position(body) is None and not _retry._replayable(body)
+            if streamed and not self._token_fresh():
+                # record the streamed body, to send it again if the token is rejected
+                body = kwargs["data"] = _upload.Replayable(body)
+        position = _retry._position(body)
+        send = partial(
+            _retry.send,
+            partial(
+                _timeout.send, session.request, policy=self.timeout, profile=profile
+            ),
+            retry=self.retry,
+            stats=self.retry_stats,
+            idempotent=idempotent,
+        )
+        try:
+            logins = self._logins
+            response = send(method, url, **kwargs)
+            if (
+                response.status_code == 401
+                and "credentials" in response.text.lower()
+                and isinstance(self.auth, UsernamePasswordAuth)
+            ):
+                first_response = response
+                with self._auth_lock:
+                    # unless another thread already logged in since the request was sent
+                    if self._logins == logins:
+                        self.set_auth_cookie()
+                session.auth = self.session.auth
+                # a streamed body that was not recorded cannot be sent again
+                resend = True
+                if isinstance(body, _upload.Replayable):
+                    if not body.recorded:
+                        raise StreamNotRecorded(
+                            f"Request body rejected with an expired auth token: {url}. "
+                            f"The body was larger than the {_upload.REPLAY_MAX_SIZE} bytes"
+                            " recorded to send it again."
+                        )
+                    kwargs["data"] = body.replay()
+                elif position is not None:
+                    body.seek(position)
+                else:
+                    resend = _retry._replayable(body)
+                if resend:
+                    response = send(method, url, **kwargs)
+                    if (
+                        response.status_code == 401
+                        and "credentials" in response.text.lower()
+                    ):
+                        # Login credentials are bad, return original response
+                        response = first_response
+        finally:
+            if isinstance(body, _upload.Replayable):
+                body.close()
 
         logger.info(
             f"{response.request.method} {response.url} : {response.status_code}"
         )
         return response
 
+    def _thread_session(self) -> requests.Session:
+        """Session sending the requests of the current thread.
+
+        Returns:
+            :attr:`Client.session`, or the session of the current thread if the client has
+            one session per thread.
+        """
+        if self._local is None:
+            return self.session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            for name in requests.Session.__attrs__:
+                if name not in ["adapters", "cookies"]:
+                    setattr(session, name, copy.copy(getattr(self.session, name)))
+            session.cookies = self.session.cookies
+            for prefix, adapter in self.session.adapters.items():
+                session.mount(prefix, adapter)
+            self._local.session = session
+        # the auth of the client session is cleared once logged in
+        session.auth = self.session.auth
+        return session
+
     def get(self, endpoint, **kwargs):
         """Calls :func:`~tamr_unify_client.Client.request` with the ``"GET"`` method."""
         return self.request("GET", endpoint, **kwargs)
@@ -142,6 +329,35 @@ class Client:
             raise TypeError(
                 "Auth cookie only supported for UsernamePasswordAuth authentication"
             )
+        with self._auth_lock:
+            self._logins += 1
+            if self.token_cache is None:
+                self._login()
+                return
+            with self.token_cache.lock():
+                cached = self.token_cache.load(self.origin, self.auth.username)
+                if (
+                    cached is not None
+                    and cached[0] != self._auth_token
+                    and not _expiring(cached[1])
+                ):
+                    # another client logged in since this client got its token
+                    self._set_token(*cached)
+                elif self._login():
+                    self.token_cache.store(
+                        self.origin,
+                        self.auth.username,
+                        self._auth_token,
+                        self._auth_token_expiry,
+                    )
+
+    def _login(self) -> bool:
+        """Log in to get an auth token.
+
+        Returns:
+            Whether the login succeeded.
+        """
+        obtained = time.time()
         r = self.post(
             "./instance:login",
             json={"username": self.auth.username, "password": self.auth.password},
@@ -149,12 +365,59 @@ class Client:
         # If login request fails for any reason do not set cookie so following responses use
         # header credentials for authentication
         if not r.ok:
-            return
+            return False
         auth_token = r.json()["token"]
+        self._set_token(auth_token, _token_expiry(auth_token), obtained=obtained)
+        return True
+
+    def _set_token(
+        self,
+        auth_token: str,
+        expiry: Optional[float],
+        *,
+        obtained: Optional[float] = None,
+    ):
+        """Authenticate subsequent requests with an auth token.
+
+        Args:
+            auth_token: Auth token.
+            expiry: Expiration time of the token (in seconds since the epoch), if known.
+            obtained: Time the token was obtained by logging in
+                (in seconds since the epoch), if known.
+        """
         self.session.cookies.set("authToken", auth_token)  # TODO: Set domain
+        self._auth_token = auth_token
+        self._auth_token_expiry = expiry
+        self._auth_token_time = obtained
         # Clear session auth.  It is still accessible as self.auth if needed
         self.session.auth = None
 
+    def _logged_in(self) -> bool:
+        """Whether requests are authenticated with the auth cookie of a login."""
+        return isinstance(self.auth, UsernamePasswordAuth) and self.session.auth is None
+
+    def _token_expiring(self) -> bool:
+        """Whether the auth token of the last login expires within a minute."""
+        return _expiring(self._auth_token_expiry)
+
+    def _token_fresh(self) -> bool:
+        """Whether the auth token of the last login is known not to expire within a minute."""
+        if self._auth_token_expiry is not None:
+            return not self._token_expiring()
+        # the expiration of opaque tokens is unknown, but they do not expire right away
+        return (
+            self._auth_token_time is not None
+            and time.time() < self._auth_token_time + TOKEN_REFRESH_MARGIN
+        )
+
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of the connection pools of the session of this client.
+
+        Returns:
+            Number of connections opened, in use and idle, and of requests sent.
+        """
+        return PoolStats(self.session)
+
     @property
     def projects(self) -> ProjectCollection:
         """Collection of all projects on this Tamr instance.
@@ -184,3 +447,30 @@ class Client:
             f"base_path={self.base_path!r}, "
             f"auth={type(self.auth).__name__})"
         )
+
+
+class StreamNotRecorded(Exception):
+    """Raised when a streamed request body rejected with an expired auth token
+    cannot be sent again, because it was larger than the recorded size.
+    """
+
+    pass
+
+
+def _expiring(expiry):
+    """Whether an auth token expiring at `expiry` (if known) should be refreshed."""
+    return expiry is not None and time.time() >= expiry - TOKEN_REFRESH_MARGIN
+
+
+def _token_expiry(token):
+    """Expiration time (in seconds since the epoch) of an auth token,
+    if it is a JSON Web Token with an expiration claim.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (ValueError, TypeError, KeyError):
+        return None
@@ -0,0 +1,48 @@
+class PrefetchStats:
+    """Statistics of a prefetching record stream, updated while the stream is consumed.
+
+    Pass an instance to e.g. :func:`~tamr_unify_client.dataset.resource.Dataset.records`
+    to monitor how far the background reader is ahead of the consumer.
+
+    :ivar capacity: Maximum number of line batches held in the queue.
+    :ivar batches: Number of line batches read so far.
+    :ivar depth: Number of line batches currently in the queue.
+    :ivar max_depth: Largest number of line batches held in the queue at once.
+    :ivar reader_waits: Number of times the reader waited because the queue was full.
+    :ivar reader_wait_seconds: Total time the reader waited for the consumer.
+    :ivar consumer_waits: Number of times the consumer waited because the queue was empty.
+    :ivar consumer_wait_seconds: Total time the consumer waited for the reader.
+    """
+
+    def __init__(self):
+        self.capacity = 0
+        self.batches = 0
+        self.depth = 0
+        self.max_depth = 0
+        self.reader_waits = 0
+        self.reader_wait_seconds = 0.0
+        self.consumer_waits = 0
+        self.consumer_wait_seconds = 0.0
+
+    @property
+    def bottleneck(self):
+        """Whether the ``"reader"`` or the ``"consumer"`` is the bottleneck, based on which
+        side waited less for the other. ``None`` before any side waited.
+
+        :type: str
+        """
+        if self.reader_wait_seconds == self.consumer_wait_seconds == 0:
+            return None
+        if self.consumer_wait_seconds >= self.reader_wait_seconds:
+            return "reader"
+        return "consumer"
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"depth={self.depth!r}, "
+            f"max_depth={self.max_depth!r}, "
+            f"batches={self.batches!r}, "
+            f"bottleneck={self.bottleneck!r})"
+        )
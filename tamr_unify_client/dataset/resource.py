@@ -1,14 +1,14 @@
 from copy import deepcopy
-import json
 import os
 from typing import Optional, TYPE_CHECKING
 import warnings
 
-from tamr_unify_client._ignore_nan_encoder import IgnoreNanEncoder
+from tamr_unify_client import _ndjson, _upload
 from tamr_unify_client.attribute.collection import AttributeCollection
 from tamr_unify_client.base_resource import BaseResource
 from tamr_unify_client.dataset.profile import DatasetProfile
 from tamr_unify_client.dataset.status import DatasetStatus
+from tamr_unify_client.dataset.upload import UploadOptions
 from tamr_unify_client.dataset.uri import DatasetURI
 from tamr_unify_client.dataset.usage import DatasetUsage
 from tamr_unify_client.operation import Operation
@@ -17,6 +17,8 @@ BUILDING_DOCS = os.environ.get("TAMR_CLIENT_DOCS") == "1"
 if TYPE_CHECKING or BUILDING_DOCS:
     import pandas as pd
 
+_DATAFRAME_CHUNK_SIZE = 10_000
+
 
 class Dataset(BaseResource):
     """A Tamr dataset."""
@@ -65,7 +67,7 @@ class Dataset(BaseResource):
         alias = self.api_path + "/attributes"
         return AttributeCollection(self.client, alias)
 
-    def _update_records(self, updates, *, ignore_nan=False):
+    def _update_records(self, updates, *, ignore_nan=False, **options):
         """Send a batch of record creations/updates/deletions to this dataset.
         You probably want to use :func:`~tamr_unify_client.dataset.resource.Dataset.upsert_records`
         or :func:`~tamr_unify_client.dataset.resource.Dataset.delete_records` instead.
@@ -74,7 +76,9 @@ class Dataset(BaseResource):
         :type records: iterable[dict]
         :param ignore_nan: Whether to treat `NaN` values as null. Unconverted `NaN`s will raise an error if found. Deprecated.
         :type ignore_nan: bool
-        :returns: JSON response body from server.
+        :param ``**options``: Upload options (e.g. ``batch_size``, ``workers``, ``compression``).
+            See :class:`~tamr_unify_client.dataset.upload.UploadOptions`.
+        :returns: JSON response body from server. When batching, the responses for all batches are merged.
         :rtype: :py:class:`dict`
         """
         if ignore_nan:
@@ -82,21 +86,75 @@ class Dataset(BaseResource):
                 "'ignore_nan' is deprecated. Users are expected to provide valid JSON representations instead",
                 DeprecationWarning,
             )
-        encoder = IgnoreNanEncoder if ignore_nan else None
-        stringified_updates = (
-            json.dumps(update, cls=encoder, allow_nan=False).encode("utf-8")
+        dumps = self.client.json_codec.dumps
+        keyed_updates = (
+            (
+                _upload.record_id(update),
+                dumps(update, allow_nan=False, ignore_nan=ignore_nan),
+            )
             for update in updates
         )
+        return self._update_serialized_records(keyed_updates, UploadOptions(**options))
 
-        return (
-            self.client.post(
-                self.api_path + ":updateRecords",
-                headers={"Content-Encoding": "utf-8"},
-                data=stringified_updates,
+    def _update_serialized_records(self, keyed_updates, options):
+        """Send serialized record creations/updates/deletions to this dataset.
+
+        :param keyed_updates: Pairs of record ID and update serialized as JSON.
+            Record IDs only determine which worker sends each update.
+        :type keyed_updates: iterable[tuple]
+        :param options: Upload options.
+        :type options: :class:`~tamr_unify_client.dataset.upload.UploadOptions`
+        :returns: JSON response body from server. When batching, the responses for all batches are merged.
+        :rtype: :py:class:`dict`
+        """
+        if options.workers < 1:
+            raise ValueError(
+                f"Number of workers must be positive, but was {options.workers}"
+            )
+        compression = options.compression
+        if compression is not None:
+            _upload.compressor(compression, options.compression_level)
+
+        def post(body):
+            if compression is not None:
+                body = _upload.compress(body, compression, options.compression_level)
+            return (
+                # record updates are idempotent, so batches can be replayed on retry
+                self.client.post(
+                    self.api_path + ":updateRecords",
+                    headers={"Content-Encoding": compression or "utf-8"},
+                    data=body,
+                    idempotent=True,
+                    profile="stream",
+                )
+                .successful()
+                .json()
             )
-            .successful()
-            .json()
+
+        batched = options.batch_size is not None or options.batch_bytes is not None
+        if options.workers > 1:
+            return _upload.post_parallel(
+                post,
+                keyed_updates,
+                workers=options.workers,
+                size=options.batch_size if batched else _upload.PARALLEL_BATCH_SIZE,
+                nbytes=options.batch_bytes,
+                max_in_flight=options.max_in_flight,
+            )
+
+        stringified_updates = (update for _, update in keyed_updates)
+        if not batched:
+            if options.spool:
+                with _upload.spool(stringified_updates) as body:
+                    return post(body)
+            if options.buffer_size is not None:
+                return post(_upload.coalesce(stringified_updates, options.buffer_size))
+            return post(stringified_updates)
+
+        batches = _upload.batches(
+            stringified_updates, size=options.batch_size, nbytes=options.batch_bytes
         )
+        return _upload.merge_responses(post(b"\n".join(batch)) for batch in batches)
 
     def upsert_from_dataframe(
         self,
@@ -104,6 +162,7 @@ class Dataset(BaseResource):
         *,
         primary_key_name: str,
         ignore_nan: Optional[bool] = None,
+        **options,
     ) -> dict:
         """Upserts a record for each row of `df` with attributes for each column in `df`.
 
@@ -111,6 +170,8 @@ class Dataset(BaseResource):
             df: The data to upsert records from.
             primary_key_name: The name of the primary key of the dataset.  Must be a column of `df`.
             ignore_nan: Legacy parameter that does nothing. Deprecated.
+            **options: Upload options (e.g. `batch_size`, `workers`).
+                See :class:`~tamr_unify_client.dataset.upload.UploadOptions`.
 
         Returns:
             JSON response body from the server.
@@ -127,14 +188,21 @@ class Dataset(BaseResource):
         if primary_key_name not in df.columns:
             raise KeyError(f"{primary_key_name} is not an attribute of the data")
 
-        # serialize records via to_json to handle `np.nan` values
-        serialized_records = ((pk, row.to_json()) for pk, row in df.iterrows())
-        records = (
-            {primary_key_name: pk, **json.loads(row)} for pk, row in serialized_records
+        dumps = self.client.json_codec.dumps
+        keyed_updates = (
+            (
+                record_id,
+                b'{"action": "CREATE", "recordId": '
+                + dumps(record_id, allow_nan=False)
+                + b', "record": '
+                + record
+                + b"}",
+            )
+            for record_id, record in _dataframe_records(df, primary_key_name)
         )
-        return self.upsert_records(records, primary_key_name)
+        return self._update_serialized_records(keyed_updates, UploadOptions(**options))
 
-    def upsert_records(self, records, primary_key_name, *, ignore_nan=False):
+    def upsert_records(self, records, primary_key_name, *, ignore_nan=False, **options):
         """Creates or updates the specified records.
 
         :param records: The records to update, as dictionaries.
@@ -143,6 +211,8 @@ class Dataset(BaseResource):
         :type primary_key_name: str
         :param ignore_nan: Whether to convert `NaN` values to `null` when upserting records.  If `False` and `NaN` is found this function will fail. Deprecated.
         :type ignore_nan: bool
+        :param ``**options``: Upload options (e.g. ``batch_size``, ``workers``).
+            See :class:`~tamr_unify_client.dataset.upload.UploadOptions`.
         :return: JSON response body from the server.
         :rtype: dict
         """
@@ -155,31 +225,35 @@ class Dataset(BaseResource):
             {"action": "CREATE", "recordId": record[primary_key_name], "record": record}
             for record in records
         )
-        return self._update_records(updates, ignore_nan=ignore_nan)
+        return self._update_records(updates, ignore_nan=ignore_nan, **options)
 
-    def delete_records(self, records, primary_key_name):
+    def delete_records(self, records, primary_key_name, **options):
         """Deletes the specified records.
 
         :param records: The records to delete, as dictionaries.
         :type records: iterable[dict]
         :param primary_key_name: The name of the primary key for these records, which must be a key in each record dictionary.
         :type primary_key_name: str
+        :param ``**options``: Upload options (e.g. ``batch_size``, ``workers``).
+            See :class:`~tamr_unify_client.dataset.upload.UploadOptions`.
         :return: JSON response body from the server.
         :rtype: dict
         """
         ids = (record[primary_key_name] for record in records)
-        return self.delete_records_by_id(ids)
+        return self.delete_records_by_id(ids, **options)
 
-    def delete_records_by_id(self, record_ids):
+    def delete_records_by_id(self, record_ids, **options):
         """Deletes the specified records.
 
         :param record_ids: The IDs of the records to delete.
         :type record_ids: iterable
+        :param ``**options``: Upload options (e.g. ``batch_size``, ``workers``).
+            See :class:`~tamr_unify_client.dataset.upload.UploadOptions`.
         :return: JSON response body from the server.
         :rtype: dict
         """
         updates = ({"action": "DELETE", "recordId": rid} for rid in record_ids)
-        return self._update_records(updates)
+        return self._update_records(updates, **options)
 
     def delete_all_records(self):
         """Removes all records from the dataset.
@@ -233,15 +307,37 @@ class Dataset(BaseResource):
         op = Operation.from_response(self.client, response)
         return op.apply_options(**options)
 
-    def records(self):
+    def records(
+        self, *, chunk_size=_ndjson.CHUNK_SIZE, columns=None, prefetch=0, stats=None
+    ):
         """Stream this dataset's records as Python dictionaries.
 
+        Records are read in large chunks and parsed in batches with the JSON codec of the client.
+        If `columns` is specified, only those attributes are parsed for records without nested
+        objects, and other records are projected onto `columns` as soon as they are parsed.
+
+        :param chunk_size: Size (in bytes) of each read from the response. Defaults to 1 MiB.
+        :type chunk_size: int
+        :param columns: Names of the attributes to keep in each record.
+            Attributes missing from a record are omitted. By default all attributes are kept.
+        :type columns: iterable[str]
+        :param prefetch: Maximum number of batches of records read ahead by a background thread,
+            so that network reads overlap with parsing. By default records are read as they are consumed.
+        :type prefetch: int
+        :param stats: Statistics updated while prefetching, including the queue depth and
+            whether reading or parsing is the bottleneck.
+        :type stats: :class:`~tamr_unify_client.dataset.prefetch.PrefetchStats`
         :return: Stream of records.
         :rtype: Python generator yielding :py:class:`dict`
+        :raises ValueError: If `prefetch` is negative.
         """
+        loads = self.client.json_codec.loads
+        if columns is not None:
+            loads = _ndjson.projection(loads, columns)
         with self.client.get(self.api_path + "/records", stream=True) as response:
-            for line in response.iter_lines():
-                yield json.loads(line)
+            yield from _ndjson.parse(
+                response, loads, chunk_size, prefetch=prefetch, stats=stats
+            )
 
     def status(self):
         """Retrieve this dataset's streamability status.
@@ -627,3 +723,25 @@ class DatasetSpec:
             f"{self.__class__.__qualname__}("
             f"dict={self._data})"
         )
+
+
+def _dataframe_records(df, primary_key_name, chunk_size=_DATAFRAME_CHUNK_SIZE):
+    """Serialize each row of a DataFrame as a JSON object, one chunk of rows at a time.
+
+    Rows are serialized column-wise via :meth:`pandas.DataFrame.to_json`, which handles `np.nan`
+    values by serializing them as `null`.
+
+    :param df: The DataFrame to serialize.
+    :type df: :class:`pandas.DataFrame`
+    :param primary_key_name: The primary key of the rows. Must be a column of `df`.
+    :type primary_key_name: str
+    :param chunk_size: Number of rows serialized at once.
+    :type chunk_size: int
+    :return: Pairs of primary key value and row as a UTF-8 encoded JSON object.
+    :rtype: Python generator yielding tuple
+    """
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        lines = chunk.to_json(orient="records", lines=True)
+        record_ids = chunk[primary_key_name].tolist()
+        yield from zip(record_ids, lines.encode("utf-8").splitlines())
@@ -0,0 +1,80 @@
+"""Options for sending record updates to a dataset."""
+from tamr_unify_client import _upload
+
+
+class UploadOptions:
+    """Options for sending record updates, e.g. by
+    :func:`~tamr_unify_client.dataset.resource.Dataset.upsert_records`.
+
+    By default, all updates are streamed to the server in a single request.
+    If `batch_size` or `batch_bytes` is specified, updates are instead split into batches
+    that are sent as sequential requests. With the retry policy of the client, a batch
+    that failed transiently is sent again from memory, without restarting the updates;
+    updates streamed in a single request cannot be replayed, so are not retried.
+    If `workers` is greater than 1, batches are sent concurrently; updates to the same record
+    are always sent by the same worker, in order.
+
+    When streaming all updates in a single request, each update is sent as its own chunk
+    unless `buffer_size` is specified, in which case updates are packed into chunks of about
+    that size (e.g. 1 MiB). Alternatively, `spool` writes all updates to a temporary file
+    before sending them, so that the request has a known ``Content-Length``.
+
+    If `compression` is specified, request bodies are compressed incrementally as they are sent,
+    which reduces the bytes sent for repetitive records at the cost of CPU time.
+
+    :param batch_size: Maximum number of updates sent per request.
+        Defaults to 10,000 when sending with multiple workers.
+    :type batch_size: int
+    :param batch_bytes: Maximum size (in bytes) of the serialized updates sent per request.
+    :type batch_bytes: int
+    :param workers: Number of concurrent connections used to send batches.
+        The connection pool of the client's session should allow at least this many connections.
+    :type workers: int
+    :param max_in_flight: Maximum number of batches held in memory at once when sending
+        with multiple workers. By default twice the number of workers.
+    :type max_in_flight: int
+    :param buffer_size: Size (in bytes) of the chunks sent when streaming updates in a single request.
+    :type buffer_size: int
+    :param spool: Whether to spool updates to a temporary file when sending them in a single request.
+    :type spool: bool
+    :param compression: Content encoding used to compress request bodies, either ``"gzip"`` or ``"deflate"``.
+        By default request bodies are not compressed.
+    :type compression: str
+    :param compression_level: Compression level, from 0 (no compression) to 9 (best compression).
+    :type compression_level: int
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size=None,
+        batch_bytes=None,
+        workers=1,
+        max_in_flight=None,
+        buffer_size=None,
+        spool=False,
+        compression=None,
+        compression_level=_upload.COMPRESSION_LEVEL,
+    ):
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.buffer_size = buffer_size
+        self.spool = spool
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"batch_size={self.batch_size!r}, "
+            f"batch_bytes={self.batch_bytes!r}, "
+            f"workers={self.workers!r}, "
+            f"max_in_flight={self.max_in_flight!r}, "
+            f"buffer_size={self.buffer_size!r}, "
+            f"spool={self.spool!r}, "
+            f"compression={self.compression!r}, "
+            f"compression_level={self.compression_level!r})"
+        )
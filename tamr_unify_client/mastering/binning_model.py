@@ -1,5 +1,4 @@
-import json
-
+from tamr_unify_client import _ndjson, _upload
 from tamr_unify_client.base_resource import BaseResource
 
 
@@ -10,34 +9,51 @@ class BinningModel(BaseResource):
     def from_json(cls, client, resource_json, api_path=None):
         return super().from_data(client, resource_json, api_path)
 
-    def records(self):
+    def records(self, *, prefetch=0, stats=None):
         """Stream this object's records as Python dictionaries.
 
+        :param prefetch: Maximum number of batches of records read ahead by a background thread,
+            so that network reads overlap with parsing. By default records are read as they are consumed.
+        :type prefetch: int
+        :param stats: Statistics updated while prefetching.
+        :type stats: :class:`~tamr_unify_client.dataset.prefetch.PrefetchStats`
         :return: Stream of records.
         :rtype: Python generator yielding :py:class:`dict`
+        :raises ValueError: If `prefetch` is negative.
         """
+        loads = self.client.json_codec.loads
         with self.client.get(self.api_path + "/records", stream=True) as response:
-            for line in response.iter_lines():
-                yield json.loads(line)
+            yield from _ndjson.parse(response, loads, prefetch=prefetch, stats=stats)
 
-    def update_records(self, records):
+    def update_records(
+        self, records, *, compression=None, compression_level=_upload.COMPRESSION_LEVEL
+    ):
         """Send a batch of record creations/updates/deletions to this dataset.
 
         :param records: Each record should be formatted as specified in the `Public Docs for Dataset updates <https://docs.tamr.com/reference#modify-a-datasets-records>`_.
         :type records: iterable[dict]
+        :param compression: Content encoding used to compress the request body incrementally,
+            either ``"gzip"`` or ``"deflate"``. By default the request body is not compressed.
+        :type compression: str
+        :param compression_level: Compression level, from 0 (no compression) to 9 (best compression).
+        :type compression_level: int
         :returns: JSON response body from server.
         :rtype: :py:class:`dict`
         """
 
         def _stringify_updates(updates):
+            dumps = self.client.json_codec.dumps
             for update in updates:
-                yield json.dumps(update).encode("utf-8")
+                yield dumps(update)
 
+        body = _stringify_updates(records)
+        if compression is not None:
+            body = _upload.compress(body, compression, compression_level)
         return (
             self.client.post(
                 self.api_path + "/records",
-                headers={"Content-Encoding": "utf-8"},
-                data=_stringify_updates(records),
+                headers={"Content-Encoding": compression or "utf-8"},
+                data=body,
             )
             .successful()
             .json()
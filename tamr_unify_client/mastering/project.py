@@ -1,5 +1,4 @@
-import json
-
+from tamr_unify_client import _ndjson
 from tamr_unify_client.base_model import MachineLearningModel
 from tamr_unify_client.dataset.resource import Dataset
 from tamr_unify_client.mastering.binning_model import BinningModel
@@ -172,11 +171,12 @@ class MasteringProject(Project):
         :type endpoint: str
         :return: A stream of the published clusters.
         """
-        string_ids = "\n".join(json.dumps(i) for i in ids)
+        codec = self.client.json_codec
+        string_ids = "\n".join(codec.dumps(i).decode("utf-8") for i in ids)
 
         with self.client.post(endpoint, data=string_ids, stream=True) as response:
-            for line in response.iter_lines():
-                yield cluster_class(json.loads(line))
+            for version in _ndjson.parse(response, codec.loads):
+                yield cluster_class(version)
 
     def estimate_pairs(self):
         """Returns pair estimate information for a mastering project
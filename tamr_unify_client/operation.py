@@ -1,6 +1,7 @@
 from time import sleep, time as now
 
 from tamr_unify_client.base_resource import BaseResource
+from tamr_unify_client.poll import FixedPoll
 
 
 class Operation(BaseResource):
@@ -147,26 +148,51 @@ class Operation(BaseResource):
         :return: Updated representation of this operation.
         :rtype: :class:`~tamr_unify_client.operation.Operation`
         """
-        op_json = self.client.get(self.api_path).successful().json()
+        op_json = self.client.get(self.api_path, profile="poll").successful().json()
         return Operation.from_json(self.client, op_json)
 
-    def wait(self, poll_interval_seconds=3, timeout_seconds=None):
+    def wait(
+        self, poll_interval_seconds=3, timeout_seconds=None, strategy=None, stats=None
+    ):
         """Continuously polls for this operation's server-side state.
 
         :param int poll_interval_seconds: Time interval (in seconds) between subsequent polls.
         :param int timeout_seconds: Time (in seconds) to wait for operation to resolve.
+        :param strategy: Strategy for the delays between polls, e.g.
+            :class:`~tamr_unify_client.poll.BackoffPoll` to resolve short operations
+            quickly while polling long operations rarely. By default polls every
+            `poll_interval_seconds`.
+        :type strategy: :class:`~tamr_unify_client.poll.PollStrategy`
+        :param stats: Statistics updated with the polls of this wait and how late they
+            observed the end of the operation.
+        :type stats: :class:`~tamr_unify_client.poll.WaitStats`
         :raises TimeoutError: If operation takes longer than `timeout_seconds` to resolve.
         :return: Resolved operation.
         :rtype: :class:`~tamr_unify_client.operation.Operation`
         """
-        started = now()
+        if strategy is None:
+            strategy = FixedPoll(poll_interval_seconds)
+        started = previous = now()
+        polls = 0
         op = self
         while timeout_seconds is None or now() - started < timeout_seconds:
             if op.state in ["PENDING", "RUNNING"]:
-                sleep(poll_interval_seconds)
+                delay = strategy.delay(op, polls)
+                if timeout_seconds is not None:
+                    delay = min(delay, timeout_seconds - (now() - started))
+                sleep(max(delay, 0.0))
             elif op.state in ["CANCELED", "SUCCEEDED", "FAILED"]:
+                strategy.observe(op)
+                if stats is not None:
+                    stats.observe(op, polls, started, previous)
                 return op
+            previous = now()
             op = op.poll()
+            polls += 1
+            if stats is not None:
+                stats.polls += 1
+        if stats is not None:
+            stats.wait_seconds += now() - started
         raise TimeoutError(
             f"Waiting for operation took longer than {timeout_seconds} seconds."
         )
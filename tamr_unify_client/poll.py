@@ -0,0 +1,257 @@
+"""Strategies for the delays between polls of operations, see
+:meth:`~tamr_unify_client.operation.Operation.wait`."""
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime, timezone
+import random
+import statistics
+import time
+
+
+class PollStrategy(ABC):
+    """Strategy for the delays between polls of an operation.
+
+    Subclass to plug in another strategy.
+    """
+
+    @abstractmethod
+    def delay(self, operation, polls):
+        """Delay (in seconds) before the next poll of an unresolved operation.
+
+        :param operation: Operation, as of the last poll.
+        :type operation: :class:`~tamr_unify_client.operation.Operation`
+        :param polls: Number of polls made so far while waiting for the operation.
+        :type polls: int
+        :rtype: float
+        """
+
+    def observe(self, operation):
+        """Called with each operation once it is resolved, e.g. to learn its duration.
+
+        :param operation: Resolved operation.
+        :type operation: :class:`~tamr_unify_client.operation.Operation`
+        """
+        pass
+
+
+class FixedPoll(PollStrategy):
+    """Poll at a fixed interval.
+
+    :param interval: Delay (in seconds) between polls.
+    :type interval: float
+    """
+
+    def __init__(self, interval=3.0):
+        self.interval = interval
+
+    def delay(self, operation, polls):
+        return self.interval
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"interval={self.interval!r})"
+        )
+
+
+class BackoffPoll(PollStrategy):
+    """Poll at a delay that grows exponentially, so that short operations resolve quickly
+    while long operations are polled rarely.
+
+    :param backoff: Delay (in seconds) before the first poll.
+    :type backoff: float
+    :param factor: Factor by which the delay grows after each poll.
+    :type factor: float
+    :param backoff_max: Maximum delay (in seconds) between polls.
+    :type backoff_max: float
+    :param jitter: Fraction of each delay that is randomized, from 0 (no randomization)
+        to 1 (any delay up to the backoff), so that many waits do not poll in lockstep.
+    :type jitter: float
+    """
+
+    def __init__(self, backoff=0.5, factor=2.0, backoff_max=30.0, jitter=0.2):
+        self.backoff = backoff
+        self.factor = factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+    def delay(self, operation, polls):
+        backoff = min(self.backoff * self.factor**polls, self.backoff_max)
+        return backoff * (1 - self.jitter * random.random())
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"backoff={self.backoff!r}, "
+            f"factor={self.factor!r}, "
+            f"backoff_max={self.backoff_max!r}, "
+            f"jitter={self.jitter!r})"
+        )
+
+
+class EstimatedPoll(PollStrategy):
+    """Poll shortly after an operation is expected to resolve, estimated from its
+    ``startTime`` and from the durations of the previous operations of the same type.
+
+    The durations of operations are learned as they resolve, so share one instance
+    between waits, e.g. for all operations of a pipeline. Estimates assume that the
+    clocks of the client and of the server agree. Operations of a type not seen yet,
+    operations that have not started and operations that take longer than estimated
+    are polled according to `fallback`.
+
+    :param fallback: Strategy when no estimate is available. Defaults to
+        :class:`~tamr_unify_client.poll.BackoffPoll`.
+    :type fallback: :class:`~tamr_unify_client.poll.PollStrategy`
+    :param margin: Time (in seconds) after the estimated end of an operation to poll it.
+    :type margin: float
+    :param interval_max: Maximum delay (in seconds) between polls, after which the end
+        of an operation is estimated again.
+    :type interval_max: float
+    :param history: Number of previous durations of each type of operation to estimate
+        from.
+    :type history: int
+    """
+
+    def __init__(self, fallback=None, margin=0.5, interval_max=60.0, history=20):
+        self.fallback = BackoffPoll() if fallback is None else fallback
+        self.margin = margin
+        self.interval_max = interval_max
+        self.history = history
+        self.durations = {}
+
+    def delay(self, operation, polls):
+        remaining = self.remaining(operation)
+        if remaining is None or remaining <= 0:
+            return self.fallback.delay(operation, polls)
+        return min(remaining + self.margin, self.interval_max)
+
+    def observe(self, operation):
+        status = operation.status or {}
+        start = _timestamp(status.get("startTime"))
+        end = _timestamp(status.get("endTime"))
+        if operation.state != "SUCCEEDED" or start is None or end is None:
+            return
+        durations = self.durations.setdefault(
+            operation.type, deque(maxlen=self.history)
+        )
+        durations.append(max(end - start, 0.0))
+
+    def remaining(self, operation):
+        """Estimated time (in seconds) until an operation resolves, if known.
+
+        :param operation: Unresolved operation.
+        :type operation: :class:`~tamr_unify_client.operation.Operation`
+        :rtype: float or None
+        """
+        durations = self.durations.get(operation.type)
+        start = _timestamp((operation.status or {}).get("startTime"))
+        if not durations or start is None:
+            return None
+        return statistics.median(durations) - (time.time() - start)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"fallback={self.fallback!r}, "
+            f"margin={self.margin!r}, "
+            f"interval_max={self.interval_max!r}, "
+            f"history={self.history!r})"
+        )
+
+
+class WaitStats:
+    """Statistics of waits for operations, to measure the tradeoff between the latency
+    of waits and the load of their polls on the server.
+
+    Updated in place while waiting for operations.
+
+    :ivar waits: Number of waits for operations that resolved.
+    :ivar polls: Number of polls.
+    :ivar wait_seconds: Total time spent waiting.
+    :ivar ended: Number of waits for operations with an ``endTime``, whose lateness is
+        known.
+    :ivar late_seconds: Total time between the end of operations and the polls that
+        observed their end. Only waits that polled operations with an ``endTime`` are
+        counted.
+    :ivar max_late_seconds: Longest time between the end of an operation and the poll
+        that observed it.
+    """
+
+    def __init__(self):
+        self.waits = 0
+        self.polls = 0
+        self.wait_seconds = 0.0
+        self.ended = 0
+        self.late_seconds = 0.0
+        self.max_late_seconds = 0.0
+
+    @property
+    def polls_per_wait(self):
+        """Average number of polls of each wait.
+
+        :type: float
+        """
+        return self.polls / self.waits if self.waits else 0.0
+
+    @property
+    def mean_late_seconds(self):
+        """Average time between the end of an operation and the poll that observed it.
+
+        :type: float
+        """
+        return self.late_seconds / self.ended if self.ended else 0.0
+
+    def observe(self, operation, polls, started, previous):
+        """Record the end of a wait for an operation.
+
+        The lateness of the wait is the time between the end of the operation and the
+        poll that observed it, at most the time since the previous poll, in case the
+        clocks of the client and of the server do not agree.
+
+        :param operation: Resolved operation.
+        :type operation: :class:`~tamr_unify_client.operation.Operation`
+        :param polls: Number of polls made while waiting.
+        :type polls: int
+        :param started: Time when the wait started.
+        :type started: float
+        :param previous: Time when the last poll was sent.
+        :type previous: float
+        """
+        observed = time.time()
+        self.waits += 1
+        self.wait_seconds += observed - started
+        end = _timestamp((operation.status or {}).get("endTime"))
+        if polls > 0 and end is not None:
+            late = min(max(observed - end, 0.0), observed - previous)
+            self.ended += 1
+            self.late_seconds += late
+            self.max_late_seconds = max(self.max_late_seconds, late)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"waits={self.waits!r}, "
+            f"polls={self.polls!r}, "
+            f"wait_seconds={self.wait_seconds!r}, "
+            f"ended={self.ended!r}, "
+            f"late_seconds={self.late_seconds!r}, "
+            f"max_late_seconds={self.max_late_seconds!r})"
+        )
+
+
+def _timestamp(value):
+    """Time (in seconds since the epoch) of a timestamp of an operation, e.g.
+    ``"2020-06-12T18:21:42.288Z"``, if valid."""
+    if not value:
+        return None
+    for format in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]:
+        try:
+            parsed = datetime.strptime(value, format)
+        except ValueError:
+            continue
+        return parsed.replace(tzinfo=timezone.utc).timestamp()
+    return None
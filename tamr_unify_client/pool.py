@@ -0,0 +1,133 @@
+"""Connection pools of the :class:`requests.Session` used by a client."""
+import socket
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# unacknowledged keep-alive probes before the OS closes a connection
+KEEPALIVE_PROBES = 3
+
+
+class PoolAdapter(HTTPAdapter):
+    """Transport adapter whose connections send TCP keep-alive probes.
+
+    Mount on a session for ``http://`` and ``https://``, or pass the pool options to
+    :class:`~tamr_unify_client.Client` to have it mounted on the session of the client.
+
+    :param tcp_keepalive: Idle time (in seconds) after which the OS sends TCP keep-alive
+        probes, also used as the interval between probes. ``None`` to not send probes.
+    :type tcp_keepalive: int
+    :param kwargs: Keyword arguments passed to :class:`requests.adapters.HTTPAdapter`,
+        e.g. ``pool_maxsize`` and ``pool_block``.
+    :raises ValueError: If `tcp_keepalive` is less than 1 second.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["tcp_keepalive"]
+
+    def __init__(self, tcp_keepalive=None, **kwargs):
+        # set before the pool manager is initialized by the base class
+        self.tcp_keepalive = tcp_keepalive
+        self._socket_options = socket_options(tcp_keepalive)
+        super().__init__(**kwargs)
+
+    def __setstate__(self, state):
+        self._socket_options = socket_options(state["tcp_keepalive"])
+        super().__setstate__(state)
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault("socket_options", self._socket_options)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def socket_options(tcp_keepalive=None):
+    """Socket options of connections, with TCP keep-alive if requested.
+
+    :param tcp_keepalive: Idle time (in seconds) before keep-alive probes are sent.
+        ``None`` to not send keep-alive probes.
+    :type tcp_keepalive: int
+    :return: Options as in :attr:`urllib3.connection.HTTPConnection.default_socket_options`.
+    :raises ValueError: If `tcp_keepalive` is less than 1 second.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    if tcp_keepalive is None:
+        return options
+    if tcp_keepalive < 1:
+        raise ValueError(
+            f"TCP keep-alive must be at least 1 second, but was {tcp_keepalive}"
+        )
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # names of the keep-alive settings differ between platforms, e.g. TCP_KEEPALIVE on macOS
+    for name, value in [
+        ("TCP_KEEPIDLE", tcp_keepalive),
+        ("TCP_KEEPALIVE", tcp_keepalive),
+        ("TCP_KEEPINTVL", tcp_keepalive),
+        ("TCP_KEEPCNT", KEEPALIVE_PROBES),
+    ]:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PoolStats:
+    """Snapshot of the connection pools of a session.
+
+    Get a new snapshot with :func:`~tamr_unify_client.Client.pool_stats`.
+
+    :ivar pools: Number of connection pools, one per host.
+    :ivar maxsize: Total number of connections kept by the pools for reuse.
+    :ivar in_use: Number of connections currently checked out of the pools by requests.
+    :ivar idle: Number of open connections waiting in the pools to be reused.
+    :ivar connections: Number of connections opened so far.
+    :ivar requests: Number of requests sent so far.
+    """
+
+    def __init__(self, session):
+        self.pools = self.maxsize = self.in_use = self.idle = 0
+        self.connections = self.requests = 0
+        for pool in _pools(session):
+            # the queue of a pool holds its idle connections, and `None` for each free slot
+            queued = list(pool.pool.queue)
+            self.pools += 1
+            self.maxsize += pool.pool.maxsize
+            self.in_use += max(pool.pool.maxsize - len(queued), 0)
+            self.idle += sum(conn is not None for conn in queued)
+            self.connections += pool.num_connections
+            self.requests += pool.num_requests
+
+    @property
+    def requests_per_connection(self):
+        """Average number of requests sent over each opened connection.
+        Close to 1 when connections are not reused, e.g. because the pools are too small
+        for the number of concurrent requests.
+
+        :type: float
+        """
+        return self.requests / self.connections if self.connections else 0.0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"pools={self.pools!r}, "
+            f"in_use={self.in_use!r}, "
+            f"idle={self.idle!r}, "
+            f"connections={self.connections!r}, "
+            f"requests={self.requests!r})"
+        )
+
+
+def _pools(session):
+    """Open connection pools of all transport adapters of a session."""
+    adapters = {id(a): a for a in session.adapters.values()}.values()
+    for adapter in adapters:
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        for manager in [adapter.poolmanager, *adapter.proxy_manager.values()]:
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is not None and pool.pool is not None:
+                    yield pool
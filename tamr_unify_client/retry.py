@@ -0,0 +1,232 @@
+"""Retries of requests that failed transiently."""
+import random
+import threading
+import time
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+
+
+class Retry:
+    """Policy for retrying requests that failed transiently.
+
+    Requests are retried on connection errors (e.g. a connection reset by a proxy), on
+    timeouts (see :class:`~tamr_unify_client.timeout.Timeout`) and on responses with a
+    retryable status (e.g. ``503 Service Unavailable``), after a delay that doubles at each
+    retry. Only requests of an idempotent method are retried, unless the request was never
+    sent, e.g. because the connection was refused or timed out, or unless it is known to be idempotent, e.g. a batch of record updates.
+    Requests whose body is a stream (e.g. a generator) cannot be replayed, so are not retried.
+
+    :param total: Maximum number of retries of each request.
+    :type total: int
+    :param backoff: Delay (in seconds) before the first retry.
+    :type backoff: float
+    :param backoff_max: Maximum delay (in seconds) before a retry, including the delay
+        requested by a ``Retry-After`` header.
+    :type backoff_max: float
+    :param jitter: Fraction of each delay that is randomized, from 0 (no randomization) to
+        1 (any delay up to the backoff), so that clients do not retry in lockstep.
+    :type jitter: float
+    :param statuses: Response statuses that are retried.
+    :type statuses: tuple[int]
+    :param methods: HTTP methods whose requests are retried.
+    :type methods: tuple[str]
+    :param budget: Maximum number of retries over all requests sharing the same
+        :class:`~tamr_unify_client.retry.RetryStats`, e.g. of a client, so that retries stop
+        when a server is persistently failing. By default retries are not limited.
+    :type budget: int
+    """
+
+    def __init__(
+        self,
+        total=3,
+        backoff=0.5,
+        backoff_max=30.0,
+        jitter=0.5,
+        statuses=(502, 503, 504),
+        methods=("DELETE", "GET", "HEAD", "OPTIONS", "PUT"),
+        budget=None,
+    ):
+        self.total = total
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = tuple(statuses)
+        self.methods = tuple(m.upper() for m in methods)
+        self.budget = budget
+
+    def delay(self, attempt, retry_after=None):
+        """Delay (in seconds) before a retry.
+
+        :param attempt: Number of the failed attempt, starting from 0.
+        :type attempt: int
+        :param retry_after: Delay requested by the server, if any.
+        :type retry_after: float
+        :rtype: float
+        """
+        backoff = min(self.backoff * 2**attempt, self.backoff_max)
+        delay = backoff * (1 - self.jitter * random.random())
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"total={self.total!r}, "
+            f"backoff={self.backoff!r}, "
+            f"statuses={self.statuses!r}, "
+            f"budget={self.budget!r})"
+        )
+
+
+class RetryStats:
+    """Statistics of retried requests, updated while requests are sent,
+    including by concurrent requests of several threads.
+
+    Pass an instance to :class:`~tamr_unify_client.Client` to monitor its retries.
+
+    :ivar requests: Number of requests sent, not counting retries.
+    :ivar retries: Number of retries.
+    :ivar retried: Number of requests that were retried at least once.
+    :ivar exhausted: Number of requests that still failed when no retries were left.
+    :ivar wait_seconds: Total time spent waiting before retries.
+    :ivar reasons: Number of retries by reason, either a response status e.g. ``"503"``
+        or an exception type e.g. ``"ConnectionError"`` or ``"ReadTimeout"``.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.retried = 0
+        self.exhausted = 0
+        self.wait_seconds = 0.0
+        self.reasons = {}
+        # guards the updates of the statistics by concurrent requests
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"requests={self.requests!r}, "
+            f"retries={self.retries!r}, "
+            f"exhausted={self.exhausted!r}, "
+            f"reasons={self.reasons!r})"
+        )
+
+
+def send(send, method, url, *, retry, stats, idempotent=None, **kwargs):
+    """Send a request, retrying it according to a policy.
+
+    :param send: Sends a request, with the signature of :meth:`requests.Session.request`.
+    :param method: HTTP method.
+    :type method: str
+    :param url: URL of the request.
+    :type url: str
+    :param retry: Retry policy. No retries if ``None``.
+    :type retry: :class:`~tamr_unify_client.retry.Retry`
+    :param stats: Statistics updated with the retries of the request.
+    :type stats: :class:`~tamr_unify_client.retry.RetryStats`
+    :param idempotent: Whether the request can be sent more than once without changing
+        its effect. By default whether its method is in the methods of `retry`.
+    :type idempotent: bool
+    :param kwargs: Keyword arguments passed to `send`.
+    :returns: Response to the last attempt.
+    :rtype: :class:`requests.Response`
+    :raises requests.exceptions.ConnectionError: If the last attempt failed to connect.
+    :raises requests.exceptions.Timeout: If the last attempt timed out, e.g. with
+        :class:`~tamr_unify_client.timeout.ReadTimeout`.
+    """
+    with stats._lock:
+        stats.requests += 1
+    if retry is None:
+        return send(method, url, **kwargs)
+    if idempotent is None:
+        idempotent = method.upper() in retry.methods
+    body = kwargs.get("data")
+    position = _position(body)
+    replayable = position is not None or _replayable(body)
+
+    for attempt in range(retry.total + 1):
+        if attempt > 0 and position is not None:
+            body.seek(position)
+        try:
+            r = send(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if not ((idempotent and replayable) or _not_sent(e)):
+                raise
+            if not _count_retry(retry, stats, attempt, type(e).__name__):
+                raise
+            retry_after = None
+        else:
+            if r.status_code not in retry.statuses or not (idempotent and replayable):
+                return r
+            if not _count_retry(retry, stats, attempt, str(r.status_code)):
+                return r
+            retry_after = _retry_after(r)
+            r.close()
+        delay = retry.delay(attempt, retry_after)
+        with stats._lock:
+            stats.wait_seconds += delay
+        time.sleep(delay)
+    raise AssertionError("unreachable: the last attempt returns or raises")
+
+
+def _count_retry(retry, stats, attempt, reason):
+    """Count the retry of a failed attempt, or the exhausted request if the attempt
+    may not be retried within the limits of a policy.
+
+    :returns: Whether the attempt may be retried.
+    :rtype: bool
+    """
+    with stats._lock:
+        if not _may_retry(retry, stats, attempt):
+            stats.exhausted += 1
+            return False
+        stats.retries += 1
+        stats.retried += attempt == 0
+        stats.reasons[reason] = stats.reasons.get(reason, 0) + 1
+        return True
+
+
+def _may_retry(retry, stats, attempt):
+    """Whether a failed attempt may be retried within the limits of a policy."""
+    if attempt >= retry.total:
+        return False
+    return retry.budget is None or stats.retries < retry.budget
+
+
+def _retry_after(response):
+    """Delay (in seconds) requested by the ``Retry-After`` header of a response, if any.
+
+    Only delays in seconds are supported, not HTTP dates.
+    """
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return None
+
+
+def _not_sent(error):
+    """Whether a request failed before being sent, so that it can be retried safely."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _position(body):
+    """Position of a seekable file body, to rewind it before a retry. ``None`` otherwise."""
+    try:
+        return body.tell() if body.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _replayable(body):
+    """Whether a request body can be sent again, i.e. is not a stream."""
+    return body is None or isinstance(body, (bytes, str, dict, list, tuple))
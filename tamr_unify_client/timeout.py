@@ -0,0 +1,155 @@
+"""Timeouts of requests, so that a half-open connection does not hang a client forever."""
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+METADATA = "metadata"
+STREAM = "stream"
+POLL = "poll"
+
+
+class Timeout:
+    """Policy for timing out requests.
+
+    Each request has a connect timeout, and a read timeout that depends on its profile:
+    requests for metadata (e.g. to get a dataset), record streams (e.g. to stream or update
+    records) and polls of operations. A read timeout bounds the time waiting for the server
+    to send any data, not the total time of a request: a record stream can take hours,
+    as long as it does not stall. Set a timeout to ``None`` to wait forever.
+
+    :param connect: Time (in seconds) to establish a connection.
+    :type connect: float
+    :param read: Time (in seconds) to wait for data of the responses to metadata requests.
+    :type read: float
+    :param stream: Time (in seconds) to wait for data of record streams, including the
+        response to a record upload while the server processes the records.
+    :type stream: float
+    :param poll: Time (in seconds) to wait for data of the responses to polls of operations.
+    :type poll: float
+    """
+
+    def __init__(self, connect=10.0, read=60.0, stream=600.0, poll=30.0):
+        self.connect = connect
+        self.read = read
+        self.stream = stream
+        self.poll = poll
+
+    def timeouts(self, profile):
+        """Connect and read timeouts of a request, as passed to :mod:`requests`.
+
+        :param profile: Profile of the request, one of ``"metadata"``, ``"stream"`` or
+            ``"poll"``.
+        :type profile: str
+        :rtype: tuple[float, float]
+        :raises ValueError: If `profile` is not supported.
+        """
+        reads = {METADATA: self.read, STREAM: self.stream, POLL: self.poll}
+        if profile not in reads:
+            raise ValueError(
+                f"Timeout profile must be one of {list(reads)}, but was '{profile}'"
+            )
+        return self.connect, reads[profile]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"connect={self.connect!r}, "
+            f"read={self.read!r}, "
+            f"stream={self.stream!r}, "
+            f"poll={self.poll!r})"
+        )
+
+
+class ConnectTimeout(requests.exceptions.ConnectTimeout):
+    """Raised when a connection could not be established within the connect timeout.
+
+    The request was not sent, so it can always be retried.
+    """
+
+    pass
+
+
+class ReadTimeout(requests.exceptions.ReadTimeout):
+    """Raised when the server sent no data within the read timeout of a request.
+
+    The request may have been processed by the server.
+    """
+
+    pass
+
+
+def send(send, method, url, *, policy, profile, **kwargs):
+    """Send a request, timing out according to a policy.
+
+    A ``timeout`` passed in `kwargs` takes precedence over the policy.
+
+    :param send: Sends a request, with the signature of :meth:`requests.Session.request`.
+    :param method: HTTP method.
+    :type method: str
+    :param url: URL of the request.
+    :type url: str
+    :param policy: Timeout policy. No timeouts if ``None``.
+    :type policy: :class:`~tamr_unify_client.timeout.Timeout`
+    :param profile: Profile of the request, one of ``"metadata"``, ``"stream"`` or
+        ``"poll"``.
+    :type profile: str
+    :param kwargs: Keyword arguments passed to `send`.
+    :rtype: :class:`requests.Response`
+    :raises ConnectTimeout: If a connection could not be established in time.
+    :raises ReadTimeout: If the server sent no data in time.
+    """
+    if policy is not None:
+        kwargs.setdefault("timeout", policy.timeouts(profile))
+    try:
+        return send(method, url, **kwargs)
+    except requests.exceptions.ConnectTimeout as e:
+        if isinstance(e, ConnectTimeout):
+            raise
+        connect, _ = _seconds(kwargs.get("timeout"))
+        raise ConnectTimeout(
+            f"Connecting for {method} {url} took longer than {connect} seconds",
+            request=e.request,
+            response=e.response,
+        ) from e
+    except requests.exceptions.ReadTimeout as e:
+        if isinstance(e, ReadTimeout):
+            raise
+        _, read = _seconds(kwargs.get("timeout"))
+        raise ReadTimeout(
+            f"Server sent no data for {method} {url} within {read} seconds",
+            request=e.request,
+            response=e.response,
+        ) from e
+
+
+def read_timeouts(response, data):
+    """Data read from a response body, raising a read timeout as such.
+
+    :mod:`requests` raises a read timeout while the body is read as a
+    :class:`requests.exceptions.ConnectionError`, as if the connection was lost.
+
+    :param response: Response whose body is read.
+    :type response: :class:`requests.Response`
+    :param data: Data read from the body, e.g. by :meth:`requests.Response.iter_content`.
+    :type data: iterable
+    :rtype: Python generator
+    :raises ReadTimeout: If the server sent no data within the read timeout of the request.
+    """
+    try:
+        yield from data
+    except requests.exceptions.ConnectionError as e:
+        if not (e.args and isinstance(e.args[0], ReadTimeoutError)):
+            raise
+        method = response.request.method if response.request else None
+        raise ReadTimeout(
+            f"Server stopped sending data for {method} {response.url}: {e.args[0]}",
+            request=response.request,
+            response=response,
+        ) from e
+
+
+def _seconds(timeout):
+    """Connect and read timeouts of a ``timeout`` argument of :mod:`requests`."""
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
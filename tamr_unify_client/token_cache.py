@@ -0,0 +1,115 @@
+"""Auth tokens cached in a file shared by the clients of many processes."""
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class TokenCache:
+    """File caching auth tokens, shared by the clients of many processes.
+
+    Tokens are cached by origin and username, with their expiration time if they are
+    JSON Web Tokens. Clients reuse a cached token instead of logging in, and log in again
+    only when the token is rejected or about to expire. Concurrent logins are serialized by
+    locking the file ``<path>.lock``, so that processes rejected at once log in only once.
+
+    The file is only readable by its owner, but holds tokens in clear: store it on a local
+    file system, where other users cannot read it.
+
+    :param path: Path of the file.
+    :type path: str or :class:`pathlib.Path`
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @contextmanager
+    def lock(self):
+        """Context holding the lock of the cache, to log in and store a token atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(str(self.path) + ".lock", "a+b") as f:
+            if sys.platform == "win32":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def load(self, origin, username):
+        """Cached auth token of a user, with its expiration time if known.
+
+        :param origin: Origin of the Tamr instance, e.g. ``"http://localhost:9100"``.
+        :type origin: str
+        :param username: Name of the user.
+        :type username: str
+        :return: Token and expiration time (in seconds since the epoch),
+            or ``None`` if no token is cached.
+        :rtype: tuple[str, float]
+        """
+        try:
+            entry = self._read()[origin][username]
+            expiry = entry.get("expiry")
+            return str(entry["token"]), None if expiry is None else float(expiry)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+    def store(self, origin, username, token, expiry=None):
+        """Cache the auth token of a user.
+
+        The file is replaced, so that readers never see it partly written.
+        Hold the :meth:`lock` of the cache while storing, so that no other token is lost.
+
+        :param origin: Origin of the Tamr instance, e.g. ``"http://localhost:9100"``.
+        :type origin: str
+        :param username: Name of the user.
+        :type username: str
+        :param token: Auth token.
+        :type token: str
+        :param expiry: Expiration time of the token (in seconds since the epoch), if known.
+        :type expiry: float
+        """
+        tokens = self._read()
+        if not isinstance(tokens.get(origin), dict):
+            tokens[origin] = {}
+        tokens[origin][username] = {"token": token, "expiry": expiry}
+        # created only readable by its owner
+        fd, temp = tempfile.mkstemp(
+            dir=str(self.path.parent), prefix=self.path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens, f)
+            os.replace(temp, str(self.path))
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def _read(self):
+        """Contents of the cache, empty if the file is missing or invalid."""
+        try:
+            with open(str(self.path)) as f:
+                tokens = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}."
+            f"{self.__class__.__qualname__}("
+            f"path={str(self.path)!r})"
+        )
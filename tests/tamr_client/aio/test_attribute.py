@@ -0,0 +1,45 @@
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_by_resource_id():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        attr = await aio.attribute.by_resource_id(s, dataset, "attr")
+    assert attr.name == "attr"
+    assert not attr.is_nullable
+    assert isinstance(attr.type, tc.attribute.type.Record)
+
+
+@fake.json_aio
+async def test_create_attribute_exists():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        with pytest.raises(tc.attribute.AlreadyExists):
+            await aio.attribute.create(s, dataset, name="attr", is_nullable=False)
+
+
+@fake.json_aio
+async def test_update():
+    attr = fake.attribute()
+
+    async with fake.aio_session() as s:
+        updated_attr = await aio.attribute.update(
+            s, attr, description="Synthetic row number updated"
+        )
+    assert updated_attr.description == "Synthetic row number updated"
+
+
+@fake.json_aio
+async def test_delete():
+    attr = fake.attribute()
+
+    async with fake.aio_session() as s:
+        await aio.attribute.delete(s, attr)
@@ -0,0 +1,13 @@
+import pytest
+
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_manual_labels():
+    project = fake.categorization_project()
+
+    async with fake.aio_session() as s:
+        await aio.categorization.manual_labels(s, project)
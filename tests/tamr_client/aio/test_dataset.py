@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_by_resource_id():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        dataset = await aio.dataset.by_resource_id(s, instance, "1")
+    assert dataset.name == "dataset 1 name"
+    assert dataset.description == "dataset 1 description"
+    assert dataset.key_attribute_names == ("tamr_id",)
+
+
+@fake.json_aio
+async def test_by_resource_id_dataset_not_found():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        with pytest.raises(tc.dataset.NotFound):
+            await aio.dataset.by_resource_id(s, instance, "1")
+
+
+@fake.json_aio
+async def test_by_name():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        dataset = await aio.dataset.by_name(s, instance, "dataset 1 name")
+    assert dataset.name == "dataset 1 name"
+    assert dataset.description == "dataset 1 description"
+    assert dataset.key_attribute_names == ("tamr_id",)
+
+
+@fake.json_aio
+async def test_get_all():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        all_datasets = await aio.dataset.get_all(s, instance)
+    assert len(all_datasets) == 2
+    assert [d.name for d in all_datasets] == ["dataset 1 name", "dataset 2 name"]
+
+
+@fake.json_aio
+async def test_create():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        dataset = await aio.dataset.create(
+            s,
+            instance,
+            name="new dataset",
+            key_attribute_names=("primary_key",),
+            description="a new dataset",
+        )
+    assert dataset.name == "new dataset"
+    assert dataset.description == "a new dataset"
+    assert dataset.key_attribute_names == ("primary_key",)
+
+
+@fake.json_aio
+async def test_materialize_async():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        op = await aio.dataset._materialize_async(s, dataset)
+    assert op.type == "SPARK"
+    assert op.description == "Materialize views to Elastic"
+    assert op.status is not None and op.status["state"] == "PENDING"
+
+
+def test_concurrent_requests():
+    httpx = pytest.importorskip("httpx")
+    in_flight = {"current": 0, "max": 0}
+
+    async def respond(request):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.01)
+        in_flight["current"] -= 1
+        id = request.url.path.split("/")[-1]
+        return httpx.Response(
+            200,
+            json={
+                "id": f"unify://unified-data/v1/datasets/{id}",
+                "name": f"dataset {id}",
+                "keyAttributeNames": ["tamr_id"],
+            },
+        )
+
+    async def by_resource_ids(ids):
+        async with aio.AsyncSession(transport=httpx.MockTransport(respond)) as s:
+            return await asyncio.gather(
+                *(aio.dataset.by_resource_id(s, fake.instance(), id) for id in ids)
+            )
+
+    datasets = asyncio.run(by_resource_ids(["1", "2", "3"]))
+    assert [d.name for d in datasets] == ["dataset 1", "dataset 2", "dataset 3"]
+    assert in_flight["max"] == 3
@@ -0,0 +1,28 @@
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_create():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        project = await aio.mastering.create(
+            s, instance, name="New Mastering Project", description="A Mastering Project"
+        )
+    assert isinstance(project, tc.MasteringProject)
+    assert project.name == "New Mastering Project"
+    assert project.description == "A Mastering Project"
+
+
+@fake.json_aio
+async def test_estimate_pairs():
+    project = fake.mastering_project()
+
+    async with fake.aio_session() as s:
+        op = await aio.mastering.estimate_pairs(s, project)
+    assert tc.operation.succeeded(op)
@@ -0,0 +1,31 @@
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake, utils
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_wait():
+    url = tc.URL(path="operations/1")
+    op = tc.operation._from_json(url, utils.load_json("operation_pending.json"))
+
+    stats = tc.WaitStats()
+    async with fake.aio_session() as s:
+        op = await aio.operation.wait(
+            s, op, strategy=tc.BackoffPoll(backoff=0), stats=stats
+        )
+    assert tc.operation.succeeded(op)
+    assert stats.waits == 1
+    assert stats.polls == 2
+
+
+@fake.json_aio
+async def test_poll_not_found():
+    url = tc.URL(path="operations/1")
+    op = tc.operation._from_json(url, utils.load_json("operation_pending.json"))
+
+    async with fake.aio_session() as s:
+        with pytest.raises(tc.operation.NotFound):
+            await aio.operation.poll(s, op)
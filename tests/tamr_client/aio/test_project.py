@@ -0,0 +1,49 @@
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_by_resource_id_mastering():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        project = await aio.project.by_resource_id(s, instance, "1")
+    assert isinstance(project, tc.MasteringProject)
+    assert project.name == "proj"
+    assert project.description == "Mastering Project"
+
+
+@fake.json_aio
+async def test_by_name_project_not_found():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        with pytest.raises(tc.project.NotFound):
+            await aio.project.by_name(s, instance, "missing project")
+
+
+@fake.json_aio
+async def test_get_all():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        project_1, project_2 = await aio.project.get_all(s, instance)
+    assert isinstance(project_1, tc.MasteringProject)
+    assert project_1.name == "project 1"
+    assert isinstance(project_2, tc.CategorizationProject)
+    assert project_2.name == "project 2"
+
+
+@fake.json_aio
+async def test_attributes():
+    project = fake.mastering_project()
+
+    async with fake.aio_session() as s:
+        attrs = await aio.project.attributes(s, project)
+    assert attrs[0].name == "RowNum"
+    assert attrs[0].type == tc.attribute.type.STRING
+    assert isinstance(attrs[1].type, tc.attribute.type.Record)
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+
+
+@fake.json_aio
+async def test_upsert():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        response = await aio.record.upsert(
+            s, dataset, _records_json, primary_key_name="primary_key"
+        )
+    assert response == _response_json
+
+
+def test_upsert_primary_key_not_found():
+    dataset = fake.dataset()
+    s = aio.AsyncSession()
+
+    with pytest.raises(tc.primary_key.NotFound):
+        asyncio.run(
+            aio.record.upsert(
+                s, dataset, _records_json, primary_key_name="wrong_primary_key"
+            )
+        )
+
+
+def test_upsert_unsupported_options():
+    dataset = fake.dataset()
+    s = aio.AsyncSession()
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            aio.record.upsert(
+                s, dataset, _records_json, options=tc.UploadOptions(workers=2)
+            )
+        )
+
+
+@fake.json_aio
+async def test_delete():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        response = await aio.record.delete(
+            s, dataset, _records_json, primary_key_name="primary_key"
+        )
+    assert response == _response_json
+
+
+@fake.json_aio
+async def test_stream():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        records = [r async for r in aio.record.stream(s, dataset)]
+    assert records == _records_json
+
+
+@fake.json_aio
+async def test_stream_columns():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        records = aio.record.stream(s, dataset, columns=["name", "primary_key"])
+        assert [r async for r in records] == [
+            {"name": "apple", "primary_key": 1},
+            {"name": 'pear "{" "primary_key": 3', "primary_key": 2},
+            {"name": "fig"},
+        ]
+
+
+@fake.json_aio
+async def test_stream_raw():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        records = [r async for r in aio.record.stream_raw(s, dataset)]
+    assert records == [b'{"primary_key": 1}', b'{"primary_key": 2}']
+
+
+@fake.json_aio
+async def test_delete_all():
+    dataset = fake.dataset()
+
+    async with fake.aio_session() as s:
+        await aio.record.delete_all(s, dataset)
+
+
+_records_json = [{"primary_key": 1}, {"primary_key": 2}]
+
+_response_json = {
+    "numCommandsProcessed": 2,
+    "allCommandsSucceeded": True,
+    "validationErrors": [],
+}
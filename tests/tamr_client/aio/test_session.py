@@ -0,0 +1,197 @@
+import asyncio
+import json
+
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+aio = pytest.importorskip("tamr_client.aio")
+httpx = pytest.importorskip("httpx")
+
+
+@fake.json_aio
+async def test_get_auth_cookie():
+    auth = fake.username_password_auth()
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        assert s.auth is None
+        assert s._stored_auth == auth
+        assert len(s.cookies.keys()) == 0
+
+        datasets = await aio.dataset.get_all(s, instance)
+
+        assert len(datasets) == 2
+        assert s.auth is None
+        assert s.cookies.get("authToken") == "auth_token_string_value"
+
+
+@fake.json_aio
+async def test_bad_credentials():
+    instance = fake.instance()
+
+    async with fake.aio_session() as s:
+        with pytest.raises(httpx.HTTPStatusError):
+            await aio.dataset.get_all(s, instance)
+
+
+def test_request_headers():
+    requests = []
+
+    def respond(request):
+        requests.append(request)
+        if request.url.path.endswith("instance:login"):
+            return httpx.Response(200, json=auth_json)
+        if "Cookie" not in request.headers:
+            return httpx.Response(401, text="Credentials are required")
+        return httpx.Response(200, json=[])
+
+    async def get_all():
+        async with aio.AsyncSession(transport=httpx.MockTransport(respond)) as s:
+            s._stored_auth = fake.username_password_auth()
+            await aio.dataset.get_all(s, fake.instance())
+
+    asyncio.run(get_all())
+
+    first, login, retried = requests
+    # No credentials in any call
+    assert all("Authorization" not in r.headers for r in requests)
+    # No cookie in first call
+    assert "Cookie" not in first.headers
+    assert json.loads(login.content) == {"username": "username", "password": "password"}
+    # Valid cookie passed in retried call
+    assert retried.headers["Cookie"] == f'authToken={auth_json["token"]}'
+
+
+def test_stream_login_first():
+    requests = []
+
+    def respond(request, body):
+        requests.append((request, body))
+        if request.url.path.endswith("instance:login"):
+            return httpx.Response(200, json=auth_json)
+        if "Cookie" not in request.headers:
+            return httpx.Response(401, text="Credentials are required")
+        return httpx.Response(200, json=_response_json)
+
+    async def upsert():
+        async with aio.AsyncSession(transport=_StreamingTransport(respond)) as s:
+            s._stored_auth = fake.username_password_auth()
+            return await aio.record.upsert(
+                s, fake.dataset(), [{"primary_key": 1}, {"primary_key": 2}]
+            )
+
+    # the streamed body can only be sent once, so the session logs in first
+    assert asyncio.run(upsert()) == _response_json
+    (login, _), (upserted, body) = requests
+    assert login.url.path.endswith("instance:login")
+    assert upserted.headers["Cookie"] == f'authToken={auth_json["token"]}'
+    assert [json.loads(line)["recordId"] for line in body.splitlines()] == [1, 2]
+
+
+def test_stream_revoked_token():
+    requests = []
+
+    def respond(request, body):
+        requests.append(request)
+        if request.url.path.endswith("instance:login"):
+            return httpx.Response(200, json=auth_json)
+        return httpx.Response(401, text="Credentials are required")
+
+    async def chunks():
+        yield b"{}\n"
+
+    async def post():
+        async with aio.AsyncSession(transport=_StreamingTransport(respond)) as s:
+            s._stored_auth = fake.username_password_auth()
+            await s.post("http://localhost/api/versioned/v1/datasets/1:updateRecords")
+            return await s.post(
+                "http://localhost/api/versioned/v1/datasets/1:updateRecords",
+                content=chunks(),
+            )
+
+    # the token was just obtained, so the streamed body is not sent again
+    assert asyncio.run(post()).status_code == 401
+    assert [r.url.path.rsplit("/", 1)[-1] for r in requests] == [
+        "1:updateRecords",
+        "instance:login",
+        "1:updateRecords",
+        "1:updateRecords",
+    ]
+
+
+def test_timeout_profiles():
+    timeouts = {}
+
+    def respond(request):
+        timeouts[request.url.path.rsplit("/", 1)[-1]] = request.extensions["timeout"]
+        return httpx.Response(200, json={"id": "1", "type": "SPARK", "status": {}})
+
+    async def send():
+        async with aio.AsyncSession(transport=httpx.MockTransport(respond)) as s:
+            await s.get("http://localhost/api/versioned/v1/datasets")
+            async with s.stream("GET", "http://localhost/api/versioned/v1/records"):
+                pass
+            url = tc.URL(instance=fake.instance(), path="operations/1")
+            await aio.operation._by_url(s, url)
+            await s.get("http://localhost/api/versioned/v1/projects", timeout=5)
+
+    asyncio.run(send())
+    assert {path: (t["connect"], t["read"]) for path, t in timeouts.items()} == {
+        "datasets": (10, 60),
+        "records": (10, 600),
+        "1": (10, 30),
+        "projects": (5, 5),
+    }
+
+
+def test_default_timeout():
+    s = aio.AsyncSession()
+    assert s._timeout_policy == tc.Timeout()
+    assert s.timeout == httpx.Timeout(None, connect=10.0, read=60.0)
+    asyncio.run(s.aclose())
+
+    s = aio.session.from_auth(tc.JwtTokenAuth("token"), timeout=None)
+    assert s.timeout == httpx.Timeout(None)
+    asyncio.run(s.aclose())
+
+
+def test_from_auth_jwt():
+    s = aio.session.from_auth(tc.JwtTokenAuth("my token"))
+    assert s._stored_auth is None
+
+    request = s.build_request("GET", "http://localhost/api/versioned/v1/datasets")
+    authenticated = next(s.auth.auth_flow(request))
+    assert authenticated.headers["Authorization"] == "Bearer my token"
+    asyncio.run(s.aclose())
+
+
+def test_from_auth_codec():
+    s = aio.session.from_auth(fake.username_password_auth(), codec="json")
+    assert s._codec == tc.codec.STDLIB
+    assert s._stored_auth == fake.username_password_auth()
+    asyncio.run(s.aclose())
+
+
+auth_json = {"token": "auth_token_string_value", "username": "user"}
+_response_json = {
+    "numCommandsProcessed": 2,
+    "allCommandsSucceeded": True,
+    "validationErrors": [],
+}
+
+
+class _StreamingTransport(httpx.AsyncBaseTransport):  # type: ignore
+    """Reads request bodies by iterating their streams once, like a network transport
+
+    Unlike :class:`httpx.MockTransport`, does not buffer the bodies of requests, so that
+    a streamed body cannot be read again.
+    """
+
+    def __init__(self, respond):
+        self._respond = respond
+
+    async def handle_async_request(self, request):
+        body = b"".join([chunk async for chunk in request.stream])
+        return self._respond(request, body)
@@ -74,3 +74,30 @@ def test_json():
         assert attr_type == tc.attribute.type.from_json(
             tc.attribute.type.to_json(attr_type)
         )
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    assert tc.attribute.type.to_arrow(tc.attribute.type.LONG) == pa.int64()
+    assert tc.attribute.type.to_arrow(tc.attribute.type.DEFAULT) == pa.list_(
+        pa.string()
+    )
+    assert tc.attribute.type.to_arrow(
+        tc.attribute.type.Map(tc.attribute.type.DOUBLE)
+    ) == pa.map_(pa.string(), pa.float64())
+
+    double_list = pa.list_(pa.float64())
+    expected_geospatial = pa.struct(
+        [
+            pa.field("point", double_list),
+            pa.field("multiPoint", pa.list_(double_list)),
+            pa.field("lineString", pa.list_(double_list)),
+            pa.field("multiLineString", pa.list_(pa.list_(double_list))),
+            pa.field("polygon", pa.list_(pa.list_(double_list))),
+            pa.field("multiPolygon", pa.list_(pa.list_(pa.list_(double_list)))),
+        ]
+    )
+    assert tc.attribute.type.to_arrow(tc.attribute.type.GEOSPATIAL) == (
+        expected_geospatial
+    )
@@ -1,3 +1,6 @@
+import json
+import math
+
 import pandas as pd
 import pytest
 
@@ -52,6 +55,31 @@ def test_upsert_index_as_primary_key():
     assert response == _response_json
 
 
+@fake.json
+def test_upsert_nan():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    df = pd.DataFrame(
+        [{"attribute": 1.5, "name": "a"}, {"attribute": math.nan, "name": None}],
+        index=[1, 2],
+    )
+    df.index.name = "primary_key"
+
+    response = tc.dataframe.upsert(s, dataset, df)
+    assert response == _response_json
+
+
+def test_to_ndjson():
+    df = pd.DataFrame(_records_with_keys_json_2 * 3)
+
+    records = tc.dataframe._to_ndjson(df, primary_key_name="attribute", chunk_size=4)
+    assert [json.loads(r) for r in records] == _records_with_keys_json_2 * 3
+    assert next(tc.dataframe._to_ndjson(df, primary_key_name="attribute")).startswith(
+        b'{"attribute":'
+    )
+
+
 def test_upsert_index_column_name_collision():
     s = fake.session()
     dataset = fake.dataset()
@@ -157,6 +185,84 @@ def test_create_handle_record_failure():
         )
 
 
+@fake.json
+def test_read():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    chunks = list(tc.dataframe.read(s, dataset, chunksize=2))
+    assert [len(df) for df in chunks] == [2, 1]
+
+    df = pd.concat(chunks, ignore_index=True)
+    assert list(df.columns) == ["primary_key", "name", "count", "score", "flag"]
+    assert [str(t) for t in df.dtypes] == [
+        "string",
+        "object",
+        "Int64",
+        "float64",
+        "boolean",
+    ]
+    assert list(df["primary_key"]) == ["1", "2", "3"]
+    assert list(df["name"]) == [["apple"], [], ["pear"]]
+    assert df["count"].tolist() == [3, pd.NA, 7]
+    assert df["score"].isna().tolist() == [False, True, False]
+    assert df["flag"].tolist() == [True, pd.NA, False]
+
+
+@fake.json
+def test_read_unwrap():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    (df,) = tc.dataframe.read(s, dataset, unwrap=True, categorical=True)
+    assert str(df["name"].dtype) == "category"
+    assert list(df["name"].cat.categories) == ["apple", "pear"]
+    assert df["name"].isna().tolist() == [False, True, False]
+
+
+@fake.json
+def test_read_unwrap_multiple():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    first, second = tc.dataframe.read(s, dataset, chunksize=3, unwrap=True)
+    assert str(first["name"].dtype) == "string"
+    assert first["name"].tolist() == ["apple", pd.NA, "pear"]
+    # a chunk with an array of several elements is not unwrapped
+    assert str(second["name"].dtype) == "object"
+    assert second["name"].tolist() == [["plum", "fig"]]
+
+
+@fake.json
+def test_read_columns():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    (df,) = tc.dataframe.read(s, dataset, columns=["score", "primary_key"])
+    assert list(df.columns) == ["score", "primary_key"]
+    assert [str(t) for t in df.dtypes] == ["float64", "string"]
+    assert list(df["primary_key"]) == ["1", "2", "3"]
+
+
+@fake.json
+def test_read_columns_invalid():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(ValueError):
+        next(tc.dataframe.read(s, dataset, columns=["primary_key", "missing"]))
+
+
+def test_read_invalid():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(ValueError):
+        next(tc.dataframe.read(s, dataset, chunksize=0))
+    with pytest.raises(ValueError):
+        next(tc.dataframe.read(s, dataset, categorical=True))
+
+
 _records_json = [{"primary_key": 1}, {"primary_key": 2}]
 
 _records_json_2 = [{"attribute": 1}, {"attribute": 2}]
@@ -0,0 +1,101 @@
+import csv
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+
+@fake.json
+def test_to_ndjson(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+
+    manifest = tc.dataset.export.to_ndjson(s, dataset, tmp_path, shard_bytes=100)
+    assert manifest.format == "ndjson.gz"
+    assert manifest.rows == 3
+    assert [shard.path for shard in manifest.shards] == [
+        "dataset.csv-00000.ndjson.gz",
+        "dataset.csv-00001.ndjson.gz",
+    ]
+    assert [shard.rows for shard in manifest.shards] == [2, 1]
+
+    records: List[Dict] = []
+    for shard in manifest.shards:
+        data = (tmp_path / shard.path).read_bytes()
+        assert shard.bytes == len(data)
+        assert shard.sha256 == hashlib.sha256(data).hexdigest()
+        records.extend(json.loads(line) for line in gzip.decompress(data).splitlines())
+    assert [r["primary_key"] for r in records] == ["1", "2", "3"]
+
+    manifest_json = json.loads((tmp_path / "dataset.csv.manifest.json").read_text())
+    assert manifest_json["rows"] == 3
+    assert manifest_json["shards"][1] == {
+        "path": "dataset.csv-00001.ndjson.gz",
+        "rows": 1,
+        "bytes": manifest.shards[1].bytes,
+        "sha256": manifest.shards[1].sha256,
+    }
+
+
+@fake.json
+def test_to_csv(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+
+    manifest = tc.dataset.export.to_csv(s, dataset, tmp_path, prefix="people")
+    assert [shard.path for shard in manifest.shards] == ["people-00000.csv"]
+
+    with open(tmp_path / "people-00000.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    # complex values are written as JSON by the codec of the session
+    assert json.loads(rows[1][3]) == {"a": 1}
+    rows[1][3] = ""
+    assert rows == [
+        ["primary_key", "name", "active", "tags"],
+        ["1", "Jane|Doe", "true", ""],
+        ["2", "", "", ""],
+        ["3", "O, Brien", "false", ""],
+    ]
+
+
+@fake.json
+def test_to_parquet(tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    s = fake.session()
+    dataset = fake.dataset()
+
+    manifest = tc.dataset.export.to_parquet(
+        s, dataset, tmp_path, shard_bytes=1, row_group_size=2
+    )
+    assert [shard.rows for shard in manifest.shards] == [2, 1]
+
+    tables = [pq.read_table(str(tmp_path / shard.path)) for shard in manifest.shards]
+    assert tables[0].schema.names == ["primary_key", "name", "active", "tags"]
+    assert tables[0].column("name").to_pylist() == [["Jane", "Doe"], []]
+    assert tables[1].column("primary_key").to_pylist() == ["3"]
+
+
+def test_to_ndjson_shard_bytes_invalid(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(ValueError):
+        tc.dataset.export.to_ndjson(s, dataset, tmp_path, shard_bytes=0)
+
+
+def test_write_shards_error(tmp_path: Path):
+    def open_shard(path: Path):
+        raise OSError("disk full")
+
+    # more chunks than the writer queue holds, so that the reader would block
+    pieces = ((1, b"{}\n", 3) for _ in range(100))
+    with pytest.raises(OSError):
+        tc.dataset.export._write_shards(
+            pieces, lambda i: tmp_path / str(i), open_shard, shard_bytes=1
+        )
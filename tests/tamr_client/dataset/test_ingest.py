@@ -0,0 +1,259 @@
+from functools import partial
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List
+
+import pytest
+import responses
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+
+def _snoop_callback(request, snoop):
+    with snoop["lock"]:
+        snoop["payloads"].extend(json.loads(line) for line in request.body.split(b"\n"))
+    response = {
+        "numCommandsProcessed": len(request.body.split(b"\n")),
+        "allCommandsSucceeded": True,
+        "validationErrors": [],
+    }
+    return 200, {}, json.dumps(response)
+
+
+def _snoop(dataset: tc.Dataset) -> Dict:
+    snoop: Dict = {"payloads": [], "lock": Lock()}
+    url = str(dataset.url) + ":updateRecords"
+    responses.add_callback(responses.POST, url, partial(_snoop_callback, snoop=snoop))
+    return snoop
+
+
+@responses.activate
+def test_from_ndjson(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+    snoop = _snoop(dataset)
+
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(
+        b'{"primary_key": 1, "name": "a"}\r\n'
+        b"\n"
+        b'  {"nested": {"primary_key": 0}, "primary_key": "2"}\n'
+        b'{"name": "caf\\u00e9", "primary_key": 3}'
+    )
+    reports: List[tc.IngestProgress] = []
+    response = tc.dataset.ingest.from_ndjson(
+        s,
+        dataset,
+        path,
+        options=tc.UploadOptions(batch_size=10),
+        progress=reports.append,
+    )
+    assert response["numCommandsProcessed"] == 3
+
+    assert snoop["payloads"] == [
+        {
+            "action": "CREATE",
+            "recordId": 1,
+            "record": {"primary_key": 1, "name": "a"},
+        },
+        {
+            "action": "CREATE",
+            "recordId": "2",
+            "record": {"nested": {"primary_key": 0}, "primary_key": "2"},
+        },
+        {
+            "action": "CREATE",
+            "recordId": 3,
+            "record": {"name": "café", "primary_key": 3},
+        },
+    ]
+    assert reports == [
+        tc.IngestProgress(
+            path=str(path),
+            records=3,
+            bytes_read=path.stat().st_size,
+            total_bytes=path.stat().st_size,
+            done=True,
+        )
+    ]
+    assert reports[0].fraction == 1.0
+
+
+@responses.activate
+def test_from_ndjson_progress(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+    _snoop(dataset)
+
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(b"".join(b'{"primary_key": %d}\n' % i for i in range(25_000)))
+    reports: List[tc.IngestProgress] = []
+    tc.dataset.ingest.from_ndjson(
+        s,
+        dataset,
+        path,
+        options=tc.UploadOptions(batch_size=5_000),
+        progress=reports.append,
+    )
+
+    assert [(r.records, r.done) for r in reports] == [
+        (10_000, False),
+        (20_000, False),
+        (25_000, True),
+    ]
+    assert 0 < reports[0].fraction < reports[1].fraction < reports[2].fraction == 1
+
+
+def test_ndjson_updates_primary_key_not_found(tmp_path: Path):
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(b'{"primary_key": 1}\n{"name": "primary_key"}\n')
+
+    updates = tc.dataset.ingest._ndjson_updates(
+        path, primary_key_name="primary_key", codec=tc.codec.STDLIB
+    )
+    next(updates)
+    with pytest.raises(tc.primary_key.NotFound):
+        next(updates)
+
+
+def test_ndjson_updates_partition(tmp_path: Path):
+    path = tmp_path / "records.ndjson"
+    # the key of the first record is found by a scan, the second by parsing the record
+    path.write_bytes('{"pk": "café"}\n{"n": {"m": 2}, "pk": "café"}\n'.encode("utf-8"))
+
+    updates = tc.dataset.ingest._ndjson_updates(
+        path, primary_key_name="pk", codec=tc.codec.STDLIB
+    )
+    keys = [key for _, key, _ in updates]
+    assert keys == ["café", "café"]
+    assert len({tc.record._partition(key, 7) for key in keys}) == 1
+
+
+@responses.activate
+def test_from_ndjson_empty(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+    _snoop(dataset)
+
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(b"")
+    response = tc.dataset.ingest.from_ndjson(
+        s, dataset, path, options=tc.UploadOptions(batch_size=10)
+    )
+    assert response["numCommandsProcessed"] == 0
+
+
+@responses.activate
+def test_from_csv(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+    snoop = _snoop(dataset)
+
+    path = tmp_path / "records.csv"
+    path.write_text('primary_key,name\n1,"Doe, Jane"\n2,\n', encoding="utf-8")
+    reports: List[tc.IngestProgress] = []
+    tc.dataset.ingest.from_csv(
+        s,
+        dataset,
+        path,
+        options=tc.UploadOptions(batch_size=10),
+        progress=reports.append,
+    )
+
+    assert [p["record"] for p in snoop["payloads"]] == [
+        {"primary_key": "1", "name": "Doe, Jane"},
+        {"primary_key": "2", "name": None},
+    ]
+    assert [p["recordId"] for p in snoop["payloads"]] == ["1", "2"]
+    assert [(r.records, r.done) for r in reports] == [(2, True)]
+
+
+def test_from_csv_primary_key_not_found(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+
+    path = tmp_path / "records.csv"
+    path.write_text("id,name\n1,a\n", encoding="utf-8")
+    with pytest.raises(tc.primary_key.NotFound):
+        tc.dataset.ingest.from_csv(
+            s, dataset, path, options=tc.UploadOptions(batch_size=10)
+        )
+
+
+@responses.activate
+def test_from_parquet(tmp_path: Path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    s = fake.session()
+    dataset = fake.dataset()
+    snoop = _snoop(dataset)
+
+    records = [{"primary_key": i, "name": [str(i)]} for i in range(5)]
+    path = tmp_path / "records.parquet"
+    pq.write_table(pa.Table.from_pylist(records), str(path), row_group_size=2)
+    reports: List[tc.IngestProgress] = []
+    tc.dataset.ingest.from_parquet(
+        s,
+        dataset,
+        path,
+        options=tc.UploadOptions(batch_size=10),
+        progress=reports.append,
+    )
+
+    assert [p["record"] for p in snoop["payloads"]] == records
+    assert [(r.records, r.done) for r in reports] == [(5, True)]
+
+
+@responses.activate
+def test_from_files(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+    snoop = _snoop(dataset)
+
+    (tmp_path / "a.ndjson").write_bytes(b'{"primary_key": 1}\n{"primary_key": 2}\n')
+    (tmp_path / "b.jsonl").write_bytes(b'{"primary_key": 3}\n')
+    (tmp_path / "c.csv").write_text("primary_key\n4\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not loaded")
+
+    reports: List[tc.IngestProgress] = []
+    response = tc.dataset.ingest.from_files(
+        s,
+        dataset,
+        tmp_path,
+        concurrency=2,
+        options=tc.UploadOptions(batch_size=10),
+        progress=reports.append,
+    )
+    assert response["numCommandsProcessed"] == 4
+    assert sorted(str(p["recordId"]) for p in snoop["payloads"]) == ["1", "2", "3", "4"]
+    assert sorted(Path(r.path).name for r in reports if r.done) == [
+        "a.ndjson",
+        "b.jsonl",
+        "c.csv",
+    ]
+
+
+def test_from_files_not_found(tmp_path: Path):
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(FileNotFoundError):
+        tc.dataset.ingest.from_files(s, dataset, str(tmp_path / "*.ndjson"))
+    with pytest.raises(ValueError):
+        tc.dataset.ingest.from_files(s, dataset, tmp_path, concurrency=0)
+
+
+def test_expand(tmp_path: Path):
+    for name in ["b.csv", "a.ndjson", "c.txt"]:
+        (tmp_path / name).write_text("")
+
+    expand = tc.dataset.ingest._expand
+    assert expand(tmp_path) == [tmp_path / "a.ndjson", tmp_path / "b.csv"]
+    assert expand(str(tmp_path / "*.csv")) == [tmp_path / "b.csv"]
+    assert expand(tmp_path / "c.txt") == [tmp_path / "c.txt"]
+    assert expand([str(tmp_path / "c.txt")]) == [tmp_path / "c.txt"]
+
+    with pytest.raises(ValueError):
+        tc.dataset.ingest._format(tmp_path / "c.txt")
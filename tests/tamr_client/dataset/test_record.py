@@ -1,6 +1,17 @@
+from functools import partial
+import gzip
+import io
+import json
+from threading import Lock
+from typing import cast, Dict, Iterator, List
+import zlib
+
 import pytest
+import requests
+import responses
 
 import tamr_client as tc
+from tamr_client.session import _Replayable
 from tests.tamr_client import fake
 
 
@@ -78,6 +89,330 @@ def test_delete_infer_primary_key():
     assert response == _response_json
 
 
+@fake.json
+def test_upsert_batched():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    records = _records_json + [{"primary_key": 3}]
+    response = tc.record.upsert(
+        s, dataset, records, options=tc.UploadOptions(batch_size=2)
+    )
+    assert response == {
+        "numCommandsProcessed": 3,
+        "allCommandsSucceeded": False,
+        "validationErrors": [{"recordId": 3, "message": "Invalid record"}],
+    }
+
+
+@fake.json
+def test_delete_batched():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    response = tc.record.delete(
+        s, dataset, _records_json, options=tc.UploadOptions(batch_bytes=1)
+    )
+    assert response == _response_json
+
+
+@responses.activate
+def test_upsert_parallel():
+    def create_callback(request, snoop):
+        with snoop["lock"]:
+            snoop["payloads"].extend(request.body.split(b"\n"))
+        return 200, {}, json.dumps(_batch_response_json)
+
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {"payloads": [], "lock": Lock()}
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    records = [{"primary_key": i % 3, "version": i} for i in range(12)]
+    response = tc.record.upsert(
+        s,
+        dataset,
+        records,
+        options=tc.UploadOptions(batch_size=1, workers=3, max_in_flight=2),
+    )
+    assert response["numCommandsProcessed"] == 12
+    assert response["allCommandsSucceeded"]
+
+    # updates to the same record are sent in order
+    sent = [json.loads(p)["record"] for p in snoop["payloads"]]
+    assert len(sent) == len(records)
+    for key in range(3):
+        assert [r for r in sent if r["primary_key"] == key] == [
+            r for r in records if r["primary_key"] == key
+        ]
+
+
+@responses.activate
+def test_upsert_parallel_failure():
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    responses.add(responses.POST, url, status=503)
+
+    records = [{"primary_key": i} for i in range(10)]
+    with pytest.raises(requests.HTTPError):
+        tc.record.upsert(
+            s, dataset, records, options=tc.UploadOptions(batch_size=1, workers=2)
+        )
+
+
+@responses.activate
+def test_upsert_batched_retry():
+    def create_callback(request, snoop):
+        snoop["bodies"].append(request.body)
+        if len(snoop["bodies"]) == 2:
+            return 503, {}, "Service Unavailable"
+        return 200, {}, json.dumps(_batch_response_json)
+
+    stats = tc.RetryStats()
+    s = tc.session.from_auth(
+        fake.username_password_auth(),
+        retry=tc.Retry(backoff=0),
+        retry_stats=stats,
+    )
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {"bodies": []}
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    def records():
+        yield from _records_json
+
+    response = tc.record.upsert(
+        s, dataset, records(), options=tc.UploadOptions(batch_size=1)
+    )
+    assert response == _response_json
+
+    first, failed, replayed = [json.loads(b)["record"] for b in snoop["bodies"]]
+    assert [first, replayed] == _records_json
+    assert failed == replayed
+    assert stats.retries == 1
+    assert stats.reasons == {"503": 1}
+
+
+@responses.activate
+def test_upsert_buffered():
+    def create_callback(request, snoop):
+        snoop["chunks"] = list(request.body)
+        return 200, {}, json.dumps(_response_json)
+
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {}
+    _add_login()
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    records = [{"primary_key": i} for i in range(100)]
+    response = tc.record.upsert(
+        s, dataset, records, options=tc.UploadOptions(buffer_size=1024)
+    )
+    assert response == _response_json
+
+    assert 1 < len(snoop["chunks"]) < len(records)
+    assert all(len(chunk) <= 1024 for chunk in snoop["chunks"])
+    sent = b"".join(snoop["chunks"]).splitlines()
+    assert [json.loads(line)["record"] for line in sent] == records
+
+
+@responses.activate
+def test_upsert_not_recorded():
+    def create_callback(request, snoop):
+        snoop.append(request.body)
+        list(request.body)
+        return 200, {}, json.dumps(_response_json)
+
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: List = []
+    _add_login()
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    # the opaque token was just obtained, so is not expected to be rejected
+    tc.record.upsert(s, dataset, _records_json)
+    tc.record.upsert(s, dataset, _records_json)
+    assert len(snoop) == 2
+    assert not any(isinstance(body, _Replayable) for body in snoop)
+
+
+@responses.activate
+def test_upsert_buffered_relogin(monkeypatch):
+    def create_callback(request, snoop):
+        if not snoop["chunks"]:
+            # reject the upload after reading its first chunk, as for an expired token
+            snoop["chunks"].append(next(iter(request.body)))
+            return 401, {}, "Credentials are required to access this resource."
+        snoop["chunks"] = list(request.body)
+        return 200, {}, json.dumps(_response_json)
+
+    # the opaque token is not known to remain valid, so the body is recorded
+    monkeypatch.setattr(tc.session, "_TOKEN_REFRESH_MARGIN", 0.0)
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {"chunks": []}
+    _add_login()
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    records = [{"primary_key": i} for i in range(100)]
+    response = tc.record.upsert(
+        s, dataset, records, options=tc.UploadOptions(buffer_size=1024)
+    )
+    assert response == _response_json
+
+    logins = [c for c in responses.calls if c.request.url.endswith(":login")]
+    assert len(logins) == 2
+    sent = b"".join(snoop["chunks"]).splitlines()
+    assert [json.loads(line)["record"] for line in sent] == records
+
+
+@responses.activate
+def test_upsert_spooled():
+    def create_callback(request, snoop):
+        snoop["headers"] = request.headers
+        snoop["body"] = request.body
+        return 200, {}, json.dumps(_response_json)
+
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {}
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    response = tc.record.upsert(
+        s, dataset, _records_json, options=tc.UploadOptions(spool=True)
+    )
+    assert response == _response_json
+
+    assert "Transfer-Encoding" not in snoop["headers"]
+    assert snoop["headers"]["Content-Length"] == str(len(snoop["body"]))
+    sent = snoop["body"].splitlines()
+    assert [json.loads(line)["record"] for line in sent] == _records_json
+
+
+@responses.activate
+def test_upsert_compressed():
+    def create_callback(request, snoop):
+        snoop["headers"] = request.headers
+        snoop["chunks"] = list(request.body)
+        return 200, {}, json.dumps(_response_json)
+
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {}
+    _add_login()
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    records = [{"primary_key": i, "name": "repetitive"} for i in range(100)]
+    response = tc.record.upsert(
+        s,
+        dataset,
+        records,
+        options=tc.UploadOptions(buffer_size=256, compression="gzip"),
+    )
+    assert response == _response_json
+
+    assert snoop["headers"]["Content-Encoding"] == "gzip"
+    sent = gzip.decompress(b"".join(snoop["chunks"])).splitlines()
+    assert [json.loads(line)["record"] for line in sent] == records
+
+
+@responses.activate
+def test_upsert_batched_compressed():
+    def create_callback(request, snoop):
+        snoop["bodies"].append(request.body)
+        return 200, {}, json.dumps(_batch_response_json)
+
+    s = fake.session()
+    dataset = fake.dataset()
+    url = str(dataset.url) + ":updateRecords"
+    snoop: Dict = {"bodies": []}
+    responses.add_callback(responses.POST, url, partial(create_callback, snoop=snoop))
+
+    records = [{"primary_key": i} for i in range(4)]
+    tc.record.upsert(
+        s,
+        dataset,
+        records,
+        options=tc.UploadOptions(batch_size=2, compression="deflate"),
+    )
+
+    assert len(snoop["bodies"]) == 2
+    sent = b"\n".join(zlib.decompress(body) for body in snoop["bodies"])
+    assert [json.loads(line)["record"] for line in sent.splitlines()] == records
+
+
+def test_upsert_compression_invalid():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(ValueError):
+        tc.record.upsert(
+            s, dataset, _records_json, options=tc.UploadOptions(compression="br")
+        )
+    with pytest.raises(ValueError):
+        tc.record.upsert(
+            s,
+            dataset,
+            _records_json,
+            options=tc.UploadOptions(compression="gzip", compression_level=10),
+        )
+
+
+def test_compress():
+    body = b"\n".join([b'{"action": "CREATE"}'] * 1000)
+
+    compressed = tc.record._compress(body, compression="gzip", level=6)
+    assert isinstance(compressed, bytes)
+    assert gzip.decompress(compressed) == body
+
+    chunks = [body[i : i + 100] for i in range(0, len(body), 100)]
+    streamed = tc.record._compress(chunks, compression="gzip", level=6)
+    assert gzip.decompress(b"".join(cast(Iterator[bytes], streamed))) == body
+
+    from_file = tc.record._compress(io.BytesIO(body), compression="deflate", level=1)
+    assert zlib.decompress(b"".join(cast(Iterator[bytes], from_file))) == body
+
+
+def test_coalesce():
+    updates = [b"a" * 3, b"b" * 3, b"c" * 10, b"d" * 2]
+
+    chunks = list(tc.record._coalesce(updates, 8))
+    assert chunks == [b"aaa\nbbb\n", b"c" * 10 + b"\n", b"dd\n"]
+
+
+def test_partition():
+    assert tc.record._partition(1, 4) == tc.record._partition(1, 4)
+    assert {tc.record._partition(i, 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+def test_batches():
+    updates = [b"a" * 10, b"b" * 10, b"c" * 30, b"d" * 10]
+
+    assert list(tc.record._batches(updates, size=3)) == [updates[:3], updates[3:]]
+    assert list(tc.record._batches(updates, nbytes=22)) == [
+        updates[:2],
+        updates[2:3],
+        updates[3:],
+    ]
+    assert list(tc.record._batches(updates, size=1, nbytes=100)) == [
+        [u] for u in updates
+    ]
+
+
+def test_batches_invalid_size():
+    with pytest.raises(ValueError):
+        list(tc.record._batches([b"a"], size=0))
+
+
 @fake.json
 def test_stream():
     s = fake.session()
@@ -87,6 +422,269 @@ def test_stream():
     assert list(records) == _records_json
 
 
+@fake.json
+def test_stream_columns():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    records = tc.record.stream(s, dataset, columns=["name", "primary_key"])
+    assert list(records) == [
+        {"name": "apple", "primary_key": 1},
+        {"name": 'pear "{" "primary_key": 3', "primary_key": 2},
+        {"name": "fig"},
+    ]
+
+
+@fake.json
+def test_stream_prefetch():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    stats = tc.PrefetchStats()
+    records = tc.record.stream(s, dataset, prefetch=2, stats=stats)
+    assert list(records) == _records_json
+    assert stats.capacity == 2
+    assert stats.batches > 0
+    assert stats.depth == 0
+
+
+@fake.json
+def test_stream_raw():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    records = tc.record.stream_raw(s, dataset)
+    assert list(records) == [b'{"primary_key": 1}', b'{"primary_key": 2}']
+
+
+@fake.json
+def test_upsert_raw():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    records = [b'{"primary_key": 1}\n', b'{"primary_key":2}']
+    response = tc.record.upsert_raw(s, dataset, records)
+    assert response == _response_json
+
+
+def test_upsert_raw_primary_key_not_found():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(tc.primary_key.NotFound):
+        tc.record.upsert_raw(s, dataset, [b"{}"], primary_key_name="wrong_primary_key")
+
+
+def test_raw_create_command():
+    pattern = tc.record._raw_key_pattern("pk")
+    c = tc.codec.STDLIB
+
+    records = [
+        b'{"pk": "a", "name": "x"}',
+        b'{"name": "x", "pk": 1.5}',
+        b'{"nested": {"pk": 2}, "pk": 3}',
+        b'{"name": "\\"pk\\": 4", "pk": 5}',
+        b'{"pk": "caf\\u00e9"}',
+        b'{"pk": ["a", 1]}',
+    ]
+    for record in records:
+        key, command = tc.record._raw_create_command(
+            record, primary_key_name="pk", pattern=pattern, codec=c
+        )
+        expected = tc.record._create_command(json.loads(record), primary_key_name="pk")
+        assert json.loads(command) == expected
+        assert key == expected["recordId"]
+
+    with pytest.raises(tc.primary_key.NotFound):
+        tc.record._raw_create_command(
+            b'{"name": "pk"}', primary_key_name="pk", pattern=pattern, codec=c
+        )
+
+
+def test_raw_create_command_partition():
+    pattern = tc.record._raw_key_pattern("pk")
+    # the key of the first record is found by a scan, the second by parsing the record
+    records = [
+        b'{"pk": "caf\xc3\xa9", "n": 1}',
+        b'{"n": {"m": 2}, "pk": "caf\xc3\xa9"}',
+    ]
+
+    keys = [
+        tc.record._raw_create_command(
+            record, primary_key_name="pk", pattern=pattern, codec=tc.codec.STDLIB
+        )[0]
+        for record in records
+    ]
+    assert keys == ["caf\u00e9", "caf\u00e9"]
+    assert len({tc.record._partition(key, 7) for key in keys}) == 1
+
+
+@fake.json
+def test_stream_rows():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    rows = list(tc.record.stream_rows(s, dataset))
+    assert [type(r) for r in rows] == [type(rows[0])] * 3
+    assert isinstance(rows[0], tc.Row)
+    assert not hasattr(rows[0], "__dict__")
+
+    first = rows[0]
+    assert list(first) == ["primary_key", "name", "tags", "geom"]
+    assert first["name"] == ["apple"]
+    assert first.get("missing") is None
+    assert "tags" in first and "missing" not in first
+    assert first == {
+        "primary_key": 1,
+        "name": ["apple"],
+        "tags": {"a": 1.5},
+        "geom": {"point": [1.0, 2.0]},
+    }
+    assert dict(rows[1]) == {
+        "primary_key": 2,
+        "name": None,
+        "tags": None,
+        "geom": None,
+    }
+    with pytest.raises(KeyError):
+        first["missing"]
+
+
+@fake.json
+def test_stream_rows_columns():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    rows = tc.record.stream_rows(s, dataset, columns=["name", "primary_key"])
+    assert [tuple(r.items()) for r in rows] == [
+        (("name", ["apple"]), ("primary_key", 1)),
+        (("name", None), ("primary_key", 2)),
+        (("name", ["pear", "fig"]), ("primary_key", 3)),
+    ]
+
+
+@fake.json
+def test_stream_arrow():
+    pa = pytest.importorskip("pyarrow")
+    s = fake.session()
+    dataset = fake.dataset()
+
+    batches = list(tc.record.stream_arrow(s, dataset, batch_size=2))
+    assert [b.num_rows for b in batches] == [2, 1]
+
+    schema = batches[0].schema
+    assert schema.names == ["primary_key", "name", "tags", "geom"]
+    assert schema.field("primary_key").type == pa.int64()
+    assert not schema.field("primary_key").nullable
+    assert schema.field("tags").type == pa.map_(pa.string(), pa.float64())
+    assert batches[0].column(2).to_pylist() == [[("a", 1.5)], None]
+    assert batches[1].to_pylist() == [
+        {
+            "primary_key": 3,
+            "name": ["pear", "fig"],
+            "tags": [],
+            "geom": {"point": None},
+        }
+    ]
+
+
+@fake.json
+def test_stream_arrow_columns():
+    pytest.importorskip("pyarrow")
+    s = fake.session()
+    dataset = fake.dataset()
+
+    (batch,) = tc.record.stream_arrow(s, dataset, columns=["name", "primary_key"])
+    assert batch.schema.names == ["name", "primary_key"]
+    assert batch.to_pylist() == [
+        {"name": ["apple"], "primary_key": 1},
+        {"name": None, "primary_key": 2},
+        {"name": ["pear", "fig"], "primary_key": 3},
+    ]
+
+
+def test_stream_arrow_batch_size_invalid():
+    pytest.importorskip("pyarrow")
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(ValueError):
+        next(tc.record.stream_arrow(s, dataset, batch_size=0))
+
+
+@fake.json
+def test_upsert_arrow():
+    pytest.importorskip("pyarrow")
+    s = fake.session()
+    dataset = fake.dataset()
+
+    # round trip: records streamed as Arrow are upserted as they were read
+    batches = tc.record.stream_arrow(s, dataset, batch_size=2)
+    response = tc.record.upsert_arrow(s, dataset, batches)
+    assert response["numCommandsProcessed"] == 3
+
+
+def test_upsert_arrow_primary_key_not_found():
+    pa = pytest.importorskip("pyarrow")
+    s = fake.session()
+    dataset = fake.dataset()
+
+    batch = pa.RecordBatch.from_pylist([{"primary_key": 1}])
+    with pytest.raises(tc.primary_key.NotFound):
+        tc.record.upsert_arrow(
+            s, dataset, [batch], primary_key_name="wrong_primary_key"
+        )
+
+
+def test_arrow_create_commands():
+    pa = pytest.importorskip("pyarrow")
+
+    schema = pa.schema(
+        [
+            pa.field("pk", pa.string()),
+            pa.field("scores", pa.list_(pa.map_(pa.string(), pa.int64()))),
+            pa.field(
+                "nested", pa.struct([pa.field("m", pa.map_(pa.string(), pa.bool_()))])
+            ),
+        ]
+    )
+    rows = [
+        {"pk": "a", "scores": [[("x", 1)], None], "nested": {"m": [("y", True)]}},
+        {"pk": "caf\u00e9", "scores": None, "nested": None},
+    ]
+    batch = pa.RecordBatch.from_pylist(rows, schema=schema)
+
+    commands = list(
+        tc.record._arrow_create_commands(
+            batch, primary_key_name="pk", dumps=tc.codec.STDLIB.dumps
+        )
+    )
+    assert [record_id for record_id, _ in commands] == ["a", "caf\u00e9"]
+    assert [json.loads(command) for _, command in commands] == [
+        {
+            "action": "CREATE",
+            "recordId": "a",
+            "record": {
+                "pk": "a",
+                "scores": [{"x": 1}, None],
+                "nested": {"m": {"y": True}},
+            },
+        },
+        {
+            "action": "CREATE",
+            "recordId": "caf\u00e9",
+            "record": {"pk": "caf\u00e9", "scores": None, "nested": None},
+        },
+    ]
+
+    with pytest.raises(tc.primary_key.NotFound):
+        next(
+            tc.record._arrow_create_commands(
+                batch, primary_key_name="wrong", dumps=tc.codec.STDLIB.dumps
+            )
+        )
+
+
 @fake.json
 def test_delete_all():
     s = fake.session()
@@ -97,8 +695,22 @@ def test_delete_all():
 
 _records_json = [{"primary_key": 1}, {"primary_key": 2}]
 
+_batch_response_json = {
+    "numCommandsProcessed": 1,
+    "allCommandsSucceeded": True,
+    "validationErrors": [],
+}
+
 _response_json = {
     "numCommandsProcessed": 2,
     "allCommandsSucceeded": True,
     "validationErrors": [],
 }
+
+
+def _add_login():
+    responses.add(
+        responses.POST,
+        "http://localhost/api/versioned/v1/instance:login",
+        json={"token": "auth_token_string_value", "username": "username"},
+    )
@@ -4,11 +4,14 @@ Utilities for faking Tamr resources and server responses for testing.
 For more, see "How to write tests" in the Contributor guide.
 """
 
+import asyncio
+from copy import deepcopy
 from functools import partial, wraps
 from inspect import getfile
 from json import dumps, load, loads
 from pathlib import Path
-from typing import Dict, Tuple
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
 
 import responses
 
@@ -41,7 +44,11 @@ def _check_request_body(request, expected_body: JsonDict):
             dictionaries (for newline-delimited JSON contents)
     """
     if isinstance(expected_body, list):
-        actual_body = [loads(x.decode("utf-8")) for x in request.body]
+        body = request.body
+        if isinstance(body, bytes):
+            # newline-delimited JSON sent as a single request body
+            body = body.splitlines()
+        actual_body = [loads(x.decode("utf-8")) for x in body]
         if actual_body != expected_body:
             raise WrongRequestBody(actual_body)
     elif expected_body is not None:
@@ -109,18 +116,23 @@ def add_response(rsps, fake: JsonDict):
     )
 
 
+def _load_fakes(test_fn) -> List[JsonDict]:
+    """Load the fake JSON data corresponding to a test from the fake_json directory"""
+    test_file = Path(getfile(test_fn))
+
+    fakes_mod_path = fake_json_dir / test_file.relative_to(tests_tc_dir).with_suffix("")
+    fakes_test_path = (fakes_mod_path / test_fn.__name__).with_suffix(".json")
+    with open(fakes_test_path) as f:
+        return load(f)
+
+
 def json(test_fn):
     """Intercept API requests and respond with fake JSON data.
 
     Will look in fake_json directory for data corresponding to the decorated test.
     Data format is a JSON list of request/response pairs in order of execution.
     """
-    test_file = Path(getfile(test_fn))
-
-    fakes_mod_path = fake_json_dir / test_file.relative_to(tests_tc_dir).with_suffix("")
-    fakes_test_path = (fakes_mod_path / test_fn.__name__).with_suffix(".json")
-    with open(fakes_test_path) as f:
-        fakes = load(f)
+    fakes = _load_fakes(test_fn)
 
     @wraps(test_fn)
     def wrapper(*args, **kwargs):
@@ -132,6 +144,88 @@ def json(test_fn):
     return wrapper
 
 
+_aio_transport = None
+
+
+def json_aio(test_fn):
+    """Intercept API requests of asynchronous sessions and respond with fake JSON data.
+
+    Same as `json`, for a coroutine function testing `tamr_client.aio`.
+    The test is run in a new event loop, and requests are intercepted for sessions
+    created by `aio_session`.
+    """
+    fakes = _load_fakes(test_fn)
+
+    @wraps(test_fn)
+    def wrapper(*args, **kwargs):
+        import httpx
+
+        global _aio_transport
+        registered = [_FakeExchange(fake) for fake in deepcopy(fakes)]
+        _aio_transport = httpx.MockTransport(partial(_aio_respond, registered))
+        try:
+            asyncio.run(test_fn(*args, **kwargs))
+        finally:
+            _aio_transport = None
+        not_called = [f.fake["request"] for f in registered if not f.called]
+        if not_called:
+            raise AssertionError(f"Not all requests have been executed: {not_called}")
+
+    return wrapper
+
+
+class _FakeExchange:
+    """A fake request/response pair, matched on the method and URL (without query)"""
+
+    def __init__(self, fake: JsonDict):
+        req = fake["request"]
+        url = req.get("url") or "http://localhost/api/versioned/v1/" + req["path"]
+        self.method = req["method"]
+        self.url = url.split("?")[0]
+        self.fake = fake
+        self.called = False
+
+
+def _aio_respond(registered: List[_FakeExchange], request):
+    """Respond to a request of an asynchronous session with the first matching fake
+
+    Like `responses`, a fake is consumed unless it is the last one matching the request.
+    """
+    import httpx
+
+    url = str(request.url.copy_with(query=None))
+    matches = [f for f in registered if (f.method, f.url) == (request.method, url)]
+    if not matches:
+        raise AssertionError(f"Unexpected request: {request.method} {request.url}")
+    match = matches[0]
+    match.called = True
+    if len(matches) > 1:
+        registered.remove(match)
+
+    req = match.fake["request"]
+    resp = match.fake["response"]
+    _check_request_body(
+        SimpleNamespace(body=request.content),
+        req.get("ndjson", req.get("json", req.get("body"))),
+    )
+    if resp.get("ndjson") is not None:
+        body = "\n".join(dumps(line) for line in resp["ndjson"])
+    elif resp.get("json") is not None:
+        body = dumps(resp["json"])
+    else:
+        body = resp.get("body") or ""
+    return httpx.Response(resp["status"], content=body.encode("utf-8"))
+
+
+def aio_session():
+    """Create an asynchronous session responding with the fake JSON data of the test"""
+    from tamr_client.aio import AsyncSession
+
+    s = AsyncSession(transport=_aio_transport)
+    s._stored_auth = username_password_auth()
+    return s
+
+
 def username_password_auth() -> tc.UsernamePasswordAuth:
     return tc.UsernamePasswordAuth("username", "password")
 
@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+
+def test_get():
+    assert tc.codec.get("json") == tc.codec.STDLIB
+
+
+def test_get_not_found():
+    with pytest.raises(tc.codec.NotFound):
+        tc.codec.get("not a codec")
+
+
+def test_default():
+    assert tc.codec.default().name in tc.codec.names()
+
+
+def test_register():
+    codec = tc.Codec(
+        name="custom", dumps=tc.codec.STDLIB.dumps, loads=tc.codec.STDLIB.loads
+    )
+    tc.codec.register(codec)
+    try:
+        assert tc.codec.get("custom") == codec
+    finally:
+        tc.codec._registry.pop("custom")
+
+
+def test_from_auth():
+    s = tc.session.from_auth(fake.username_password_auth(), codec="json")
+    assert tc.codec._from_session(s) == tc.codec.STDLIB
+
+
+def test_from_auth_not_found():
+    with pytest.raises(tc.codec.NotFound):
+        tc.session.from_auth(fake.username_password_auth(), codec="not a codec")
+
+
+def test_roundtrip():
+    record = {"id": 1, "name": ["é/", None], "score": 0.1, "nested": {"ok": True}}
+    for name in tc.codec.names():
+        codec = tc.codec.get(name)
+        assert codec.loads(codec.dumps(record)) == record
+
+
+def test_nonfinite_matches_stdlib():
+    record = {"id": 1, "a": [math.nan], "b": math.inf, "c": -math.inf, "d": None}
+    for name in tc.codec.names():
+        codec = tc.codec.get(name)
+        assert codec.dumps(record) == tc.codec.STDLIB.dumps(record)
+
+
+def test_projection():
+    codec = tc.codec._projection(tc.codec.STDLIB, ["b", "a", "café"])
+    # scanned records
+    assert codec.loads('{"café": 1, "a": [2], "c": 0, "b": 3}') == {
+        "b": 3,
+        "a": [2],
+        "café": 1,
+    }
+    assert codec.loads(b'{"x": "\\"a\\": 0", "a": 1, "b": 2}') == {"b": 2, "a": 1}
+    # parsed records
+    assert codec.loads(b'{"a": {"b": 0}, "b": 1}') == {"b": 1, "a": {"b": 0}}
+    assert codec.loads(b'{"b": 1, "\\u0063af\\u00e9": 2}') == {"b": 1, "café": 2}
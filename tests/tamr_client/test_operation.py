@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 import responses
 
@@ -132,3 +134,128 @@ def test_operation_failed_success():
     err_msg = str(exc_info.value)
     assert str(url) in err_msg
     assert op.status is not None and str(op.status["state"]) in err_msg
+
+
+def _op_json(state: str, start: str = "", end: str = "") -> dict:
+    op_json = utils.load_json("operation_pending.json")
+    op_json["status"] = {
+        "state": state,
+        "startTime": start,
+        "endTime": end,
+        "message": "",
+    }
+    return op_json
+
+
+@responses.activate
+def test_operation_wait_backoff():
+    s = fake.session()
+    url = tc.URL(path="operations/1")
+    op = tc.operation._from_json(url, _op_json("PENDING"))
+    end = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    responses.add(responses.GET, str(url), json=_op_json("RUNNING"))
+    responses.add(responses.GET, str(url), json=_op_json("SUCCEEDED", end=end))
+
+    stats = tc.WaitStats()
+    strategy = tc.BackoffPoll(backoff=0.001, jitter=0)
+    op = tc.operation.wait(s, op, strategy=strategy, stats=stats)
+
+    assert tc.operation.succeeded(op)
+    assert stats.waits == 1
+    assert stats.polls == 2
+    assert stats.polls_per_wait == 2
+    assert stats.ended == 1
+    assert 0 <= stats.late_seconds == stats.max_late_seconds < 1
+
+
+@responses.activate
+def test_operation_wait_timeout():
+    s = fake.session()
+    url = tc.URL(path="operations/1")
+    op = tc.operation._from_json(url, _op_json("PENDING"))
+    responses.add(responses.GET, str(url), json=_op_json("RUNNING"))
+
+    stats = tc.WaitStats()
+    with pytest.raises(TimeoutError):
+        tc.operation.wait(s, op, timeout_seconds=1, stats=stats)
+    assert stats.waits == 0
+    # the delay of 3 seconds is cut short by the timeout
+    assert stats.polls == 1
+    assert 1 <= stats.wait_seconds < 3
+
+
+def test_poll_strategy_abstract():
+    class HalfMinutePoll(tc.PollStrategy):
+        def delay(self, operation, polls):
+            return 30.0
+
+    op = tc.operation._from_json(tc.URL(path="operations/1"), _op_json("RUNNING"))
+    assert tc.operation._strategy_delay(HalfMinutePoll(), op, 0) == 30
+    with pytest.raises(TypeError):
+        tc.PollStrategy()  # type: ignore
+
+
+def test_backoff_poll():
+    strategy = tc.BackoffPoll(backoff=1, factor=2, backoff_max=5, jitter=0)
+    op = tc.operation._from_json(tc.URL(path="operations/1"), _op_json("RUNNING"))
+
+    delays = [tc.operation._strategy_delay(strategy, op, polls) for polls in range(4)]
+    assert delays == [1, 2, 4, 5]
+    jittered = tc.BackoffPoll(backoff=1, jitter=0.5)
+    assert 0.5 <= tc.operation._strategy_delay(jittered, op, 0) <= 1
+
+
+def test_estimated_poll():
+    url = tc.URL(path="operations/1")
+    strategy = tc.EstimatedPoll(fallback=tc.FixedPoll(7), margin=1, interval_max=100)
+    now = datetime.now(timezone.utc)
+    started = (now - timedelta(seconds=10)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    running = _running(url, started)
+
+    # no history for this type of operation yet
+    assert tc.operation._strategy_delay(strategy, running, 0) == 7
+
+    for duration in [20, 30, 40]:
+        tc.operation._learn(
+            strategy,
+            tc.operation._from_json(
+                url,
+                _op_json(
+                    "SUCCEEDED",
+                    start="2020-06-12T18:00:00Z",
+                    end=f"2020-06-12T18:00:{duration:02}Z",
+                ),
+            ),
+        )
+    tc.operation._learn(
+        strategy,
+        tc.operation._from_json(
+            url,
+            _op_json(
+                "FAILED", start="2020-06-12T18:00:00Z", end="2020-06-12T18:00:01Z"
+            ),
+        ),
+    )
+    assert list(strategy.durations["SPARK"]) == [20, 30, 40]
+
+    # median of 30 seconds, 10 seconds of which have passed
+    estimate = tc.operation.remaining(strategy, running)
+    assert estimate is not None and 19 < estimate <= 20
+    assert 20 < tc.operation._strategy_delay(strategy, running, 0) <= 21
+    # longer than estimated
+    late = (now - timedelta(seconds=60)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert tc.operation._strategy_delay(strategy, _running(url, late), 3) == 7
+    # not started
+    assert tc.operation._strategy_delay(strategy, _running(url, ""), 0) == 7
+
+
+def _running(url: tc.URL, start: str) -> tc.Operation:
+    return tc.operation._from_json(url, _op_json("RUNNING", start=start))
+
+
+def test_timestamp():
+    assert tc.operation._timestamp("1970-01-01T00:01:00.500Z") == 60.5
+    assert tc.operation._timestamp("1970-01-01T00:01:00Z") == 60
+    assert tc.operation._timestamp("") is None
+    assert tc.operation._timestamp(None) is None
+    assert tc.operation._timestamp("yesterday") is None
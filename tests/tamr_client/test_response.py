@@ -1,5 +1,7 @@
 import json
+import time
 
+import pytest
 import responses
 
 import tamr_client as tc
@@ -22,3 +24,109 @@ def test_ndjson():
     assert len(ndjson) == 3
     for record in ndjson:
         assert record in records
+
+
+@responses.activate
+def test_ndjson_small_chunks():
+    s = fake.session()
+
+    records = [{"a": i, "b": "x" * i} for i in range(20)]
+    url = tc.URL(path="datasets/1/records")
+    body = "\n".join(json.dumps(x) for x in records) + "\n\n"
+    responses.add(responses.GET, str(url), body=body)
+
+    r = s.get(str(url), stream=True)
+
+    assert list(tc.response.ndjson(r, chunk_size=7)) == records
+
+
+@responses.activate
+def test_ndjson_intern():
+    s = fake.session()
+
+    records = [
+        {
+            "id": i,
+            "source": "source " + "ab"[i % 2],
+            "tags": ["x" * 3],
+            "other": "y" * 3,
+        }
+        for i in range(4)
+    ]
+    url = tc.URL(path="datasets/1/records")
+    body = "\n".join(json.dumps(x) for x in records)
+    responses.add(responses.GET, str(url), body=body)
+
+    r = s.get(str(url), stream=True)
+
+    stats = tc.InternStats()
+    parsed = list(tc.response.ndjson(r, intern=["source", "tags"], intern_stats=stats))
+    assert parsed == records
+    assert parsed[0]["source"] is parsed[2]["source"]
+    assert parsed[1]["source"] is parsed[3]["source"]
+    assert parsed[0]["tags"][0] is parsed[3]["tags"][0]
+    assert parsed[0]["other"] is not parsed[1]["other"]
+    assert (stats.strings, stats.unique, stats.repeats) == (8, 3, 5)
+    assert stats.bytes_saved > 0
+
+
+def test_line_batches():
+    chunks = [b'{"a"', b": 1}\n{", b'"b": 2}\n', b"\n", b'{"c": 3}']
+
+    batches = list(tc.response._line_batches(chunks))
+    assert batches == [[b'{"a": 1}'], [b'{"b": 2}'], [b""], [b'{"c": 3}']]
+
+
+def test_line_batches_crlf():
+    chunks = [b'{"a": 1}\r', b'\n{"b": 2}\r\n\r\n', b'{"c": 3}\r\n']
+
+    batches = list(tc.response._line_batches(chunks))
+    assert [line for batch in batches for line in batch] == [
+        b'{"a": 1}',
+        b'{"b": 2}',
+        b"",
+        b'{"c": 3}',
+    ]
+
+
+def test_prefetch():
+    batches = [[b"1"], [b"2", b"3"], [b"4"]]
+    stats = tc.PrefetchStats()
+
+    assert list(tc.response._prefetch(iter(batches), 1, stats)) == batches
+    assert stats.batches == 3
+    assert stats.max_depth == 1
+
+
+def test_prefetch_slow_consumer():
+    batches = [[b"1"]] * 5
+    stats = tc.PrefetchStats()
+
+    prefetched = tc.response._prefetch(iter(batches), 2, stats)
+    for _ in prefetched:
+        time.sleep(0.01)
+    assert stats.reader_waits > 0
+    assert stats.bottleneck == "consumer"
+
+
+def test_prefetch_slow_reader():
+    def slow_batches():
+        for i in range(3):
+            time.sleep(0.01)
+            yield [str(i).encode()]
+
+    stats = tc.PrefetchStats()
+    assert len(list(tc.response._prefetch(slow_batches(), 2, stats))) == 3
+    assert stats.consumer_waits > 0
+    assert stats.bottleneck == "reader"
+
+
+def test_prefetch_error():
+    def failing_batches():
+        yield [b"1"]
+        raise OSError("connection reset")
+
+    prefetched = tc.response._prefetch(failing_batches(), 2, tc.PrefetchStats())
+    assert next(prefetched) == [b"1"]
+    with pytest.raises(OSError):
+        next(prefetched)
@@ -0,0 +1,175 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
+import sys
+
+import pytest
+import requests
+import responses
+from urllib3 import HTTPConnectionPool
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+import tamr_client as tc
+from tamr_client import retry
+from tests.tamr_client import fake
+
+_url = "http://localhost/api/versioned/v1/datasets"
+
+
+def _session(**kwargs) -> tc.Session:
+    stats = tc.RetryStats()
+    policy = tc.Retry(backoff=0, **kwargs)
+    return tc.session.from_auth(
+        tc.JwtTokenAuth("token"), retry=policy, retry_stats=stats
+    )
+
+
+def _refused() -> requests.exceptions.ConnectionError:
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(
+        MaxRetryError(HTTPConnectionPool("localhost"), _url, reason)
+    )
+
+
+@responses.activate
+def test_retry_status():
+    responses.add(responses.GET, _url, status=503)
+    responses.add(responses.GET, _url, status=502)
+    responses.add(responses.GET, _url, json=[])
+    s = _session()
+
+    r = s.get(_url)
+    assert r.status_code == 200
+    assert len(responses.calls) == 3
+    assert s._retry_stats == tc.RetryStats(
+        requests=1, retries=2, retried=1, reasons={"503": 1, "502": 1}
+    )
+
+
+@responses.activate
+def test_retry_connection_error():
+    responses.add(responses.GET, _url, body=requests.exceptions.ConnectionError())
+    responses.add(responses.GET, _url, json=[])
+    s = _session()
+
+    assert s.get(_url).status_code == 200
+    assert s._retry_stats.reasons == {"ConnectionError": 1}
+
+
+@responses.activate
+def test_retry_exhausted():
+    responses.add(responses.GET, _url, status=503)
+    responses.add(responses.GET, _url, status=503)
+    responses.add(responses.GET, _url, json=[])
+    s = _session(total=1)
+
+    assert s.get(_url).status_code == 503
+    assert len(responses.calls) == 2
+    assert s._retry_stats.exhausted == 1
+
+
+@responses.activate
+def test_retry_budget():
+    for _ in range(4):
+        responses.add(responses.GET, _url, status=503)
+    s = _session(budget=1)
+
+    assert s.get(_url).status_code == 503
+    assert s.get(_url).status_code == 503
+    assert len(responses.calls) == 3
+    assert s._retry_stats.retries == 1
+    assert s._retry_stats.exhausted == 2
+
+
+def test_retry_stats_concurrent():
+    def send(method, url):
+        response = requests.Response()
+        response.status_code = 503
+        response.raw = io.BytesIO()
+        return response
+
+    stats = tc.RetryStats()
+    policy = tc.Retry(total=1, backoff=0)
+
+    def request(_):
+        return retry._send(send, "GET", _url, retry=policy, stats=stats)
+
+    # switch threads as often as possible, to interleave the updates of the statistics
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(16) as pool:
+            list(pool.map(request, range(20000)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert stats.requests == 20000
+    assert stats.retries == 20000
+    assert stats.exhausted == 20000
+    assert stats.reasons == {"503": 20000}
+
+
+@responses.activate
+def test_no_retry_post():
+    responses.add(responses.POST, _url, status=503)
+    responses.add(responses.POST, _url, body=requests.exceptions.ConnectionError())
+    s = _session()
+
+    assert s.post(_url, json={}).status_code == 503
+    with pytest.raises(requests.exceptions.ConnectionError):
+        s.post(_url, json={})
+    assert len(responses.calls) == 2
+    assert s._retry_stats.retries == 0
+
+
+@responses.activate
+def test_retry_post_not_sent():
+    responses.add(responses.POST, _url, body=_refused())
+    responses.add(responses.POST, _url, json={})
+    s = _session()
+
+    assert s.post(_url, json={}).status_code == 200
+    assert s._retry_stats.reasons == {"ConnectionError": 1}
+
+
+@responses.activate
+def test_retry_idempotent_post():
+    bodies = []
+
+    def create_callback(request):
+        bodies.append(request.body.read())
+        status = 503 if len(bodies) == 1 else 200
+        return status, {}, "{}"
+
+    responses.add_callback(responses.POST, _url, create_callback)
+    s = _session()
+
+    body = io.BytesIO(b"skipped\nreplayed")
+    body.readline()
+    r = s.request("POST", _url, data=body, idempotent=True)
+    assert r.status_code == 200
+    assert bodies == [b"replayed", b"replayed"]
+    assert s._retry_stats.retries == 1
+
+
+@responses.activate
+def test_no_retry_stream():
+    responses.add(responses.POST, _url, status=503)
+    s = _session()
+
+    r = s.request("POST", _url, data=iter([b"a", b"b"]), idempotent=True)
+    assert r.status_code == 503
+    assert len(responses.calls) == 1
+
+
+def test_delay():
+    policy = tc.Retry(backoff=1, backoff_max=5, jitter=0)
+    assert [retry._delay(policy, i) for i in range(4)] == [1, 2, 4, 5]
+    assert retry._delay(policy, 0, retry_after=3) == 3
+    assert retry._delay(policy, 0, retry_after=60) == 5
+
+    jittered = tc.Retry(backoff=1, jitter=0.5)
+    assert all(0.5 <= retry._delay(jittered, 0) <= 1 for _ in range(100))
+
+
+def test_default_no_retry():
+    s = fake.session()
+    assert s._retry is None
@@ -1,11 +1,22 @@
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import responses
+from urllib3.poolmanager import PoolManager
 
 import tamr_client as tc
+from tamr_client import token_cache
+from tamr_client.session import _Replayable
 from tests.tamr_client import fake
 
 
@@ -123,4 +134,282 @@ def test_request_headers():
     assert snoop_dict_3["headers"]["Cookie"] == f'authToken={auth_json["token"]}'
 
 
+@responses.activate
+def test_refresh_expiring_token():
+    auth_endpoint = "http://localhost/api/versioned/v1/instance:login"
+    endpoint = "http://localhost/api/versioned/v1/backups"
+    tokens = [_jwt(time.time() + 30), _jwt(time.time() + 3600)]
+    responses.add_callback(
+        responses.POST,
+        auth_endpoint,
+        lambda _: (200, {}, json.dumps({"token": tokens.pop(0), "username": "user"})),
+    )
+    responses.add(responses.POST, endpoint, json={})
+    responses.add(responses.GET, endpoint, json=[])
+
+    s = fake.session()
+    instance = fake.instance()
+    s.post(endpoint, data=iter([b"{}"]))  # streamed body, so logs in first
+    tc.backup.get_all(session=s, instance=instance)  # token expires within a minute
+    tc.backup.get_all(session=s, instance=instance)
+
+    logins = [c for c in responses.calls if c.request.url == auth_endpoint]
+    assert len(logins) == 2
+    assert not tokens
+
+
+@responses.activate
+def test_stream_recorded_unless_token_fresh():
+    auth_endpoint = "http://localhost/api/versioned/v1/instance:login"
+    endpoint = "http://localhost/api/versioned/v1/datasets/1:updateRecords"
+    tokens = ["auth_token_string_value", _jwt(time.time() + 3600)]
+    responses.add_callback(
+        responses.POST,
+        auth_endpoint,
+        lambda _: (200, {}, json.dumps({"token": tokens.pop(0), "username": "user"})),
+    )
+    responses.add(responses.POST, endpoint, json={})
+
+    s = fake.session()
+    s.post(
+        endpoint, data=iter([b"{}"])
+    )  # expiry of the token unknown, but just obtained
+    assert not isinstance(responses.calls[-1].request.body, _Replayable)
+
+    s._auth_token_time = time.time() - 3600
+    s.post(endpoint, data=iter([b"{}"]))  # expiry of the token unknown
+    assert isinstance(responses.calls[-1].request.body, _Replayable)
+
+    s._auth_token_expiry = time.time()  # expiring, so logs in again
+    s.post(endpoint, data=iter([b"{}"]))
+    assert not isinstance(responses.calls[-1].request.body, _Replayable)
+    assert not tokens
+
+
+@responses.activate
+def test_stream_revoked_token():
+    auth_endpoint = "http://localhost/api/versioned/v1/instance:login"
+    endpoint = "http://localhost/api/versioned/v1/datasets/1:updateRecords"
+    responses.add(
+        responses.POST,
+        auth_endpoint,
+        json={"token": _jwt(time.time() + 3600), "username": "user"},
+    )
+    responses.add(
+        responses.POST,
+        endpoint,
+        status=401,
+        body="Credentials are required to access this resource.",
+    )
+
+    s = fake.session()
+    r = s.post(endpoint, data=iter([b"{}"]))
+
+    # the streamed body was not recorded, so is not sent again after logging in
+    assert r.status_code == 401
+    assert [c.request.url for c in responses.calls] == [
+        auth_endpoint,
+        endpoint,
+        auth_endpoint,
+    ]
+
+
+@responses.activate
+def test_stream_not_recorded(monkeypatch):
+    auth_endpoint = "http://localhost/api/versioned/v1/instance:login"
+    endpoint = "http://localhost/api/versioned/v1/datasets/1:updateRecords"
+    responses.add(
+        responses.POST,
+        auth_endpoint,
+        json={"token": "auth_token_string_value", "username": "user"},
+    )
+
+    def create_callback(request):
+        list(request.body)
+        return 401, {}, "Credentials are required to access this resource."
+
+    responses.add_callback(responses.POST, endpoint, create_callback)
+    monkeypatch.setattr(tc.session, "_REPLAY_MAX_SIZE", 4)
+
+    s = fake.session()
+    s._auth_token = "auth_token_string_value"
+    s._auth_token_time = time.time() - 3600
+    s.auth = None
+    with pytest.raises(tc.session.StreamNotRecorded):
+        s.post(endpoint, data=iter([b"{}\n", b"{}\n", b"{}\n"]))
+
+
+@responses.activate
+def test_concurrent_logins():
+    auth_endpoint = "http://localhost/api/versioned/v1/instance:login"
+    endpoint = "http://localhost/api/versioned/v1/backups"
+    server: Dict[str, Any] = {"logins": 0}
+    barrier = threading.Barrier(4)
+
+    def login_callback(request):
+        server["logins"] += 1
+        return 200, {}, json.dumps({"token": "token", "username": "user"})
+
+    def get_callback(request):
+        if request.headers.get("Cookie") != "authToken=token":
+            barrier.wait(timeout=5)  # all threads are rejected at once
+            return 401, {}, "Credentials are required to access this resource."
+        return 200, {}, json.dumps([])
+
+    responses.add_callback(responses.POST, auth_endpoint, login_callback)
+    responses.add_callback(responses.GET, endpoint, get_callback)
+
+    s = fake.session()
+    with ThreadPoolExecutor(4) as executor:
+        statuses = list(executor.map(lambda _: s.get(endpoint).status_code, range(4)))
+
+    assert statuses == [200] * 4
+    assert server["logins"] == 1
+
+
+@responses.activate
+def test_request_url_keyword():
+    responses.add(
+        responses.POST,
+        "http://localhost/api/versioned/v1/instance:login",
+        json=auth_json,
+    )
+    responses.add(responses.POST, "http://localhost/api/versioned/v1/datasets", json={})
+
+    s = fake.session()
+    r = s.request(
+        "POST", url="http://localhost/api/versioned/v1/datasets", data=iter([b"{}"])
+    )
+
+    assert r.status_code == 200
+    assert s.cookies.get("authToken") == auth_json["token"]
+
+
+def test_token_expiry():
+    assert tc.session._token_expiry(_jwt(1600000000)) == 1600000000
+    assert tc.session._token_expiry("auth_token_string_value") is None
+    assert tc.session._token_expiry("not.a.jwt") is None
+
+
+@responses.activate
+def test_token_cache(tmp_path):
+    auth_endpoint = "http://localhost/api/versioned/v1/instance:login"
+    endpoint = "http://localhost/api/versioned/v1/backups"
+    server: Dict[str, Any] = {"logins": 0, "token": None}
+
+    def login_callback(request):
+        server["logins"] += 1
+        server["token"] = f"token_{server['logins']}"
+        return 200, {}, json.dumps({"token": server["token"], "username": "user"})
+
+    def get_callback(request):
+        if request.headers.get("Cookie") != f"authToken={server['token']}":
+            return 401, {}, "Credentials are required to access this resource."
+        return 200, {}, json.dumps([])
+
+    responses.add_callback(responses.POST, auth_endpoint, login_callback)
+    responses.add_callback(responses.GET, endpoint, get_callback)
+
+    cache = tc.TokenCache(tmp_path / "tokens.json")
+    s1 = tc.session.from_auth(fake.username_password_auth(), token_cache=cache)
+    s2 = tc.session.from_auth(fake.username_password_auth(), token_cache=cache)
+    instance = fake.instance()
+
+    tc.backup.get_all(session=s1, instance=instance)
+    tc.backup.get_all(session=s2, instance=instance)  # reuses the cached token
+    assert server["logins"] == 1
+
+    server["token"] = "revoked"
+    tc.backup.get_all(session=s2, instance=instance)  # logs in again
+    tc.backup.get_all(session=s1, instance=instance)  # reuses the token of `s2`
+    assert server["logins"] == 2
+    assert s1.cookies.get("authToken") == s2.cookies.get("authToken") == "token_2"
+
+
+def test_token_cache_file(tmp_path):
+    cache = tc.TokenCache(tmp_path / "tokens.json")
+    assert token_cache._load(cache, "http://localhost", "user") is None
+
+    with token_cache._locked(cache):
+        token_cache._store(cache, "http://localhost", "user", "token", 1600000000.0)
+        token_cache._store(cache, "http://localhost", "other", "other_token", None)
+    assert token_cache._load(cache, "http://localhost", "user") == (
+        "token",
+        1600000000.0,
+    )
+    assert token_cache._load(cache, "http://localhost", "other") == (
+        "other_token",
+        None,
+    )
+    assert token_cache._load(cache, "http://otherhost", "user") is None
+    if os.name == "posix":
+        assert (tmp_path / "tokens.json").stat().st_mode & 0o077 == 0
+
+    (tmp_path / "tokens.json").write_text("not json")
+    assert token_cache._load(cache, "http://localhost", "user") is None
+
+
+def test_from_auth_pool():
+    s = tc.session.from_auth(
+        fake.username_password_auth(), pool_maxsize=20, pool_block=True
+    )
+
+    assert s.get_adapter("https://localhost") is s.get_adapter("http://localhost")
+    pool_kw = _pool_manager(s).connection_pool_kw
+    assert pool_kw["maxsize"] == 20
+    assert pool_kw["block"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in pool_kw["socket_options"]
+
+
+def test_from_auth_tcp_keepalive():
+    s = tc.session.from_auth(fake.username_password_auth(), tcp_keepalive=30)
+
+    pool = _pool_manager(s).connection_from_url("http://localhost")
+    conn = pool._get_conn()
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in conn.socket_options
+
+    with pytest.raises(ValueError):
+        tc.session.from_auth(fake.username_password_auth(), tcp_keepalive=0)
+
+
+def test_pool_stats():
+    s = tc.session.from_auth(fake.username_password_auth(), pool_maxsize=4)
+    assert tc.session.pool_stats(s) == tc.PoolStats()
+
+    pool = _pool_manager(s).connection_from_url("http://localhost")
+    conns = [pool._get_conn(), pool._get_conn()]
+
+    stats = tc.session.pool_stats(s)
+    assert stats.pools == 1
+    assert stats.maxsize == 4
+    assert stats.in_use == 2
+    assert stats.idle == 0
+    assert stats.connections == 2
+
+    pool._put_conn(conns[0])
+    stats = tc.session.pool_stats(s)
+    assert stats.in_use == 1
+    assert stats.idle == 1
+
+    _pool_manager(s).connection_from_url("http://otherhost")
+    assert tc.session.pool_stats(s).pools == 2
+
+    assert tc.PoolStats(connections=2, requests=6).requests_per_connection == 3
+
+
+def _pool_manager(s: tc.Session) -> PoolManager:
+    adapter = s.get_adapter("http://localhost")
+    assert isinstance(adapter, HTTPAdapter)
+    return adapter.poolmanager
+
+
+def _jwt(exp: float) -> str:
+    def encode(claims: tc._types.JsonDict) -> str:
+        return (
+            base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+        )
+
+    return ".".join([encode({"alg": "none"}), encode({"exp": exp}), "signature"])
+
+
 auth_json = {"token": "auth_token_string_value", "username": "user"}
@@ -0,0 +1,151 @@
+import json
+from typing import Any, List
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from urllib3 import HTTPConnectionPool
+from urllib3.exceptions import ReadTimeoutError
+
+import tamr_client as tc
+from tests.tamr_client import fake
+
+_url = "http://localhost/api/versioned/v1/datasets"
+
+
+class _Adapter(BaseAdapter):
+    """Transport adapter recording the timeout of each request, and failing as instructed
+
+    Args:
+        outcomes: Status of the response to each request, or exception raised instead
+        body: Body of the responses
+    """
+
+    def __init__(self, outcomes: List[Any], body: bytes = b"{}"):
+        super().__init__()
+        self.outcomes = outcomes
+        self.body = body
+        self.timeouts: List[Any] = []
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        r = requests.Response()
+        r.status_code = outcome
+        r.request = request
+        r.url = request.url
+        r._content = self.body
+        return r
+
+    def close(self):
+        pass
+
+
+def _session(outcomes: List[Any], body: bytes = b"{}", **kwargs) -> tc.Session:
+    s = tc.session.from_auth(tc.JwtTokenAuth("token"), **kwargs)
+    s.mount("http://", _Adapter(outcomes, body))
+    return s
+
+
+def _timeouts(s: tc.Session) -> List[Any]:
+    adapter = s.get_adapter(_url)
+    assert isinstance(adapter, _Adapter)
+    return adapter.timeouts
+
+
+def test_timeout_profiles():
+    s = _session([200] * 6, timeout=tc.Timeout(connect=1, read=2, stream=3, poll=4))
+
+    s.get(_url)
+    s.get(_url, stream=True)
+    s.post(_url, data=iter([b"{}"]))
+    s.request("GET", _url, profile="poll")
+    s.get(_url, timeout=5)
+    with pytest.raises(ValueError):
+        s.request("GET", _url, profile="unknown")
+    assert _timeouts(s) == [(1, 2), (1, 3), (1, 3), (1, 4), 5]
+
+
+def test_timeout_default():
+    s = _session([200, 200])
+    s.get(_url)
+    assert _timeouts(s) == [(10.0, 60.0)]
+
+    s = _session([200], timeout=None)
+    s.get(_url)
+    assert _timeouts(s) == [None]
+
+
+def test_typed_timeouts():
+    s = _session(
+        [requests.exceptions.ConnectTimeout(), requests.exceptions.ReadTimeout()]
+    )
+
+    with pytest.raises(tc.timeout.ConnectTimeout) as connect:
+        s.get(_url)
+    assert isinstance(connect.value, requests.exceptions.ConnectionError)
+    with pytest.raises(tc.timeout.ReadTimeout) as read:
+        s.get(_url)
+    assert isinstance(read.value, requests.exceptions.Timeout)
+    assert isinstance(read.value, tc.TamrClientException)
+
+
+def test_retry_timeouts():
+    stats = tc.RetryStats()
+    s = _session(
+        [
+            requests.exceptions.ReadTimeout(),
+            200,
+            requests.exceptions.ConnectTimeout(),
+            200,
+            requests.exceptions.ReadTimeout(),
+        ],
+        retry=tc.Retry(backoff=0),
+        retry_stats=stats,
+    )
+
+    assert s.get(_url).status_code == 200
+    # connection timed out, so the request was not sent
+    assert s.post(_url, json={}).status_code == 200
+    # the request may have been processed
+    with pytest.raises(tc.timeout.ReadTimeout):
+        s.post(_url, json={})
+    assert stats.reasons == {"ReadTimeout": 1, "ConnectTimeout": 1}
+
+
+class _StalledBody:
+    """Raw body of a response sending a line, then no more data within the read timeout"""
+
+    def stream(self, chunk_size, decode_content=None):
+        yield b'{"a": 1}\n'
+        raise ReadTimeoutError(HTTPConnectionPool("localhost"), _url, "Read timed out.")
+
+
+def _stalled_response() -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r.raw = _StalledBody()
+    r.url = _url
+    r.request = requests.Request("GET", _url).prepare()
+    return r
+
+
+def test_stream_read_timeout():
+    records = tc.response.ndjson(_stalled_response())
+    assert next(records) == {"a": 1}
+    with pytest.raises(tc.timeout.ReadTimeout):
+        next(records)
+
+    with pytest.raises(tc.timeout.ReadTimeout):
+        list(tc.response.ndjson(_stalled_response(), decode_unicode=False))
+
+
+def test_poll_profile():
+    op_json = {"id": "1", "type": "SPARK", "description": "", "status": None}
+    s = _session([200], json.dumps(op_json).encode(), timeout=tc.Timeout(poll=4))
+    url = tc.URL(instance=fake.instance(), path="operations/1")
+
+    tc.operation.poll(s, tc.operation._from_json(url, op_json))
+    assert _timeouts(s) == [(10.0, 4)]
@@ -1,10 +1,12 @@
 from functools import partial
+import gzip
 import json
 
 import responses
 
 from tamr_unify_client import Client
 from tamr_unify_client.auth import UsernamePasswordAuth
+from tamr_unify_client.dataset.prefetch import PrefetchStats
 
 
 project_config = {
@@ -54,6 +56,26 @@ def test_binning_model_records():
     assert binning_model_records == records_body
 
 
+@responses.activate
+def test_binning_model_records_prefetch():
+    records_url = project_url + "/binningModel/records"
+    records_body = [{"id": [str(i)]} for i in range(5)]
+
+    responses.add(responses.GET, project_url, json=project_config)
+    responses.add(
+        responses.GET,
+        records_url,
+        body="\n".join(json.dumps(body) for body in records_body),
+    )
+
+    tamr = Client(UsernamePasswordAuth("username", "password"))
+    binning_model = tamr.projects.by_resource_id("1").as_mastering().binning_model()
+
+    stats = PrefetchStats()
+    assert list(binning_model.records(prefetch=2, stats=stats)) == records_body
+    assert stats.batches > 0
+
+
 @responses.activate
 def test_binning_model_update_records():
 
@@ -160,3 +182,32 @@ def test_binning_model_update_records():
     binning_model.update_records(updates)
     actual = [json.loads(item) for item in snoop_dict["payload"]]
     assert expected_updates == actual
+
+
+@responses.activate
+def test_binning_model_update_records_compressed():
+    update_records_url = project_url + "/binningModel/records"
+    responses.add(responses.GET, project_url, json=project_config)
+
+    snoop_dict = {}
+
+    def update_callback(request, snoop):
+        snoop["headers"] = request.headers
+        snoop["payload"] = b"".join(request.body)
+        return 200, {}, "{}"
+
+    responses.add_callback(
+        responses.POST,
+        update_records_url,
+        callback=partial(update_callback, snoop=snoop_dict),
+    )
+
+    tamr = Client(UsernamePasswordAuth("username", "password"), json_codec="json")
+    binning_model = tamr.projects.by_resource_id("1").as_mastering().binning_model()
+
+    updates = [{"action": "DELETE", "recordId": str(i)} for i in range(3)]
+    binning_model.update_records(updates, compression="gzip")
+
+    assert snoop_dict["headers"]["Content-Encoding"] == "gzip"
+    expected = b"".join(json.dumps(update).encode("utf-8") for update in updates)
+    assert gzip.decompress(snoop_dict["payload"]) == expected
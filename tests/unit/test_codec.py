@@ -0,0 +1,38 @@
+import json
+import math
+from unittest import TestCase
+
+from tamr_unify_client import _codec, Client
+from tamr_unify_client.auth import UsernamePasswordAuth
+
+
+class TestCodec(TestCase):
+    def test_client_default(self):
+        client = Client(UsernamePasswordAuth("username", "password"))
+        self.assertEqual(client.json_codec, _codec.default())
+
+    def test_client_codec(self):
+        client = Client(UsernamePasswordAuth("username", "password"), json_codec="json")
+        self.assertEqual(client.json_codec, _codec.STDLIB)
+
+    def test_client_codec_not_found(self):
+        with self.assertRaises(KeyError):
+            Client(UsernamePasswordAuth("username", "password"), json_codec="nope")
+
+    def test_roundtrip(self):
+        record = {"id": 1, "name": ["é/", None], "score": 0.1}
+        for codec in _codec._registry.values():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.loads(codec.dumps(record)), record)
+
+    def test_nonfinite_matches_stdlib(self):
+        record = {"id": 1, "a": [math.nan], "b": math.inf, "c": -math.inf, "d": None}
+        stdlib = _codec.STDLIB
+        for codec in _codec._registry.values():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.dumps(record), stdlib.dumps(record))
+                self.assertEqual(
+                    json.loads(codec.dumps(record, ignore_nan=True)),
+                    {"id": 1, "a": [None], "b": None, "c": None, "d": None},
+                )
+                self.assertRaises(ValueError, codec.dumps, record, allow_nan=False)
@@ -1,18 +1,23 @@
 from functools import partial
+import gzip
 import json
+from threading import Lock
 from unittest import TestCase
 
 from pandas import DataFrame
+from requests import HTTPError
 import responses
 
 from tamr_unify_client import Client
 from tamr_unify_client.auth import UsernamePasswordAuth
+from tamr_unify_client.dataset.prefetch import PrefetchStats
+from tamr_unify_client.dataset.resource import _dataframe_records
 
 
 class TestDatasetRecords(TestCase):
     def setUp(self):
         auth = UsernamePasswordAuth("username", "password")
-        self.tamr = Client(auth)
+        self.tamr = Client(auth, json_codec="json")
 
     @responses.activate
     def test_get(self):
@@ -28,6 +33,87 @@ class TestDatasetRecords(TestCase):
         records = list(dataset.records())
         self.assertListEqual(records, self._records_json)
 
+    @responses.activate
+    def test_get_small_chunks(self):
+        records_url = f"{self._dataset_url}/records"
+        responses.add(responses.GET, self._dataset_url, json={})
+        responses.add(
+            responses.GET,
+            records_url,
+            body="\n".join([json.dumps(x) for x in self._records_json]) + "\n\n",
+        )
+
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+        records = list(dataset.records(chunk_size=5))
+        self.assertListEqual(records, self._records_json)
+
+    @responses.activate
+    def test_get_crlf(self):
+        records_url = f"{self._dataset_url}/records"
+        responses.add(responses.GET, self._dataset_url, json={})
+        responses.add(
+            responses.GET,
+            records_url,
+            body="\r\n".join([json.dumps(x) for x in self._records_json]) + "\r\n",
+        )
+
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+        records = list(dataset.records(chunk_size=5))
+        self.assertListEqual(records, self._records_json)
+
+    @responses.activate
+    def test_get_columns(self):
+        records_url = f"{self._dataset_url}/records"
+        responses.add(responses.GET, self._dataset_url, json={})
+        records_json = [
+            {"pk": 1, "attribute1": "a", "attribute2": {"nested": 1}},
+            {"pk": 2, "attribute1": '"pk": 3'},
+            {"attribute1": "c"},
+        ]
+        responses.add(
+            responses.GET,
+            records_url,
+            body="\n".join([json.dumps(x) for x in records_json]),
+        )
+
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+        records = list(dataset.records(columns=["pk", "attribute1"]))
+        self.assertListEqual(
+            records,
+            [
+                {"pk": 1, "attribute1": "a"},
+                {"pk": 2, "attribute1": '"pk": 3'},
+                {"attribute1": "c"},
+            ],
+        )
+
+    @responses.activate
+    def test_get_prefetch(self):
+        records_url = f"{self._dataset_url}/records"
+        responses.add(responses.GET, self._dataset_url, json={})
+        responses.add(
+            responses.GET,
+            records_url,
+            body="\n".join([json.dumps(x) for x in self._records_json]),
+        )
+
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+        stats = PrefetchStats()
+        records = list(dataset.records(chunk_size=5, prefetch=1, stats=stats))
+        self.assertListEqual(records, self._records_json)
+        self.assertEqual(stats.capacity, 1)
+        self.assertGreater(stats.batches, 1)
+        self.assertEqual(stats.depth, 0)
+
+    @responses.activate
+    def test_get_prefetch_invalid(self):
+        responses.add(responses.GET, self._dataset_url, json={})
+        responses.add(responses.GET, f"{self._dataset_url}/records", body="")
+
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+        with self.assertRaises(ValueError):
+            list(dataset.records(prefetch=-1))
+
     @responses.activate
     def test_update(self):
         def create_callback(request, snoop):
@@ -115,7 +201,7 @@ class TestDatasetRecords(TestCase):
             self._dataframe, primary_key_name="attribute1"
         )
         self.assertEqual(response, self._response_json)
-        self.assertEqual(snoop["payload"], TestDatasetRecords.stringify(updates, False))
+        self.assertEqual([json.loads(p) for p in snoop["payload"]], updates)
 
     @responses.activate
     def test_upsert_from_dataframe_nan(self):
@@ -137,7 +223,184 @@ class TestDatasetRecords(TestCase):
             self._dataframe_nan, primary_key_name="pk"
         )
         self.assertEqual(response, self._response_json)
-        self.assertEqual(snoop["payload"], TestDatasetRecords.stringify(updates, True))
+        self.assertEqual([json.loads(p) for p in snoop["payload"]], updates)
+
+    @responses.activate
+    def test_upsert_from_dataframe_batched(self):
+        def create_callback(request, snoop):
+            snoop["payloads"].append(request.body)
+            return 200, {}, json.dumps(self._batch_response_json)
+
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        updates = TestDatasetRecords.records_to_updates(self._records_json)
+        snoop = {"payloads": []}
+        responses.add_callback(
+            responses.POST, records_url, partial(create_callback, snoop=snoop)
+        )
+
+        response = dataset.upsert_from_dataframe(
+            self._dataframe, primary_key_name="attribute1", batch_size=1
+        )
+        self.assertEqual(response, self._response_json)
+        self.assertEqual([json.loads(p) for p in snoop["payloads"]], updates)
+
+    def test_dataframe_records(self):
+        records = list(_dataframe_records(self._dataframe_nan, "pk", chunk_size=1))
+        self.assertEqual(
+            records,
+            [(1, b'{"pk":1,"attribute1":null}'), (2, b'{"pk":2,"attribute1":null}')],
+        )
+
+    @responses.activate
+    def test_upsert_batched(self):
+        def create_callback(request, snoop):
+            snoop["payloads"].append(request.body)
+            return 200, {}, json.dumps(self._batch_response_json)
+
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        updates = TestDatasetRecords.records_to_updates(self._records_json)
+        snoop = {"payloads": []}
+        responses.add_callback(
+            responses.POST, records_url, partial(create_callback, snoop=snoop)
+        )
+
+        response = dataset.upsert_records(
+            self._records_json, "attribute1", batch_size=1
+        )
+        self.assertEqual(response, self._response_json)
+        self.assertEqual(
+            snoop["payloads"], TestDatasetRecords.stringify(updates, False)
+        )
+
+    @responses.activate
+    def test_upsert_buffered(self):
+        def create_callback(request, snoop):
+            snoop["payload"] = list(request.body)
+            return 200, {}, json.dumps(self._response_json)
+
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        updates = TestDatasetRecords.records_to_updates(self._records_json)
+        snoop = {}
+        responses.add_callback(
+            responses.POST, records_url, partial(create_callback, snoop=snoop)
+        )
+
+        response = dataset.upsert_records(
+            self._records_json, "attribute1", buffer_size=1024 * 1024
+        )
+        self.assertEqual(response, self._response_json)
+        expected = b"".join(
+            u + b"\n" for u in TestDatasetRecords.stringify(updates, False)
+        )
+        self.assertEqual(snoop["payload"], [expected])
+
+    @responses.activate
+    def test_upsert_spooled(self):
+        def create_callback(request, snoop):
+            snoop["headers"] = request.headers
+            snoop["payload"] = request.body
+            return 200, {}, json.dumps(self._response_json)
+
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        updates = TestDatasetRecords.records_to_updates(self._records_json)
+        snoop = {}
+        responses.add_callback(
+            responses.POST, records_url, partial(create_callback, snoop=snoop)
+        )
+
+        response = dataset.upsert_records(self._records_json, "attribute1", spool=True)
+        self.assertEqual(response, self._response_json)
+        self.assertEqual(
+            snoop["payload"].splitlines(), TestDatasetRecords.stringify(updates, False)
+        )
+        self.assertEqual(snoop["headers"]["Content-Length"], str(len(snoop["payload"])))
+
+    @responses.activate
+    def test_upsert_compressed(self):
+        def create_callback(request, snoop):
+            snoop["headers"] = request.headers
+            snoop["payload"] = b"".join(request.body)
+            return 200, {}, json.dumps(self._response_json)
+
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        updates = TestDatasetRecords.records_to_updates(self._records_json)
+        snoop = {}
+        responses.add_callback(
+            responses.POST, records_url, partial(create_callback, snoop=snoop)
+        )
+
+        response = dataset.upsert_records(
+            self._records_json, "attribute1", buffer_size=64, compression="gzip"
+        )
+        self.assertEqual(response, self._response_json)
+        self.assertEqual(snoop["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(snoop["payload"]).splitlines(),
+            TestDatasetRecords.stringify(updates, False),
+        )
+
+    @responses.activate
+    def test_upsert_compression_invalid(self):
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+        with self.assertRaises(ValueError):
+            dataset.upsert_records(self._records_json, "attribute1", compression="br")
+
+    @responses.activate
+    def test_upsert_parallel(self):
+        def create_callback(request, snoop):
+            with snoop["lock"]:
+                snoop["payloads"].extend(request.body.split(b"\n"))
+            return 200, {}, json.dumps(self._batch_response_json)
+
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        records = [{"attribute1": i % 3, "version": i} for i in range(12)]
+        snoop = {"payloads": [], "lock": Lock()}
+        responses.add_callback(
+            responses.POST, records_url, partial(create_callback, snoop=snoop)
+        )
+
+        response = dataset.upsert_records(
+            records, "attribute1", batch_size=1, workers=3, max_in_flight=2
+        )
+        self.assertEqual(response["numCommandsProcessed"], 12)
+        sent = [json.loads(p)["record"] for p in snoop["payloads"]]
+        self.assertCountEqual(sent, records)
+        for key in range(3):
+            self.assertEqual(
+                [r for r in sent if r["attribute1"] == key],
+                [r for r in records if r["attribute1"] == key],
+            )
+
+    @responses.activate
+    def test_upsert_parallel_failure(self):
+        responses.add(responses.GET, self._dataset_url, json={})
+        dataset = self.tamr.datasets.by_resource_id(self._dataset_id)
+
+        records_url = f"{self._dataset_url}:updateRecords"
+        responses.add(responses.POST, records_url, status=503)
+
+        records = [{"attribute1": i} for i in range(10)]
+        with self.assertRaises(HTTPError):
+            dataset.upsert_records(records, "attribute1", batch_size=1, workers=2)
 
     @responses.activate
     def test_delete(self):
@@ -221,6 +484,11 @@ class TestDatasetRecords(TestCase):
         _nan_records_json, columns=["pk", "attribute1"], dtype=object
     )
     _null_records_json = [{"pk": 1, "attribute1": None}, {"pk": 2, "attribute1": None}]
+    _batch_response_json = {
+        "numCommandsProcessed": 1,
+        "allCommandsSucceeded": True,
+        "validationErrors": [],
+    }
     _response_json = {
         "numCommandsProcessed": 2,
         "allCommandsSucceeded": True,
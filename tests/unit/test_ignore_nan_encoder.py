@@ -0,0 +1,43 @@
+import json
+import math
+from unittest import TestCase
+
+from tamr_unify_client._ignore_nan_encoder import IgnoreNanEncoder
+
+
+class TestIgnoreNanEncoder(TestCase):
+    def test_nonfinite_as_null(self):
+        record = {
+            "id": 1,
+            "a": [math.nan, 1.5],
+            "b": (math.inf,),
+            "c": {"d": -math.inf},
+        }
+        self.assertEqual(
+            json.dumps(record, cls=IgnoreNanEncoder),
+            '{"id": 1, "a": [null, 1.5], "b": [null], "c": {"d": null}}',
+        )
+
+    def test_nonfinite_key_as_null(self):
+        self.assertEqual(
+            json.dumps({math.nan: 1, 0.5: 2}, cls=IgnoreNanEncoder),
+            '{"null": 1, "0.5": 2}',
+        )
+
+    def test_finite_matches_stdlib(self):
+        record = {"id": "é/", "a": [0.1, None, True], "b": {"c": 10**30}}
+        self.assertEqual(json.dumps(record, cls=IgnoreNanEncoder), json.dumps(record))
+
+    def test_matches_incremental(self):
+        record = {"id": 1, "a": [math.nan, 0.1], "b": {"c": math.inf, "d": "x"}}
+        for kwargs in [{}, {"sort_keys": True}, {"ensure_ascii": False}]:
+            with self.subTest(**kwargs):
+                encoder = IgnoreNanEncoder(**kwargs)
+                self.assertEqual(
+                    encoder.encode(record), "".join(encoder.iterencode(record))
+                )
+
+    def test_allow_nan_ignored(self):
+        self.assertEqual(
+            json.dumps([math.nan], cls=IgnoreNanEncoder, allow_nan=True), "[null]"
+        )
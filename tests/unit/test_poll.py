@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+
+import pytest
+import responses
+
+from tamr_unify_client import Client
+from tamr_unify_client.auth import UsernamePasswordAuth
+from tamr_unify_client.operation import Operation
+from tamr_unify_client.poll import (
+    BackoffPoll,
+    EstimatedPoll,
+    FixedPoll,
+    PollStrategy,
+    WaitStats,
+)
+
+
+@pytest.fixture
+def client():
+    return Client(UsernamePasswordAuth("username", "password"))
+
+
+def _op_json(state, start="", end=""):
+    return {
+        "id": "1",
+        "type": "SPARK",
+        "description": "",
+        "status": {"state": state, "startTime": start, "endTime": end, "message": ""},
+        "relativeId": "operations/1",
+    }
+
+
+def _timestamp(seconds_ago):
+    then = datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)
+    return then.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+@responses.activate
+def test_wait_backoff(client):
+    url = urljoin(client.origin + client.base_path, "operations/1")
+    responses.add(responses.GET, url, json=_op_json("RUNNING"))
+    responses.add(responses.GET, url, json=_op_json("SUCCEEDED", end=_timestamp(0)))
+
+    stats = WaitStats()
+    op = Operation.from_json(client, _op_json("PENDING"))
+    op = op.wait(strategy=BackoffPoll(backoff=0.001, jitter=0), stats=stats)
+
+    assert op.succeeded()
+    assert stats.waits == 1
+    assert stats.polls == 2
+    assert stats.ended == 1
+    assert 0 <= stats.mean_late_seconds == stats.max_late_seconds < 1
+
+
+@responses.activate
+def test_wait_timeout(client):
+    url = urljoin(client.origin + client.base_path, "operations/1")
+    responses.add(responses.GET, url, json=_op_json("RUNNING"))
+
+    stats = WaitStats()
+    op = Operation.from_json(client, _op_json("PENDING"))
+    with pytest.raises(TimeoutError):
+        op.wait(timeout_seconds=1, stats=stats)
+    # the delay of 3 seconds is cut short by the timeout
+    assert stats.waits == 0
+    assert stats.polls == 1
+    assert 1 <= stats.wait_seconds < 3
+
+
+def test_poll_strategy_abstract(client):
+    class HalfMinutePoll(PollStrategy):
+        def delay(self, operation, polls):
+            return 30.0
+
+    op = Operation.from_json(client, _op_json("RUNNING"))
+    assert HalfMinutePoll().delay(op, 0) == 30
+    with pytest.raises(TypeError):
+        PollStrategy()
+
+
+def test_backoff_poll(client):
+    strategy = BackoffPoll(backoff=1, factor=2, backoff_max=5, jitter=0)
+    op = Operation.from_json(client, _op_json("RUNNING"))
+
+    assert [strategy.delay(op, polls) for polls in range(4)] == [1, 2, 4, 5]
+    assert 0.5 <= BackoffPoll(backoff=1, jitter=0.5).delay(op, 0) <= 1
+
+
+def test_estimated_poll(client):
+    strategy = EstimatedPoll(fallback=FixedPoll(7), margin=1, interval_max=100)
+    running = Operation.from_json(client, _op_json("RUNNING", start=_timestamp(10)))
+
+    # no history for this type of operation yet
+    assert strategy.delay(running, 0) == 7
+
+    for state, duration in [("SUCCEEDED", 20), ("SUCCEEDED", 40), ("FAILED", 1)]:
+        strategy.observe(
+            Operation.from_json(
+                client,
+                _op_json(
+                    state,
+                    start="2020-06-12T18:00:00Z",
+                    end=f"2020-06-12T18:00:{duration:02}Z",
+                ),
+            )
+        )
+    assert list(strategy.durations["SPARK"]) == [20, 40]
+
+    # median of 30 seconds, 10 seconds of which have passed
+    assert 20 < strategy.delay(running, 0) <= 21
+    # longer than estimated
+    late = Operation.from_json(client, _op_json("RUNNING", start=_timestamp(60)))
+    assert strategy.delay(late, 3) == 7
+    # not started
+    assert strategy.delay(Operation.from_json(client, _op_json("RUNNING")), 0) == 7
@@ -0,0 +1,64 @@
+import pickle
+import socket
+
+import pytest
+import requests
+
+from tamr_unify_client import Client
+from tamr_unify_client.auth import UsernamePasswordAuth
+from tamr_unify_client.pool import PoolAdapter
+
+auth = UsernamePasswordAuth("username", "password")
+
+
+def test_default_adapters():
+    session = requests.Session()
+    adapter = session.get_adapter("http://localhost")
+
+    client = Client(auth, session=session)
+    assert client.session.get_adapter("http://localhost") is adapter
+
+
+def test_pool_options():
+    client = Client(auth, pool_maxsize=20, pool_block=True, tcp_keepalive=30)
+
+    adapter = client.session.get_adapter("https://localhost")
+    assert isinstance(adapter, PoolAdapter)
+    assert adapter is client.session.get_adapter("http://localhost")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 20
+    assert adapter.poolmanager.connection_pool_kw["block"]
+
+    pool = adapter.poolmanager.connection_from_url("http://localhost:9100")
+    conn = pool._get_conn()
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in conn.socket_options
+
+    with pytest.raises(ValueError):
+        Client(auth, tcp_keepalive=0)
+
+
+def test_adapter_pickle():
+    adapter = pickle.loads(pickle.dumps(PoolAdapter(tcp_keepalive=30, pool_maxsize=3)))
+    assert adapter.tcp_keepalive == 30
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 3
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_pool_stats():
+    client = Client(auth, pool_maxsize=4)
+    stats = client.pool_stats()
+    assert (stats.pools, stats.connections, stats.requests) == (0, 0, 0)
+    assert stats.requests_per_connection == 0
+
+    pool = client.session.get_adapter(client.origin).poolmanager.connection_from_url(
+        client.origin
+    )
+    conns = [pool._get_conn(), pool._get_conn()]
+    pool._put_conn(conns[0])
+
+    stats = client.pool_stats()
+    assert stats.pools == 1
+    assert stats.maxsize == 4
+    assert stats.in_use == 1
+    assert stats.idle == 1
+    assert stats.connections == 2
@@ -1,12 +1,17 @@
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import json
+import threading
+import time
 
 import pytest
 import requests
 import responses
 
-from tamr_unify_client import Client
+from tamr_unify_client import _upload, Client
 from tamr_unify_client.auth import TokenAuth, UsernamePasswordAuth
+from tamr_unify_client.client import StreamNotRecorded
 
 auth_json = {
     "token": "auth_token_string_value",
@@ -167,7 +172,205 @@ def test_auth_cookie_refresh():
     assert snoop_dict_3["headers"]["Cookie"] == f'authToken={auth_json["token"]}'
 
 
+@responses.activate
+def test_auth_cookie_refresh_streamed(monkeypatch):
+    bodies = []
+
+    def post_callback(request):
+        if request.headers["Cookie"] == f'authToken={expired_auth_json["token"]}':
+            # reject the upload after reading its first chunk
+            bodies.append(next(iter(request.body)))
+            return 401, {}, "Credentials are required to access this resource."
+        bodies.append(b"".join(request.body))
+        return 200, {}, json.dumps({})
+
+    tokens = [expired_auth_json, auth_json]
+    auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+    responses.add_callback(
+        responses.POST, auth_endpoint, lambda _: (200, {}, json.dumps(tokens.pop(0)))
+    )
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    responses.add_callback(responses.POST, endpoint, post_callback)
+
+    # the opaque token is not known to remain valid, so the body is recorded
+    monkeypatch.setattr("tamr_unify_client.client.TOKEN_REFRESH_MARGIN", 0.0)
+    client = Client(UsernamePasswordAuth("user", "password"), store_auth_cookie=True)
+    chunks = [b"first\n", b"second\n", b"third\n"]
+    r = client.post("test", data=iter(chunks))
+
+    assert r.status_code == 200
+    assert bodies == [b"first\n", b"".join(chunks)]
+    assert not tokens
+
+
+@responses.activate
+def test_auth_cookie_refresh_expiring():
+    tokens = [_jwt(time.time() + 30), _jwt(time.time() + 3600)]
+    auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+    responses.add_callback(
+        responses.POST,
+        auth_endpoint,
+        lambda _: (200, {}, json.dumps({"token": tokens.pop(0), "username": "user"})),
+    )
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    responses.add(responses.GET, endpoint, json={})
+
+    client = Client(UsernamePasswordAuth("user", "password"), store_auth_cookie=True)
+    client.get("test")  # token expires within a minute, so logs in again first
+    client.get("test")
+
+    assert [c.request.url for c in responses.calls] == [
+        auth_endpoint,
+        auth_endpoint,
+        endpoint,
+        endpoint,
+    ]
+    assert not tokens
+
+
+@responses.activate
+def test_auth_cookie_stream_revoked():
+    auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+    responses.add(
+        responses.POST,
+        auth_endpoint,
+        json={"token": _jwt(time.time() + 3600), "username": "user"},
+    )
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    responses.add(
+        responses.POST,
+        endpoint,
+        status=401,
+        body="Credentials are required to access this resource.",
+    )
+
+    client = Client(UsernamePasswordAuth("user", "password"), store_auth_cookie=True)
+    r = client.post("test", data=iter([b"first\n", b"second\n"]))
+
+    # the token is fresh, so the streamed body was not recorded to be sent again
+    assert r.status_code == 401
+    assert [c.request.url for c in responses.calls] == [
+        auth_endpoint,
+        endpoint,
+        auth_endpoint,
+    ]
+
+
+@responses.activate
+def test_auth_cookie_stream_fresh():
+    bodies = []
+
+    def post_callback(request):
+        bodies.append(request.body)
+        b"".join(request.body)
+        return 200, {}, json.dumps({})
+
+    auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+    responses.add(responses.POST, auth_endpoint, json=auth_json)
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    responses.add_callback(responses.POST, endpoint, post_callback)
+
+    client = Client(UsernamePasswordAuth("user", "password"), store_auth_cookie=True)
+    # the opaque token was just obtained, so is not expected to be rejected
+    client.post("test", data=iter([b"first\n"]))
+    client.post("test", data=iter([b"second\n"]))
+
+    assert len(bodies) == 2
+    assert not any(isinstance(body, _upload.Replayable) for body in bodies)
+
+
+@responses.activate
+def test_auth_cookie_stream_not_recorded(monkeypatch):
+    def post_callback(request):
+        b"".join(request.body)
+        return 401, {}, "Credentials are required to access this resource."
+
+    auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+    responses.add(responses.POST, auth_endpoint, json=auth_json)
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    responses.add_callback(responses.POST, endpoint, post_callback)
+
+    monkeypatch.setattr("tamr_unify_client.client.TOKEN_REFRESH_MARGIN", 0.0)
+    monkeypatch.setattr(_upload, "REPLAY_MAX_SIZE", 8)
+    client = Client(UsernamePasswordAuth("user", "password"), store_auth_cookie=True)
+    with pytest.raises(StreamNotRecorded):
+        client.post("test", data=iter([b"first\n", b"second\n"]))
+
+
 def test_auth_cookie_token_auth_not_supported():
     auth = TokenAuth("token")
     with pytest.raises(TypeError):
         Client(auth, store_auth_cookie=True)
+
+
+@responses.activate
+def test_session_per_thread():
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    responses.add(responses.GET, endpoint, json={})
+
+    session = requests.Session()
+    session.headers["X-Test"] = "value"
+    client = Client(TokenAuth("token"), session=session, session_per_thread=True)
+
+    sessions = []
+    workers = [
+        threading.Thread(target=lambda: sessions.append(client._thread_session()))
+        for _ in range(2)
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert sessions[0] is not sessions[1]
+    assert client._thread_session() is client._thread_session()
+    for s in sessions:
+        assert s is not session
+        assert s.cookies is session.cookies
+        assert s.get_adapter(endpoint) is session.get_adapter(endpoint)
+        assert s.headers["X-Test"] == "value"
+        assert s.auth == client.auth
+
+    client.get("test")
+    assert responses.calls[0].request.headers["Authorization"] == "BasicCreds token"
+
+
+@responses.activate
+def test_session_per_thread_single_login():
+    threads = 4
+    rejected = threading.Barrier(threads)
+    logins = []
+
+    def get_callback(request):
+        if "Cookie" not in request.headers:
+            # reject all threads before any of them logs in
+            rejected.wait(timeout=5)
+            return 401, {}, "Credentials are required to access this resource."
+        return 200, {}, json.dumps({})
+
+    def login_callback(request):
+        logins.append(json.loads(request.body))
+        return 200, {}, json.dumps(auth_json)
+
+    endpoint = "http://localhost:9100/api/versioned/v1/test"
+    auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+    responses.add_callback(responses.GET, endpoint, get_callback)
+    responses.add_callback(responses.POST, auth_endpoint, login_callback)
+
+    auth = UsernamePasswordAuth("user", "password")
+    client = Client(auth, session_per_thread=True)
+    with ThreadPoolExecutor(threads) as pool:
+        statuses = list(
+            pool.map(lambda _: client.get("test").status_code, range(threads))
+        )
+
+    assert statuses == [200] * threads
+    assert logins == [{"username": "user", "password": "password"}]
+    assert client.session.auth is None
+    assert client.session.cookies.get("authToken") == auth_json["token"]
+
+
+def _jwt(exp):
+    def encode(claims):
+        return base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+
+    return ".".join([encode({"alg": "none"}), encode({"exp": exp}), "signature"])
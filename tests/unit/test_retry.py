@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import io
+import json
+import sys
+
+import pytest
+import requests
+import responses
+
+from tamr_unify_client import Client
+from tamr_unify_client.auth import TokenAuth
+from tamr_unify_client import retry
+from tamr_unify_client.retry import Retry, RetryStats
+
+_url = "http://localhost:9100/api/versioned/v1/datasets"
+
+
+def _client(**kwargs):
+    return Client(TokenAuth("token"), retry=Retry(backoff=0, **kwargs))
+
+
+@responses.activate
+def test_retry_status():
+    responses.add(responses.GET, _url, status=503)
+    responses.add(responses.GET, _url, body=requests.exceptions.ConnectionError())
+    responses.add(responses.GET, _url, json=[])
+    client = _client()
+
+    assert client.get("datasets").status_code == 200
+    assert len(responses.calls) == 3
+    assert client.retry_stats.requests == 1
+    assert client.retry_stats.retries == 2
+    assert client.retry_stats.reasons == {"503": 1, "ConnectionError": 1}
+
+
+@responses.activate
+def test_retry_exhausted():
+    for _ in range(3):
+        responses.add(responses.GET, _url, status=504)
+    stats = RetryStats()
+    client = Client(
+        TokenAuth("token"), retry=Retry(total=1, backoff=0), retry_stats=stats
+    )
+
+    assert client.get("datasets").status_code == 504
+    assert len(responses.calls) == 2
+    assert client.retry_stats is stats
+    assert stats.exhausted == 1
+
+
+@responses.activate
+def test_no_retry_post():
+    responses.add(responses.POST, _url, status=503)
+    responses.add(responses.POST, _url, json={})
+    client = _client()
+
+    assert client.post("datasets", json={}).status_code == 503
+    assert client.retry_stats.retries == 0
+
+
+@responses.activate
+def test_no_retry_by_default():
+    responses.add(responses.GET, _url, status=503)
+    responses.add(responses.GET, _url, json=[])
+    client = Client(TokenAuth("token"))
+
+    assert client.get("datasets").status_code == 503
+    assert client.retry_stats.requests == 1
+
+
+@responses.activate
+def test_upsert_batched_retry():
+    def create_callback(request, snoop):
+        snoop["bodies"].append(request.body)
+        if len(snoop["bodies"]) == 2:
+            return 502, {}, "Bad Gateway"
+        return 200, {}, json.dumps(_batch_response_json)
+
+    responses.add(responses.GET, f"{_url}/1", json={})
+    snoop = {"bodies": []}
+    responses.add_callback(
+        responses.POST,
+        f"{_url}/1:updateRecords",
+        partial(create_callback, snoop=snoop),
+    )
+    client = _client()
+    dataset = client.datasets.by_resource_id("1")
+
+    records = iter([{"pk": 1}, {"pk": 2}])
+    response = dataset.upsert_records(records, "pk", batch_size=1)
+    assert response["numCommandsProcessed"] == 2
+
+    sent = [json.loads(body)["recordId"] for body in snoop["bodies"]]
+    assert sent == [1, 2, 2]
+    assert client.retry_stats.reasons == {"502": 1}
+
+
+def test_delay():
+    retry = Retry(backoff=1, backoff_max=5, jitter=0)
+    assert [retry.delay(i) for i in range(4)] == [1, 2, 4, 5]
+    assert retry.delay(0, retry_after=3) == 3
+
+    jittered = Retry(backoff=1, jitter=0.5)
+    assert all(0.5 <= jittered.delay(0) <= 1 for _ in range(100))
+
+
+def test_retry_stats_concurrent():
+    def send(method, url):
+        response = requests.Response()
+        response.status_code = 503
+        response.raw = io.BytesIO()
+        return response
+
+    stats = RetryStats()
+    policy = Retry(total=1, backoff=0)
+
+    def request(_):
+        return retry.send(send, "GET", _url, retry=policy, stats=stats)
+
+    # switch threads as often as possible, to interleave the updates of the statistics
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(16) as pool:
+            list(pool.map(request, range(20000)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert stats.requests == 20000
+    assert stats.retries == 20000
+    assert stats.exhausted == 20000
+    assert stats.reasons == {"503": 20000}
+
+
+@pytest.mark.parametrize("method", ["get", "put", "delete"])
+@responses.activate
+def test_retry_idempotent_methods(method):
+    responses.add(method.upper(), _url, status=503)
+    responses.add(method.upper(), _url, json={})
+    client = _client()
+
+    assert getattr(client, method)("datasets").status_code == 200
+
+
+_batch_response_json = {
+    "numCommandsProcessed": 1,
+    "allCommandsSucceeded": True,
+    "validationErrors": [],
+}
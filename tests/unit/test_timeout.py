@@ -0,0 +1,137 @@
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from urllib3.exceptions import ReadTimeoutError
+
+from tamr_unify_client import _ndjson, Client
+from tamr_unify_client.auth import TokenAuth
+from tamr_unify_client.operation import Operation
+from tamr_unify_client.retry import Retry
+from tamr_unify_client.timeout import ConnectTimeout, ReadTimeout, Timeout
+
+
+class _Adapter(BaseAdapter):
+    """Transport adapter recording the timeout of each request, and failing as instructed."""
+
+    def __init__(self, outcomes, body=b"{}"):
+        super().__init__()
+        self.outcomes = outcomes
+        self.body = body
+        self.timeouts = []
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        r = requests.Response()
+        r.status_code = outcome
+        r.request = request
+        r.url = request.url
+        r._content = self.body
+        return r
+
+    def close(self):
+        pass
+
+
+def _client(outcomes, body=b"{}", **kwargs):
+    client = Client(TokenAuth("token"), **kwargs)
+    adapter = _Adapter(outcomes, body)
+    client.session.mount("http://", adapter)
+    return client, adapter
+
+
+def test_timeout_profiles():
+    client, adapter = _client(
+        [200] * 5, timeout=Timeout(connect=1, read=2, stream=3, poll=4)
+    )
+
+    client.get("datasets")
+    client.get("datasets/1/records", stream=True)
+    client.post("datasets/1:updateRecords", data=iter([b"{}"]))
+    client.get("operations/1", profile="poll")
+    client.get("datasets", timeout=5)
+    with pytest.raises(ValueError):
+        client.get("datasets", profile="unknown")
+    assert adapter.timeouts == [(1, 2), (1, 3), (1, 3), (1, 4), 5]
+
+
+def test_timeout_default():
+    client, adapter = _client([200])
+    client.get("datasets")
+    assert adapter.timeouts == [(10.0, 60.0)]
+
+    client, adapter = _client([200], timeout=None)
+    client.get("datasets")
+    assert adapter.timeouts == [None]
+
+
+def test_typed_timeouts():
+    client, _ = _client(
+        [requests.exceptions.ConnectTimeout(), requests.exceptions.ReadTimeout()]
+    )
+
+    with pytest.raises(ConnectTimeout) as connect:
+        client.get("datasets")
+    assert isinstance(connect.value, requests.exceptions.ConnectionError)
+    with pytest.raises(ReadTimeout) as read:
+        client.get("datasets")
+    assert isinstance(read.value, requests.exceptions.Timeout)
+
+
+def test_retry_timeouts():
+    client, _ = _client(
+        [
+            requests.exceptions.ReadTimeout(),
+            200,
+            requests.exceptions.ConnectTimeout(),
+            200,
+            requests.exceptions.ReadTimeout(),
+        ],
+        retry=Retry(backoff=0),
+    )
+
+    assert client.get("datasets").status_code == 200
+    # connection timed out, so the request was not sent
+    assert client.post("datasets", json={}).status_code == 200
+    # the request may have been processed
+    with pytest.raises(ReadTimeout):
+        client.post("datasets", json={})
+    assert client.retry_stats.reasons == {"ReadTimeout": 1, "ConnectTimeout": 1}
+
+
+def test_stream_read_timeout():
+    class StalledBody:
+        def stream(self, chunk_size, decode_content=None):
+            yield b'{"a": 1}\n'
+            raise ReadTimeoutError(None, "http://localhost", "Read timed out.")
+
+    r = requests.Response()
+    r.status_code = 200
+    r.raw = StalledBody()
+    r.url = "http://localhost:9100/api/versioned/v1/datasets/1/records"
+    r.request = requests.Request("GET", r.url).prepare()
+
+    records = _ndjson.parse(r, json.loads)
+    assert next(records) == {"a": 1}
+    with pytest.raises(ReadTimeout):
+        next(records)
+
+
+def test_poll_profile():
+    op_json = {
+        "id": "1",
+        "type": "SPARK",
+        "description": "",
+        "status": None,
+        "relativeId": "operations/1",
+    }
+    client, adapter = _client(
+        [200], json.dumps(op_json).encode(), timeout=Timeout(poll=4)
+    )
+
+    Operation.from_json(client, op_json).poll()
+    assert adapter.timeouts == [(10.0, 4)]
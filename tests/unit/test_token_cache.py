@@ -0,0 +1,77 @@
+import json
+import os
+import threading
+
+import responses
+
+from tamr_unify_client import Client
+from tamr_unify_client.auth import UsernamePasswordAuth
+from tamr_unify_client.token_cache import TokenCache
+
+auth_endpoint = "http://localhost:9100/api/versioned/v1/instance:login"
+endpoint = "http://localhost:9100/api/versioned/v1/test"
+
+
+@responses.activate
+def test_token_cache_shared(tmp_path):
+    server = {"logins": 0, "token": None}
+
+    def login_callback(request):
+        server["logins"] += 1
+        server["token"] = f"token_{server['logins']}"
+        return 200, {}, json.dumps({"token": server["token"], "username": "user"})
+
+    def get_callback(request):
+        if request.headers.get("Cookie") != f"authToken={server['token']}":
+            return 401, {}, "Credentials are required to access this resource."
+        return 200, {}, json.dumps({})
+
+    responses.add_callback(responses.POST, auth_endpoint, login_callback)
+    responses.add_callback(responses.GET, endpoint, get_callback)
+
+    cache = TokenCache(tmp_path / "tokens.json")
+    auth = UsernamePasswordAuth("user", "password")
+    client_1 = Client(auth, store_auth_cookie=True, token_cache=cache)
+    client_2 = Client(auth, store_auth_cookie=True, token_cache=cache)
+    assert server["logins"] == 1
+    assert client_2.get("test").status_code == 200
+
+    server["token"] = "revoked"
+    assert client_2.get("test").status_code == 200  # logs in again
+    assert client_1.get("test").status_code == 200  # reuses the token of `client_2`
+    assert server["logins"] == 2
+    assert cache.load("http://localhost:9100", "user") == ("token_2", None)
+
+
+def test_token_cache_file(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    assert cache.load("http://localhost:9100", "user") is None
+
+    with cache.lock():
+        cache.store("http://localhost:9100", "user", "token", 1600000000.0)
+        cache.store("http://localhost:9100", "other", "other_token")
+    assert cache.load("http://localhost:9100", "user") == ("token", 1600000000.0)
+    assert cache.load("http://localhost:9100", "other") == ("other_token", None)
+    assert cache.load("http://otherhost:9100", "user") is None
+    if os.name == "posix":
+        assert (tmp_path / "tokens.json").stat().st_mode & 0o077 == 0
+
+    (tmp_path / "tokens.json").write_text("not json")
+    assert cache.load("http://localhost:9100", "user") is None
+
+
+def test_token_cache_lock(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    events = []
+
+    def other():
+        with cache.lock():
+            events.append("other")
+
+    with cache.lock():
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join(timeout=0.2)
+        events.append("first")
+    thread.join()
+    assert events == ["first", "other"]